@@ -45,7 +45,8 @@ expressionStmt: expression ';';
 // ============================================================================
 
 expression: assignmentExpr;
-assignmentExpr: postfixExpr ASSIGN assignmentExpr | logicalOrExpr;
+// Fatorada à esquerda: decide com 1 token de lookahead; o alvo atribuível é checado na semântica
+assignmentExpr: logicalOrExpr (ASSIGN assignmentExpr)?;
 logicalOrExpr: logicalAndExpr (OR logicalAndExpr)*;
 logicalAndExpr: equalityExpr (AND equalityExpr)*;
 equalityExpr: relationalExpr ((EQ | NEQ) relationalExpr)*;
@@ -0,0 +1,367 @@
+"""
+AST compacto compartilhado pela análise semântica e pela geração de código.
+
+A árvore do ANTLR é convertida uma única vez (TypeScriptLowering.lower_program)
+em nós tipados com __slots__, sem os contextos intermediários de filho único da
+gramática:
+
+- statement → variableDecl → letDecl vira um único VarDecl; blocos e o programa
+  guardam a lista de statements diretamente;
+- na árvore do ANTLR cada literal ou identificador é uma cadeia de ~10 contextos
+  (expression → assignmentExpr → … → postfixExpr → primary); aqui a expressão é
+  representada só pelos nós que carregam informação:
+  - BinaryExpr: uma sequência de operandos do MESMO nível de precedência
+    (a + b - c → operands=[a, b, c], ops=['+', '-']);
+  - UnaryExpr: operadores prefixados (ops) aplicados a um operando;
+  - PostfixExpr: primário seguido de acessos/chamadas (IndexOp, MemberOp, CallOp);
+  - AssignExpr, Literal, Identifier, ArrayLiteral, ObjectLiteral.
+  Parênteses não geram nó: a estrutura já codifica a precedência.
+
+Identificadores, nomes de tipo e operadores são strings internadas (sys.intern).
+
+Os nós de expressão são produzidos pelo parser de precedência
+(TypeScriptExprParser) ou pela conversão de um ExpressionContext do ANTLR
+(TypeScriptLowering.lower_expression); os dois caminhos geram árvores iguais. Linha/coluna de cada nó
+são as do primeiro token da construção correspondente na gramática (o mesmo
+`ctx.start` do ANTLR), usadas nas mensagens de erro.
+
+Este módulo não depende do runtime do ANTLR: um programa recarregado do cache
+(TypeScriptProgramCache) é analisado sem importar lexer nem parser.
+"""
+
+
+class Node:
+    """Base dos nós. A identidade é a do objeto; o repr (gerado a partir de
+    _fields) descreve a árvore inteira e serve para comparar estruturas."""
+    __slots__ = ()
+    _fields = ()
+
+    def __repr__(self):
+        args = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({args})"
+
+
+class Expr(Node):
+    """Expressão com a posição (linha:coluna) do seu primeiro token"""
+    __slots__ = ("line", "column")
+    _fields = ("line", "column")
+
+    def __init__(self, line: int, column: int):
+        self.line = line
+        self.column = column
+
+
+class Literal(Expr):
+    """Literal: kind é 'number', 'string' ou 'boolean'; text é o texto do token"""
+    __slots__ = ("kind", "text")
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, kind: str, text: str, line: int, column: int):
+        super().__init__(line, column)
+        self.kind = kind
+        self.text = text
+
+
+class Identifier(Expr):
+    __slots__ = ("name",)
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, name: str, line: int, column: int):
+        super().__init__(line, column)
+        self.name = name
+
+
+class ArrayLiteral(Expr):
+    __slots__ = ("elements",)
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, elements: list, line: int, column: int):
+        super().__init__(line, column)
+        self.elements = elements
+
+
+class ObjectLiteral(Expr):
+    """Literal de objeto: props é uma lista de (chave sem aspas, expressão)"""
+    __slots__ = ("props",)
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, props: list, line: int, column: int):
+        super().__init__(line, column)
+        self.props = props
+
+
+class IndexOp(Node):
+    """Operador pós-fixado [index]"""
+    __slots__ = ("index",)
+    _fields = __slots__
+
+    def __init__(self, index):
+        self.index = index
+
+
+class MemberOp(Node):
+    """Operador pós-fixado .name"""
+    __slots__ = ("name",)
+    _fields = __slots__
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class CallOp(Node):
+    """Operador pós-fixado (args)"""
+    __slots__ = ("args",)
+    _fields = __slots__
+
+    def __init__(self, args: list):
+        self.args = args
+
+
+class PostfixExpr(Expr):
+    """primary seguido de pelo menos um operador pós-fixado"""
+    __slots__ = ("primary", "ops")
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, primary, ops: list, line: int, column: int):
+        super().__init__(line, column)
+        self.primary = primary
+        self.ops = ops
+
+
+class UnaryExpr(Expr):
+    """Operadores prefixados ('!' / '-', na ordem do fonte) aplicados a operand"""
+    __slots__ = ("ops", "operand")
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, ops: list, operand, line: int, column: int):
+        super().__init__(line, column)
+        self.ops = ops
+        self.operand = operand
+
+
+class BinaryExpr(Expr):
+    """Cadeia associativa à esquerda de um único nível de precedência:
+    operands[0] ops[0] operands[1] ops[1] ... (len(operands) == len(ops) + 1)"""
+    __slots__ = ("ops", "operands")
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, ops: list, operands: list, line: int, column: int):
+        super().__init__(line, column)
+        self.ops = ops
+        self.operands = operands
+
+
+class AssignExpr(Expr):
+    """target = value (associativa à direita; target é validado na semântica)"""
+    __slots__ = ("target", "value")
+    _fields = Expr._fields + __slots__
+
+    def __init__(self, target, value, line: int, column: int):
+        super().__init__(line, column)
+        self.target = target
+        self.value = value
+
+
+# Níveis de precedência dos operadores binários (maior = liga mais forte),
+# na mesma ordem das regras de TypeScript.g4
+BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "==": 3, "!=": 3,
+    "<": 4, "<=": 4, ">": 4, ">=": 4,
+    "+": 5, "-": 5,
+    "*": 6, "/": 6, "%": 6,
+}
+
+
+# ============================================================================
+# TIPOS E STATEMENTS
+# ============================================================================
+
+
+class TypeRef(Node):
+    """Anotação de tipo: name é o tipo base (number, string, boolean, void ou
+    interface); is_array indica o sufixo []"""
+    __slots__ = ("name", "is_array", "line", "column")
+    _fields = __slots__
+
+    def __init__(self, name: str, is_array: bool, line: int, column: int):
+        self.name = name
+        self.is_array = is_array
+        self.line = line
+        self.column = column
+
+
+class Stmt(Node):
+    """Statement com a posição (linha:coluna) do seu primeiro token"""
+    __slots__ = ("line", "column")
+    _fields = ("line", "column")
+
+    def __init__(self, line: int, column: int):
+        self.line = line
+        self.column = column
+
+
+class Program(Stmt):
+    __slots__ = ("body",)
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, body: list, line: int, column: int):
+        super().__init__(line, column)
+        self.body = body
+
+
+class Block(Stmt):
+    __slots__ = ("body",)
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, body: list, line: int, column: int):
+        super().__init__(line, column)
+        self.body = body
+
+
+class VarDecl(Stmt):
+    """let/const name: type (= init)?; init é None quando não há inicializador"""
+    __slots__ = ("name", "type", "init", "is_const")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, name: str, type_: TypeRef, init, is_const: bool,
+                 line: int, column: int):
+        super().__init__(line, column)
+        self.name = name
+        self.type = type_
+        self.init = init
+        self.is_const = is_const
+
+
+class Param(Node):
+    __slots__ = ("name", "type")
+    _fields = __slots__
+
+    def __init__(self, name: str, type_: TypeRef):
+        self.name = name
+        self.type = type_
+
+
+class FunctionDecl(Stmt):
+    __slots__ = ("name", "params", "return_type", "body")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, name: str, params: list, return_type: TypeRef, body: Block,
+                 line: int, column: int):
+        super().__init__(line, column)
+        self.name = name
+        self.params = params
+        self.return_type = return_type
+        self.body = body
+
+
+class InterfaceDecl(Stmt):
+    """interface name { prop: type; ... }; props é uma lista de (nome, TypeRef)"""
+    __slots__ = ("name", "props")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, name: str, props: list, line: int, column: int):
+        super().__init__(line, column)
+        self.name = name
+        self.props = props
+
+
+class IfStmt(Stmt):
+    __slots__ = ("cond", "then", "else_")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, cond, then, else_, line: int, column: int):
+        super().__init__(line, column)
+        self.cond = cond
+        self.then = then
+        self.else_ = else_
+
+
+class WhileStmt(Stmt):
+    __slots__ = ("cond", "body")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, cond, body, line: int, column: int):
+        super().__init__(line, column)
+        self.cond = cond
+        self.body = body
+
+
+class ForStmt(Stmt):
+    """for (init cond; update) body; init é VarDecl, ExprStmt ou None"""
+    __slots__ = ("init", "cond", "update", "body")
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, init, cond, update, body, line: int, column: int):
+        super().__init__(line, column)
+        self.init = init
+        self.cond = cond
+        self.update = update
+        self.body = body
+
+
+class ReturnStmt(Stmt):
+    __slots__ = ("value",)
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, value, line: int, column: int):
+        super().__init__(line, column)
+        self.value = value
+
+
+class ExprStmt(Stmt):
+    __slots__ = ("expr",)
+    _fields = Stmt._fields + __slots__
+
+    def __init__(self, expr, line: int, column: int):
+        super().__init__(line, column)
+        self.expr = expr
+
+
+# Nós visitados pelos visitors (TypeScriptWalk.dispatch_table): cada visitor tem
+# um método visit<Classe> para cada um. IndexOp, MemberOp, CallOp, TypeRef e Param
+# são tratados pelo nó que os contém.
+NODE_TYPES = (
+    Literal, Identifier, ArrayLiteral, ObjectLiteral, PostfixExpr, UnaryExpr, BinaryExpr,
+    AssignExpr, Program, Block, VarDecl, FunctionDecl, InterfaceDecl, IfStmt, WhileStmt,
+    ForStmt, ReturnStmt, ExprStmt,
+)
+
+
+# Campos de cada classe que guardam nós (ou listas/tuplas com nós), na ordem de
+# _fields; os demais (nomes, operadores, posições) não são percorridos
+_CHILDREN = {
+    Literal: (), Identifier: (), ArrayLiteral: ("elements",), ObjectLiteral: ("props",),
+    IndexOp: ("index",), MemberOp: (), CallOp: ("args",), PostfixExpr: ("primary", "ops"),
+    UnaryExpr: ("operand",), BinaryExpr: ("operands",), AssignExpr: ("target", "value"),
+    TypeRef: (), Program: ("body",), Block: ("body",), VarDecl: ("type", "init"),
+    Param: ("type",), FunctionDecl: ("params", "return_type", "body"),
+    InterfaceDecl: ("props",), IfStmt: ("cond", "then", "else_"), WhileStmt: ("cond", "body"),
+    ForStmt: ("init", "cond", "update", "body"), ReturnStmt: ("value",), ExprStmt: ("expr",),
+}
+_PUSH_ORDER = {cls: fields[::-1] for cls, fields in _CHILDREN.items()}
+
+
+def preorder(node) -> list:
+    """Nós da subárvore em pré-ordem, com uma pilha explícita (sem recursão).
+
+    Duas árvores com a mesma estrutura produzem os nós na mesma ordem, então a
+    posição de um nó nessa lista o identifica em uma cópia da árvore.
+    """
+    result = []
+    append = result.append
+    stack = [node]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    push_order = _PUSH_ORDER
+    while stack:
+        value = pop()
+        fields = push_order.get(type(value))
+        if fields is None:
+            if type(value) is list or type(value) is tuple:
+                extend(reversed(value))
+            continue  # strings, números, None
+        append(value)
+        for field in fields:
+            push(getattr(value, field))
+    return result
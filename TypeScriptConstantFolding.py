@@ -0,0 +1,305 @@
+"""
+Avaliação de expressões constantes em tempo de compilação, entre a análise
+semântica e a geração de Jasmin.
+
+O gerador emitia `60 * 60 * 24` como `ldc 60 / ldc 60 / imul / ldc 24 / imul`,
+`-(-5)` como `ldc 5 / ineg / ineg` e `!true` com desvios. fold_constants()
+substitui por um único literal as expressões cujos operandos são literais:
+
+- aritméticos (+ - * / %): a cadeia é avaliada da esquerda para a direita e o
+  maior prefixo de literais vira um literal (`60 * 60 * x` → `3600 * x`);
+- relacionais (< <= > >=), igualdade (== !=) e lógicos (&& ||): só quando todos
+  os operandos da cadeia são literais (number ou boolean; strings não);
+- unários: `-` sobre number e `!` sobre number ou boolean.
+
+O valor é o mesmo que o código gerado calcula: JasminGenerator avalia as cadeias
+de comparação inteiras, da esquerda para a direita (`1 == 2 == false` é
+`(1 == 2) == false`), e && e || com curto-circuito.
+
+Os resultados seguem a aritmética de int da JVM, que é a do código gerado:
+soma, subtração, multiplicação e negação com estouro em 32 bits (complemento de
+dois), `idiv` truncando em direção a zero, `irem` com o sinal do dividendo
+(inclusive `-2147483648 / -1`, que volta a -2147483648). Literais com parte
+decimal são truncados, como em JasminGenerator.visitLiteral. Divisão ou resto
+por zero não é avaliada: a expressão fica para a execução (e a
+ArithmeticException acontece lá), e a posição é registrada em
+ConstantFolding.division_by_zero. Um literal fora do intervalo de int vale o que
+o `ldc` do Jasmin carrega, os 32 bits menos significativos (`2147483648` é
+-2147483648); acima de 64 bits o Jasmin rejeita o número, e a expressão não é
+avaliada.
+
+O programa original não é alterado: os nós com algum filho avaliado são copiados
+(com o tipo do original em SemanticAnalyzer.types, que o gerador consulta) e o
+resto é compartilhado. Assim a eliminação de código morto, que roda depois, vê
+`if (1 > 2)` como `if (false)`. O percurso usa TypeScriptWalk.walk, sem limite
+de aninhamento.
+"""
+
+import operator
+
+from TypeScriptAST import (
+    ArrayLiteral, AssignExpr, BinaryExpr, Block, CallOp, ExprStmt, ForStmt, FunctionDecl,
+    IfStmt, IndexOp, Literal, ObjectLiteral, PostfixExpr, Program, ReturnStmt, UnaryExpr,
+    VarDecl, WhileStmt,
+)
+from TypeScriptWalk import dispatch_table, walk
+
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+
+
+def wrap(value: int) -> int:
+    """Valor reduzido a int de 32 bits com sinal (estouro da JVM)"""
+    return (value - INT_MIN) % 2 ** 32 + INT_MIN
+
+
+def idiv(a: int, b: int) -> int:
+    """Divisão inteira da JVM: trunca em direção a zero"""
+    quotient = abs(a) // abs(b)
+    return wrap(-quotient if (a < 0) != (b < 0) else quotient)
+
+
+def irem(a: int, b: int) -> int:
+    """Resto da JVM: a - idiv(a, b) * b, com o sinal do dividendo"""
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
+
+
+_ARITHMETIC = {
+    "+": lambda a, b: wrap(a + b),
+    "-": lambda a, b: wrap(a - b),
+    "*": lambda a, b: wrap(a * b),
+    "/": idiv,
+    "%": irem,
+}
+
+_OTHER = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+    "&&": lambda a, b: a and b, "||": lambda a, b: a or b,
+}
+
+
+def _value(node):
+    """int ou bool de um literal number/boolean; None para qualquer outro nó"""
+    if type(node) is not Literal:
+        return None
+    if node.kind == "boolean":
+        return node.text == "true"
+    if node.kind == "number":
+        text = node.text
+        value = int(float(text)) if "." in text else int(text)
+        if -2 ** 63 <= value < 2 ** 63:
+            return wrap(value)
+    return None
+
+
+class ConstantFolding:
+    """Resultado da avaliação: o programa com as expressões constantes substituídas"""
+
+    def __init__(self, program, folded: int, division_by_zero: list):
+        self.program = program                    # Program com os literais avaliados
+        self.folded = folded                      # expressões substituídas ou encurtadas
+        self.division_by_zero = division_by_zero  # [(linha, coluna)] mantidas para a execução
+
+
+class _Folder:
+    """Visitor (percorrido por walk) que devolve cada nó com as subexpressões
+    constantes avaliadas; o próprio nó quando nada muda"""
+
+    def __init__(self, types: dict):
+        self.types = types
+        self.folded = 0
+        self.division_by_zero = []
+        self.dispatch = dispatch_table(self)
+
+    def _copy(self, original, node):
+        """`node` substitui `original`: herda o tipo registrado pela análise"""
+        t = self.types.get(original)
+        if t is not None:
+            self.types[node] = t
+        return node
+
+    def _literal(self, value, original, position):
+        if type(value) is bool:
+            literal = Literal("boolean", "true" if value else "false",
+                              position.line, position.column)
+        else:
+            literal = Literal("number", str(value), position.line, position.column)
+        self.folded += 1
+        return self._copy(original, literal)
+
+    def _same(self, node):
+        return node
+
+    visitLiteral = visitIdentifier = visitInterfaceDecl = _same
+
+    def _list(self, nodes):
+        """Visita uma lista de filhos; devolve (lista nova, algum mudou?)"""
+        result, changed = [], False
+        for child in nodes:
+            folded = yield child
+            changed = changed or folded is not child
+            result.append(folded)
+        return result, changed
+
+    # ========================================================================
+    # EXPRESSÕES
+    # ========================================================================
+
+    def visitBinaryExpr(self, node):
+        operands, changed = yield from self._list(node.operands)
+        ops = node.ops
+
+        # Maior prefixo da cadeia (associativa à esquerda) só com literais
+        value = _value(operands[0])
+        count = 0
+        if value is not None:
+            table = _ARITHMETIC if ops[0] in _ARITHMETIC else _OTHER
+            for op, operand in zip(ops, operands[1:]):
+                right = _value(operand)
+                if right is None:
+                    break
+                if op in ("/", "%") and right == 0:
+                    self.division_by_zero.append((node.line, node.column))
+                    break
+                value = table[op](value, right)
+                count += 1
+
+        if count == len(ops):
+            return self._literal(value, node, node)
+        if count and ops[0] in _ARITHMETIC:
+            prefix = self._literal(value, node, operands[0])
+            operands, ops, changed = [prefix] + operands[count + 1:], ops[count:], True
+        if not changed:
+            return node
+        return self._copy(node, BinaryExpr(ops, operands, node.line, node.column))
+
+    def visitUnaryExpr(self, node):
+        operand = yield node.operand
+        value = _value(operand)
+        # Mesma ordem do gerador: as negações aritméticas, depois as lógicas
+        if value is not None and not (type(value) is bool and "-" in node.ops):
+            if node.ops.count("-") % 2:
+                value = wrap(-value)
+            if node.ops.count("!") % 2:
+                value = not value
+            return self._literal(value, node, node)
+        if operand is node.operand:
+            return node
+        return self._copy(node, UnaryExpr(node.ops, operand, node.line, node.column))
+
+    def visitAssignExpr(self, node):
+        target = yield node.target
+        value = yield node.value
+        if target is node.target and value is node.value:
+            return node
+        return self._copy(node, AssignExpr(target, value, node.line, node.column))
+
+    def visitPostfixExpr(self, node):
+        primary = yield node.primary
+        changed = primary is not node.primary
+        ops = []
+        for op in node.ops:
+            if type(op) is IndexOp:
+                index = yield op.index
+                if index is not op.index:
+                    op = self._copy(op, IndexOp(index))
+            elif type(op) is CallOp:
+                args, args_changed = yield from self._list(op.args)
+                if args_changed:
+                    op = self._copy(op, CallOp(args))
+            ops.append(op)
+        if not changed and all(a is b for a, b in zip(ops, node.ops)):
+            return node
+        return self._copy(node, PostfixExpr(primary, ops, node.line, node.column))
+
+    def visitArrayLiteral(self, node):
+        elements, changed = yield from self._list(node.elements)
+        if not changed:
+            return node
+        return self._copy(node, ArrayLiteral(elements, node.line, node.column))
+
+    def visitObjectLiteral(self, node):
+        values, changed = yield from self._list([value for _, value in node.props])
+        if not changed:
+            return node
+        props = [(key, value) for (key, _), value in zip(node.props, values)]
+        return self._copy(node, ObjectLiteral(props, node.line, node.column))
+
+    # ========================================================================
+    # STATEMENTS
+    # ========================================================================
+
+    def visitProgram(self, node):
+        body, changed = yield from self._list(node.body)
+        return Program(body, node.line, node.column) if changed else node
+
+    def visitBlock(self, node):
+        body, changed = yield from self._list(node.body)
+        return Block(body, node.line, node.column) if changed else node
+
+    def visitVarDecl(self, node):
+        init = yield node.init
+        if init is node.init:
+            return node
+        return self._copy(node, VarDecl(node.name, node.type, init, node.is_const,
+                                        node.line, node.column))
+
+    def visitFunctionDecl(self, node):
+        body = yield node.body
+        if body is node.body:
+            return node
+        return self._copy(node, FunctionDecl(node.name, node.params, node.return_type, body,
+                                             node.line, node.column))
+
+    def visitIfStmt(self, node):
+        cond = yield node.cond
+        then = yield node.then
+        else_ = yield node.else_
+        if cond is node.cond and then is node.then and else_ is node.else_:
+            return node
+        return self._copy(node, IfStmt(cond, then, else_, node.line, node.column))
+
+    def visitWhileStmt(self, node):
+        cond = yield node.cond
+        body = yield node.body
+        if cond is node.cond and body is node.body:
+            return node
+        return self._copy(node, WhileStmt(cond, body, node.line, node.column))
+
+    def visitForStmt(self, node):
+        init = yield node.init
+        cond = yield node.cond
+        update = yield node.update
+        body = yield node.body
+        if (init is node.init and cond is node.cond and update is node.update
+                and body is node.body):
+            return node
+        return self._copy(node, ForStmt(init, cond, update, body, node.line, node.column))
+
+    def visitReturnStmt(self, node):
+        value = yield node.value
+        if value is node.value:
+            return node
+        return self._copy(node, ReturnStmt(value, node.line, node.column))
+
+    def visitExprStmt(self, node):
+        expr = yield node.expr
+        if expr is node.expr:
+            return node
+        return self._copy(node, ExprStmt(expr, node.line, node.column))
+
+
+def fold_constants(program, analyzer) -> ConstantFolding:
+    """Avalia as expressões constantes do programa (TypeScriptAST.Program) já
+    analisado sem erros por `analyzer`"""
+    folder = _Folder(analyzer.types)
+    folded = walk(folder, program)
+    return ConstantFolding(folded, folder.folded, folder.division_by_zero)
+
+
+def count_instructions(jasmin: str) -> int:
+    """Instruções de um código Jasmin (linhas indentadas que não são diretivas)"""
+    return sum(1 for line in jasmin.splitlines()
+               if line.startswith("    ") and not line.lstrip().startswith("."))
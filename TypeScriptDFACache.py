@@ -0,0 +1,345 @@
+"""
+Cache persistente dos DFAs de predição do lexer e do parser.
+
+O ANTLR constrói os DFAs (`decisionsToDFA`) de forma preguiçosa, decisão por decisão,
+enquanto analisa a entrada. Cada processo novo começa com os DFAs vazios e paga de novo
+a simulação do ATN. Este módulo grava um snapshot dos DFAs "aquecidos" em disco e o
+recarrega no início de outro processo.
+
+O snapshot contém apenas dados simples (tuplas, listas e inteiros, via `marshal`):
+estados do ATN são gravados pelo número, contextos de predição e ações do lexer por
+índice. Os objetos do runtime são reconstruídos com seus construtores, então os hashes
+(que dependem do PYTHONHASHSEED) são recalculados no processo que carrega.
+
+A chave do snapshot é o hash de `TypeScript.g4` + versão do runtime + versão do formato;
+snapshots obsoletos ou corrompidos são descartados e reconstruídos.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from typing import Dict, List, Optional
+
+from antlr4.PredictionContext import (ArrayPredictionContext, PredictionContext,
+                                      SingletonPredictionContext)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerAction import LexerIndexedCustomAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState
+
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptParser import TypeScriptParser
+
+FORMAT_VERSION = 1
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR_PATH = os.path.join(PROJECT_DIR, "TypeScript.g4")
+DEFAULT_CACHE_PATH = os.path.join(PROJECT_DIR, ".ts_cache", "dfa.bin")
+
+# Códigos especiais para arestas
+_EDGE_ERROR = -2
+
+
+class DFACacheError(Exception):
+    """Snapshot inválido ou com construções não suportadas (predicados)"""
+
+
+def _error_state(is_lexer: bool) -> DFAState:
+    """Estado de erro compartilhado (o lexer usa uma instância própria)"""
+    return LexerATNSimulator.ERROR if is_lexer else ATNSimulator.ERROR
+
+
+def grammar_key() -> str:
+    """Hash que identifica a gramática e o runtime para os quais o snapshot vale"""
+    h = hashlib.sha256()
+    with open(GRAMMAR_PATH, "rb") as f:
+        h.update(f.read())
+    h.update(f"|fmt={FORMAT_VERSION}|marshal={marshal.version}".encode())
+    h.update(f"|py={sys.version_info[0]}.{sys.version_info[1]}".encode())
+    h.update(f"|atn-states={len(TypeScriptParser.atn.states)}".encode())
+    return h.hexdigest()
+
+
+def dfa_state_count() -> int:
+    """Total de estados nos DFAs do lexer e do parser (para saber se houve aquecimento)"""
+    return sum(len(dfa._states) for dfa in TypeScriptLexer.decisionsToDFA) + \
+        sum(len(dfa._states) for dfa in TypeScriptParser.decisionsToDFA)
+
+
+# ============================================================================
+# SERIALIZAÇÃO
+# ============================================================================
+
+
+class _Encoder:
+    """Converte os DFAs de um reconhecedor em estruturas simples"""
+
+    def __init__(self, atn, is_lexer: bool):
+        self.atn = atn
+        self.is_lexer = is_lexer
+        self.ctx_ids: Dict[int, int] = {}
+        self.contexts: List[tuple] = []
+        self.exec_ids: Dict[int, int] = {}
+        self.executors: List[tuple] = []
+        self.action_index = {id(a): i for i, a in enumerate(atn.lexerActions or [])}
+        self.error_state = _error_state(is_lexer)
+
+    def context(self, ctx: Optional[PredictionContext]) -> int:
+        """Registra um contexto (e seus pais) em pós-ordem; retorna o id"""
+        if ctx is None:
+            return -1
+        if id(ctx) in self.ctx_ids:
+            return self.ctx_ids[id(ctx)]
+        # Pós-ordem iterativa: pais antes dos filhos
+        stack = [(ctx, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in self.ctx_ids:
+                continue
+            parents = self._parents(node)
+            if not expanded:
+                stack.append((node, True))
+                for p in parents:
+                    if p is not None and id(p) not in self.ctx_ids:
+                        stack.append((p, False))
+                continue
+            parent_ids = tuple(-1 if p is None else self.ctx_ids[id(p)] for p in parents)
+            if node is PredictionContext.EMPTY:
+                entry = ("e",)
+            elif isinstance(node, ArrayPredictionContext):
+                entry = ("a", parent_ids, tuple(node.returnStates))
+            else:
+                entry = ("s", parent_ids[0], node.returnState)
+            self.ctx_ids[id(node)] = len(self.contexts)
+            self.contexts.append(entry)
+        return self.ctx_ids[id(ctx)]
+
+    @staticmethod
+    def _parents(node):
+        if node is PredictionContext.EMPTY:
+            return ()
+        if isinstance(node, ArrayPredictionContext):
+            return tuple(node.parents)
+        return (node.parentCtx,)
+
+    def executor(self, exe: Optional[LexerActionExecutor]) -> int:
+        if exe is None:
+            return -1
+        if id(exe) in self.exec_ids:
+            return self.exec_ids[id(exe)]
+        actions = []
+        for action in exe.lexerActions:
+            if isinstance(action, LexerIndexedCustomAction):
+                actions.append((action.offset, self._action(action.action)))
+            else:
+                actions.append((-1, self._action(action)))
+        self.exec_ids[id(exe)] = len(self.executors)
+        self.executors.append(tuple(actions))
+        return self.exec_ids[id(exe)]
+
+    def _action(self, action) -> int:
+        if id(action) in self.action_index:
+            return self.action_index[id(action)]
+        for i, a in enumerate(self.atn.lexerActions):
+            if a == action:
+                return i
+        raise DFACacheError("Ação de lexer fora da tabela do ATN")
+
+    def config(self, cfg: ATNConfig) -> tuple:
+        if cfg.semanticContext is not SemanticContext.NONE:
+            raise DFACacheError("Predicados semânticos não são suportados no snapshot")
+        entry = (cfg.state.stateNumber, cfg.alt, self.context(cfg.context),
+                 cfg.reachesIntoOuterContext, cfg.precedenceFilterSuppressed)
+        if self.is_lexer:
+            entry += (self.executor(cfg.lexerActionExecutor), cfg.passedThroughNonGreedyDecision)
+        return entry
+
+    def config_set(self, configs: ATNConfigSet) -> tuple:
+        conflicting = None if configs.conflictingAlts is None else tuple(sorted(configs.conflictingAlts))
+        return (tuple(self.config(c) for c in configs.configs), configs.fullCtx, configs.uniqueAlt,
+                conflicting, configs.hasSemanticContext, configs.dipsIntoOuterContext)
+
+    def state(self, s: DFAState) -> tuple:
+        if s.predicates is not None:
+            raise DFACacheError("Predicados semânticos não são suportados no snapshot")
+        edges = ()
+        n_edges = -1
+        if s.edges is not None:
+            n_edges = len(s.edges)
+            edges = tuple((i, _EDGE_ERROR if t is self.error_state else t.stateNumber)
+                          for i, t in enumerate(s.edges) if t is not None)
+        return (s.stateNumber, self.config_set(s.configs), n_edges, edges, s.isAcceptState,
+                s.prediction, self.executor(s.lexerActionExecutor), s.requiresFullContext)
+
+    def dfa(self, dfa: DFA) -> tuple:
+        if dfa.precedenceDfa:
+            raise DFACacheError("DFAs de precedência não são suportados no snapshot")
+        states = tuple(self.state(s) for s in dfa._states)
+        s0 = -1 if dfa.s0 is None else dfa.s0.stateNumber
+        return (dfa.decision, s0, states)
+
+
+def _encode(decisions_to_dfa, atn, is_lexer: bool) -> tuple:
+    enc = _Encoder(atn, is_lexer)
+    dfas = tuple(enc.dfa(d) for d in decisions_to_dfa)
+    return (tuple(enc.contexts), tuple(enc.executors), dfas)
+
+
+# ============================================================================
+# DESSERIALIZAÇÃO
+# ============================================================================
+
+
+def _decode(payload, decisions_to_dfa, atn, is_lexer: bool, context_cache=None) -> List[DFA]:
+    """Reconstrói os DFAs a partir do payload (sem alterar os DFAs atuais)"""
+    raw_contexts, raw_executors, raw_dfas = payload
+    if len(raw_dfas) != len(decisions_to_dfa):
+        raise DFACacheError("Número de decisões diferente do ATN atual")
+
+    contexts: List[PredictionContext] = []
+    for entry in raw_contexts:
+        if entry[0] == "e":
+            ctx = PredictionContext.EMPTY
+        elif entry[0] == "s":
+            parent = None if entry[1] < 0 else contexts[entry[1]]
+            ctx = SingletonPredictionContext.create(parent, entry[2])
+        else:
+            parents = [None if p < 0 else contexts[p] for p in entry[1]]
+            ctx = ArrayPredictionContext(parents, list(entry[2]))
+        if context_cache is not None:
+            ctx = context_cache.add(ctx)
+        contexts.append(ctx)
+
+    lexer_actions = atn.lexerActions or []
+    executors = []
+    for actions in raw_executors:
+        built = []
+        for offset, idx in actions:
+            action = lexer_actions[idx]
+            built.append(action if offset < 0 else LexerIndexedCustomAction(offset, action))
+        executors.append(LexerActionExecutor(built))
+
+    states_by_number = atn.states
+    error_state = _error_state(is_lexer)
+    result = []
+    for decision, (raw_decision, s0_number, raw_states) in enumerate(raw_dfas):
+        if raw_decision != decision:
+            raise DFACacheError("Decisões fora de ordem no snapshot")
+        dfa = DFA(atn.decisionToState[decision], decision)
+        by_number: Dict[int, DFAState] = {}
+        pending_edges = []
+        for (number, raw_configs, n_edges, edges, is_accept, prediction, exe_id,
+             full_ctx) in raw_states:
+            cfgs, full, unique_alt, conflicting, has_sem, dips = raw_configs
+            configs = ATNConfigSet(full)
+            for c in cfgs:
+                state = states_by_number[c[0]]
+                ctx = None if c[2] < 0 else contexts[c[2]]
+                if is_lexer:
+                    cfg = LexerATNConfig(state, c[1], ctx,
+                                         lexerActionExecutor=None if c[5] < 0 else executors[c[5]])
+                    cfg.passedThroughNonGreedyDecision = c[6]
+                else:
+                    cfg = ATNConfig(state, c[1], ctx)
+                cfg.reachesIntoOuterContext = c[3]
+                cfg.precedenceFilterSuppressed = c[4]
+                configs.add(cfg)
+            configs.uniqueAlt = unique_alt
+            configs.conflictingAlts = None if conflicting is None else set(conflicting)
+            configs.hasSemanticContext = has_sem
+            configs.dipsIntoOuterContext = dips
+            configs.setReadonly(True)
+
+            s = DFAState(number, configs)
+            s.isAcceptState = is_accept
+            s.prediction = prediction
+            s.lexerActionExecutor = None if exe_id < 0 else executors[exe_id]
+            s.requiresFullContext = full_ctx
+            if n_edges >= 0:
+                s.edges = [None] * n_edges
+                pending_edges.append((s, edges))
+            by_number[number] = s
+            dfa._states[s] = s
+
+        for s, edges in pending_edges:
+            for i, target in edges:
+                s.edges[i] = error_state if target == _EDGE_ERROR else by_number[target]
+        if s0_number >= 0:
+            dfa.s0 = by_number[s0_number]
+        result.append(dfa)
+    return result
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+
+def load_dfa_cache(path: str = DEFAULT_CACHE_PATH) -> str:
+    """Carrega o snapshot nos DFAs compartilhados do lexer e do parser.
+
+    Retorna o status: "carregado", "ausente", "obsoleto" ou "corrompido".
+    Em caso de snapshot obsoleto/corrompido os DFAs continuam vazios e o
+    arquivo é removido (será regravado por save_dfa_cache).
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return "ausente"
+
+    try:
+        snapshot = marshal.loads(data)
+        if not isinstance(snapshot, dict) or snapshot.get("format") != FORMAT_VERSION:
+            raise DFACacheError("Formato desconhecido")
+        if snapshot.get("key") != grammar_key():
+            _remove(path)
+            return "obsoleto"
+        lexer_dfas = _decode(snapshot["lexer"], TypeScriptLexer.decisionsToDFA,
+                             TypeScriptLexer.atn, True)
+        parser_dfas = _decode(snapshot["parser"], TypeScriptParser.decisionsToDFA,
+                              TypeScriptParser.atn, False, TypeScriptParser.sharedContextCache)
+    except Exception:
+        _remove(path)
+        return "corrompido"
+
+    # Só instala depois de tudo reconstruído: falhas não deixam DFAs pela metade
+    TypeScriptLexer.decisionsToDFA[:] = lexer_dfas
+    TypeScriptParser.decisionsToDFA[:] = parser_dfas
+    return "carregado"
+
+
+def save_dfa_cache(path: str = DEFAULT_CACHE_PATH) -> bool:
+    """Grava o snapshot dos DFAs atuais (escrita atômica). Retorna True se gravou."""
+    try:
+        snapshot = {
+            "format": FORMAT_VERSION,
+            "key": grammar_key(),
+            "lexer": _encode(TypeScriptLexer.decisionsToDFA, TypeScriptLexer.atn, True),
+            "parser": _encode(TypeScriptParser.decisionsToDFA, TypeScriptParser.atn, False),
+        }
+    except DFACacheError:
+        return False
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove(tmp_path)
+        return False
+    return True
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,251 @@
+"""
+Eliminação de código morto no programa inteiro, entre a análise semântica e a
+geração de Jasmin.
+
+O gerador emitia todas as funções, um campo estático por variável global e uma
+classe por interface, usadas ou não. eliminate_dead_code() parte do código de
+nível superior (o corpo do main) e mantém só o que é alcançável dali:
+
+1. Desvios com condição constante (literal booleano) são resolvidos: `if (false)`
+   fica só com o else, `if (true)` só com o then, `while (false)` some e
+   `for (init; false; ...)` fica só com o init.
+2. Alcançabilidade por nomes, com uma lista de trabalho: os statements do main
+   mencionam nomes (identificadores); um nome de função torna a função alcançável,
+   e os nomes mencionados no corpo dela (já sem os desvios mortos) entram na lista.
+   Uma variável global cujo inicializador não tem efeitos (literais, variáveis,
+   operadores sem divisão) só é mantida se o seu nome for mencionado; com efeitos
+   (chamadas, atribuições, acessos a arrays, divisões), a declaração é mantida.
+3. Interfaces: mantidas as que aparecem no tipo de algum nó alcançável (em
+   SemanticAnalyzer.types), de uma global mantida ou de um campo de uma interface
+   mantida.
+
+Nomes são comparados sem considerar escopo (uma variável local com o nome de uma
+global mantém a global), o que só deixa de remover código, nunca remove demais.
+
+O programa original não é alterado: os statements com desvios removidos são
+copiados (as funções copiadas recebem o tipo de retorno da original em
+SemanticAnalyzer.types) e o resto é compartilhado. O percurso usa
+TypeScriptWalk.walk, sem limite de aninhamento.
+"""
+
+from typing import Dict, List
+
+from TypeScriptAST import (
+    ArrayLiteral, BinaryExpr, Block, ForStmt, FunctionDecl, Identifier, IfStmt, InterfaceDecl,
+    Literal, Node, ObjectLiteral, Program, UnaryExpr, VarDecl, WhileStmt, preorder,
+)
+from TypeScriptSemantic import ArrayType, InterfaceType
+from TypeScriptWalk import dispatch_table, walk
+
+# Nós de expressão sem efeitos colaterais (BinaryExpr só sem / e %, que podem falhar)
+_PURE = frozenset((Literal, Identifier, ArrayLiteral, ObjectLiteral, UnaryExpr, BinaryExpr))
+
+
+def _constant(cond):
+    """True/False para um literal booleano, None para qualquer outra condição"""
+    if type(cond) is Literal and cond.kind == "boolean":
+        return cond.text == "true"
+    return None
+
+
+def _is_pure(expr) -> bool:
+    for node in preorder(expr):
+        if type(node) not in _PURE:
+            return False
+        if type(node) is BinaryExpr and ("/" in node.ops or "%" in node.ops):
+            return False
+    return True
+
+
+class DeadCode:
+    """Resultado da eliminação: o programa podado, as globais e interfaces que o
+    gerador deve emitir e o que foi removido"""
+
+    def __init__(self, program, global_vars: dict, interfaces: dict, functions: List[str],
+                 globals_: List[str], interface_names: List[str], branches: list):
+        self.program = program            # Program só com o código alcançável
+        self.global_vars = global_vars    # {nome: VarSymbol} mantidas
+        self.interfaces = interfaces      # {nome: InterfaceType} mantidas
+        self.removed_functions = functions
+        self.removed_globals = globals_
+        self.removed_interfaces = interface_names
+        self.removed_branches = branches  # [(tipo do statement, linha, coluna)]
+
+    def removed_anything(self) -> bool:
+        return bool(self.removed_functions or self.removed_globals
+                    or self.removed_interfaces or self.removed_branches)
+
+    def report(self, max_names: int = 10) -> List[str]:
+        """Linhas do relatório: contagens e os primeiros nomes de cada categoria"""
+        lines = [f"Código morto removido: {len(self.removed_functions)} função(ões), "
+                 f"{len(self.removed_globals)} global(is), "
+                 f"{len(self.removed_interfaces)} interface(s), "
+                 f"{len(self.removed_branches)} desvio(s) com condição constante"]
+        branches = [f"{kind} na linha {line}" for kind, line, _ in self.removed_branches]
+        for label, names in (("funções", self.removed_functions),
+                             ("globais", self.removed_globals),
+                             ("interfaces", self.removed_interfaces),
+                             ("desvios", branches)):
+            if names:
+                shown = ", ".join(names[:max_names])
+                more = f" (+{len(names) - max_names})" if len(names) > max_names else ""
+                lines.append(f"  {label}: {shown}{more}")
+        return lines
+
+
+class _BranchPruner:
+    """Visitor (percorrido por walk) que devolve cada statement sem os desvios de
+    condição constante; o próprio nó quando nada muda, None quando ele some"""
+
+    def __init__(self, types: dict):
+        self.types = types
+        self.branches = []
+        self.dispatch = dispatch_table(self)
+
+    def _same(self, node):
+        return node
+
+    # Expressões e declarações não contêm statements
+    visitLiteral = visitIdentifier = visitArrayLiteral = visitObjectLiteral = _same
+    visitPostfixExpr = visitUnaryExpr = visitBinaryExpr = visitAssignExpr = _same
+    visitVarDecl = visitInterfaceDecl = visitReturnStmt = visitExprStmt = _same
+
+    def visitProgram(self, node):
+        raise TypeError("Program é podado por eliminate_dead_code")
+
+    def visitBlock(self, node):
+        body = []
+        for stmt in node.body:
+            pruned = yield stmt
+            if pruned is not None:
+                body.append(pruned)
+        if len(body) == len(node.body) and all(a is b for a, b in zip(body, node.body)):
+            return node
+        return Block(body, node.line, node.column)
+
+    def visitFunctionDecl(self, node):
+        body = yield node.body
+        if body is node.body:
+            return node
+        pruned = FunctionDecl(node.name, node.params, node.return_type, body,
+                              node.line, node.column)
+        self.types[pruned] = self.types[node]
+        return pruned
+
+    def visitIfStmt(self, node):
+        constant = _constant(node.cond)
+        if constant is not None:
+            self.branches.append(("if", node.line, node.column))
+            return (yield node.then if constant else node.else_)
+        then = yield node.then
+        else_ = yield node.else_
+        if then is node.then and else_ is node.else_:
+            return node
+        return IfStmt(node.cond, then, else_, node.line, node.column)
+
+    def visitWhileStmt(self, node):
+        if _constant(node.cond) is False:
+            self.branches.append(("while", node.line, node.column))
+            return None
+        body = yield node.body
+        if body is node.body:
+            return node
+        return WhileStmt(node.cond, body, node.line, node.column)
+
+    def visitForStmt(self, node):
+        if _constant(node.cond) is False:
+            self.branches.append(("for", node.line, node.column))
+            return node.init
+        body = yield node.body
+        if body is node.body:
+            return node
+        return ForStmt(node.init, node.cond, node.update, body, node.line, node.column)
+
+
+def _interface_names(t, found: set):
+    """Interfaces declaradas mencionadas por um tipo (arrays e objetos literais inclusos)"""
+    while type(t) is ArrayType:
+        t = t.elem
+    if type(t) is InterfaceType:
+        if t.id == "<obj-literal>":
+            for prop in t.props.values():
+                _interface_names(prop, found)
+        else:
+            found.add(t.id)
+
+
+def eliminate_dead_code(program, analyzer) -> DeadCode:
+    """Poda o programa (TypeScriptAST.Program) já analisado sem erros por `analyzer`"""
+    types = analyzer.types
+    pruner = _BranchPruner(types)
+    body = program.body
+
+    # Declarações de nível superior alcançadas por nome
+    functions: Dict[str, FunctionDecl] = {}
+    pure_globals: Dict[str, VarDecl] = {}
+    roots = []
+    for stmt in body:
+        if type(stmt) is FunctionDecl:
+            functions[stmt.name] = stmt
+        elif type(stmt) is VarDecl and (stmt.init is None or _is_pure(stmt.init)):
+            pure_globals[stmt.name] = stmt
+        elif type(stmt) is not InterfaceDecl:
+            roots.append(stmt)
+
+    kept: Dict[Node, Node] = {}  # statement original → podado (None: removido)
+    referenced, pending = set(), list(roots)
+    type_objects = set()
+    while pending:
+        stmt = pending.pop()
+        pruned = kept[stmt] = walk(pruner, stmt)
+        if pruned is None:
+            continue
+        for node in preorder(pruned):
+            cls = type(node)
+            if cls is Identifier or (cls is VarDecl and node.init is None):
+                name = node.name
+                if name not in referenced:
+                    referenced.add(name)
+                    declaration = functions.get(name) or pure_globals.get(name)
+                    if declaration is not None and declaration not in kept:
+                        pending.append(declaration)
+            t = types.get(node)
+            if t is not None:
+                type_objects.add(t)
+
+    global_vars = {name: symbol for name, symbol in analyzer.sym.global_vars.items()
+                   if name in referenced}
+    used_interfaces = set()
+    for t in type_objects:
+        _interface_names(t, used_interfaces)
+    for symbol in global_vars.values():
+        _interface_names(symbol.type, used_interfaces)
+    # Campos de interfaces mantidas mantêm as interfaces dos seus tipos
+    declared = analyzer.sym.interfaces
+    pending_names = list(used_interfaces)
+    while pending_names:
+        iface = declared.get(pending_names.pop())
+        if iface is None:
+            continue
+        for prop in iface.props.values():
+            found = set()
+            _interface_names(prop, found)
+            pending_names.extend(found - used_interfaces)
+            used_interfaces |= found
+
+    new_body = []
+    for stmt in body:
+        if type(stmt) is InterfaceDecl:
+            if stmt.name in used_interfaces:
+                new_body.append(stmt)
+        elif kept.get(stmt) is not None:
+            new_body.append(kept[stmt])
+
+    return DeadCode(
+        Program(new_body, program.line, program.column),
+        global_vars,
+        {name: iface for name, iface in declared.items() if name in used_interfaces},
+        [name for name, stmt in functions.items() if stmt not in kept],
+        [name for name in analyzer.sym.global_vars if name not in referenced],
+        [name for name in declared if name not in used_interfaces],
+        sorted(pruner.branches, key=lambda branch: branch[1:]))
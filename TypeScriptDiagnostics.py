@@ -0,0 +1,108 @@
+"""
+Diagnósticos estruturados do compilador.
+
+Cada erro é um Diagnostic com código, severidade, posição (linha, coluna) e
+argumentos; a mensagem em português só é montada quando pedida (`message`,
+`str()`), a partir do modelo do código em MESSAGES. Assim os analisadores
+registram erros sem formatar texto, e ferramentas (e os testes) consomem os
+campos diretamente, por exemplo pela saída `--diagnostics=json` do main.py.
+
+O formato textual continua o de sempre: `Linha L:C - mensagem`, ou
+`ERRO: mensagem` para diagnósticos sem posição.
+"""
+
+from typing import Optional
+
+# Severidades
+ERROR = "error"
+
+# Código → modelo da mensagem ({0}, {1}, ... são os argumentos)
+MESSAGES = {
+    # Léxico e sintaxe (mensagem do ANTLR)
+    "syntax": "{0}",
+    # Declarações
+    "undeclared-interface": "Interface '{0}' não declarada",
+    "duplicate-interface": "Interface '{0}' já declarada",
+    "duplicate-variable": "Variável '{0}' já declarada",
+    "duplicate-function": "Função '{0}' já declarada",
+    "const-without-initializer": "Variável const '{0}' deve ser inicializada na declaração",
+    "initializer-type": "Tipo do inicializador incompatível: esperado {0} mas foi {1}",
+    # Objetos literais atribuídos a interfaces
+    "missing-field": "Campo '{0}' ausente no objeto literal para a interface {1}",
+    "field-type": "Tipo do campo '{0}' incompatível: esperado {1} mas foi {2}",
+    "extra-field": "Campo extra '{0}' no objeto literal não declarado na interface {1}",
+    # Funções e retorno
+    "missing-return": "Função '{0}' deve retornar um valor do tipo {1}",
+    "void-return-value": "Função do tipo void não deve retornar expressão",
+    "return-type": "Tipo de retorno incompatível. Esperado {0} mas foi {1}",
+    "print-argument": "Função nativa 'print' aceita apenas string, number ou boolean",
+    "read-arguments": "Função nativa 'read' não aceita argumentos",
+    # Comandos
+    "condition-type": "Condição de {0} deve ser do tipo boolean",
+    # Expressões
+    "undeclared-variable": "Variável '{0}' não declarada",
+    "heterogeneous-array": "Array heterogêneo: elementos têm tipos diferentes ({0} vs {1})",
+    "index-non-array": "Acesso de array em tipo não-array",
+    "push-arity": "Método 'push' do array requer exatamente 1 argumento",
+    "push-type": "Argumento de 'push' deve ter tipo {0}, mas tem {1}",
+    "method-arguments": "Método '{0}' do array não aceita argumentos",
+    "unknown-array-method": "Array não possui método '{0}'",
+    "array-property": "Array não possui propriedades acessíveis",
+    "unknown-field": "Campo '{0}' não existe na interface '{1}'",
+    "member-non-interface": "Acesso de propriedade em tipo não-interface",
+    "number-operands": "Operador '{0}' requer operandos do tipo number",
+    "same-type-operands": "Operador '{0}' requer operandos do mesmo tipo",
+    "boolean-operands": "Operador '{0}' requer operandos do tipo boolean",
+    "assignment-target": "Lado esquerdo da atribuição deve ser uma variável, campo ou elemento de array",
+    "const-assignment": "Não é possível reatribuir variável const '{0}'",
+    "assignment-type": "Tipos incompatíveis na atribuição: não é possível atribuir {0} a {1}",
+    # Falha interna do compilador (exceção)
+    "internal": "{0}",
+}
+
+
+class DiagnosticLimit(Exception):
+    """Limite de erros atingido: interrompe a análise semântica"""
+
+
+class Diagnostic:
+    """Erro (ou aviso) em uma posição do fonte; a mensagem é formatada sob demanda"""
+
+    __slots__ = ("code", "severity", "line", "column", "args")
+
+    def __init__(self, code: str, line: Optional[int], column: Optional[int],
+                 args: tuple = (), severity: str = ERROR):
+        self.code = code
+        self.severity = severity
+        self.line = line        # None: diagnóstico sem posição
+        self.column = column
+        self.args = args        # strings (nomes e tipos já convertidos em texto)
+
+    @property
+    def message(self) -> str:
+        return MESSAGES[self.code].format(*self.args)
+
+    def at(self, line: Optional[int], column: Optional[int]) -> "Diagnostic":
+        """O mesmo diagnóstico em outra posição"""
+        return Diagnostic(self.code, line, column, self.args, self.severity)
+
+    def to_dict(self) -> dict:
+        return {"code": self.code, "severity": self.severity, "line": self.line,
+                "column": self.column, "args": list(self.args), "message": self.message}
+
+    def __str__(self):
+        if self.line is None:
+            return f"ERRO: {self.message}"
+        return f"Linha {self.line}:{self.column} - {self.message}"
+
+    def __repr__(self):
+        return f"Diagnostic({self.code!r}, {self.line}, {self.column}, {self.args!r})"
+
+    def _key(self):
+        return (self.code, self.severity, self.line, self.column, self.args)
+
+    def __eq__(self, other):
+        return type(other) is Diagnostic and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
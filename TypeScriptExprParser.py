@@ -0,0 +1,306 @@
+"""
+Parser de expressões por precedência (precedence climbing, estilo Pratt).
+
+`TypeScriptPrattParser` é o parser gerado com a regra `expression` substituída.
+As regras de statement continuam sendo as do ANTLR; ao chegar em uma expressão,
+em vez de descer pelas ~10 regras da cadeia de precedência (assignmentExpr →
+logicalOrExpr → … → primary), um laço de precedência consome os tokens e monta
+diretamente os nós planos de TypeScriptAST. O ExpressionContext devolvido não tem
+filhos: o nó fica em `ctx.node`.
+
+Operadores, precedência e associatividade são os de TypeScript.g4:
+- atribuição: associativa à direita, o alvo é validado na semântica;
+- || < && < (== !=) < (< <= > >=) < (+ -) < (* / %), todos associativos à esquerda;
+- prefixos (! -) e pós-fixos ([expr] .id (args)).
+
+Os níveis da expressão são geradores executados com uma pilha explícita (_run),
+como os visitors de TypeScriptWalk: uma subexpressão aninhada é pedida com
+`yield`, e a profundidade das expressões não esbarra no limite de recursão.
+
+Erros de sintaxe passam pelo `_errHandler` do parser, como nas regras geradas:
+tokens de fechamento são casados no estado correspondente do ATN (recuperação
+inline por inserção/remoção de um token) e os demais erros viram
+RecognitionException, relatada e recuperada em `expression`. Com o
+BailErrorStrategy (estágio SLL de parse_program) qualquer erro aborta o parsing.
+"""
+
+import sys
+
+from antlr4.IntervalSet import IntervalSet
+from antlr4.atn.Transition import AtomTransition
+from antlr4.error.Errors import InputMismatchException, RecognitionException
+
+from TypeScriptAST import (
+    BINARY_PRECEDENCE, ArrayLiteral, AssignExpr, BinaryExpr, CallOp, Identifier,
+    IndexOp, Literal, MemberOp, ObjectLiteral, PostfixExpr, UnaryExpr,
+)
+from TypeScriptParser import TypeScriptParser
+
+
+def _literal_token_types() -> dict:
+    """Mapeia o texto de cada token literal da gramática para seu tipo"""
+    return {name[1:-1]: ttype
+            for ttype, name in enumerate(TypeScriptParser.literalNames)
+            if name.startswith("'")}
+
+
+_P = TypeScriptParser
+_T = _literal_token_types()
+_LBRACE, _RBRACE = _T["{"], _T["}"]
+_LPAREN, _RPAREN = _T["("], _T[")"]
+_LBRACK, _RBRACK = _T["["], _T["]"]
+_COLON, _COMMA, _DOT = _T[":"], _T[","], _T["."]
+_ASSIGN, _NOT, _MINUS = _T["="], _T["!"], _T["-"]
+_ID, _STRING = TypeScriptParser.ID, TypeScriptParser.STRING
+
+_PRECEDENCE = {_T[op]: prec for op, prec in BINARY_PRECEDENCE.items()}
+
+_intern = sys.intern
+
+_LITERAL_KINDS = {
+    TypeScriptParser.NUMBER_LIT: "number",
+    TypeScriptParser.STRING: "string",
+    TypeScriptParser.BOOLEAN_LIT: "boolean",
+}
+
+# Estado inicial da regra expression no ATN (usado em enterRule, como no código gerado)
+_EXPRESSION_STATE = TypeScriptParser.atn.ruleToStartState[TypeScriptParser.RULE_expression].stateNumber
+
+
+def _match_state(rule: int, ttype: int) -> int:
+    """Estado do ATN, dentro da regra, que casa o token ttype.
+
+    Antes de casar um token de fechamento o parser se posiciona nesse estado, como
+    faz o código gerado; assim a recuperação inline do DefaultErrorStrategy
+    (inserção/remoção de um único token) funciona e gera as mesmas mensagens.
+    """
+    states = [s.stateNumber for s in _P.atn.states
+              if s.ruleIndex == rule and len(s.transitions) == 1
+              and isinstance(s.transitions[0], AtomTransition)
+              and s.transitions[0].label_ == ttype]
+    assert len(states) == 1, (rule, ttype, states)
+    return states[0]
+
+
+_MEMBER_NAME = _match_state(_P.RULE_postfixOp, _ID)
+_INDEX_CLOSE = _match_state(_P.RULE_postfixOp, _RBRACK)
+_CALL_CLOSE = _match_state(_P.RULE_postfixOp, _RPAREN)
+_PAREN_CLOSE = _match_state(_P.RULE_primary, _RPAREN)
+_ARRAY_CLOSE = _match_state(_P.RULE_arrayLiteral, _RBRACK)
+_OBJECT_CLOSE = _match_state(_P.RULE_objectLiteral, _RBRACE)
+_PROP_COLON = _match_state(_P.RULE_propAssign, _COLON)
+
+
+def _token_set(*types) -> IntervalSet:
+    result = IntervalSet()
+    for ttype in types:
+        result.addOne(ttype)
+    return result
+
+
+# FIRST(expression): tokens que podem iniciar uma expressão
+_EXPRESSION_START = _token_set(_LBRACE, _LPAREN, _LBRACK, _MINUS, _NOT, _ID,
+                               *_LITERAL_KINDS)
+
+
+class ExpressionMismatch(InputMismatchException):
+    """Token inesperado dentro de uma expressão.
+
+    O conjunto esperado é informado explicitamente (não há estado do ATN que o
+    descreva), e a mensagem segue o formato do DefaultErrorStrategy:
+    "mismatched input X expecting Y".
+    """
+
+    def __init__(self, recognizer, expected: IntervalSet):
+        super().__init__(recognizer)
+        self.expected = expected
+
+    def getExpectedTokens(self):
+        return self.expected
+
+
+class TypeScriptPrattParser(TypeScriptParser):
+    """TypeScriptParser com `expression` resolvida por precedence climbing"""
+
+    def expression(self):
+        localctx = TypeScriptParser.ExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, _EXPRESSION_STATE, self.RULE_expression)
+        try:
+            localctx.node = self._run(self._assignment())
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+    @staticmethod
+    def _run(parse):
+        """Executa o gerador `parse` com uma pilha explícita. Cada subexpressão
+        aninhada (parênteses, índice, argumento, elemento, valor de propriedade,
+        lado direito de `=`) é pedida com `yield self._assignment()` e recebe o nó"""
+        stack = [parse]
+        node = None
+        while True:
+            try:
+                stack.append(stack[-1].send(node))
+                node = None
+            except StopIteration as done:
+                stack.pop()
+                node = done.value
+                if not stack:
+                    return node
+
+    # ------------------------------------------------------------------------
+    # Tokens
+    # ------------------------------------------------------------------------
+
+    def _advance(self):
+        """Consome e retorna o token atual (equivalente a um match bem-sucedido)"""
+        token = self._input.LT(1)
+        self._input.consume()
+        if self._errHandler.errorRecoveryMode:
+            self._errHandler.reportMatch(self)
+        return token
+
+    def _expect(self, ttype: int, state: int):
+        """Casa ttype no estado `state` do ATN; se não casar, delega ao _errHandler"""
+        if self._input.LA(1) == ttype:
+            return self._advance()
+        self.state = state
+        return self._errHandler.recoverInline(self)
+
+    # ------------------------------------------------------------------------
+    # Níveis da expressão
+    # ------------------------------------------------------------------------
+
+    def _assignment(self):
+        """logicalOr ('=' assignment)?"""
+        start = self._input.LT(1)
+        target = yield from self._binary(1)
+        if self._input.LA(1) != _ASSIGN:
+            return target
+        self._advance()
+        value = yield self._assignment()
+        return AssignExpr(target, value, start.line, start.column)
+
+    def _binary(self, min_prec: int):
+        """Operadores binários com precedência >= min_prec.
+
+        Cada nível gera um único BinaryExpr com todos os operandos consecutivos
+        daquele nível (a + b - c), igual aos filhos da regra correspondente.
+        """
+        start = self._input.LT(1)
+        left = yield from self._unary()
+        prec = _PRECEDENCE.get(self._input.LA(1))
+        while prec is not None and prec >= min_prec:
+            level = prec
+            ops = []
+            operands = [left]
+            while prec == level:
+                ops.append(_intern(self._advance().text))
+                operands.append((yield from self._binary(level + 1)))
+                prec = _PRECEDENCE.get(self._input.LA(1))
+            left = BinaryExpr(ops, operands, start.line, start.column)
+        return left
+
+    def _unary(self):
+        """('!' | '-')* postfix"""
+        start = self._input.LT(1)
+        if start.type != _NOT and start.type != _MINUS:
+            return (yield from self._postfix())
+        ops = []
+        la = start.type
+        while la == _NOT or la == _MINUS:
+            ops.append(_intern(self._advance().text))
+            la = self._input.LA(1)
+        operand = yield from self._postfix()
+        return UnaryExpr(ops, operand, start.line, start.column)
+
+    def _postfix(self):
+        """primary ('[' expression ']' | '.' ID | '(' args ')')*"""
+        start = self._input.LT(1)
+        primary = yield from self._primary()
+        ops = []
+        while True:
+            la = self._input.LA(1)
+            if la == _DOT:
+                self._advance()
+                ops.append(MemberOp(_intern(self._expect(_ID, _MEMBER_NAME).text)))
+            elif la == _LPAREN:
+                self._advance()
+                ops.append(CallOp((yield from self._list(_RPAREN, _CALL_CLOSE))))
+            elif la == _LBRACK:
+                self._advance()
+                index = yield self._assignment()
+                self._expect(_RBRACK, _INDEX_CLOSE)
+                ops.append(IndexOp(index))
+            else:
+                break
+        if not ops:
+            return primary
+        return PostfixExpr(primary, ops, start.line, start.column)
+
+    def _primary(self):
+        token = self._input.LT(1)
+        ttype = token.type
+        if ttype == _ID:
+            self._advance()
+            return Identifier(_intern(token.text), token.line, token.column)
+        kind = _LITERAL_KINDS.get(ttype)
+        if kind is not None:
+            self._advance()
+            return Literal(kind, token.text, token.line, token.column)
+        if ttype == _LPAREN:
+            # Parênteses não geram nó, como em TypeScriptLowering: `(a) = 1` é uma
+            # atribuição a `a` (válida em TypeScript) e `(f()) = 1` é recusada pela
+            # semântica (assignment-target) nos dois parsers de expressões
+            self._advance()
+            inner = yield self._assignment()
+            self._expect(_RPAREN, _PAREN_CLOSE)
+            return inner
+        if ttype == _LBRACK:
+            self._advance()
+            elements = yield from self._list(_RBRACK, _ARRAY_CLOSE)
+            return ArrayLiteral(elements, token.line, token.column)
+        if ttype == _LBRACE:
+            self._advance()
+            props = yield from self._props()
+            return ObjectLiteral(props, token.line, token.column)
+        raise ExpressionMismatch(self, _EXPRESSION_START)
+
+    def _list(self, close: int, close_state: int) -> list:
+        """(expression (',' expression)*)? seguido do token de fechamento"""
+        items = []
+        if self._input.LA(1) != close:
+            items.append((yield self._assignment()))
+            while self._input.LA(1) == _COMMA:
+                self._advance()
+                items.append((yield self._assignment()))
+        self._expect(close, close_state)
+        return items
+
+    def _props(self) -> list:
+        """(propAssign (',' propAssign)*)? '}' — propAssign: (STRING | ID) ':' expression"""
+        props = []
+        if self._input.LA(1) != _RBRACE:
+            props.append((yield from self._prop()))
+            while self._input.LA(1) == _COMMA:
+                self._advance()
+                props.append((yield from self._prop()))
+        self._expect(_RBRACE, _OBJECT_CLOSE)
+        return props
+
+    def _prop(self):
+        key = self._input.LT(1)
+        if key.type == _ID:
+            name = _intern(key.text)
+        elif key.type == _STRING:
+            name = _intern(key.text[1:-1])
+        else:
+            raise ExpressionMismatch(self, _token_set(_STRING, _ID))
+        self._advance()
+        self._expect(_COLON, _PROP_COLON)
+        value = yield self._assignment()
+        return name, value
@@ -0,0 +1,177 @@
+"""
+Reparsing incremental por statements de nível superior.
+
+parse_source(texto) faz o parsing completo e guarda, além do AST, a divisão do
+fonte em segmentos: um por statement de nível superior (a mesma varredura de
+TypeScriptParallelParse), com offset, linha e coluna do início e os nós do AST
+daquele statement.
+
+reparse(anterior, início, fim, novo) aplica a edição "substituir
+anterior.text[início:fim] por novo":
+- os segmentos que a edição toca, inclusive os que só encostam nela, formam a
+  região afetada. No texto novo a região vai até o primeiro limite de statement
+  que coincide com o início de um segmento antigo. Uma '{' sem par, por exemplo,
+  faz a região crescer;
+- só a região é relexada e reanalisada (parse_chunk), já nas posições do arquivo;
+- os segmentos antes da região são reaproveitados como estão. Os depois dela
+  também, com o início deslocado pela diferença de tamanho e de linhas da edição,
+  e de coluna para os que começam na linha em que a região termina.
+
+O deslocamento dos nós reaproveitados é adiado. Cada segmento lembra para qual
+posição de início seus nós foram calculados, e `program` só corrige os segmentos
+que se moveram. O custo de reparse depende do tamanho da região; do arquivo
+inteiro só vem a atualização de alguns inteiros por segmento.
+
+Se a região tiver erro léxico ou sintático, ou se o resultado anterior tinha
+erros, o arquivo inteiro é reanalisado: os erros relatados são sempre os do
+parsing completo, com as mesmas mensagens (SyntaxErrorStrategy não deixa a
+recuperação de erros de um parsing alterar a do seguinte). Os nós reaproveitados
+passam a pertencer ao novo resultado, e o anterior não deve mais ser usado.
+"""
+
+from bisect import bisect_right
+
+from antlr4 import CommonTokenStream, InputStream
+
+from TypeScriptAST import Program
+from TypeScriptParallelParse import iter_statement_offsets, parse_chunk, shift_positions
+from TypeScriptRegexLexer import create_lexer
+from TypeScriptSyntaxErrors import SyntaxErrorCollector
+
+
+class ParsedSource:
+    """Texto analisado, dividido em segmentos de um statement de nível superior"""
+
+    def __init__(self, text: str, options: tuple):
+        self.text = text
+        self.options = options   # (lexer_kind, expr_parser, parse_mode)
+        self.errors = []         # [Diagnostic] de sintaxe; com erros não há AST
+        self.starts = []         # offset do início de cada segmento
+        self.lines = []          # linha do início de cada segmento
+        self.columns = []        # coluna do início de cada segmento
+        self.bodies = []         # nós do AST de cada segmento
+        self.placed = []         # (linha, coluna) de início para a qual os nós foram calculados
+        self.position = (1, 0)   # posição do Program (primeiro token do arquivo)
+        self.reparsed = (0, len(text))  # trecho do texto relexado e reanalisado
+
+    @property
+    def program(self):
+        """Program do texto inteiro (None se houve erros de sintaxe)"""
+        if self.errors:
+            return None
+        body = []
+        for i, nodes in enumerate(self.bodies):
+            line, column = self.lines[i], self.columns[i]
+            placed_line, placed_column = self.placed[i]
+            if line != placed_line or column != placed_column:
+                shift_positions(nodes, line - placed_line, column - placed_column, placed_line)
+                self.placed[i] = (line, column)
+            body.extend(nodes)
+        return Program(body, *self.position)
+
+    def _set_region(self, start: int, end: int, line: int, body: list):
+        """Acrescenta os segmentos de text[start:end] (que começa na linha `line`)
+        a partir dos nós analisados da região"""
+        text = self.text
+        offsets = [start]
+        offsets.extend(iter_statement_offsets(text, start, end))
+        if len(offsets) != len(body):
+            # Não deveria acontecer; um segmento só para a região continua correto
+            offsets, bodies = [start], [body]
+        else:
+            bodies = [[node] for node in body]
+        previous = start
+        for offset, nodes in zip(offsets, bodies):
+            line += text.count("\n", previous, offset)
+            column = offset - text.rfind("\n", 0, offset) - 1
+            previous = offset
+            self.starts.append(offset)
+            self.lines.append(line)
+            self.columns.append(column)
+            self.bodies.append(nodes)
+            self.placed.append((line, column))
+
+
+def parse_source(text: str, lexer_kind: str = "antlr", expr_parser: str = "pratt",
+                 parse_mode: str = "auto") -> ParsedSource:
+    """Parsing completo de `text`, guardando os segmentos para reparse"""
+    from main import parse_program
+    from TypeScriptLowering import lower_program
+
+    source = ParsedSource(text, (lexer_kind, expr_parser, parse_mode))
+    errors = SyntaxErrorCollector()
+    lexer = create_lexer(InputStream(text), lexer_kind)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    tree, _ = parse_program(CommonTokenStream(lexer), parse_mode, expr_parser, errors)
+    if errors.count:
+        source.errors = errors.diagnostics()
+        return source
+    program = lower_program(tree)
+    source.position = (program.line, program.column)
+    source._set_region(0, len(text), 1, program.body)
+    return source
+
+
+def reparse(previous: ParsedSource, start: int, end: int, new_text: str) -> ParsedSource:
+    """Aplica a edição text[start:end] = new_text, reanalisando só os statements
+    de nível superior afetados"""
+    old = previous.text
+    if not 0 <= start <= end <= len(old):
+        raise ValueError(f"Edição fora do texto: [{start}, {end}) em {len(old)} caracteres")
+    text = old[:start] + new_text + old[end:]
+    if previous.errors:
+        return parse_source(text, *previous.options)
+
+    starts = previous.starts
+    delta = len(text) - len(old)
+    first = bisect_right(starts, start) - 1
+    if first > 0 and starts[first] == start:
+        first -= 1  # a edição encosta no fim do segmento anterior
+    last = bisect_right(starts, end) - 1
+
+    # Fim da região: primeiro limite de statement do texto novo, depois da edição,
+    # que coincide com o início (deslocado) de um segmento antigo
+    region_start = starts[first]
+    region_end = len(text)
+    following = len(starts)
+    edit_end = start + len(new_text)
+    for offset in iter_statement_offsets(text, region_start):
+        if offset < edit_end:
+            continue
+        index = bisect_right(starts, offset - delta, last + 1) - 1
+        if index > last and starts[index] == offset - delta:
+            region_end, following = offset, index
+            break
+
+    line = previous.lines[first]
+    result = parse_chunk(text[region_start:region_end], line, previous.columns[first],
+                         *previous.options)
+    if result is None:
+        return parse_source(text, *previous.options)
+    region, _ = result
+
+    source = ParsedSource(text, previous.options)
+    source.reparsed = (region_start, region_end)
+    source.position = (region.line, region.column) if first == 0 else previous.position
+    source.starts = starts[:first]
+    source.lines = previous.lines[:first]
+    source.columns = previous.columns[:first]
+    source.bodies = previous.bodies[:first]
+    source.placed = previous.placed[:first]
+    source._set_region(region_start, region_end, line, region.body)
+
+    if following < len(starts):
+        # Segmentos seguintes: mesmos nós, início deslocado pela edição
+        old_line, old_column = previous.lines[following], previous.columns[following]
+        new_line = line + text.count("\n", region_start, region_end)
+        new_column = region_end - text.rfind("\n", 0, region_end) - 1
+        line_delta, column_delta = new_line - old_line, new_column - old_column
+        same_line = bisect_right(previous.lines, old_line, following)
+        source.starts += [offset + delta for offset in starts[following:]]
+        source.lines += [n + line_delta for n in previous.lines[following:]]
+        source.columns += [n + column_delta for n in previous.columns[following:same_line]]
+        source.columns += previous.columns[same_line:]
+        source.bodies += previous.bodies[following:]
+        source.placed += previous.placed[following:]
+    return source
@@ -0,0 +1,311 @@
+"""
+Análise semântica incremental por statement de nível superior.
+
+O resultado é o de TwoPhaseAnalyzer (TypeScriptParallelSemantic), usado pelo
+main.py: os corpos de função enxergam todas as funções, interfaces e variáveis
+globais, então chamadas a funções declaradas mais adiante e leituras de globais
+declaradas depois da função são aceitas; o código de nível superior é verificado
+na ordem do arquivo.
+
+A fase 1 de TwoPhaseAnalyzer (TwoPhaseAnalyzer.declare: interfaces, assinaturas
+das funções, símbolos das variáveis globais) é refeita a cada chamada: não visita
+corpos nem inicializadores. A fase 2 de cada statement depende só:
+- do seu conteúdo;
+- dos símbolos globais que ele menciona: para uma função, como estão nas tabelas
+  da fase 1; para o código de nível superior, como estavam naquele ponto da ordem
+  do arquivo. Tipo das variáveis, assinatura das funções, forma das interfaces.
+
+Para cada statement, IncrementalAnalyzer guarda um resumo da fase 2. A chave do
+resumo junta:
+- o hash do conteúdo, com posições relativas ao início do statement, para que
+  linhas inseridas antes dele não o invalidem;
+- as assinaturas dos nomes que ele menciona.
+
+Para funções, esses nomes incluem as funções chamadas (as arestas de call_graph).
+Uma edição no corpo de uma função reanalisa só essa função. Uma mudança de
+assinatura também reanalisa quem a chama ou usa. Mudar a forma de uma interface
+reanalisa os statements que usam a interface ou variáveis e funções com ela no tipo.
+
+Os resumos não reanalisados são reaplicados no TwoPhaseAnalyzer novo: os símbolos
+que definiam voltam às tabelas globais, os tipos dos seus nós voltam a
+SemanticAnalyzer.types (lido pelo gerador de Jasmin) e os erros voltam à lista,
+depois dos erros da fase 1 do mesmo statement, com as posições corrigidas (ver
+tests/test_incremental_semantic.py).
+
+Os resumos ficam em memória, para editores e ferramentas que reanalisam o mesmo
+programa a cada alteração. Combinado com TypeScriptIncremental, que reaproveita
+os nós dos statements não editados, o hash de conteúdo desses statements também
+é reaproveitado.
+"""
+
+import hashlib
+import marshal
+from typing import Dict, List, Optional
+
+from TypeScriptAST import FunctionDecl, Identifier, InterfaceDecl, Node, TypeRef, VarDecl, preorder
+from TypeScriptDiagnostics import Diagnostic
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer, body_checker, check_bodies
+from TypeScriptSemantic import ArrayType, PrimitiveType, SemanticAnalyzer, Type
+
+
+class _RecordingDict(dict):
+    """Tabela global que anota os nomes escritos (os símbolos que cada statement define)"""
+    __slots__ = ("written",)
+
+    def __init__(self):
+        super().__init__()
+        self.written = set()
+
+    def __setitem__(self, key, value):
+        self.written.add(key)
+        super().__setitem__(key, value)
+
+
+class Summary:
+    """Resultado da análise de um statement de nível superior"""
+    __slots__ = ("errors", "variables", "functions", "interfaces", "calls", "stmt", "types")
+
+    def __init__(self, errors, variables, functions, interfaces, calls, stmt, types):
+        self.errors = errors          # [Diagnostic] da fase 2, com posição relativa (ver _relative)
+        self.variables = variables    # {nome: VarSymbol} globais definidas
+        self.functions = functions    # {nome: FuncSymbol}
+        self.interfaces = interfaces  # {nome: InterfaceType}
+        self.calls = calls            # {função: frozenset(chamadas)}
+        self.stmt = stmt              # statement analisado
+        self.types = types            # {nó de stmt: Type} da fase 2 (SemanticAnalyzer.types)
+
+
+def fingerprint(stmt) -> tuple:
+    """(hash do conteúdo com posições relativas ao statement, nomes mencionados)"""
+    base_line, base_column = stmt.line, stmt.column
+    flat, names = [], set()
+    stack = [stmt]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Node):
+            cls = type(value)
+            flat.append(cls.__name__)
+            if cls is Identifier or cls is TypeRef:
+                names.add(value.name)
+            elif cls is VarDecl or cls is FunctionDecl or cls is InterfaceDecl:
+                names.add(value.name)
+            for field in value._fields:
+                item = getattr(value, field)
+                if field == "line":
+                    flat.append(item - base_line)
+                elif field == "column":
+                    flat.append(item - base_column if value.line == base_line else item)
+                else:
+                    stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            flat.append(len(value))
+            stack.extend(reversed(value))
+        else:
+            flat.append(value)
+    key = hashlib.blake2b(marshal.dumps(tuple(flat)), digest_size=16).digest()
+    return key, tuple(sorted(names))
+
+
+def _relative(errors: List[Diagnostic], line: int, column: int) -> List[Diagnostic]:
+    """Diagnósticos com a posição relativa a (line, column): na linha do statement
+    a coluna também é relativa"""
+    result = []
+    for error in errors:
+        if error.line is None:
+            result.append(error)
+        elif error.line == line:
+            result.append(error.at(0, error.column - column))
+        else:
+            result.append(error.at(error.line - line, error.column))
+    return result
+
+
+def _absolute(errors: List[Diagnostic], line: int, column: int) -> List[Diagnostic]:
+    result = []
+    for error in errors:
+        if error.line is None:
+            result.append(error)
+        elif error.line == 0:
+            result.append(error.at(line, column + error.column))
+        else:
+            result.append(error.at(line + error.line, error.column))
+    return result
+
+
+class IncrementalAnalyzer:
+    """Reanalisa só os statements de nível superior cujo conteúdo ou cujas
+    dependências mudaram desde a chamada anterior de analyze()"""
+
+    def __init__(self):
+        self.analyzer: Optional[TwoPhaseAnalyzer] = None  # tabelas do último programa
+        self.rechecked: List[int] = []  # índices dos statements reanalisados na última chamada
+        self._summaries: Dict[tuple, Summary] = {}
+        self._fingerprints: Dict[int, tuple] = {}  # id(stmt) → (stmt, hash, nomes)
+        self._versions: Dict[str, int] = {}  # versão (forma) de cada interface global
+        # Tipos por nó do último programa (analyzer.types), atualizados só nos
+        # statements que mudaram, os resumos usados para montá-los e os tipos da fase 1
+        self._types: Dict[Node, Type] = {}
+        self._used: List[Summary] = []
+        self._declared_types: Dict[Node, Type] = {}
+
+    def analyze(self, program) -> List[Diagnostic]:
+        """Analisa o programa (TypeScriptAST.Program) e retorna a lista de erros,
+        igual à de TwoPhaseAnalyzer().analyze(program)"""
+        body = program.body
+        analyzer = TwoPhaseAnalyzer()
+        declared = [[] for _ in body]  # erros da fase 1 de cada statement
+        declared_types = analyzer.types = {}
+        _, global_vars = analyzer.declare(body, declared)
+        checker = body_checker(*analyzer.tables(global_vars))
+        sym = analyzer.sym
+        for table in ("global_vars", "global_funcs", "global_interfaces"):
+            recording = _RecordingDict()
+            recording.update(getattr(sym, table))
+            setattr(sym, table, recording)
+
+        previous, previous_fingerprints = self._summaries, self._fingerprints
+        self._summaries, self._fingerprints, self._versions = {}, {}, {}
+        for name, iface in sym.global_interfaces.items():
+            self._versions[name] = self._version(name, iface)
+        self.rechecked = []
+        errors: List[Diagnostic] = []
+        previous_used, used, new = self._used, [], []
+        # Assinaturas nas tabelas da fase 1, que não mudam durante a fase 2, e os
+        # nomes que a fase 2 registra nas tabelas globais (funções e interfaces
+        # internas, vistas pelos corpos verificados de novo)
+        declared_signatures, nested = {}, set()
+
+        for index, stmt in enumerate(body):
+            cached = previous_fingerprints.get(id(stmt))
+            if cached is not None and cached[0] is stmt:
+                _, key, names = cached
+            else:
+                key, names = fingerprint(stmt)
+            self._fingerprints[id(stmt)] = (stmt, key, names)
+
+            if type(stmt) is FunctionDecl:
+                # O corpo é verificado com as tabelas da fase 1
+                signatures = []
+                for name in names:
+                    signature = declared_signatures.get(name)
+                    if signature is None:
+                        signature = declared_signatures[name] = self._signature(checker.sym, name)
+                    if name in nested:
+                        signature = (signature, self._signature(sym, name))
+                    signatures.append(signature)
+                summary_key = (key, tuple(signatures))
+            else:
+                summary_key = (key, tuple(self._signature(sym, name) for name in names))
+            summary = previous.get(summary_key) or self._summaries.get(summary_key)
+            if summary is None:
+                summary = self._check(analyzer, checker, global_vars, stmt)
+                self.rechecked.append(index)
+                new.append(summary)
+            else:
+                if summary.stmt is not stmt:
+                    summary = self._moved(summary, stmt)
+                    new.append(summary)
+                self._apply(analyzer, summary)
+            self._summaries[summary_key] = summary
+            used.append(summary)
+            if summary.functions or summary.interfaces:
+                nested.update(summary.functions, summary.interfaces)
+                declared_signatures.clear()  # as versões das interfaces podem mudar
+            for name, iface in summary.interfaces.items():
+                self._versions[name] = self._version(name, iface)
+            errors.extend(declared[index])
+            errors.extend(_absolute(summary.errors, stmt.line, stmt.column))
+
+        # Tipos: sai o que era dos resumos que deixaram de ser usados, entra o
+        # dos resumos novos; os statements reaproveitados não custam nada. Os da
+        # fase 1 (parâmetros e retorno das funções) são trocados a cada chamada
+        types, current = self._types, set(map(id, used))
+        for node in self._declared_types:
+            types.pop(node, None)
+        for summary in previous_used:
+            if id(summary) not in current:
+                for node in summary.types:
+                    types.pop(node, None)
+        for summary in new:
+            types.update(summary.types)
+        types.update(declared_types)
+        self._used, self._declared_types = used, declared_types
+
+        analyzer.errors = errors
+        analyzer.types = types
+        self.analyzer = analyzer
+        return errors
+
+    @staticmethod
+    def _check(analyzer: TwoPhaseAnalyzer, checker: SemanticAnalyzer, global_vars: dict,
+               stmt) -> Summary:
+        """Fase 2 do statement (como em TwoPhaseAnalyzer._check) e o resumo do que
+        ela produziu; checker verifica os corpos de função com as tabelas da fase 1"""
+        sym = analyzer.sym
+        tables = (sym.global_vars, sym.global_funcs, sym.global_interfaces)
+        for table in tables:
+            table.written.clear()
+        analyzer.errors, analyzer.error_count = [], 0
+        types = analyzer.types = {}
+        if type(stmt) is FunctionDecl:
+            checker.types = types
+            result = check_bodies(checker, [stmt])[0] + (None,)
+            analyzer.check_function(stmt, result, None, global_vars)
+        elif type(stmt) is not InterfaceDecl:
+            analyzer.visit(stmt)
+        variables, functions, interfaces = (
+            {name: table[name] for name in table.written} for table in tables)
+        callers = set(functions)
+        if type(stmt) is FunctionDecl:
+            callers.add(stmt.name)
+        calls = {name: frozenset(analyzer.call_graph[name])
+                 for name in callers if name in analyzer.call_graph}
+        errors = _relative(analyzer.errors, stmt.line, stmt.column)
+        return Summary(errors, variables, functions, interfaces, calls, stmt, types)
+
+    @staticmethod
+    def _moved(summary: Summary, stmt) -> Summary:
+        """Resumo para outro statement com o mesmo conteúdo (outros nós): os tipos
+        passam para os nós na mesma posição da pré-ordem"""
+        types = summary.types
+        moved = {new: types[old] for old, new in zip(preorder(summary.stmt), preorder(stmt))
+                 if old in types}
+        return Summary(summary.errors, summary.variables, summary.functions,
+                       summary.interfaces, summary.calls, stmt, moved)
+
+    @staticmethod
+    def _apply(analyzer: TwoPhaseAnalyzer, summary: Summary):
+        """Reaplica os símbolos definidos por um statement que não mudou"""
+        sym = analyzer.sym
+        for name, symbol in summary.variables.items():
+            sym.define_var(name, symbol)
+        for name, func in summary.functions.items():
+            sym.funcs[name] = func
+        for name, iface in summary.interfaces.items():
+            sym.interfaces[name] = iface
+        for name, callees in summary.calls.items():
+            analyzer.call_graph.setdefault(name, set()).update(callees)
+
+    def _version(self, name: str, iface) -> int:
+        """Versão da interface: muda quando a sua forma muda"""
+        return hash((name, tuple(
+            (prop, self._type_signature(t)) for prop, t in iface.props.items())))
+
+    def _type_signature(self, t):
+        """Descrição do tipo que muda quando a forma de uma interface nele muda"""
+        if t is None or type(t) is PrimitiveType:
+            return t and t.n
+        if type(t) is ArrayType:
+            return ("[]", self._type_signature(t.elem))
+        return ("I", t.id, self._versions.get(t.id))
+
+    def _signature(self, sym, name: str) -> tuple:
+        """Assinatura do nome global no ponto atual: variável, função e interface"""
+        var = sym.global_vars.get(name)
+        func = sym.global_funcs.get(name)
+        return (
+            var and (self._type_signature(var.type), var.is_const),
+            func and (tuple(self._type_signature(t) for t in func.param_types),
+                      self._type_signature(func.return_type)),
+            self._versions.get(name, name in sym.global_interfaces),
+        )
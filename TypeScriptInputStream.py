@@ -0,0 +1,68 @@
+"""
+Fluxos de entrada compactos para o lexer.
+
+`antlr4.InputStream` guarda, além do texto, uma lista Python com um inteiro por
+caractere (`data`): 8 bytes de ponteiro por caractere, mais os objetos int acima
+de 256. Em fontes de vários MB isso domina o consumo de memória do compilador.
+
+CompactInputStream mantém a mesma interface (é uma subclasse de InputStream:
+LA/LT/consume/seek/getText/strdata), mas `data` é uma memoryview de inteiros
+sobre o texto codificado com a menor largura que comporta todos os code points:
+- 1 byte  (latin-1, inclui ASCII)
+- 2 bytes (UTF-16 sem pares substitutos: só o plano multilíngue básico)
+- 4 bytes (UTF-32)
+
+CompactFileStream substitui `antlr4.FileStream`: o arquivo é mapeado com mmap e
+decodificado direto do mapeamento, sem a cópia intermediária em `bytes`.
+"""
+
+import mmap
+import sys
+
+from antlr4.InputStream import InputStream
+
+# Codificações na ordem nativa, para que memoryview.cast leia os inteiros
+_UTF16 = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def code_points(text: str) -> memoryview:
+    """memoryview com o code point de cada caractere de `text`, na menor largura"""
+    try:
+        return memoryview(text.encode("latin-1"))
+    except UnicodeEncodeError:
+        pass
+    data = text.encode(_UTF16, "surrogatepass")
+    if len(data) == 2 * len(text):
+        return memoryview(data).cast("H")
+    return memoryview(text.encode(_UTF32, "surrogatepass")).cast("I")
+
+
+class CompactInputStream(InputStream):
+    """InputStream com os code points em um buffer compacto em vez de uma lista"""
+
+    __slots__ = ()
+
+    def _loadString(self):
+        self._index = 0
+        self.data = code_points(self.strdata)
+        self._size = len(self.data)
+
+
+class CompactFileStream(CompactInputStream):
+    """Substituto de antlr4.FileStream sobre CompactInputStream"""
+
+    __slots__ = ("fileName",)
+
+    def __init__(self, fileName: str, encoding: str = "ascii", errors: str = "strict"):
+        super().__init__(self.readDataFrom(fileName, encoding, errors))
+        self.fileName = fileName
+
+    def readDataFrom(self, fileName: str, encoding: str, errors: str = "strict") -> str:
+        with open(fileName, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # arquivo vazio não pode ser mapeado
+                return f.read().decode(encoding, errors)
+            with mapped:
+                return str(mapped, encoding, errors)
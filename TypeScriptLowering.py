@@ -0,0 +1,238 @@
+"""
+Conversão da árvore do ANTLR para o AST compacto (TypeScriptAST).
+
+lower_program percorre os contextos de statement uma única vez; as expressões
+reaproveitam o nó já montado pelo parser de precedência (`ctx.node`) ou são
+convertidas a partir das regras da gramática (lower_expression). Nomes,
+operadores e tipos são internados com sys.intern.
+"""
+
+import sys
+
+from TypeScriptAST import (
+    ArrayLiteral, AssignExpr, BinaryExpr, Block, CallOp, ExprStmt, ForStmt,
+    FunctionDecl, Identifier, IfStmt, IndexOp, InterfaceDecl, Literal, MemberOp,
+    ObjectLiteral, Param, PostfixExpr, Program, ReturnStmt, TypeRef, UnaryExpr,
+    VarDecl, WhileStmt,
+)
+from TypeScriptParser import TypeScriptParser
+
+
+_P = TypeScriptParser
+
+_BINARY_CONTEXTS = (
+    _P.LogicalOrExprContext, _P.LogicalAndExprContext, _P.EqualityExprContext,
+    _P.RelationalExprContext, _P.AdditiveExprContext, _P.MultiplicativeExprContext,
+)
+
+
+_intern = sys.intern
+
+
+def _token_text(node):
+    """Texto internado de um terminal (None se ausente por erro de sintaxe)"""
+    return _intern(node.getText()) if node is not None else None
+
+
+def lower_program(ctx) -> Program:
+    """Converte a árvore do ANTLR (ProgramContext) no AST compacto"""
+    start = ctx.start
+    return Program(_lower_statements(ctx.statement()), start.line, start.column)
+
+
+def _lower_statements(contexts) -> list:
+    body = []
+    for stmt in contexts:
+        node = lower_statement(stmt)
+        if node is not None:
+            body.append(node)
+    return body
+
+
+def lower_statement(ctx):
+    """Converte um StatementContext (ou a regra concreta sob ele) no nó correspondente"""
+    if isinstance(ctx, (_P.StatementContext, _P.VariableDeclContext)):
+        if ctx.getChildCount() == 0:
+            return None
+        return lower_statement(ctx.getChild(0))
+    if ctx is None or not hasattr(ctx, "start"):
+        return None
+    start = ctx.start
+
+    if isinstance(ctx, (_P.LetDeclContext, _P.ConstDeclContext)):
+        return VarDecl(_token_text(ctx.ID()), lower_type(ctx.typeExpr()),
+                       expression_node(ctx.expression()),
+                       isinstance(ctx, _P.ConstDeclContext), start.line, start.column)
+
+    if isinstance(ctx, _P.ExpressionStmtContext):
+        return ExprStmt(expression_node(ctx.expression()), start.line, start.column)
+
+    if isinstance(ctx, _P.BlockContext):
+        return Block(_lower_statements(ctx.statement()), start.line, start.column)
+
+    if isinstance(ctx, _P.IfStmtContext):
+        return IfStmt(expression_node(ctx.expression()),
+                      lower_statement(ctx.statement(0)), lower_statement(ctx.statement(1)),
+                      start.line, start.column)
+
+    if isinstance(ctx, _P.WhileStmtContext):
+        return WhileStmt(expression_node(ctx.expression()), lower_statement(ctx.statement()),
+                         start.line, start.column)
+
+    if isinstance(ctx, _P.ForStmtContext):
+        return _lower_for(ctx)
+
+    if isinstance(ctx, _P.ReturnStmtContext):
+        return ReturnStmt(expression_node(ctx.expression()), start.line, start.column)
+
+    if isinstance(ctx, _P.FunctionDeclContext):
+        params = []
+        if ctx.paramList():
+            params = [Param(_token_text(p.ID()), lower_type(p.typeExpr()))
+                      for p in ctx.paramList().param()]
+        body = lower_statement(ctx.block())
+        return FunctionDecl(_token_text(ctx.ID()), params, lower_type(ctx.typeExpr()),
+                            body, start.line, start.column)
+
+    if isinstance(ctx, _P.InterfaceDeclContext):
+        props = [(_token_text(p.ID()), lower_type(p.typeExpr())) for p in ctx.interfaceProp()]
+        return InterfaceDecl(_token_text(ctx.ID()), props, start.line, start.column)
+
+    return None
+
+
+def _lower_for(ctx) -> ForStmt:
+    """for '(' (variableDecl | expressionStmt | ';') expression? ';' expression? ')' statement
+
+    Condição e incremento são distinguidos pela posição em relação ao segundo ';'.
+    """
+    init = cond = update = None
+    after_cond = False
+    for i in range(2, ctx.getChildCount()):
+        child = ctx.getChild(i)
+        if i == 2:
+            init = lower_statement(child)
+        elif isinstance(child, _P.ExpressionContext):
+            if after_cond:
+                update = expression_node(child)
+            else:
+                cond = expression_node(child)
+        elif isinstance(child, _P.StatementContext):
+            break
+        elif child.getText() == ";":
+            after_cond = True
+    start = ctx.start
+    return ForStmt(init, cond, update, lower_statement(ctx.statement()),
+                   start.line, start.column)
+
+
+def lower_type(ctx):
+    """Converte typeExpr (baseType ('[' ']')?) em TypeRef"""
+    if ctx is None or ctx.baseType() is None:
+        return None
+    start = ctx.start
+    return TypeRef(_intern(ctx.baseType().getText()), ctx.getChildCount() > 1,
+                   start.line, start.column)
+
+
+def expression_node(ctx):
+    """Retorna o nó plano de um ExpressionContext (None se ausente ou inválido).
+
+    O parser de precedência guarda o nó em `ctx.node`; contextos produzidos pelas
+    regras do ANTLR são convertidos uma única vez e o resultado fica em cache.
+    """
+    if ctx is None:
+        return None
+    node = getattr(ctx, "node", None)
+    if node is None:
+        node = lower_expression(ctx)
+        ctx.node = node
+    return node
+
+
+def lower_expression(ctx):
+    """Converte um contexto de expressão do ANTLR no nó plano equivalente.
+
+    Subárvores incompletas (erro de sintaxe) viram None.
+    """
+    if ctx is None or ctx.getChildCount() == 0:
+        return None
+    start = ctx.start
+
+    if isinstance(ctx, _P.ExpressionContext):
+        return lower_expression(ctx.assignmentExpr())
+
+    if isinstance(ctx, _P.AssignmentExprContext):
+        target = lower_expression(ctx.logicalOrExpr())
+        if not ctx.ASSIGN():
+            return target
+        return AssignExpr(target, lower_expression(ctx.assignmentExpr()),
+                          start.line, start.column)
+
+    if isinstance(ctx, _BINARY_CONTEXTS):
+        n = ctx.getChildCount()
+        if n == 1:
+            return lower_expression(ctx.getChild(0))
+        operands = [lower_expression(ctx.getChild(i)) for i in range(0, n, 2)]
+        ops = [_intern(ctx.getChild(i).getText()) for i in range(1, n, 2)]
+        return BinaryExpr(ops, operands, start.line, start.column)
+
+    if isinstance(ctx, _P.UnaryExprContext):
+        n = ctx.getChildCount()
+        operand = lower_expression(ctx.getChild(n - 1))
+        if n == 1:
+            return operand
+        ops = [_intern(ctx.getChild(i).getText()) for i in range(n - 1)]
+        return UnaryExpr(ops, operand, start.line, start.column)
+
+    if isinstance(ctx, _P.PostfixExprContext):
+        primary = lower_expression(ctx.primary())
+        ops = [_lower_postfix_op(op) for op in ctx.postfixOp()]
+        if not ops:
+            return primary
+        return PostfixExpr(primary, ops, start.line, start.column)
+
+    if isinstance(ctx, _P.PrimaryContext):
+        if ctx.literal():
+            return lower_expression(ctx.literal())
+        if ctx.ID():
+            return Identifier(_token_text(ctx.ID()), start.line, start.column)
+        if ctx.expression():
+            # Parênteses não geram nó: (a) = 1 atribui a `a`, como no parser de precedência
+            return lower_expression(ctx.expression())
+        if ctx.arrayLiteral():
+            return lower_expression(ctx.arrayLiteral())
+        if ctx.objectLiteral():
+            return lower_expression(ctx.objectLiteral())
+        return None
+
+    if isinstance(ctx, _P.LiteralContext):
+        if ctx.NUMBER_LIT():
+            kind = "number"
+        elif ctx.STRING():
+            kind = "string"
+        else:
+            kind = "boolean"
+        return Literal(kind, ctx.getText(), start.line, start.column)
+
+    if isinstance(ctx, _P.ArrayLiteralContext):
+        return ArrayLiteral([lower_expression(e) for e in ctx.expression()],
+                            start.line, start.column)
+
+    if isinstance(ctx, _P.ObjectLiteralContext):
+        props = []
+        for prop in ctx.propAssign():
+            key = _token_text(prop.ID()) if prop.ID() else _intern(prop.STRING().getText()[1:-1])
+            props.append((key, lower_expression(prop.expression())))
+        return ObjectLiteral(props, start.line, start.column)
+
+    return None
+
+
+def _lower_postfix_op(op):
+    first = op.getChild(0).getText()
+    if first == "[":
+        return IndexOp(lower_expression(op.expression(0)))
+    if first == ".":
+        return MemberOp(_token_text(op.ID()))
+    return CallOp([lower_expression(e) for e in op.expression()])
@@ -0,0 +1,188 @@
+"""
+Parsing paralelo por statements de nível superior.
+
+Uma varredura barata sobre os tokens (a regex mestre do TypeScriptRegexLexer, sem
+criar objetos de token) conta a profundidade de (), [] e {} e marca onde começa
+cada statement de nível superior: depois de um ';' ou de um '}' em profundidade 0,
+exceto quando o próximo token continua o statement ('else' após o ramo do if;
+'}' seguido de ';', '.', operador etc. é um literal de objeto dentro de uma
+expressão). Os statements são agrupados em blocos contíguos de tamanho parecido,
+e cada bloco é analisado (lexer + parser + conversão para o AST) em um processo
+do pool.
+
+Cada bloco é analisado como um programa a partir da linha 1, coluna 0; as
+posições dos nós são deslocadas para as do arquivo original (a coluna só muda
+na primeira linha do bloco, que começa no primeiro token do statement). Os
+corpos dos blocos, concatenados em ordem, formam o mesmo Program do parsing
+sequencial.
+
+Se algum bloco tiver erro léxico ou sintático (ou a divisão tiver caído no meio
+de um statement, o que também aparece como erro), parse_parallel devolve None e
+o chamador refaz o parsing sequencial: as mensagens de erro são sempre as do
+parsing do arquivo inteiro.
+"""
+
+import marshal
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from TypeScriptAST import Program, preorder
+from TypeScriptProgramCache import decode, encode
+from TypeScriptRegexLexer import _MASTER, _OP, _SKIP
+
+# Blocos por processo: mais blocos equilibram melhor a carga, menos blocos
+# pagam menos transferência entre processos
+CHUNKS_PER_JOB = 4
+
+# Tokens que, logo após um '}' de profundidade 0, continuam o mesmo statement
+_CONTINUES_AFTER_BRACE = frozenset({"else", ";", ".", "[", "(", ")", "]", "}", ",", ":",
+                                    "=", "==", "!=", "<", "<=", ">", ">=", "&&", "||",
+                                    "+", "-", "*", "/", "%"})
+_OPENERS = frozenset("([{")
+_CLOSERS = frozenset(")]}")
+
+
+def statement_offsets(text: str, pos: int = 0, endpos: int = None) -> list:
+    """Offsets (em caracteres) do primeiro token de cada statement de nível superior
+    a partir do segundo; o primeiro statement começa no início do arquivo.
+
+    pos/endpos limitam a varredura a text[pos:endpos], que deve começar no início
+    de um statement (profundidade 0); os offsets continuam relativos a text.
+    """
+    return list(iter_statement_offsets(text, pos, endpos))
+
+
+def iter_statement_offsets(text: str, pos: int = 0, endpos: int = None):
+    """statement_offsets sob demanda (a varredura para quando o consumidor para)"""
+    depth = 0
+    pending = None  # último token de profundidade 0 que pode encerrar um statement
+    for m in _MASTER.finditer(text, pos, len(text) if endpos is None else endpos):
+        group = m.lastindex
+        if group == _SKIP:
+            continue
+        value = m.group(group)
+        if pending is not None:
+            if pending == ";":
+                split = value != "else"
+            else:
+                split = value not in _CONTINUES_AFTER_BRACE
+            if split:
+                yield m.start()
+            pending = None
+        if group != _OP:
+            continue
+        if value in _OPENERS:
+            depth += 1
+        elif value in _CLOSERS:
+            depth -= 1
+            if depth == 0 and value == "}":
+                pending = "}"
+        elif value == ";" and depth == 0:
+            pending = ";"
+
+
+def split_chunks(text: str, n_chunks: int) -> list:
+    """Divide o fonte em até n_chunks blocos de statements inteiros.
+
+    Retorna [(texto, linha, coluna)], com a posição original do início de cada bloco.
+    """
+    offsets = statement_offsets(text)
+    target = len(text) / max(n_chunks, 1)
+    starts = [0]
+    for offset in offsets:
+        if offset - starts[-1] >= target:
+            starts.append(offset)
+
+    chunks = []
+    line, scanned = 1, 0
+    for i, start in enumerate(starts):
+        line += text.count("\n", scanned, start)
+        scanned = start
+        line_start = text.rfind("\n", 0, start) + 1
+        end = starts[i + 1] if i + 1 < len(starts) else len(text)
+        chunks.append((text[start:end], line, start - line_start))
+    return chunks
+
+
+def shift_positions(value, lines: int, column: int, first_line: int = 1):
+    """Desloca linha/coluna dos nós: todas as linhas em `lines` e, só nos nós da
+    linha first_line (a primeira do bloco), as colunas em `column`"""
+    for node in preorder(value):
+        if "line" in node._fields:
+            if node.line == first_line:
+                node.column += column
+            node.line += lines
+
+
+def parse_chunk(text: str, line: int = 1, column: int = 0, lexer_kind: str = "antlr",
+                expr_parser: str = "pratt", parse_mode: str = "auto"):
+    """Analisa um bloco de statements que começa na posição (line, column) do arquivo.
+
+    Retorna (Program com as posições do arquivo, caminho de predição), ou None se
+    houve erro léxico ou sintático.
+    """
+    from antlr4 import CommonTokenStream, InputStream
+
+    from main import parse_program
+    from TypeScriptLowering import lower_program
+    from TypeScriptRegexLexer import create_lexer
+    from TypeScriptSyntaxErrors import SyntaxErrorCollector, SyntaxErrorLimit
+
+    errors = SyntaxErrorCollector(1)
+    lexer = create_lexer(InputStream(text), lexer_kind)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    try:
+        tree, parse_path = parse_program(CommonTokenStream(lexer), parse_mode,
+                                         expr_parser, errors)
+    except SyntaxErrorLimit:
+        return None
+    if errors.count:
+        return None
+    program = lower_program(tree)
+    if line > 1 or column:
+        shift_positions(program, line - 1, column)
+    return program, parse_path
+
+
+def _parse_chunk(task):
+    """Executado no processo do pool: (bytes do marshal do Program, caminho de
+    predição) do bloco, ou None se houve erro léxico ou sintático"""
+    result = parse_chunk(*task)
+    if result is None:
+        return None
+    program, parse_path = result
+    return marshal.dumps(encode(program)), parse_path
+
+
+def parse_parallel(text: str, jobs: int, lexer_kind: str = "antlr",
+                   expr_parser: str = "pratt", parse_mode: str = "auto"):
+    """Analisa o fonte em blocos, em até `jobs` processos.
+
+    Retorna (Program, caminho de predição, número de blocos), ou None se algum
+    bloco teve erro (o chamador deve refazer o parsing sequencial).
+    """
+    chunks = split_chunks(text, jobs * CHUNKS_PER_JOB)
+    tasks = [(chunk, line, column, lexer_kind, expr_parser, parse_mode)
+             for chunk, line, column in chunks]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        results = list(pool.map(_parse_chunk, tasks))
+    if any(result is None for result in results):
+        return None
+
+    body = []
+    paths = set()
+    first = None
+    for data, parse_path in results:
+        program = decode(marshal.loads(data))
+        if first is None:
+            first = program
+        body.extend(program.body)
+        paths.add(parse_path)
+    parse_path = "SLL→LL" if "SLL→LL" in paths else paths.pop()
+    return Program(body, first.line, first.column), parse_path, len(chunks)
+
+
+def default_jobs() -> int:
+    """Número de processos para --jobs 0: os núcleos disponíveis"""
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
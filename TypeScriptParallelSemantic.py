@@ -0,0 +1,387 @@
+"""
+Análise semântica em duas fases, com os corpos das funções verificados em paralelo.
+
+SemanticAnalyzer percorre o programa uma vez, na ordem do arquivo, então uma
+função só pode chamar funções declaradas antes dela. TwoPhaseAnalyzer separa a
+análise em duas fases:
+
+1. Declarações, no processo principal, sobre os statements de nível superior:
+   - todas as interfaces, na ordem do arquivo;
+   - a assinatura de cada função (FuncSymbol) e o símbolo de cada variável
+     global (VarSymbol), sem visitar corpos nem inicializadores.
+2. Verificação:
+   - os corpos das funções, em blocos contíguos, em um pool de processos. Cada
+     corpo enxerga todas as funções, interfaces e variáveis globais da fase 1, e
+     por isso chamadas a funções declaradas mais adiante no arquivo são resolvidas;
+   - o código de nível superior (variáveis globais, comandos), no processo
+     principal e na ordem do arquivo, como em SemanticAnalyzer: uma variável
+     global só é visível para esse código a partir da sua declaração.
+
+Os erros de cada statement de nível superior ficam em uma lista própria, e as
+listas são concatenadas na ordem do arquivo. O resultado não depende do número
+de processos nem da ordem em que os blocos terminam. Um programa sem erros em
+SemanticAnalyzer também não tem erros aqui, e as tabelas finais (usadas pelo
+gerador de Jasmin) são as mesmas.
+
+Os tipos calculados nos corpos (SemanticAnalyzer.types, lidos pelo gerador) vão
+para a tabela do analisador principal. Um processo do pool devolve os tipos de
+cada função na ordem da pré-ordem dos nós (preorder), descritos por nome
+(describe), e o processo principal os associa aos seus próprios nós e aos seus
+próprios objetos de tipo.
+
+Uma função declarada dentro do corpo de outra só é registrada quando esse corpo
+é verificado. Esses corpos são verificados de novo no processo principal, na
+ordem do arquivo, e registram as funções internas como no SemanticAnalyzer.
+
+A fase 2 percorre os statements de nível superior na ordem do arquivo: o
+resultado de cada função é consumido na sua posição, e o código de nível superior
+entre elas é verificado enquanto o pool verifica os blocos seguintes. Com um
+limite de erros (max_errors), a análise para quando os erros dos statements já
+verificados chegam ao limite, e os blocos ainda pendentes são cancelados. Os erros
+relatados são sempre os primeiros do programa, na ordem do arquivo: os da fase 1
+ficam nos seus statements e não interrompem a análise.
+"""
+
+import gc
+import marshal
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import compress, repeat
+from typing import List
+
+from TypeScriptAST import FunctionDecl, InterfaceDecl, VarDecl, preorder
+from TypeScriptDiagnostics import Diagnostic, DiagnosticLimit
+from TypeScriptProgramCache import decode, encode
+from TypeScriptSemantic import ArrayType, InterfaceType, PrimitiveType, SemanticAnalyzer, VarSymbol
+from TypeScriptWalk import run
+
+# Com menos funções do que isso os corpos são verificados no próprio processo
+MIN_PARALLEL_FUNCTIONS = 64
+
+# Blocos de funções por processo (mais blocos equilibram melhor a carga)
+CHUNKS_PER_JOB = 4
+
+# Processos do pool criados com fork herdam o AST em vez de recebê-lo serializado
+FORK = "fork" in multiprocessing.get_all_start_methods()
+_CONTEXT = multiprocessing.get_context("fork") if FORK else None
+
+
+def body_checker(funcs, interfaces, global_vars, unresolved,
+                 max_errors: int = 0) -> SemanticAnalyzer:
+    """Analisador que verifica corpos de função com as tabelas da fase 1"""
+    checker = SemanticAnalyzer(max_errors)
+    checker.sym.funcs = funcs
+    checker.sym.interfaces = interfaces
+    for name, symbol in global_vars.items():
+        checker.sym.define_var(name, symbol)
+    checker._unresolved = unresolved
+    return checker
+
+
+def _resolve_silently(checker: SemanticAnalyzer, annotations: list) -> list:
+    """Resolve anotações de tipo sem relatar erros: eles são relatados uma única
+    vez, em outro ponto da análise, e só ali contam para o limite de erros"""
+    errors, count, limit = checker.errors, checker.error_count, checker.max_errors
+    checker.errors, checker.max_errors = [], 0
+    types = [checker.resolve_type(annotation) for annotation in annotations]
+    checker.errors, checker.error_count, checker.max_errors = errors, count, limit
+    return types
+
+
+def _signature(checker: SemanticAnalyzer, node) -> tuple:
+    """Parâmetros e retorno da função, sem repetir os erros já relatados na fase 1"""
+    *param_types, return_type = _resolve_silently(
+        checker, [param.type for param in node.params] + [node.return_type])
+    return [(param.name, t) for param, t in zip(node.params, param_types)], return_type
+
+
+def check_bodies(checker: SemanticAnalyzer, functions: list) -> list:
+    """Verifica os corpos das funções, uma a uma.
+
+    Retorna, por função, (erros, funções chamadas, declara funções internas?). As
+    funções internas são desfeitas depois de cada corpo, para que o resultado não
+    dependa de quais funções caíram no mesmo bloco. Pelo mesmo motivo o limite de
+    erros do checker vale para cada corpo; se for atingido, o resultado da função
+    interrompida é o último.
+    """
+    funcs = checker.sym.funcs
+    declared = dict(funcs)
+    results = []
+    for node in functions:
+        params, return_type = _signature(checker, node)
+        errors = checker.errors = []
+        checker.error_count = 0
+        try:
+            run(checker, checker.check_function_body(node, params, return_type))
+        except DiagnosticLimit:
+            results.append((errors, set(), False))
+            break
+        calls = checker.call_graph.pop(node.name, set())
+        nested = bool(checker.call_graph)
+        if nested:
+            checker.call_graph.clear()
+            funcs.clear()
+            funcs.update(declared)
+        results.append((errors, calls, nested))
+    return results
+
+
+def describe(t):
+    """Descrição do tipo que atravessa processos: nomes em vez de objetos"""
+    if t is None or type(t) is PrimitiveType:
+        return t and t.n
+    if type(t) is ArrayType:
+        return ("[]", describe(t.elem))
+    if t.id == "<obj-literal>":
+        return ("{}", tuple((key, describe(value)) for key, value in t.props.items()))
+    return ("I", t.id)
+
+
+_checker = None  # analisador do processo do pool (ver _init_worker)
+_inherited = None  # (funções, tabelas, pré-ordens) herdadas pelos processos criados com fork
+
+
+def _init_worker(tables: bytes):
+    """Executado uma vez em cada processo do pool: recebe as tabelas da fase 1"""
+    global _checker
+    _checker = body_checker(*(_inherited[1] if tables is None else pickle.loads(tables)))
+
+
+def _check_chunk(chunk) -> list:
+    """Executado no processo do pool: check_bodies de um bloco de funções, dado
+    por (início, fim) nas funções herdadas ou pelos bytes do marshal dos nós.
+
+    Cada resultado leva também os tipos da função, porque os nós e os tipos deste
+    processo não são os do processo principal: (descrições, índices), com um índice
+    por nó na pré-ordem. As descrições (ver describe) são as dos tipos do bloco, e
+    o índice 0 (None) marca os nós sem tipo.
+    """
+    if type(chunk) is tuple:
+        start, end = chunk
+        functions = _inherited[0][start:end]
+        orders = _inherited[2][start:end]
+    else:
+        functions = decode(marshal.loads(chunk))
+        orders = [preorder(function) for function in functions]
+    types = _checker.types = {}
+    results = check_bodies(_checker, functions)
+    distinct = [None, *(set(types.values()) - {None})]
+    codes = {t: code for code, t in enumerate(distinct)}
+    descriptions = [describe(t) for t in distinct]
+    return [result + ((descriptions, list(map(codes.__getitem__, map(types.get, order)))),)
+            for order, result in zip(orders, results)]
+
+
+class TwoPhaseAnalyzer(SemanticAnalyzer):
+    """Declarações primeiro, depois corpos de função em até `jobs` processos
+    (1: no próprio processo; 0: um por núcleo)"""
+
+    def __init__(self, jobs: int = 1, max_errors: int = 0):
+        super().__init__(max_errors)
+        if jobs == 0:
+            # Importado só aqui: TypeScriptParallelParse carrega o runtime do ANTLR
+            from TypeScriptParallelParse import default_jobs
+            jobs = default_jobs()
+        self.jobs = jobs
+        self._recheck = None  # verifica de novo os corpos com funções internas (ver check_function)
+        self._own_types = {}  # tipos devolvidos pelo pool, por descrições (ver _receive_types)
+
+    def analyze(self, program) -> List[Diagnostic]:
+        """Analisa o programa (TypeScriptAST.Program) e retorna a lista de erros,
+        na ordem dos statements de nível superior"""
+        body = program.body
+        errors = [[] for _ in body]  # erros de cada statement de nível superior
+        limit, self.max_errors = self.max_errors, 0
+        try:
+            # Os erros da fase 1 podem estar em qualquer statement: não interrompem
+            functions, global_vars = self.declare(body, errors)
+            self.max_errors = limit
+            self._check(body, functions, global_vars, errors)
+        except DiagnosticLimit:
+            pass
+        self.max_errors = limit
+
+        self.errors = [error for stmt_errors in errors for error in stmt_errors]
+        if self.max_errors:
+            del self.errors[self.max_errors:]
+        return self.errors
+
+    def declare(self, body: list, errors: list) -> tuple:
+        """Fase 1: interfaces, assinaturas das funções e símbolos das variáveis globais.
+
+        Retorna (índices das funções em body, {nome: VarSymbol} das globais).
+        """
+        for index, stmt in enumerate(body):
+            if type(stmt) is InterfaceDecl:
+                self.errors = errors[index]
+                self.visitInterfaceDecl(stmt)
+
+        functions, global_vars = [], {}
+        for index, stmt in enumerate(body):
+            if type(stmt) is FunctionDecl:
+                self.errors = errors[index]
+                self.declare_function(stmt)
+                functions.append(index)
+            elif type(stmt) is VarDecl:
+                # Os erros do tipo são relatados quando o statement é verificado
+                declared_type, = _resolve_silently(self, [stmt.type])
+                global_vars[stmt.name] = VarSymbol(stmt.name, declared_type,
+                                                   is_const=stmt.is_const)
+        return functions, global_vars
+
+    def _check(self, body: list, functions: list, global_vars: dict, errors: list):
+        """Fase 2, na ordem do arquivo: os corpos de função (verificados em paralelo,
+        com os resultados consumidos na ordem) e o código de nível superior.
+
+        Com limite de erros, a verificação para ao fim do statement em que os erros
+        dos statements já verificados chegam ao limite: os erros dos statements
+        seguintes viriam depois deles.
+        """
+        nodes = [body[index] for index in functions]
+        tables = self.tables(global_vars)
+        if self.jobs > 1 and len(nodes) >= MIN_PARALLEL_FUNCTIONS:
+            # Nós de cada função em pré-ordem: as posições identificam os nós nos
+            # tipos devolvidos pelo pool (calculadas uma vez, herdadas com fork)
+            orders = [preorder(node) for node in nodes]
+            results = self._check_parallel(nodes, orders, tables)
+        else:
+            checker = body_checker(*tables)
+            checker.types = self.types
+            # Um corpo por vez: com limite de erros, os seguintes podem não ser verificados
+            results = (check_bodies(checker, [node])[0] + (None,) for node in nodes)
+            orders = repeat(None)
+
+        self._recheck, self._own_types = None, {}
+        found = 0  # erros dos statements já verificados
+        # O pool só é encerrado quando os resultados se esgotam (ou quando results é
+        # fechado ao atingir o limite de erros)
+        with closing(results):
+            pending = zip(results, orders)
+            for stmt, stmt_errors in zip(body, errors):
+                self.errors = stmt_errors
+                # _err interrompe no limite: conta os erros anteriores a este statement
+                self.error_count = found + len(stmt_errors)
+                if type(stmt) is FunctionDecl:
+                    result, order = next(pending)
+                    self.check_function(stmt, result, order, global_vars)
+                elif type(stmt) is not InterfaceDecl:
+                    self.visit(stmt)
+                found += len(stmt_errors)
+                if 0 < self.max_errors <= found:
+                    raise DiagnosticLimit()
+
+    def tables(self, global_vars: dict) -> tuple:
+        """Tabelas da fase 1 com que os corpos de função são verificados (ver body_checker)"""
+        return (dict(self.sym.funcs), dict(self.sym.interfaces), global_vars,
+                dict(self._unresolved), self.max_errors)
+
+    def check_function(self, stmt, result: tuple, order, global_vars: dict):
+        """Fase 2 de uma função de nível superior, com os erros em self.errors.
+
+        result é o de check_bodies mais os tipos devolvidos pelo pool (None quando o
+        corpo foi verificado no próprio processo, já com os tipos em self.types), e
+        order os nós da função em pré-ordem. Um corpo que declara funções internas é
+        verificado de novo aqui, registrando-as nas tabelas.
+        """
+        body_errors, calls, nested, types = result
+        if not nested:
+            self.errors.extend(body_errors)
+            self.call_graph[stmt.name].update(calls)
+            if types is not None:
+                self._receive_types(order, types)
+            return
+        recheck = self._recheck
+        if recheck is None:
+            recheck = self._recheck = body_checker(self.sym.funcs, self.sym.interfaces,
+                                                   global_vars, self._unresolved)
+            recheck.call_graph = self.call_graph
+        recheck.types = self.types
+        recheck.errors = self.errors
+        recheck.error_count = self.error_count
+        recheck.max_errors = self.max_errors
+        params, return_type = _signature(recheck, stmt)
+        try:
+            run(recheck, recheck.check_function_body(stmt, params, return_type))
+        except DiagnosticLimit:
+            pass
+
+    def _receive_types(self, order: list, types: tuple):
+        """Registra os tipos devolvidos por um processo do pool para os nós da
+        função, dados em pré-ordem (order)"""
+        descriptions, codes = types
+        own_types = self._own_types
+        own = own_types.get(id(descriptions))
+        if own is None:
+            own = own_types[id(descriptions)] = [
+                None, *(self._own_type(description) for description in descriptions[1:])]
+        self.types.update(zip(compress(order, codes),
+                              map(own.__getitem__, filter(None, codes))))
+
+    def _own_type(self, description):
+        """Tipo deste analisador com a descrição dada (ver describe).
+
+        Interfaces são a declarada (ou a não resolvida) com o mesmo nome, e objetos
+        literais o tipo da mesma forma em _literal_shapes.
+        """
+        if type(description) is str:
+            return PrimitiveType(description)
+        kind, detail = description
+        if kind == "[]":
+            return ArrayType(self._own_type(detail))
+        if kind == "{}":
+            props = {key: self._own_type(value) for key, value in detail}
+            shape = tuple(props.items())
+            obj = self._literal_shapes.get(shape)
+            if obj is None:
+                obj = self._literal_shapes[shape] = InterfaceType("<obj-literal>")
+                obj.props = props
+            return obj
+        if detail.startswith("<unknown:"):
+            name = detail[len("<unknown:"):-1]
+            if name not in self._unresolved:
+                self._unresolved[name] = InterfaceType(detail)
+            return self._unresolved[name]
+        # Interface declarada dentro de um corpo só existe no processo que o verificou
+        return self.sym.interfaces.get(detail) or InterfaceType(detail)
+
+    def _check_parallel(self, nodes: list, orders: list, tables: tuple):
+        """check_bodies em blocos contíguos de funções, em um pool de processos.
+
+        Com fork os processos herdam os nós e as tabelas, e cada tarefa é só um
+        intervalo de índices: serializar o AST custa mais do que verificá-lo. Sem
+        fork, os nós de cada bloco vão pelo marshal, como em TypeScriptParallelParse.
+
+        Os resultados de cada bloco são gerados assim que ele termina, na ordem dos
+        blocos: o processo principal registra os tipos de um bloco enquanto os
+        seguintes ainda estão sendo verificados.
+        """
+        global _inherited
+        n_chunks = min(len(nodes), self.jobs * CHUNKS_PER_JOB)
+        size = -(-len(nodes) // n_chunks)
+        bounds = [(start, min(start + size, len(nodes))) for start in range(0, len(nodes), size)]
+        workers = min(self.jobs, len(bounds))
+        if FORK:
+            _inherited = (nodes, tables, orders)
+            chunks, initargs = bounds, (None,)
+            # Objetos congelados não são percorridos pelo gc dos processos filhos,
+            # que assim não escrevem (e copiam) as páginas do AST herdado
+            gc.freeze()
+        else:
+            chunks = [marshal.dumps(encode(nodes[start:end])) for start, end in bounds]
+            initargs = (pickle.dumps(tables),)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_CONTEXT,
+                                     initializer=_init_worker, initargs=initargs) as pool:
+                try:
+                    for chunk in pool.map(_check_chunk, chunks):
+                        yield from chunk
+                except GeneratorExit:
+                    # Limite de erros atingido: os blocos pendentes não são verificados
+                    pool.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            if FORK:
+                gc.unfreeze()
+                _inherited = None
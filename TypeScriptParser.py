@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,1,45,340,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,45,338,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
         7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
@@ -24,111 +24,110 @@ def serializedATN():
         10,1,10,1,10,3,10,155,8,10,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,
         12,1,12,1,12,1,12,3,12,168,8,12,1,12,3,12,171,8,12,1,12,1,12,3,12,
         175,8,12,1,12,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,15,1,15,1,15,
-        1,15,1,15,3,15,190,8,15,1,16,1,16,1,16,5,16,195,8,16,10,16,12,16,
-        198,9,16,1,17,1,17,1,17,5,17,203,8,17,10,17,12,17,206,9,17,1,18,
-        1,18,1,18,5,18,211,8,18,10,18,12,18,214,9,18,1,19,1,19,1,19,5,19,
-        219,8,19,10,19,12,19,222,9,19,1,20,1,20,1,20,5,20,227,8,20,10,20,
-        12,20,230,9,20,1,21,1,21,1,21,5,21,235,8,21,10,21,12,21,238,9,21,
-        1,22,5,22,241,8,22,10,22,12,22,244,9,22,1,22,1,22,1,23,1,23,5,23,
-        250,8,23,10,23,12,23,253,9,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
-        1,24,1,24,1,24,5,24,265,8,24,10,24,12,24,268,9,24,3,24,270,8,24,
-        1,24,3,24,273,8,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,3,25,
-        283,8,25,1,26,1,26,1,26,1,26,5,26,289,8,26,10,26,12,26,292,9,26,
-        3,26,294,8,26,1,26,1,26,1,27,1,27,1,27,1,27,5,27,302,8,27,10,27,
-        12,27,305,9,27,3,27,307,8,27,1,27,1,27,1,28,1,28,1,28,1,28,1,29,
-        1,29,1,29,3,29,318,8,29,1,30,1,30,1,31,1,31,1,31,1,31,5,31,326,8,
-        31,10,31,12,31,329,9,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,33,
-        1,33,1,33,0,0,34,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,
-        36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,0,8,1,0,30,31,1,
-        0,32,35,1,0,25,26,1,0,27,29,2,0,26,26,38,38,2,0,40,40,42,42,2,0,
-        20,23,42,42,1,0,39,41,348,0,71,1,0,0,0,2,85,1,0,0,0,4,87,1,0,0,0,
-        6,98,1,0,0,0,8,100,1,0,0,0,10,110,1,0,0,0,12,118,1,0,0,0,14,129,
-        1,0,0,0,16,137,1,0,0,0,18,141,1,0,0,0,20,147,1,0,0,0,22,156,1,0,
-        0,0,24,162,1,0,0,0,26,179,1,0,0,0,28,182,1,0,0,0,30,189,1,0,0,0,
-        32,191,1,0,0,0,34,199,1,0,0,0,36,207,1,0,0,0,38,215,1,0,0,0,40,223,
-        1,0,0,0,42,231,1,0,0,0,44,242,1,0,0,0,46,247,1,0,0,0,48,272,1,0,
-        0,0,50,282,1,0,0,0,52,284,1,0,0,0,54,297,1,0,0,0,56,310,1,0,0,0,
-        58,314,1,0,0,0,60,319,1,0,0,0,62,321,1,0,0,0,64,332,1,0,0,0,66,337,
-        1,0,0,0,68,70,3,2,1,0,69,68,1,0,0,0,70,73,1,0,0,0,71,69,1,0,0,0,
-        71,72,1,0,0,0,72,74,1,0,0,0,73,71,1,0,0,0,74,75,5,0,0,1,75,1,1,0,
-        0,0,76,86,3,6,3,0,77,86,3,12,6,0,78,86,3,62,31,0,79,86,3,20,10,0,
-        80,86,3,22,11,0,81,86,3,24,12,0,82,86,3,26,13,0,83,86,3,18,9,0,84,
-        86,3,4,2,0,85,76,1,0,0,0,85,77,1,0,0,0,85,78,1,0,0,0,85,79,1,0,0,
-        0,85,80,1,0,0,0,85,81,1,0,0,0,85,82,1,0,0,0,85,83,1,0,0,0,85,84,
-        1,0,0,0,86,3,1,0,0,0,87,91,5,1,0,0,88,90,3,2,1,0,89,88,1,0,0,0,90,
-        93,1,0,0,0,91,89,1,0,0,0,91,92,1,0,0,0,92,94,1,0,0,0,93,91,1,0,0,
-        0,94,95,5,2,0,0,95,5,1,0,0,0,96,99,3,8,4,0,97,99,3,10,5,0,98,96,
-        1,0,0,0,98,97,1,0,0,0,99,7,1,0,0,0,100,101,5,11,0,0,101,102,5,42,
-        0,0,102,103,5,3,0,0,103,106,3,58,29,0,104,105,5,24,0,0,105,107,3,
-        28,14,0,106,104,1,0,0,0,106,107,1,0,0,0,107,108,1,0,0,0,108,109,
-        5,4,0,0,109,9,1,0,0,0,110,111,5,12,0,0,111,112,5,42,0,0,112,113,
-        5,3,0,0,113,114,3,58,29,0,114,115,5,24,0,0,115,116,3,28,14,0,116,
-        117,5,4,0,0,117,11,1,0,0,0,118,119,5,13,0,0,119,120,5,42,0,0,120,
-        122,5,5,0,0,121,123,3,14,7,0,122,121,1,0,0,0,122,123,1,0,0,0,123,
-        124,1,0,0,0,124,125,5,6,0,0,125,126,5,3,0,0,126,127,3,58,29,0,127,
-        128,3,4,2,0,128,13,1,0,0,0,129,134,3,16,8,0,130,131,5,7,0,0,131,
-        133,3,16,8,0,132,130,1,0,0,0,133,136,1,0,0,0,134,132,1,0,0,0,134,
-        135,1,0,0,0,135,15,1,0,0,0,136,134,1,0,0,0,137,138,5,42,0,0,138,
-        139,5,3,0,0,139,140,3,58,29,0,140,17,1,0,0,0,141,143,5,19,0,0,142,
-        144,3,28,14,0,143,142,1,0,0,0,143,144,1,0,0,0,144,145,1,0,0,0,145,
-        146,5,4,0,0,146,19,1,0,0,0,147,148,5,14,0,0,148,149,5,5,0,0,149,
-        150,3,28,14,0,150,151,5,6,0,0,151,154,3,2,1,0,152,153,5,15,0,0,153,
-        155,3,2,1,0,154,152,1,0,0,0,154,155,1,0,0,0,155,21,1,0,0,0,156,157,
-        5,16,0,0,157,158,5,5,0,0,158,159,3,28,14,0,159,160,5,6,0,0,160,161,
+        3,15,188,8,15,1,16,1,16,1,16,5,16,193,8,16,10,16,12,16,196,9,16,
+        1,17,1,17,1,17,5,17,201,8,17,10,17,12,17,204,9,17,1,18,1,18,1,18,
+        5,18,209,8,18,10,18,12,18,212,9,18,1,19,1,19,1,19,5,19,217,8,19,
+        10,19,12,19,220,9,19,1,20,1,20,1,20,5,20,225,8,20,10,20,12,20,228,
+        9,20,1,21,1,21,1,21,5,21,233,8,21,10,21,12,21,236,9,21,1,22,5,22,
+        239,8,22,10,22,12,22,242,9,22,1,22,1,22,1,23,1,23,5,23,248,8,23,
+        10,23,12,23,251,9,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
+        1,24,5,24,263,8,24,10,24,12,24,266,9,24,3,24,268,8,24,1,24,3,24,
+        271,8,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,3,25,281,8,25,1,
+        26,1,26,1,26,1,26,5,26,287,8,26,10,26,12,26,290,9,26,3,26,292,8,
+        26,1,26,1,26,1,27,1,27,1,27,1,27,5,27,300,8,27,10,27,12,27,303,9,
+        27,3,27,305,8,27,1,27,1,27,1,28,1,28,1,28,1,28,1,29,1,29,1,29,3,
+        29,316,8,29,1,30,1,30,1,31,1,31,1,31,1,31,5,31,324,8,31,10,31,12,
+        31,327,9,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,0,
+        0,34,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,
+        44,46,48,50,52,54,56,58,60,62,64,66,0,8,1,0,30,31,1,0,32,35,1,0,
+        25,26,1,0,27,29,2,0,26,26,38,38,2,0,40,40,42,42,2,0,20,23,42,42,
+        1,0,39,41,346,0,71,1,0,0,0,2,85,1,0,0,0,4,87,1,0,0,0,6,98,1,0,0,
+        0,8,100,1,0,0,0,10,110,1,0,0,0,12,118,1,0,0,0,14,129,1,0,0,0,16,
+        137,1,0,0,0,18,141,1,0,0,0,20,147,1,0,0,0,22,156,1,0,0,0,24,162,
+        1,0,0,0,26,179,1,0,0,0,28,182,1,0,0,0,30,184,1,0,0,0,32,189,1,0,
+        0,0,34,197,1,0,0,0,36,205,1,0,0,0,38,213,1,0,0,0,40,221,1,0,0,0,
+        42,229,1,0,0,0,44,240,1,0,0,0,46,245,1,0,0,0,48,270,1,0,0,0,50,280,
+        1,0,0,0,52,282,1,0,0,0,54,295,1,0,0,0,56,308,1,0,0,0,58,312,1,0,
+        0,0,60,317,1,0,0,0,62,319,1,0,0,0,64,330,1,0,0,0,66,335,1,0,0,0,
+        68,70,3,2,1,0,69,68,1,0,0,0,70,73,1,0,0,0,71,69,1,0,0,0,71,72,1,
+        0,0,0,72,74,1,0,0,0,73,71,1,0,0,0,74,75,5,0,0,1,75,1,1,0,0,0,76,
+        86,3,6,3,0,77,86,3,12,6,0,78,86,3,62,31,0,79,86,3,20,10,0,80,86,
+        3,22,11,0,81,86,3,24,12,0,82,86,3,26,13,0,83,86,3,18,9,0,84,86,3,
+        4,2,0,85,76,1,0,0,0,85,77,1,0,0,0,85,78,1,0,0,0,85,79,1,0,0,0,85,
+        80,1,0,0,0,85,81,1,0,0,0,85,82,1,0,0,0,85,83,1,0,0,0,85,84,1,0,0,
+        0,86,3,1,0,0,0,87,91,5,1,0,0,88,90,3,2,1,0,89,88,1,0,0,0,90,93,1,
+        0,0,0,91,89,1,0,0,0,91,92,1,0,0,0,92,94,1,0,0,0,93,91,1,0,0,0,94,
+        95,5,2,0,0,95,5,1,0,0,0,96,99,3,8,4,0,97,99,3,10,5,0,98,96,1,0,0,
+        0,98,97,1,0,0,0,99,7,1,0,0,0,100,101,5,11,0,0,101,102,5,42,0,0,102,
+        103,5,3,0,0,103,106,3,58,29,0,104,105,5,24,0,0,105,107,3,28,14,0,
+        106,104,1,0,0,0,106,107,1,0,0,0,107,108,1,0,0,0,108,109,5,4,0,0,
+        109,9,1,0,0,0,110,111,5,12,0,0,111,112,5,42,0,0,112,113,5,3,0,0,
+        113,114,3,58,29,0,114,115,5,24,0,0,115,116,3,28,14,0,116,117,5,4,
+        0,0,117,11,1,0,0,0,118,119,5,13,0,0,119,120,5,42,0,0,120,122,5,5,
+        0,0,121,123,3,14,7,0,122,121,1,0,0,0,122,123,1,0,0,0,123,124,1,0,
+        0,0,124,125,5,6,0,0,125,126,5,3,0,0,126,127,3,58,29,0,127,128,3,
+        4,2,0,128,13,1,0,0,0,129,134,3,16,8,0,130,131,5,7,0,0,131,133,3,
+        16,8,0,132,130,1,0,0,0,133,136,1,0,0,0,134,132,1,0,0,0,134,135,1,
+        0,0,0,135,15,1,0,0,0,136,134,1,0,0,0,137,138,5,42,0,0,138,139,5,
+        3,0,0,139,140,3,58,29,0,140,17,1,0,0,0,141,143,5,19,0,0,142,144,
+        3,28,14,0,143,142,1,0,0,0,143,144,1,0,0,0,144,145,1,0,0,0,145,146,
+        5,4,0,0,146,19,1,0,0,0,147,148,5,14,0,0,148,149,5,5,0,0,149,150,
+        3,28,14,0,150,151,5,6,0,0,151,154,3,2,1,0,152,153,5,15,0,0,153,155,
+        3,2,1,0,154,152,1,0,0,0,154,155,1,0,0,0,155,21,1,0,0,0,156,157,5,
+        16,0,0,157,158,5,5,0,0,158,159,3,28,14,0,159,160,5,6,0,0,160,161,
         3,2,1,0,161,23,1,0,0,0,162,163,5,17,0,0,163,167,5,5,0,0,164,168,
         3,6,3,0,165,168,3,26,13,0,166,168,5,4,0,0,167,164,1,0,0,0,167,165,
         1,0,0,0,167,166,1,0,0,0,168,170,1,0,0,0,169,171,3,28,14,0,170,169,
         1,0,0,0,170,171,1,0,0,0,171,172,1,0,0,0,172,174,5,4,0,0,173,175,
         3,28,14,0,174,173,1,0,0,0,174,175,1,0,0,0,175,176,1,0,0,0,176,177,
         5,6,0,0,177,178,3,2,1,0,178,25,1,0,0,0,179,180,3,28,14,0,180,181,
-        5,4,0,0,181,27,1,0,0,0,182,183,3,30,15,0,183,29,1,0,0,0,184,185,
-        3,46,23,0,185,186,5,24,0,0,186,187,3,30,15,0,187,190,1,0,0,0,188,
-        190,3,32,16,0,189,184,1,0,0,0,189,188,1,0,0,0,190,31,1,0,0,0,191,
-        196,3,34,17,0,192,193,5,37,0,0,193,195,3,34,17,0,194,192,1,0,0,0,
-        195,198,1,0,0,0,196,194,1,0,0,0,196,197,1,0,0,0,197,33,1,0,0,0,198,
-        196,1,0,0,0,199,204,3,36,18,0,200,201,5,36,0,0,201,203,3,36,18,0,
-        202,200,1,0,0,0,203,206,1,0,0,0,204,202,1,0,0,0,204,205,1,0,0,0,
-        205,35,1,0,0,0,206,204,1,0,0,0,207,212,3,38,19,0,208,209,7,0,0,0,
-        209,211,3,38,19,0,210,208,1,0,0,0,211,214,1,0,0,0,212,210,1,0,0,
-        0,212,213,1,0,0,0,213,37,1,0,0,0,214,212,1,0,0,0,215,220,3,40,20,
-        0,216,217,7,1,0,0,217,219,3,40,20,0,218,216,1,0,0,0,219,222,1,0,
-        0,0,220,218,1,0,0,0,220,221,1,0,0,0,221,39,1,0,0,0,222,220,1,0,0,
-        0,223,228,3,42,21,0,224,225,7,2,0,0,225,227,3,42,21,0,226,224,1,
-        0,0,0,227,230,1,0,0,0,228,226,1,0,0,0,228,229,1,0,0,0,229,41,1,0,
-        0,0,230,228,1,0,0,0,231,236,3,44,22,0,232,233,7,3,0,0,233,235,3,
-        44,22,0,234,232,1,0,0,0,235,238,1,0,0,0,236,234,1,0,0,0,236,237,
-        1,0,0,0,237,43,1,0,0,0,238,236,1,0,0,0,239,241,7,4,0,0,240,239,1,
-        0,0,0,241,244,1,0,0,0,242,240,1,0,0,0,242,243,1,0,0,0,243,245,1,
-        0,0,0,244,242,1,0,0,0,245,246,3,46,23,0,246,45,1,0,0,0,247,251,3,
-        50,25,0,248,250,3,48,24,0,249,248,1,0,0,0,250,253,1,0,0,0,251,249,
-        1,0,0,0,251,252,1,0,0,0,252,47,1,0,0,0,253,251,1,0,0,0,254,255,5,
-        8,0,0,255,256,3,28,14,0,256,257,5,9,0,0,257,273,1,0,0,0,258,259,
-        5,10,0,0,259,273,5,42,0,0,260,269,5,5,0,0,261,266,3,28,14,0,262,
-        263,5,7,0,0,263,265,3,28,14,0,264,262,1,0,0,0,265,268,1,0,0,0,266,
-        264,1,0,0,0,266,267,1,0,0,0,267,270,1,0,0,0,268,266,1,0,0,0,269,
-        261,1,0,0,0,269,270,1,0,0,0,270,271,1,0,0,0,271,273,5,6,0,0,272,
-        254,1,0,0,0,272,258,1,0,0,0,272,260,1,0,0,0,273,49,1,0,0,0,274,283,
-        3,66,33,0,275,283,5,42,0,0,276,277,5,5,0,0,277,278,3,28,14,0,278,
-        279,5,6,0,0,279,283,1,0,0,0,280,283,3,52,26,0,281,283,3,54,27,0,
-        282,274,1,0,0,0,282,275,1,0,0,0,282,276,1,0,0,0,282,280,1,0,0,0,
-        282,281,1,0,0,0,283,51,1,0,0,0,284,293,5,8,0,0,285,290,3,28,14,0,
-        286,287,5,7,0,0,287,289,3,28,14,0,288,286,1,0,0,0,289,292,1,0,0,
-        0,290,288,1,0,0,0,290,291,1,0,0,0,291,294,1,0,0,0,292,290,1,0,0,
-        0,293,285,1,0,0,0,293,294,1,0,0,0,294,295,1,0,0,0,295,296,5,9,0,
-        0,296,53,1,0,0,0,297,306,5,1,0,0,298,303,3,56,28,0,299,300,5,7,0,
-        0,300,302,3,56,28,0,301,299,1,0,0,0,302,305,1,0,0,0,303,301,1,0,
-        0,0,303,304,1,0,0,0,304,307,1,0,0,0,305,303,1,0,0,0,306,298,1,0,
-        0,0,306,307,1,0,0,0,307,308,1,0,0,0,308,309,5,2,0,0,309,55,1,0,0,
-        0,310,311,7,5,0,0,311,312,5,3,0,0,312,313,3,28,14,0,313,57,1,0,0,
-        0,314,317,3,60,30,0,315,316,5,8,0,0,316,318,5,9,0,0,317,315,1,0,
-        0,0,317,318,1,0,0,0,318,59,1,0,0,0,319,320,7,6,0,0,320,61,1,0,0,
-        0,321,322,5,18,0,0,322,323,5,42,0,0,323,327,5,1,0,0,324,326,3,64,
-        32,0,325,324,1,0,0,0,326,329,1,0,0,0,327,325,1,0,0,0,327,328,1,0,
-        0,0,328,330,1,0,0,0,329,327,1,0,0,0,330,331,5,2,0,0,331,63,1,0,0,
-        0,332,333,5,42,0,0,333,334,5,3,0,0,334,335,3,58,29,0,335,336,5,4,
-        0,0,336,65,1,0,0,0,337,338,7,7,0,0,338,67,1,0,0,0,31,71,85,91,98,
-        106,122,134,143,154,167,170,174,189,196,204,212,220,228,236,242,
-        251,266,269,272,282,290,293,303,306,317,327
+        5,4,0,0,181,27,1,0,0,0,182,183,3,30,15,0,183,29,1,0,0,0,184,187,
+        3,32,16,0,185,186,5,24,0,0,186,188,3,30,15,0,187,185,1,0,0,0,187,
+        188,1,0,0,0,188,31,1,0,0,0,189,194,3,34,17,0,190,191,5,37,0,0,191,
+        193,3,34,17,0,192,190,1,0,0,0,193,196,1,0,0,0,194,192,1,0,0,0,194,
+        195,1,0,0,0,195,33,1,0,0,0,196,194,1,0,0,0,197,202,3,36,18,0,198,
+        199,5,36,0,0,199,201,3,36,18,0,200,198,1,0,0,0,201,204,1,0,0,0,202,
+        200,1,0,0,0,202,203,1,0,0,0,203,35,1,0,0,0,204,202,1,0,0,0,205,210,
+        3,38,19,0,206,207,7,0,0,0,207,209,3,38,19,0,208,206,1,0,0,0,209,
+        212,1,0,0,0,210,208,1,0,0,0,210,211,1,0,0,0,211,37,1,0,0,0,212,210,
+        1,0,0,0,213,218,3,40,20,0,214,215,7,1,0,0,215,217,3,40,20,0,216,
+        214,1,0,0,0,217,220,1,0,0,0,218,216,1,0,0,0,218,219,1,0,0,0,219,
+        39,1,0,0,0,220,218,1,0,0,0,221,226,3,42,21,0,222,223,7,2,0,0,223,
+        225,3,42,21,0,224,222,1,0,0,0,225,228,1,0,0,0,226,224,1,0,0,0,226,
+        227,1,0,0,0,227,41,1,0,0,0,228,226,1,0,0,0,229,234,3,44,22,0,230,
+        231,7,3,0,0,231,233,3,44,22,0,232,230,1,0,0,0,233,236,1,0,0,0,234,
+        232,1,0,0,0,234,235,1,0,0,0,235,43,1,0,0,0,236,234,1,0,0,0,237,239,
+        7,4,0,0,238,237,1,0,0,0,239,242,1,0,0,0,240,238,1,0,0,0,240,241,
+        1,0,0,0,241,243,1,0,0,0,242,240,1,0,0,0,243,244,3,46,23,0,244,45,
+        1,0,0,0,245,249,3,50,25,0,246,248,3,48,24,0,247,246,1,0,0,0,248,
+        251,1,0,0,0,249,247,1,0,0,0,249,250,1,0,0,0,250,47,1,0,0,0,251,249,
+        1,0,0,0,252,253,5,8,0,0,253,254,3,28,14,0,254,255,5,9,0,0,255,271,
+        1,0,0,0,256,257,5,10,0,0,257,271,5,42,0,0,258,267,5,5,0,0,259,264,
+        3,28,14,0,260,261,5,7,0,0,261,263,3,28,14,0,262,260,1,0,0,0,263,
+        266,1,0,0,0,264,262,1,0,0,0,264,265,1,0,0,0,265,268,1,0,0,0,266,
+        264,1,0,0,0,267,259,1,0,0,0,267,268,1,0,0,0,268,269,1,0,0,0,269,
+        271,5,6,0,0,270,252,1,0,0,0,270,256,1,0,0,0,270,258,1,0,0,0,271,
+        49,1,0,0,0,272,281,3,66,33,0,273,281,5,42,0,0,274,275,5,5,0,0,275,
+        276,3,28,14,0,276,277,5,6,0,0,277,281,1,0,0,0,278,281,3,52,26,0,
+        279,281,3,54,27,0,280,272,1,0,0,0,280,273,1,0,0,0,280,274,1,0,0,
+        0,280,278,1,0,0,0,280,279,1,0,0,0,281,51,1,0,0,0,282,291,5,8,0,0,
+        283,288,3,28,14,0,284,285,5,7,0,0,285,287,3,28,14,0,286,284,1,0,
+        0,0,287,290,1,0,0,0,288,286,1,0,0,0,288,289,1,0,0,0,289,292,1,0,
+        0,0,290,288,1,0,0,0,291,283,1,0,0,0,291,292,1,0,0,0,292,293,1,0,
+        0,0,293,294,5,9,0,0,294,53,1,0,0,0,295,304,5,1,0,0,296,301,3,56,
+        28,0,297,298,5,7,0,0,298,300,3,56,28,0,299,297,1,0,0,0,300,303,1,
+        0,0,0,301,299,1,0,0,0,301,302,1,0,0,0,302,305,1,0,0,0,303,301,1,
+        0,0,0,304,296,1,0,0,0,304,305,1,0,0,0,305,306,1,0,0,0,306,307,5,
+        2,0,0,307,55,1,0,0,0,308,309,7,5,0,0,309,310,5,3,0,0,310,311,3,28,
+        14,0,311,57,1,0,0,0,312,315,3,60,30,0,313,314,5,8,0,0,314,316,5,
+        9,0,0,315,313,1,0,0,0,315,316,1,0,0,0,316,59,1,0,0,0,317,318,7,6,
+        0,0,318,61,1,0,0,0,319,320,5,18,0,0,320,321,5,42,0,0,321,325,5,1,
+        0,0,322,324,3,64,32,0,323,322,1,0,0,0,324,327,1,0,0,0,325,323,1,
+        0,0,0,325,326,1,0,0,0,326,328,1,0,0,0,327,325,1,0,0,0,328,329,5,
+        2,0,0,329,63,1,0,0,0,330,331,5,42,0,0,331,332,5,3,0,0,332,333,3,
+        58,29,0,333,334,5,4,0,0,334,65,1,0,0,0,335,336,7,7,0,0,336,67,1,
+        0,0,0,31,71,85,91,98,106,122,134,143,154,167,170,174,187,194,202,
+        210,218,226,234,240,249,264,267,270,280,288,291,301,304,315,325
     ]
 
 class TypeScriptParser ( Parser ):
@@ -1240,8 +1239,8 @@ class TypeScriptParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def postfixExpr(self):
-            return self.getTypedRuleContext(TypeScriptParser.PostfixExprContext,0)
+        def logicalOrExpr(self):
+            return self.getTypedRuleContext(TypeScriptParser.LogicalOrExprContext,0)
 
 
         def ASSIGN(self):
@@ -1251,10 +1250,6 @@ class TypeScriptParser ( Parser ):
             return self.getTypedRuleContext(TypeScriptParser.AssignmentExprContext,0)
 
 
-        def logicalOrExpr(self):
-            return self.getTypedRuleContext(TypeScriptParser.LogicalOrExprContext,0)
-
-
         def getRuleIndex(self):
             return TypeScriptParser.RULE_assignmentExpr
 
@@ -1271,25 +1266,19 @@ class TypeScriptParser ( Parser ):
 
         localctx = TypeScriptParser.AssignmentExprContext(self, self._ctx, self.state)
         self.enterRule(localctx, 30, self.RULE_assignmentExpr)
+        self._la = 0 # Token type
         try:
-            self.state = 189
+            self.enterOuterAlt(localctx, 1)
+            self.state = 184
+            self.logicalOrExpr()
+            self.state = 187
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,12,self._ctx)
-            if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 184
-                self.postfixExpr()
+            _la = self._input.LA(1)
+            if _la==24:
                 self.state = 185
                 self.match(TypeScriptParser.ASSIGN)
                 self.state = 186
                 self.assignmentExpr()
-                pass
-
-            elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 188
-                self.logicalOrExpr()
-                pass
 
 
         except RecognitionException as re:
@@ -1340,17 +1329,17 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 191
+            self.state = 189
             self.logicalAndExpr()
-            self.state = 196
+            self.state = 194
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==37:
-                self.state = 192
+                self.state = 190
                 self.match(TypeScriptParser.OR)
-                self.state = 193
+                self.state = 191
                 self.logicalAndExpr()
-                self.state = 198
+                self.state = 196
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1402,17 +1391,17 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 199
+            self.state = 197
             self.equalityExpr()
-            self.state = 204
+            self.state = 202
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==36:
-                self.state = 200
+                self.state = 198
                 self.match(TypeScriptParser.AND)
-                self.state = 201
+                self.state = 199
                 self.equalityExpr()
-                self.state = 206
+                self.state = 204
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1470,22 +1459,22 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 207
+            self.state = 205
             self.relationalExpr()
-            self.state = 212
+            self.state = 210
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==30 or _la==31:
-                self.state = 208
+                self.state = 206
                 _la = self._input.LA(1)
                 if not(_la==30 or _la==31):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 209
+                self.state = 207
                 self.relationalExpr()
-                self.state = 214
+                self.state = 212
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1555,22 +1544,22 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 215
+            self.state = 213
             self.additiveExpr()
-            self.state = 220
+            self.state = 218
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 64424509440) != 0):
-                self.state = 216
+                self.state = 214
                 _la = self._input.LA(1)
                 if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 64424509440) != 0)):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 217
+                self.state = 215
                 self.additiveExpr()
-                self.state = 222
+                self.state = 220
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1628,22 +1617,22 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 223
+            self.state = 221
             self.multiplicativeExpr()
-            self.state = 228
+            self.state = 226
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==25 or _la==26:
-                self.state = 224
+                self.state = 222
                 _la = self._input.LA(1)
                 if not(_la==25 or _la==26):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 225
+                self.state = 223
                 self.multiplicativeExpr()
-                self.state = 230
+                self.state = 228
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1707,22 +1696,22 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 231
+            self.state = 229
             self.unaryExpr()
-            self.state = 236
+            self.state = 234
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 939524096) != 0):
-                self.state = 232
+                self.state = 230
                 _la = self._input.LA(1)
                 if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 939524096) != 0)):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 233
+                self.state = 231
                 self.unaryExpr()
-                self.state = 238
+                self.state = 236
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1777,22 +1766,22 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 242
+            self.state = 240
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==26 or _la==38:
-                self.state = 239
+                self.state = 237
                 _la = self._input.LA(1)
                 if not(_la==26 or _la==38):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 244
+                self.state = 242
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 245
+            self.state = 243
             self.postfixExpr()
         except RecognitionException as re:
             localctx.exception = re
@@ -1840,15 +1829,15 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 247
+            self.state = 245
             self.primary()
-            self.state = 251
+            self.state = 249
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1312) != 0):
-                self.state = 248
+                self.state = 246
                 self.postfixOp()
-                self.state = 253
+                self.state = 251
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1896,50 +1885,50 @@ class TypeScriptParser ( Parser ):
         self.enterRule(localctx, 48, self.RULE_postfixOp)
         self._la = 0 # Token type
         try:
-            self.state = 272
+            self.state = 270
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [8]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 254
+                self.state = 252
                 self.match(TypeScriptParser.T__7)
-                self.state = 255
+                self.state = 253
                 self.expression()
-                self.state = 256
+                self.state = 254
                 self.match(TypeScriptParser.T__8)
                 pass
             elif token in [10]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 258
+                self.state = 256
                 self.match(TypeScriptParser.T__9)
-                self.state = 259
+                self.state = 257
                 self.match(TypeScriptParser.ID)
                 pass
             elif token in [5]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 260
+                self.state = 258
                 self.match(TypeScriptParser.T__4)
-                self.state = 269
+                self.state = 267
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8521282224418) != 0):
-                    self.state = 261
+                    self.state = 259
                     self.expression()
-                    self.state = 266
+                    self.state = 264
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     while _la==7:
-                        self.state = 262
+                        self.state = 260
                         self.match(TypeScriptParser.T__6)
-                        self.state = 263
+                        self.state = 261
                         self.expression()
-                        self.state = 268
+                        self.state = 266
                         self._errHandler.sync(self)
                         _la = self._input.LA(1)
 
 
 
-                self.state = 271
+                self.state = 269
                 self.match(TypeScriptParser.T__5)
                 pass
             else:
@@ -1997,36 +1986,36 @@ class TypeScriptParser ( Parser ):
         localctx = TypeScriptParser.PrimaryContext(self, self._ctx, self.state)
         self.enterRule(localctx, 50, self.RULE_primary)
         try:
-            self.state = 282
+            self.state = 280
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [39, 40, 41]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 274
+                self.state = 272
                 self.literal()
                 pass
             elif token in [42]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 275
+                self.state = 273
                 self.match(TypeScriptParser.ID)
                 pass
             elif token in [5]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 276
+                self.state = 274
                 self.match(TypeScriptParser.T__4)
-                self.state = 277
+                self.state = 275
                 self.expression()
-                self.state = 278
+                self.state = 276
                 self.match(TypeScriptParser.T__5)
                 pass
             elif token in [8]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 280
+                self.state = 278
                 self.arrayLiteral()
                 pass
             elif token in [1]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 281
+                self.state = 279
                 self.objectLiteral()
                 pass
             else:
@@ -2074,29 +2063,29 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 284
+            self.state = 282
             self.match(TypeScriptParser.T__7)
-            self.state = 293
+            self.state = 291
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8521282224418) != 0):
-                self.state = 285
+                self.state = 283
                 self.expression()
-                self.state = 290
+                self.state = 288
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==7:
-                    self.state = 286
+                    self.state = 284
                     self.match(TypeScriptParser.T__6)
-                    self.state = 287
+                    self.state = 285
                     self.expression()
-                    self.state = 292
+                    self.state = 290
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 295
+            self.state = 293
             self.match(TypeScriptParser.T__8)
         except RecognitionException as re:
             localctx.exception = re
@@ -2140,29 +2129,29 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 297
+            self.state = 295
             self.match(TypeScriptParser.T__0)
-            self.state = 306
+            self.state = 304
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==40 or _la==42:
-                self.state = 298
+                self.state = 296
                 self.propAssign()
-                self.state = 303
+                self.state = 301
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==7:
-                    self.state = 299
+                    self.state = 297
                     self.match(TypeScriptParser.T__6)
-                    self.state = 300
+                    self.state = 298
                     self.propAssign()
-                    self.state = 305
+                    self.state = 303
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 308
+            self.state = 306
             self.match(TypeScriptParser.T__1)
         except RecognitionException as re:
             localctx.exception = re
@@ -2209,16 +2198,16 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 310
+            self.state = 308
             _la = self._input.LA(1)
             if not(_la==40 or _la==42):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 311
+            self.state = 309
             self.match(TypeScriptParser.T__2)
-            self.state = 312
+            self.state = 310
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -2259,15 +2248,15 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 314
+            self.state = 312
             self.baseType()
-            self.state = 317
+            self.state = 315
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 315
+                self.state = 313
                 self.match(TypeScriptParser.T__7)
-                self.state = 316
+                self.state = 314
                 self.match(TypeScriptParser.T__8)
 
 
@@ -2321,7 +2310,7 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 319
+            self.state = 317
             _la = self._input.LA(1)
             if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4398062239744) != 0)):
                 self._errHandler.recoverInline(self)
@@ -2376,23 +2365,23 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 321
+            self.state = 319
             self.match(TypeScriptParser.INTERFACE)
-            self.state = 322
+            self.state = 320
             self.match(TypeScriptParser.ID)
-            self.state = 323
+            self.state = 321
             self.match(TypeScriptParser.T__0)
-            self.state = 327
+            self.state = 325
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==42:
-                self.state = 324
+                self.state = 322
                 self.interfaceProp()
-                self.state = 329
+                self.state = 327
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 330
+            self.state = 328
             self.match(TypeScriptParser.T__1)
         except RecognitionException as re:
             localctx.exception = re
@@ -2435,13 +2424,13 @@ class TypeScriptParser ( Parser ):
         self.enterRule(localctx, 64, self.RULE_interfaceProp)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 332
+            self.state = 330
             self.match(TypeScriptParser.ID)
-            self.state = 333
+            self.state = 331
             self.match(TypeScriptParser.T__2)
-            self.state = 334
+            self.state = 332
             self.typeExpr()
-            self.state = 335
+            self.state = 333
             self.match(TypeScriptParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -2487,7 +2476,7 @@ class TypeScriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 337
+            self.state = 335
             _la = self._input.LA(1)
             if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3848290697216) != 0)):
                 self._errHandler.recoverInline(self)
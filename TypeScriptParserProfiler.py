@@ -0,0 +1,184 @@
+"""
+Perfil das decisões de predição do TypeScriptParser.
+
+O runtime Python do ANTLR não traz o ProfilingATNSimulator do runtime Java; este
+módulo é um porte dele. ProfilingATNSimulator substitui o `_interp` do parser e
+acumula, por decisão (`adaptivePredict`):
+- invocações e tempo total de predição;
+- lookahead (k) do SLL: total, mínimo e máximo;
+- fallbacks para LL completo (conflito no SLL) e lookahead do LL;
+- transições resolvidas pelo DFA e pelo ATN, ambiguidades, sensibilidades
+  ao contexto e erros de predição.
+
+Decisões LL(1) que o código gerado resolve com `LA(1)` não passam por
+adaptivePredict e por isso não aparecem (como no runtime Java). Com o parser de
+expressões "pratt", as regras de expressão também não usam predição.
+
+Cada decisão é associada à regra que a contém (`TypeScriptParser.ruleNames`).
+O relatório é impresso como tabela e pode ser gravado em JSON para acompanhar os
+pontos quentes da gramática ao longo do tempo.
+"""
+
+import json
+import os
+import time
+
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROFILE_PATH = os.path.join(PROJECT_DIR, ".ts_cache", "parser_profile.json")
+
+
+class DecisionInfo:
+    """Estatísticas de uma decisão (equivalente a org.antlr.v4.runtime.atn.DecisionInfo)"""
+
+    __slots__ = ("decision", "invocations", "time_ns",
+                 "sll_total_look", "sll_min_look", "sll_max_look",
+                 "ll_fallback", "ll_total_look", "ll_min_look", "ll_max_look",
+                 "sll_dfa_transitions", "sll_atn_transitions", "ll_atn_transitions",
+                 "ambiguities", "context_sensitivities", "errors", "max_look_line")
+
+    def __init__(self, decision: int):
+        self.decision = decision
+        for field in self.__slots__[1:]:
+            setattr(self, field, 0)
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator que mede cada chamada de adaptivePredict"""
+
+    def __init__(self, parser):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        self.predictionMode = parser._interp.predictionMode
+        self.decisions = [DecisionInfo(i) for i in range(len(parser.atn.decisionToState))]
+        self._current = None
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._conflicting_alt = 0
+
+    def adaptivePredict(self, input, decision, outerContext):
+        info = self.decisions[decision]
+        self._current = info
+        self._sll_stop = self._ll_stop = -1
+        start_index = input.index
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            sll_k = self._sll_stop - start_index + 1
+            info.sll_total_look += sll_k
+            info.sll_min_look = sll_k if info.sll_min_look == 0 else min(info.sll_min_look, sll_k)
+            if sll_k > info.sll_max_look:
+                info.sll_max_look = sll_k
+                info.max_look_line = input.get(start_index).line
+            if self._ll_stop >= 0:
+                ll_k = self._ll_stop - start_index + 1
+                info.ll_total_look += ll_k
+                info.ll_min_look = ll_k if info.ll_min_look == 0 else min(info.ll_min_look, ll_k)
+                info.ll_max_look = max(info.ll_max_look, ll_k)
+            self._current = None
+
+    def getExistingTargetState(self, previousD, t):
+        self._sll_stop = self._input.index
+        state = super().getExistingTargetState(previousD, t)
+        if state is not None:
+            self._current.sll_dfa_transitions += 1
+            if state is self.ERROR:
+                self._current.errors += 1
+        return state
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._ll_stop = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        info = self._current
+        if info is not None:
+            if fullCtx:
+                info.ll_atn_transitions += 1
+            else:
+                info.sll_atn_transitions += 1
+            if reach is None:
+                info.errors += 1
+        return reach
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        alts = conflictingAlts if conflictingAlts else configs.getAlts()
+        self._conflicting_alt = min(alts)
+        self.decisions[dfa.decision].ll_fallback += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        if prediction != self._conflicting_alt:
+            self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def enable_profiling(parser) -> ProfilingATNSimulator:
+    """Instala o simulador de perfil no parser (antes de chamar a regra inicial)"""
+    parser._interp = ProfilingATNSimulator(parser)
+    return parser._interp
+
+
+def decision_report(simulator: ProfilingATNSimulator) -> list:
+    """Uma entrada por decisão invocada, da mais cara para a mais barata"""
+    parser = simulator.parser
+    rows = []
+    for info in simulator.decisions:
+        if not info.invocations:
+            continue
+        state = simulator.atn.decisionToState[info.decision]
+        rows.append({
+            "decision": info.decision,
+            "rule": parser.ruleNames[state.ruleIndex],
+            "invocations": info.invocations,
+            "time_ms": info.time_ns / 1e6,
+            "sll_avg_look": info.sll_total_look / info.invocations,
+            "sll_min_look": info.sll_min_look,
+            "sll_max_look": info.sll_max_look,
+            "sll_max_look_line": info.max_look_line,
+            "ll_fallback": info.ll_fallback,
+            "ll_min_look": info.ll_min_look,
+            "ll_max_look": info.ll_max_look,
+            "sll_dfa_transitions": info.sll_dfa_transitions,
+            "sll_atn_transitions": info.sll_atn_transitions,
+            "ll_atn_transitions": info.ll_atn_transitions,
+            "ambiguities": info.ambiguities,
+            "context_sensitivities": info.context_sensitivities,
+            "errors": info.errors,
+        })
+    rows.sort(key=lambda row: row["time_ms"], reverse=True)
+    return rows
+
+
+def format_table(rows: list) -> str:
+    """Tabela legível do relatório de decision_report"""
+    header = (f"  {'dec':>4} {'regra':<22} {'invoc.':>8} {'SLL→LL':>7} "
+              f"{'k méd':>6} {'k máx':>6} {'k LL':>5} {'ATN':>6} {'amb.':>5} {'tempo':>10}")
+    lines = ["Perfil do parser (decisões por tempo de predição):", header]
+    total_ms = 0.0
+    for row in rows:
+        total_ms += row["time_ms"]
+        lines.append(
+            f"  {row['decision']:>4} {row['rule']:<22} {row['invocations']:>8} "
+            f"{row['ll_fallback']:>7} {row['sll_avg_look']:>6.2f} {row['sll_max_look']:>6} "
+            f"{row['ll_max_look']:>5} {row['sll_atn_transitions'] + row['ll_atn_transitions']:>6} "
+            f"{row['ambiguities']:>5} {row['time_ms']:>7.2f} ms")
+    invocations = sum(row["invocations"] for row in rows)
+    lines.append(f"  {'total':>27} {invocations:>8} "
+                 f"{sum(row['ll_fallback'] for row in rows):>7} {'':>33} {total_ms:>7.2f} ms")
+    return "\n".join(lines)
+
+
+def write_json(path: str, rows: list, **meta):
+    """Grava o relatório (com metadados da execução) em JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(meta, decisions=rows), f, ensure_ascii=False, indent=2)
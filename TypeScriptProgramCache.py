@@ -0,0 +1,259 @@
+"""
+Cache persistente de programas já analisados sintaticamente.
+
+Para um arquivo que não mudou, lexer e parser produzem sempre o mesmo AST. Este
+módulo guarda o AST (TypeScriptAST.Program) em disco, endereçado pelo conteúdo:
+a chave é o SHA-256 dos bytes do fonte combinado com a chave do compilador (hash
+de `TypeScript.g4`, dos módulos que definem o AST e da versão do formato). Um
+acerto devolve o Program diretamente, sem executar TypeScriptLexer nem
+TypeScriptParser.
+
+Só entram no cache programas sem erros léxicos/sintáticos (esses precisam ser
+relatados pelo parser a cada execução).
+
+Formato (via `marshal`, só dados simples): o AST vira duas listas planas, sem
+aninhamento (marshal recusa estruturas com mais de ~2000 níveis, e programas
+profundos também precisam entrar no cache):
+- `code`, uma operação (int) por valor, em pré-ordem: constante, lista ou tupla
+  (as tuplas (nome, nó) de ObjectLiteral/InterfaceDecl) ou nó de uma classe;
+- `consts`, na mesma ordem, as constantes (str, bool, None) e os tamanhos das
+  listas e tuplas.
+encode e decode usam uma pilha explícita; decode lê `code` de trás para frente,
+e cada nó encontra seus campos já reconstruídos no topo da pilha. Strings
+internadas continuam internadas ao recarregar (marshal preserva isso).
+
+O diretório tem um limite de tamanho: `index.bin` guarda, para cada entrada, o
+tamanho e o instante do último uso; ao gravar, as entradas menos recentemente
+usadas são removidas até caber no limite. O índice também acumula os totais de
+acertos e falhas.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+import TypeScriptAST
+from TypeScriptAST import Node
+
+FORMAT_VERSION = 2
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, ".ts_cache", "programs")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Arquivos cujo conteúdo determina o AST produzido para um mesmo fonte
+_KEY_FILES = ("TypeScript.g4", "TypeScriptAST.py", "TypeScriptLowering.py",
+              "TypeScriptExprParser.py")
+
+
+def _node_classes() -> list:
+    """Classes concretas de nó (com _fields), em ordem estável"""
+    classes = [cls for cls in vars(TypeScriptAST).values()
+               if isinstance(cls, type) and issubclass(cls, Node) and cls._fields
+               and cls.__module__ == TypeScriptAST.__name__]
+    return sorted(classes, key=lambda cls: cls.__name__)
+
+
+_CLASSES = _node_classes()
+_TAGS = {cls: tag for tag, cls in enumerate(_CLASSES)}
+
+_compiler_key = None  # calculada na primeira chamada de compiler_key()
+
+
+def compiler_key() -> str:
+    """Hash que identifica a gramática e a versão do compilador"""
+    global _compiler_key
+    if _compiler_key is None:
+        h = hashlib.sha256()
+        for name in _KEY_FILES:
+            with open(os.path.join(PROJECT_DIR, name), "rb") as f:
+                h.update(f.read())
+        h.update(f"|fmt={FORMAT_VERSION}|marshal={marshal.version}".encode())
+        h.update(f"|py={sys.version_info[0]}.{sys.version_info[1]}".encode())
+        _compiler_key = h.hexdigest()
+    return _compiler_key
+
+
+def source_key(data: bytes) -> str:
+    """Chave do cache para os bytes de um arquivo fonte"""
+    return hashlib.sha256(compiler_key().encode() + b"|" + data).hexdigest()
+
+
+# ============================================================================
+# SERIALIZAÇÃO
+# ============================================================================
+
+
+# Operações de `code`; um nó da classe _CLASSES[i] é _NODE + i
+_CONST, _LIST, _TUPLE, _NODE = 0, 1, 2, 3
+
+
+def encode(value) -> tuple:
+    """Converte nós (e listas/tuplas de nós) nas listas planas (code, consts)"""
+    code, consts = [], []
+    op, const = code.append, consts.append
+    stack = [value]
+    pop, extend = stack.pop, stack.extend
+    tags = _TAGS
+    while stack:
+        value = pop()
+        kind = type(value)
+        tag = tags.get(kind)
+        if tag is not None:
+            op(_NODE + tag)
+            extend([getattr(value, field) for field in reversed(kind._fields)])
+        elif kind is list or kind is tuple:
+            op(_LIST if kind is list else _TUPLE)
+            const(len(value))
+            extend(reversed(value))
+        else:
+            op(_CONST)
+            const(value)
+    return code, consts
+
+
+def decode(encoded: tuple):
+    """Inverso de encode: reconstrói os nós sem passar pelos construtores"""
+    code, consts = encoded
+    values = []
+    push, pop = values.append, values.pop
+    k = len(consts)
+    classes = _CLASSES
+    for op in reversed(code):
+        if op == _CONST:
+            k -= 1
+            push(consts[k])
+        elif op < _NODE:
+            k -= 1
+            n = consts[k]
+            items = values[:-n - 1:-1] if n else []
+            if n:
+                del values[-n:]
+            push(items if op == _LIST else tuple(items))
+        else:
+            cls = classes[op - _NODE]
+            node = cls.__new__(cls)
+            for field in cls._fields:
+                setattr(node, field, pop())
+            push(node)
+    return values[0]
+
+
+# ============================================================================
+# CACHE EM DISCO
+# ============================================================================
+
+
+class ProgramCache:
+    """Diretório de ASTs serializados com limite de tamanho e remoção LRU"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(path, "index.bin")
+        self.index = self._load_index()
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, "rb") as f:
+                index = marshal.load(f)
+            if isinstance(index, dict) and index.get("format") == FORMAT_VERSION:
+                return index
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        return {"format": FORMAT_VERSION, "clock": 0, "hits": 0, "misses": 0, "entries": {}}
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.bin")
+
+    def _touch(self, key: str, size: int):
+        self.index["clock"] += 1
+        self.index["entries"][key] = (size, self.index["clock"])
+
+    @property
+    def hits(self) -> int:
+        return self.index["hits"]
+
+    @property
+    def misses(self) -> int:
+        return self.index["misses"]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for size, _ in self.index["entries"].values())
+
+    def get(self, key: str):
+        """Program da chave, ou None (falha). Entradas ilegíveis são descartadas."""
+        program = None
+        if key in self.index["entries"]:
+            try:
+                with open(self._entry_path(key), "rb") as f:
+                    data = f.read()
+                entry = marshal.loads(data)
+                if entry.get("key") == key:
+                    program = decode(entry["program"])
+            except Exception:
+                program = None
+            if program is None:
+                self._drop(key)
+
+        if program is None:
+            self.index["misses"] += 1
+        else:
+            self.index["hits"] += 1
+            self._touch(key, len(data))
+        self._save_index()
+        return program
+
+    def put(self, key: str, program) -> bool:
+        """Grava o Program (escrita atômica) e aplica o limite de tamanho"""
+        data = marshal.dumps({"key": key, "program": encode(program)})
+        if len(data) > self.max_bytes:
+            return False
+
+        os.makedirs(self.path, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            _remove(tmp_path)
+            return False
+
+        self._touch(key, len(data))
+        self._evict()
+        self._save_index()
+        return True
+
+    def _evict(self):
+        """Remove as entradas menos recentemente usadas até caber no limite"""
+        entries = self.index["entries"]
+        total = self.total_bytes
+        for key in sorted(entries, key=lambda k: entries[k][1]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key][0]
+            self._drop(key)
+
+    def _drop(self, key: str):
+        self.index["entries"].pop(key, None)
+        _remove(self._entry_path(key))
+
+    def _save_index(self):
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,184 @@
+"""
+Lexer alternativo baseado em uma única regex compilada.
+
+Substitui o `TypeScriptLexer` gerado (que simula o ATN do lexer caractere por
+caractere em Python puro) sem mudar nada para o parser: produz os mesmos tipos de
+token (`TypeScriptLexer.tokens`), as mesmas posições (linha/coluna/índices) e os
+mesmos erros de reconhecimento, e alimenta o `CommonTokenStream` normalmente.
+
+Cada alternativa da regex espelha uma regra de token de `TypeScript.g4`. A regra
+do ANTLR (maior casamento; empate → regra declarada primeiro) é reproduzida assim:
+- palavras-chave, tipos e BOOLEAN_LIT casam como ID e são reclassificadas pela
+  tabela de literais (empate de tamanho: a regra literal vem antes de ID);
+- operadores de dois caracteres aparecem antes dos de um caractere;
+- comentários aparecem antes de '/'; um comentário de bloco sem fechamento não
+  casa e cai em '/' seguido de '*', como no ATN.
+"""
+
+import re
+import sys
+from typing import TextIO
+
+from antlr4 import Token
+from antlr4.Token import CommonToken
+
+from TypeScriptLexer import TypeScriptLexer
+
+
+def _literal_types() -> dict:
+    """Mapeia o texto de cada token literal da gramática para seu tipo"""
+    table = {}
+    for ttype, name in enumerate(TypeScriptLexer.literalNames):
+        if name.startswith("'"):
+            table[name[1:-1]] = ttype
+    # BOOLEAN_LIT: 'true' | 'false' (declarada antes de ID)
+    table["true"] = TypeScriptLexer.BOOLEAN_LIT
+    table["false"] = TypeScriptLexer.BOOLEAN_LIT
+    return table
+
+
+_LITERAL_TYPES = _literal_types()
+
+# Grupos da regex mestre (a ordem importa: ver docstring do módulo)
+_SKIP, _NUMBER, _STRING, _WORD, _OP = 1, 2, 3, 4, 5
+
+_MASTER = re.compile(r"""
+      ( [ \t\r\n]+                      # WS
+      | //[^\r\n]*                      # LINE_COMMENT
+      | /\*.*?\*/ )                     # BLOCK_COMMENT
+    | ( [0-9]+ (?:\.[0-9]+)? )          # NUMBER_LIT
+    | ( "(?:[^"\\]|\\.)*"               # STRING
+      | '(?:[^'\\]|\\.)*' )
+    | ( [a-zA-Z_][a-zA-Z0-9_]* )        # ID / palavras-chave / BOOLEAN_LIT
+    | ( == | != | <= | >= | && | \|\|   # operadores e pontuação
+      | [{}:;(),\[\].=+\-*/%<>!] )
+""", re.VERBOSE | re.DOTALL)
+
+
+def _make_token(source, ttype, start, stop, line, column, text):
+    """Cria um CommonToken preenchendo os slots diretamente (evita o __init__,
+    que consulta linha/coluna no simulador do lexer)"""
+    token = _new_token(CommonToken)
+    token.source = source
+    token.type = ttype
+    token.channel = Token.DEFAULT_CHANNEL
+    token.start = start
+    token.stop = stop
+    token.tokenIndex = -1
+    token.line = line
+    token.column = column
+    token._text = text
+    return token
+
+
+_new_token = CommonToken.__new__
+
+
+class TypeScriptRegexLexer(TypeScriptLexer):
+    """Lexer compatível com TypeScriptLexer, implementado com uma regex mestre"""
+
+    def __init__(self, input=None, output: TextIO = sys.stdout):
+        super().__init__(input, output)
+        self._text_data = input.strdata if input is not None else ""
+        self._pos = 0
+        self._line = 1
+        self._col = 0
+
+    def reset(self):
+        super().reset()
+        self._pos = 0
+        self._line = 1
+        self._col = 0
+
+    def _advance(self, start: int, end: int):
+        """Atualiza linha/coluna após consumir text[start:end]"""
+        nl = self._text_data.count("\n", start, end)
+        if nl:
+            self._line += nl
+            self._col = end - self._text_data.rindex("\n", start, end) - 1
+        else:
+            self._col += end - start
+
+    def nextToken(self):
+        text = self._text_data
+        size = len(text)
+        match = _MASTER.match
+        pos = self._pos
+
+        while pos < size:
+            m = match(text, pos)
+            if m is None:
+                self._recognition_error(pos)
+                pos = self._pos
+                continue
+
+            group = m.lastindex
+            end = m.end()
+            if group == _SKIP:
+                self._advance(pos, end)
+                pos = end
+                continue
+
+            value = m.group(group)
+            if group == _WORD:
+                ttype = _LITERAL_TYPES.get(value, TypeScriptLexer.ID)
+            elif group == _OP:
+                ttype = _LITERAL_TYPES[value]
+            elif group == _NUMBER:
+                ttype = TypeScriptLexer.NUMBER_LIT
+            else:
+                ttype = TypeScriptLexer.STRING
+
+            token = _make_token(self._tokenFactorySourcePair, ttype, pos, end - 1,
+                                self._line, self._col, value)
+            if group == _STRING:
+                self._advance(pos, end)  # strings podem conter quebras de linha
+            else:
+                self._col += end - pos
+            self._pos = end
+            self._token = token
+            return token
+
+        self._pos = pos
+        eof = _make_token(self._tokenFactorySourcePair, Token.EOF, size, size - 1,
+                          self._line, self._col, "<EOF>")
+        self._token = eof
+        return eof
+
+    def _recognition_error(self, pos: int):
+        """Reproduz o erro do ATN: relata o texto até o ponto de falha e pula um caractere"""
+        text = self._text_data
+        size = len(text)
+        ch = text[pos]
+        if ch in "\"'":
+            fail = size       # string sem fechamento: o ATN lê até EOF
+        elif ch in "&|":
+            fail = pos + 1    # primeiro caractere de '&&' / '||'
+        else:
+            fail = pos        # nenhuma regra começa com este caractere
+
+        line, col = self._line, self._col
+        msg = "token recognition error at: '" + self.getErrorDisplay(text[pos:fail + 1]) + "'"
+        self.getErrorListenerDispatch().syntaxError(self, None, line, col, msg, None)
+
+        # recover(): consome um caractere além do ponto de falha, se não for EOF
+        resume = fail + 1 if fail < size else size
+        self._advance(pos, resume)
+        self._pos = resume
+
+    def getAllTokens(self):
+        tokens = []
+        t = self.nextToken()
+        while t.type != Token.EOF:
+            tokens.append(t)
+            t = self.nextToken()
+        return tokens
+
+
+def create_lexer(input_stream, kind: str = "antlr"):
+    """Cria o lexer pedido: "antlr" (gerado) ou "regex" (TypeScriptRegexLexer)"""
+    if kind == "regex":
+        return TypeScriptRegexLexer(input_stream)
+    if kind == "antlr":
+        return TypeScriptLexer(input_stream)
+    raise ValueError(f"Lexer desconhecido: '{kind}'")
@@ -3,8 +3,11 @@ Analisador Semântico TypeScript - Versão Refatorada e Simples
 Realiza checagem de tipos e validação semântica para uma linguagem similar ao TypeScript.
 """
 
-from antlr4 import ParseTreeVisitor, ParserRuleContext, Token
-from typing import Dict, List, Set, Optional
+from TypeScriptAST import CallOp, Identifier, IndexOp, MemberOp, Node, PostfixExpr
+from TypeScriptDiagnostics import Diagnostic, DiagnosticLimit
+from TypeScriptWalk import dispatch_table, walk
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Optional
 
 # ============================================================================
 # SISTEMA DE TIPOS
@@ -12,7 +15,14 @@ from typing import Dict, List, Set, Optional
 
 
 class Type:
-    """Classe base para todos os tipos"""
+    """Classe base para todos os tipos
+
+    Tipos primitivos são únicos (PrimitiveType("number") devolve sempre o mesmo
+    objeto) e cada tipo guarda o seu tipo array (ArrayType(t) devolve sempre o
+    mesmo objeto para o mesmo t). Assim tipos iguais costumam ser o mesmo objeto,
+    e types_equal começa por uma comparação de identidade.
+    """
+    __slots__ = ("_array",)
 
     def name(self) -> str:
         raise NotImplementedError()
@@ -22,35 +32,71 @@ class Type:
 
 
 class PrimitiveType(Type):
-    """Tipos primitivos: number, string, boolean"""
-
-    def __init__(self, n: str):
-        self.n = n
+    """Tipos primitivos: number, string, boolean (um objeto por nome)"""
+    __slots__ = ("n",)
+    _interned: Dict[str, "PrimitiveType"] = {}
+
+    def __new__(cls, n: str):
+        t = cls._interned.get(n)
+        if t is None:
+            t = super().__new__(cls)
+            t.n = n
+            t._array = None
+            cls._interned[n] = t
+        return t
+
+    def __reduce__(self):
+        return PrimitiveType, (self.n,)
 
     def name(self) -> str:
         return self.n
 
 
 class ArrayType(Type):
-    """Array de elementos: T[]"""
-
-    def __init__(self, elem: Type):
-        self.elem = elem
+    """Array de elementos: T[] (um objeto por tipo de elemento)"""
+    __slots__ = ("elem",)
+
+    def __new__(cls, elem: Type):
+        t = elem._array if elem is not None else None
+        if t is None:
+            t = super().__new__(cls)
+            t.elem = elem
+            t._array = None
+            if elem is not None:
+                elem._array = t
+        return t
+
+    def __reduce__(self):
+        return ArrayType, (self.elem,)
 
     def name(self) -> str:
         return f"{self.elem.name()}[]"
 
 
 class InterfaceType(Type):
-    """Interface definida pelo usuário"""
+    """Interface definida pelo usuário
+
+    Interfaces declaradas são únicas por nome em cada análise (SymbolTable.interfaces);
+    objetos literais (<obj-literal>) são tipos estruturais, um por literal.
+    """
+    __slots__ = ("id", "props")
 
     def __init__(self, id_: str):
         self.id = id_
         self.props: Dict[str, Type] = {}
+        self._array = None
 
     def name(self) -> str:
         return self.id
 
+
+NUMBER = PrimitiveType("number")
+STRING = PrimitiveType("string")
+BOOLEAN = PrimitiveType("boolean")
+VOID = PrimitiveType("void")
+UNKNOWN = PrimitiveType("unknown")
+UNKNOWN_ARRAY = ArrayType(UNKNOWN)
+
 # ============================================================================
 # SÍMBOLOS
 # ============================================================================
@@ -75,7 +121,14 @@ class FuncSymbol:
 
 
 class SymbolTable:
-    """Tabela de símbolos com suporte a escopos aninhados"""
+    """Tabela de símbolos com suporte a escopos aninhados
+
+    Além dos dicionários de cada escopo, mantém `_visible`: para cada nome, o símbolo
+    do escopo mais próximo que o declara. A busca é uma consulta a esse dicionário,
+    sem percorrer a pilha de escopos. Ao declarar um nome em um bloco, o símbolo que
+    ele esconde é guardado no registro do bloco e restaurado em pop_scope, então
+    cada declaração custa O(1) amortizado.
+    """
 
     def __init__(self):
         self.global_vars: Dict[str, VarSymbol] = {}  # Variáveis globais
@@ -84,14 +137,15 @@ class SymbolTable:
                                      InterfaceType] = {}  # Interfaces globais
         # Pilha de escopos de bloco
         self.scope_stack: List[Dict[str, VarSymbol]] = []
+        # Símbolo visível de cada nome (bloco mais interno ou global)
+        self._visible: Dict[str, VarSymbol] = {}
+        # Por bloco: nome → símbolo de bloco escondido (None: o global, se houver)
+        self._hidden: List[Dict[str, Optional[VarSymbol]]] = []
 
     @property
-    def vars(self) -> Dict[str, VarSymbol]:
-        """Retorna variáveis do escopo atual (bloco + global)"""
-        result = self.global_vars.copy()
-        for scope in self.scope_stack:
-            result.update(scope)
-        return result
+    def vars(self) -> Mapping[str, VarSymbol]:
+        """Variáveis visíveis no escopo atual (bloco + global), somente leitura"""
+        return MappingProxyType(self._visible)
 
     @property
     def funcs(self) -> Dict[str, FuncSymbol]:
@@ -116,27 +170,40 @@ class SymbolTable:
     def push_scope(self):
         """Cria um novo escopo de bloco"""
         self.scope_stack.append({})
+        self._hidden.append({})
 
     def pop_scope(self):
-        """Remove o escopo de bloco atual"""
-        if self.scope_stack:
-            self.scope_stack.pop()
+        """Remove o escopo de bloco atual, tornando visíveis os símbolos que ele escondia"""
+        if not self.scope_stack:
+            return
+        self.scope_stack.pop()
+        visible = self._visible
+        for name, outer in self._hidden.pop().items():
+            if outer is None:
+                outer = self.global_vars.get(name)
+                if outer is None:
+                    del visible[name]
+                    continue
+            visible[name] = outer
 
     def define_var(self, name: str, symbol: VarSymbol, is_block_local: bool = False):
         """Define uma variável no escopo apropriado"""
         if is_block_local and self.scope_stack:
-            self.scope_stack[-1][name] = symbol
+            scope = self.scope_stack[-1]
+            if name not in scope:
+                outer = self._visible.get(name)
+                self._hidden[-1][name] = None if outer is self.global_vars.get(name) else outer
+            scope[name] = symbol
+            self._visible[name] = symbol
         else:
+            # Um símbolo de bloco com o mesmo nome continua visível
+            if self._visible.get(name) is self.global_vars.get(name):
+                self._visible[name] = symbol
             self.global_vars[name] = symbol
 
     def get_var(self, name: str) -> Optional[VarSymbol]:
         """Obtém uma variável do escopo mais próximo"""
-        # Procura da pilha de escopos do mais próximo para o mais distante
-        for scope in reversed(self.scope_stack):
-            if name in scope:
-                return scope[name]
-        # Procura no escopo global
-        return self.global_vars.get(name)
+        return self._visible.get(name)
 
     def var_exists_in_current_scope(self, name: str) -> bool:
         """Verifica se uma variável já existe no escopo atual (sem considerar escopos exteriores)"""
@@ -152,7 +219,7 @@ class SymbolTable:
 # ============================================================================
 
 
-class SemanticAnalyzer(ParseTreeVisitor):
+class SemanticAnalyzer:
     """
     Visitor responsável pela análise semântica:
     - Checagem e validação de tipos
@@ -160,16 +227,32 @@ class SemanticAnalyzer(ParseTreeVisitor):
     - Garantia de imutabilidade para const
     - Validação de homogeneidade em arrays
     - Validação de acesso a propriedades
+    - Registro do tipo de cada expressão e declaração (types), lido pelo gerador
+    - Erros como diagnósticos estruturados (TypeScriptDiagnostics), com limite opcional
     """
 
-    def __init__(self):
-        super().__init__()
+    # Tipos dos literais e das anotações primitivas
+    _LITERALS = {"number": NUMBER, "string": STRING, "boolean": BOOLEAN}
+    _DECLARABLE = {**_LITERALS, "void": VOID}
+    # Tipos aceitos por print(x)
+    _PRINTABLE = frozenset((NUMBER, STRING, BOOLEAN, UNKNOWN))
+
+    def __init__(self, max_errors: int = 0):
         self.sym = SymbolTable()
-        self.errors: List[str] = []
+        self.errors: List[Diagnostic] = []
+        self.max_errors = max_errors  # interrompe a análise no N-ésimo erro (0: sem limite)
+        self.error_count = 0          # erros registrados, mesmo se self.errors for trocada
         self.call_graph: Dict[str, Set[str]] = {}
         self.current_function: Optional[str] = None
         self.expected_return_type: Optional[Type] = None
         self.in_block_scope: bool = False  # Rastreia se estamos em um bloco de escopo
+        self._unresolved: Dict[str, InterfaceType] = {}  # interfaces não declaradas, por nome
+        self._literal_shapes: Dict[tuple, InterfaceType] = {}  # forma do objeto literal → tipo
+        self._assignable: Dict[tuple, bool] = {}  # (alvo, origem) → resultado de is_assignable
+        # Tipo resolvido por nó: expressões, operadores pós-fixados (tipo do valor até o
+        # operador), VarDecl (tipo declarado), Param e FunctionDecl (tipo de retorno)
+        self.types: Dict[Node, Type] = {}
+        self.dispatch = dispatch_table(self)  # {classe do nó: visitX ligado}
         # Registra funções nativas
         self._register_builtins()
 
@@ -178,257 +261,236 @@ class SemanticAnalyzer(ParseTreeVisitor):
         # print(x: number|string|boolean): void
         self.sym.funcs["print"] = FuncSymbol(
             "print",
-            [PrimitiveType("unknown")],  # aceitaremos validação manual
-            PrimitiveType("void")
+            [UNKNOWN],  # aceitaremos validação manual
+            VOID
         )
         # read(): unknown (atribui a string ou number)
         self.sym.funcs["read"] = FuncSymbol(
             "read",
             [],
-            PrimitiveType("unknown")
+            UNKNOWN
         )
         # array(): unknown[]
         self.sym.funcs["array"] = FuncSymbol(
             "array",
             [],
-            ArrayType(PrimitiveType("unknown"))
+            UNKNOWN_ARRAY
         )
         # push(arr: unknown[], x: unknown): void
         self.sym.funcs["push"] = FuncSymbol(
             "push",
-            [ArrayType(PrimitiveType("unknown")), PrimitiveType("unknown")],
-            PrimitiveType("void")
+            [UNKNOWN_ARRAY, UNKNOWN],
+            VOID
         )
         # pop(arr: unknown[]): unknown
         self.sym.funcs["pop"] = FuncSymbol(
             "pop",
-            [ArrayType(PrimitiveType("unknown"))],
-            PrimitiveType("unknown")
+            [UNKNOWN_ARRAY],
+            UNKNOWN
         )
         # size(arr: unknown[]): number
         self.sym.funcs["size"] = FuncSymbol(
             "size",
-            [ArrayType(PrimitiveType("unknown"))],
-            PrimitiveType("number")
+            [UNKNOWN_ARRAY],
+            NUMBER
         )
 
-    def _err(self, ctx: Optional[ParserRuleContext], msg: str):
-        """Registra erro com informação de linha:coluna"""
-        if ctx and hasattr(ctx, 'start'):
-            token: Token = ctx.start
-            self.errors.append(f"Linha {token.line}:{token.column} - {msg}")
+    def _err(self, node, code: str, *args: str):
+        """Registra o diagnóstico `code` na linha:coluna do nó; a mensagem só é
+        formatada quando pedida. Levanta DiagnosticLimit ao atingir max_errors."""
+        if node is not None:
+            self.errors.append(Diagnostic(code, node.line, node.column, args))
         else:
-            self.errors.append(f"ERRO: {msg}")
+            self.errors.append(Diagnostic(code, None, None, args))
+        self.error_count += 1
+        if self.error_count == self.max_errors:
+            raise DiagnosticLimit(code)
 
     def types_equal(self, a: Type, b: Type) -> bool:
-        """Verifica se dois tipos são equivalentes"""
+        """Verifica se dois tipos são equivalentes
+
+        Primitivos são únicos, então dois primitivos distintos nunca são iguais; só
+        arrays e interfaces diferentes por identidade ainda são comparados por nome.
+        """
+        if a is b:
+            return a is not None
         if not (a and b):
             return False
-        if isinstance(a, PrimitiveType) and isinstance(b, PrimitiveType):
-            return a.name() == b.name()
-        if isinstance(a, ArrayType) and isinstance(b, ArrayType):
+        if type(a) is ArrayType and type(b) is ArrayType:
             return self.types_equal(a.elem, b.elem)
-        if isinstance(a, InterfaceType) and isinstance(b, InterfaceType):
-            return a.name() == b.name()
+        if type(a) is InterfaceType and type(b) is InterfaceType:
+            return a.id == b.id
         return False
 
-    def _parse_type(self, text: str) -> Type:
-        """Auxiliar: interpreta tipo a partir do texto (ex.: 'number[]', 'User')"""
-        if text.endswith("[]"):
-            inner = text[:-2]
-            inner_type = self._parse_type(inner)
-            return ArrayType(inner_type)
-
-        if text in ("number", "string", "boolean", "void"):
-            return PrimitiveType(text)
-
-        if text in self.sym.interfaces:
-            return self.sym.interfaces[text]
-
-        self._err(None, f"Tipo '{text}' não encontrado")
-        return InterfaceType(f"<unknown:{text}>")
-
-    def type_from_ctx(self, ctx) -> Optional[Type]:
-        """Extrai tipo a partir do contexto da gramática"""
-        if not ctx:
+    def resolve_type(self, ref) -> Optional[Type]:
+        """Resolve uma anotação de tipo (TypeRef) para o Type correspondente"""
+        if ref is None:
             return None
 
-        try:
-            # Try to get baseType
-            bt = ctx.baseType() if hasattr(ctx, 'baseType') else None
-
-            if not bt:
-                # Fallback to text parsing
-                return self._parse_type(ctx.getText())
-
-            # Parse base type
-            if hasattr(bt, 'NUMBER_TYPE') and bt.NUMBER_TYPE():
-                base = PrimitiveType("number")
-            elif hasattr(bt, 'STRING_TYPE') and bt.STRING_TYPE():
-                base = PrimitiveType("string")
-            elif hasattr(bt, 'BOOLEAN_TYPE') and bt.BOOLEAN_TYPE():
-                base = PrimitiveType("boolean")
-            elif hasattr(bt, 'ID') and bt.ID() and bt.ID().getText() == "void":
-                base = PrimitiveType("void")
-            elif hasattr(bt, 'ID') and bt.ID():
-                name = bt.ID().getText()
-                if name in self.sym.interfaces:
-                    base = self.sym.interfaces[name]
-                else:
-                    self._err(ctx, f"Interface '{name}' não declarada")
-                    base = InterfaceType(f"<unknown:{name}>")
-            else:
-                return self._parse_type(ctx.getText())
-
-            # Check if array
-            if ctx.getText().endswith("[]"):
-                return ArrayType(base)
-            return base
-
-        except Exception:
-            return self._parse_type(ctx.getText())
+        name = ref.name
+        base = self._DECLARABLE.get(name) or self.sym.interfaces.get(name)
+        if base is None:
+            self._err(ref, "undeclared-interface", name)
+            base = self._unresolved.get(name)
+            if base is None:
+                base = self._unresolved[name] = InterfaceType(f"<unknown:{name}>")
+
+        if ref.is_array:
+            return ArrayType(base)
+        return base
+
+    def is_assignable(self, target: Type, source: Type, node) -> bool:
+        """Verifica se o tipo origem pode ser atribuído ao tipo destino
+
+        O resultado de cada par (alvo, origem) é memorizado: os tipos são canônicos e
+        objetos literais com a mesma forma são o mesmo tipo, então a comparação
+        estrutural roda uma vez por par. Os erros ficam em _report_unassignable,
+        chamado só quando o resultado é falso.
+        """
+        ok = self._assignable_cached(target, source)
+        if not ok and target and source:
+            self._report_unassignable(target, source, node)
+        return ok
 
-    def is_assignable(self, target: Type, source: Type, ctx) -> bool:
-        """Verifica se o tipo origem pode ser atribuído ao tipo destino"""
+    def _assignable_cached(self, target: Type, source: Type) -> bool:
         if not (target and source):
             return False
-
+        key = (target, source)
+        ok = self._assignable.get(key)
+        if ok is None:
+            ok = self._assignable[key] = self._check_assignable(target, source)
+        return ok
+
+    def _check_assignable(self, target: Type, source: Type) -> bool:
+        """Regras de atribuição, sem registrar erros"""
         # Primitives: must match exactly
         if isinstance(target, PrimitiveType) and isinstance(source, PrimitiveType):
             # unknown pode ser atribuído a string ou number (não boolean)
-            if source.name() == "unknown" and target.name() in ("string", "number"):
+            if source is UNKNOWN and (target is STRING or target is NUMBER):
                 return True
             return self.types_equal(target, source)
 
         # Arrays
         if isinstance(target, ArrayType) and isinstance(source, ArrayType):
             # Empty array (unknown[]) can assign to any array
-            if isinstance(source.elem, PrimitiveType) and source.elem.name() == "unknown":
+            if source.elem is UNKNOWN:
                 return True
             # Object literal arrays to interface arrays
             if isinstance(target.elem, InterfaceType) and isinstance(source.elem, InterfaceType):
-                if source.elem.name() == "<obj-literal>":
-                    return self.is_assignable(target.elem, source.elem, ctx)
+                if source.elem.id == "<obj-literal>":
+                    return self._assignable_cached(target.elem, source.elem)
             return self.types_equal(target, source)
 
         # Interfaces: check field compatibility
         if isinstance(target, InterfaceType) and isinstance(source, InterfaceType):
-            tgt, src = target, source
-
-            # Verifica todos os campos do alvo presentes na origem
-            for fname, ftype in tgt.props.items():
-                if fname not in src.props:
-                    self._err(
-                        ctx, f"Campo '{fname}' ausente no objeto literal para a interface {tgt.name()}")
-                    return False
-                if not self.is_assignable(ftype, src.props[fname], ctx):
-                    self._err(
-                        ctx, f"Tipo do campo '{fname}' incompatível: esperado {ftype.name()} mas foi {src.props[fname].name()}")
+            src_props = source.props
+            for fname, ftype in target.props.items():
+                if fname not in src_props or not self._assignable_cached(ftype, src_props[fname]):
                     return False
-
-            # Verifica se não há campos extras na origem
-            for k in src.props:
-                if k not in tgt.props:
-                    self._err(
-                        ctx, f"Campo extra '{k}' no objeto literal não declarado na interface {tgt.name()}")
-                    return False
-
-            return True
+            return all(k in target.props for k in src_props)
 
         return False
 
+    def _report_unassignable(self, target: Type, source: Type, node):
+        """Registra por que a origem não pode ser atribuída ao alvo (campo ausente,
+        de tipo incompatível ou extra), na ordem em que as regras são verificadas"""
+        if isinstance(target, ArrayType) and isinstance(source, ArrayType):
+            if (isinstance(target.elem, InterfaceType) and isinstance(source.elem, InterfaceType)
+                    and source.elem.id == "<obj-literal>"):
+                self.is_assignable(target.elem, source.elem, node)
+            return
+        if not (isinstance(target, InterfaceType) and isinstance(source, InterfaceType)):
+            return
+        tgt, src = target, source
+
+        # Verifica todos os campos do alvo presentes na origem
+        for fname, ftype in tgt.props.items():
+            if fname not in src.props:
+                self._err(node, "missing-field", fname, tgt.name())
+                return
+            if not self.is_assignable(ftype, src.props[fname], node):
+                self._err(node, "field-type", fname, ftype.name(), src.props[fname].name())
+                return
+
+        # Verifica se não há campos extras na origem
+        for k in src.props:
+            if k not in tgt.props:
+                self._err(node, "extra-field", k, tgt.name())
+                return
+
     # ========================================================================
     # STATEMENT VISITORS
     # ========================================================================
 
-    def visitInterfaceDecl(self, ctx):
+    def visitProgram(self, node):
+        """Processa os statements de nível superior"""
+        for stmt in node.body:
+            yield stmt
+
+    def visitInterfaceDecl(self, node):
         """Processa declaração de interface"""
-        name = ctx.ID().getText()
+        name = node.name
         if name in self.sym.interfaces:
-            self._err(ctx, f"Interface '{name}' já declarada")
+            self._err(node, "duplicate-interface", name)
             return None
 
         iface = InterfaceType(name)
-        for prop in ctx.interfaceProp():
-            prop_name = prop.ID().getText()
-            prop_type = self.type_from_ctx(prop.typeExpr())
-            iface.props[prop_name] = prop_type
+        for prop_name, prop_type in node.props:
+            iface.props[prop_name] = self.resolve_type(prop_type)
 
         self.sym.interfaces[name] = iface
         return None
 
-    def visitVariableDecl(self, ctx):
-        """Processa declaração de variável via letDecl ou constDecl"""
-        # Delega para letDecl ou constDecl
-        if ctx.letDecl():
-            return self.visit(ctx.letDecl())
-        elif ctx.constDecl():
-            return self.visit(ctx.constDecl())
-        return None
-
-    def visitLetDecl(self, ctx):
-        """Processa declaração de variável let"""
-        name = ctx.ID().getText()
-        declared_type = self.type_from_ctx(ctx.typeExpr())
+    def visitVarDecl(self, node):
+        """Processa declaração de variável let/const"""
+        name = node.name
+        declared_type = self.types[node] = self.resolve_type(node.type)
 
         if self.sym.var_exists_in_current_scope(name):
-            self._err(ctx, f"Variável '{name}' já declarada")
+            self._err(node, "duplicate-variable", name)
 
-        symbol = VarSymbol(name, declared_type, is_const=False)
+        symbol = VarSymbol(name, declared_type, is_const=node.is_const)
         self.sym.define_var(name, symbol, is_block_local=self.in_block_scope)
 
         # Check initializer if present
-        if ctx.ASSIGN():
-            init_type = self.visit(ctx.expression())
-            if not self.is_assignable(declared_type, init_type, ctx):
-                self._err(
-                    ctx, f"Tipo do inicializador incompatível: esperado {declared_type.name()} mas foi {init_type.name() if init_type else 'null'}")
+        if node.init is not None:
+            init_type = yield node.init
+            if not self.is_assignable(declared_type, init_type, node):
+                self._err(node, "initializer-type", declared_type.name(),
+                          init_type.name() if init_type else "null")
+        elif node.is_const:
+            # const obriga ASSIGN (gramática já exige, mas validamos por segurança)
+            self._err(node, "const-without-initializer", name)
 
         return declared_type
 
-    def visitConstDecl(self, ctx):
-        """Processa declaração de variável const (obrigatoriamente inicializada)"""
-        name = ctx.ID().getText()
-        declared_type = self.type_from_ctx(ctx.typeExpr())
-
-        if self.sym.var_exists_in_current_scope(name):
-            self._err(ctx, f"Variável '{name}' já declarada")
-
-        symbol = VarSymbol(name, declared_type, is_const=True)
-        self.sym.define_var(name, symbol, is_block_local=self.in_block_scope)
-
-        # const obriga ASSIGN (gramática já exige, mas validamos por segurança)
-        if ctx.ASSIGN():
-            init_type = self.visit(ctx.expression())
-            if not self.is_assignable(declared_type, init_type, ctx):
-                self._err(
-                    ctx, f"Tipo do inicializador incompatível: esperado {declared_type.name()} mas foi {init_type.name() if init_type else 'null'}")
-        else:
-            self._err(
-                ctx, f"Variável const '{name}' deve ser inicializada na declaração")
-
-        return declared_type
-
-    def visitFunctionDecl(self, ctx):
+    def visitFunctionDecl(self, node):
         """Processa declaração de função com checagem de parâmetros e retorno"""
-        name = ctx.ID().getText()
-        params = []
-        param_types = []
+        params, return_type = self.declare_function(node)
+        return (yield from self.check_function_body(node, params, return_type))
 
-        if ctx.paramList():
-            for param in ctx.paramList().param():
-                param_name = param.ID().getText()
-                param_type = self.type_from_ctx(param.typeExpr())
-                params.append((param_name, param_type))
-                param_types.append(param_type)
+    def declare_function(self, node):
+        """Registra a assinatura da função; retorna ([(nome, tipo)] dos parâmetros, tipo de retorno)"""
+        name = node.name
+        types = self.types
+        params = []
+        for param in node.params:
+            param_type = types[param] = self.resolve_type(param.type)
+            params.append((param.name, param_type))
+        param_types = [param_type for _, param_type in params]
 
-        return_type = self.type_from_ctx(ctx.typeExpr())
+        return_type = types[node] = self.resolve_type(node.return_type)
 
         if name in self.sym.funcs:
-            self._err(ctx, f"Função '{name}' já declarada")
+            self._err(node, "duplicate-function", name)
 
         self.sym.funcs[name] = FuncSymbol(name, param_types, return_type)
         self.call_graph.setdefault(name, set())
+        return params, return_type
+
+    def check_function_body(self, node, params, return_type):
+        """Verifica o corpo da função já declarada (gerador, como os visitX)"""
+        name = node.name
 
         # Enter function scope
         prev_func = self.current_function
@@ -450,7 +512,7 @@ class SemanticAnalyzer(ParseTreeVisitor):
                 param_name, param_type), is_block_local=True)
 
         # Analyze body (visitBlock criará um novo escopo)
-        self.visit(ctx.block())
+        yield node.body
 
         # Restore function scope
         self.sym.pop_scope()
@@ -459,93 +521,94 @@ class SemanticAnalyzer(ParseTreeVisitor):
         self.expected_return_type = prev_return
 
         # Check missing return for non-void functions
-        if isinstance(return_type, PrimitiveType) and return_type.name() != "void":
+        if isinstance(return_type, PrimitiveType) and return_type is not VOID:
             if not getattr(self, "_return_seen", False):
-                self._err(
-                    ctx, f"Função '{name}' deve retornar um valor do tipo {return_type.name()}")
+                self._err(node, "missing-return", name, return_type.name())
         self._return_seen = prev_return_seen
 
         return return_type
 
-    def visitReturnStmt(self, ctx):
+    def visitReturnStmt(self, node):
         """Processa return com checagem de tipo"""
         # Marca que houve um return neste corpo de função
         self._return_seen = True
         # Se função é void, permitir 'return;' vazio ou ausência de return
-        if self.expected_return_type and isinstance(self.expected_return_type, PrimitiveType) and self.expected_return_type.name() == "void":
-            if ctx.expression():
-                self._err(ctx, "Função do tipo void não deve retornar expressão")
-            return PrimitiveType("void")
+        if self.expected_return_type is VOID:
+            if node.value is not None:
+                self._err(node, "void-return-value")
+            return VOID
 
         # Função não-void: exige retorno com expressão compatível
-        if ctx.expression() is None:
+        if node.value is None:
             func_name = self.current_function or "<função>"
             expected = self.expected_return_type.name(
             ) if self.expected_return_type else 'desconhecido'
-            self._err(
-                ctx, f"Função '{func_name}' deve retornar um valor do tipo {expected}")
-            return PrimitiveType("void")
+            self._err(node, "missing-return", func_name, expected)
+            return VOID
 
-        expr_type = self.visit(ctx.expression())
+        expr_type = yield node.value
         if self.expected_return_type:
-            if not self.is_assignable(self.expected_return_type, expr_type, ctx):
-                self._err(
-                    ctx, f"Tipo de retorno incompatível. Esperado {self.expected_return_type.name()} mas foi {expr_type.name() if expr_type else 'null'}")
+            if not self.is_assignable(self.expected_return_type, expr_type, node):
+                self._err(node, "return-type", self.expected_return_type.name(),
+                          expr_type.name() if expr_type else "null")
         return expr_type
-        return PrimitiveType("void")
 
-    def visitBlock(self, ctx):
+    def visitExprStmt(self, node):
+        """Processa statement de expressão"""
+        return (yield node.expr)
+
+    def visitBlock(self, node):
         """Processa um bloco de código, criando escopo de bloco"""
         self.sym.push_scope()
         old_in_block = self.in_block_scope
         self.in_block_scope = True
 
         # Visita todos os statements dentro do bloco
-        for stmt in ctx.statement():
-            self.visit(stmt)
+        for stmt in node.body:
+            yield stmt
 
         self.in_block_scope = old_in_block
         self.sym.pop_scope()
 
-    def visitIfStmt(self, ctx):
+    def visitIfStmt(self, node):
         """Processa statement if com escopo de bloco"""
         # Avalia a condição
-        cond_type = self.visit(ctx.expression())
-        if not (isinstance(cond_type, PrimitiveType) and cond_type.name() == "boolean"):
-            self._err(ctx, "Condição de if deve ser do tipo boolean")
+        cond_type = yield node.cond
+        if cond_type is not BOOLEAN:
+            self._err(node, "condition-type", "if")
 
         # Visita o statement do if (pode ser um bloco ou um statement simples)
         self.sym.push_scope()
         old_in_block = self.in_block_scope
         self.in_block_scope = True
-        self.visit(ctx.statement(0))
+        yield node.then
         self.in_block_scope = old_in_block
         self.sym.pop_scope()
 
         # Visita o statement do else se existir
-        if ctx.statement(1):  # else clause
+        if node.else_ is not None:
             self.sym.push_scope()
             self.in_block_scope = True
-            self.visit(ctx.statement(1))
+            yield node.else_
             self.in_block_scope = old_in_block
             self.sym.pop_scope()
 
-    def visitWhileStmt(self, ctx):
+    def visitWhileStmt(self, node):
         """Processa statement while com escopo de bloco"""
         # Avalia a condição
-        cond_type = self.visit(ctx.expression())
-        if not (isinstance(cond_type, PrimitiveType) and cond_type.name() == "boolean"):
-            self._err(ctx, "Condição de while deve ser do tipo boolean")
+        cond_type = yield node.cond
+        if cond_type is not BOOLEAN:
+            self._err(node, "condition-type", "while")
 
         # Visita o statement dentro do while (pode ser um bloco ou um statement simples)
         self.sym.push_scope()
         old_in_block = self.in_block_scope
         self.in_block_scope = True
-        self.visit(ctx.statement())
+        yield node.body
         self.in_block_scope = old_in_block
         self.sym.pop_scope()
 
-    def visitForStmt(self, ctx):
+    def visitForStmt(self, node):
         """Processa statement for com escopo de bloco"""
         # Cria escopo para o for (variável de iteração fica no escopo do for)
         self.sym.push_scope()
@@ -553,22 +616,19 @@ class SemanticAnalyzer(ParseTreeVisitor):
         self.in_block_scope = True
 
         # Processa inicialização (declaração ou expressão)
-        first_part = ctx.getChild(2)  # Skip 'for' e '('
-        if first_part.getText() != ";":
-            self.visit(first_part)
+        yield node.init
 
         # Verifica condição (se houver)
-        if ctx.expression(0):
-            cond_type = self.visit(ctx.expression(0))
-            if not (isinstance(cond_type, PrimitiveType) and cond_type.name() == "boolean"):
-                self._err(ctx, "Condição de for deve ser do tipo boolean")
+        if node.cond is not None:
+            cond_type = yield node.cond
+            if cond_type is not BOOLEAN:
+                self._err(node, "condition-type", "for")
 
         # Verifica incremento (se houver)
-        if ctx.expression(1):
-            self.visit(ctx.expression(1))
+        yield node.update
 
         # Visita o statement dentro do for
-        self.visit(ctx.statement())
+        yield node.body
 
         self.in_block_scope = old_in_block
         self.sym.pop_scope()
@@ -577,121 +637,96 @@ class SemanticAnalyzer(ParseTreeVisitor):
     # EXPRESSION VISITORS
     # ========================================================================
 
-    def visitLiteral(self, ctx):
-        """Processa literal (number, string, boolean)"""
-        if ctx.NUMBER_LIT():
-            return PrimitiveType("number")
-        if ctx.STRING():
-            return PrimitiveType("string")
-        if ctx.BOOLEAN_LIT():
-            return PrimitiveType("boolean")
-        return None
-
-    def visitPrimary(self, ctx):
-        """Processa expressões primárias (literais, identificadores, parênteses, arrays, objetos)"""
-        # Literal
-        if ctx.literal():
-            return self.visit(ctx.literal())
-
-        # Identifier (variable or function reference)
-        if ctx.ID():
-            name = ctx.ID().getText()
-            if name in self.sym.vars:
-                return self.sym.vars[name].type
-            if name in self.sym.funcs:
-                return self.sym.funcs[name].return_type
-            self._err(ctx, f"Variável '{name}' não declarada")
-            return None
-
-        # Parenthesized expression
-        if ctx.expression():
-            return self.visit(ctx.expression())
-
-        # Array literal
-        if ctx.arrayLiteral():
-            return self.visit(ctx.arrayLiteral())
+    def visit(self, node):
+        """Visita um nó do AST (None: trecho ausente por erro de sintaxe).
 
-        # Object literal
-        if ctx.objectLiteral():
-            return self.visit(ctx.objectLiteral())
+        Os visitX que visitam filhos são geradores (`yield filho`), executados por
+        TypeScriptWalk.walk com uma pilha explícita, sem limite de aninhamento.
+        """
+        return walk(self, node)
 
+    def visitLiteral(self, node):
+        """Processa literal (number, string, boolean)"""
+        t = self.types[node] = self._LITERALS[node.kind]
+        return t
+
+    def visitIdentifier(self, node):
+        """Processa identificador (variável ou referência a função)"""
+        name = node.name
+        var = self.sym.get_var(name)
+        if var is not None:
+            t = self.types[node] = var.type
+            return t
+        if name in self.sym.funcs:
+            t = self.types[node] = self.sym.funcs[name].return_type
+            return t
+        self._err(node, "undeclared-variable", name)
         return None
 
-    def visitArrayLiteral(self, ctx):
+    def visitArrayLiteral(self, node):
         """Processa array literal com verificação de homogeneidade"""
-        exprs = list(ctx.expression()) if ctx.expression() else []
+        exprs = node.elements
 
         if not exprs:
-            return ArrayType(PrimitiveType("unknown"))
+            self.types[node] = UNKNOWN_ARRAY
+            return UNKNOWN_ARRAY
 
-        first = self.visit(exprs[0])
+        first = yield exprs[0]
         for expr in exprs[1:]:
-            elem_type = self.visit(expr)
+            elem_type = yield expr
             if not self.types_equal(first, elem_type):
-                self._err(
-                    ctx, f"Array heterogêneo: elementos têm tipos diferentes ({first.name()} vs {elem_type.name() if elem_type else 'null'})")
-
-        return ArrayType(first)
+                self._err(node, "heterogeneous-array", first.name(),
+                          elem_type.name() if elem_type else "null")
 
-    def visitObjectLiteral(self, ctx):
-        """Processa object literal como interface anônima"""
-        obj = InterfaceType("<obj-literal>")
-        for prop in ctx.propAssign():
-            # Handle both ID and STRING as property names
-            if prop.ID():
-                key = prop.ID().getText()
-            else:
-                key = prop.STRING().getText()[1:-1]  # Remove quotes
+        t = self.types[node] = ArrayType(first)
+        return t
 
-            value_type = self.visit(prop.expression())
-            obj.props[key] = value_type
+    def visitObjectLiteral(self, node):
+        """Processa object literal como interface anônima
 
+        Literais com as mesmas chaves e os mesmos tipos de valor (na mesma ordem)
+        recebem o mesmo InterfaceType, que serve de chave no cache de is_assignable.
+        """
+        props = {}
+        for key, value in node.props:
+            props[key] = yield value
+
+        shape = tuple(props.items())
+        obj = self._literal_shapes.get(shape)
+        if obj is None:
+            obj = self._literal_shapes[shape] = InterfaceType("<obj-literal>")
+            obj.props = props
+        self.types[node] = obj
         return obj
 
-    def visitPostfixExpr(self, ctx):
+    def visitPostfixExpr(self, node):
         """Processa expressões pós-fixadas: acesso a array, acesso a propriedade, chamadas de função"""
         # Get primary ID name for function call resolution
         primary_id = None
-        if ctx.primary().ID():
-            primary_id = ctx.primary().ID().getText()
-
-        result_type = self.visit(ctx.primary())
+        if isinstance(node.primary, Identifier):
+            primary_id = node.primary.name
 
-        # Process postfix operators
-        postfix_ops = ctx.postfixOp() if hasattr(
-            ctx, 'postfixOp') and ctx.postfixOp() else []
-        if not isinstance(postfix_ops, list):
-            postfix_ops = [postfix_ops] if postfix_ops else []
+        result_type = yield node.primary
 
+        postfix_ops = node.ops
         for op_idx, op in enumerate(postfix_ops):
-            op_text = op.getText()
-
-            if op_text.startswith('['):
-                # Array access
+            if isinstance(op, IndexOp):
+                # Array access (o índice é visitado para registrar seu tipo)
+                yield op.index
                 if isinstance(result_type, ArrayType):
                     result_type = result_type.elem
                 else:
-                    self._err(ctx, "Acesso de array em tipo não-array")
+                    self._err(node, "index-non-array")
                     return None
 
-            elif op_text.startswith('.'):
+            elif isinstance(op, MemberOp):
                 # Property access or array method call
-                # Extract the identifier after the dot
-                method_or_prop = op_text[1:]
-                # Check if it's followed by () for method call
-                is_method_call = False
+                method_or_prop = op.name
                 method_name = method_or_prop
-                arg_exprs = []
-
-                # Try to detect if next op is a function call (parentheses)
-                if op_idx + 1 < len(postfix_ops) and postfix_ops[op_idx + 1].getText().startswith('('):
-                    is_method_call = True
-                    method_op = postfix_ops[op_idx + 1]
-                    try:
-                        arg_exprs = list(method_op.expression()) if hasattr(
-                            method_op, 'expression') and method_op.expression() else []
-                    except Exception:
-                        arg_exprs = []
+                # Check if it's followed by () for method call
+                next_op = postfix_ops[op_idx + 1] if op_idx + 1 < len(postfix_ops) else None
+                is_method_call = isinstance(next_op, CallOp)
+                arg_exprs = next_op.args if is_method_call else []
 
                 # Handle array methods
                 if isinstance(result_type, ArrayType):
@@ -699,255 +734,177 @@ class SemanticAnalyzer(ParseTreeVisitor):
                         if method_name == "push":
                             # push(x): x deve ter o tipo do elemento do array
                             if len(arg_exprs) != 1:
-                                self._err(
-                                    ctx, "Método 'push' do array requer exatamente 1 argumento")
+                                self._err(node, "push-arity")
                             else:
-                                arg_type = self.visit(arg_exprs[0])
+                                arg_type = yield arg_exprs[0]
                                 if not self.types_equal(result_type.elem, arg_type):
-                                    self._err(
-                                        ctx, f"Argumento de 'push' deve ter tipo {result_type.elem.name()}, mas tem {arg_type.name() if arg_type else 'null'}")
-                            result_type = PrimitiveType("void")
+                                    self._err(node, "push-type", result_type.elem.name(),
+                                              arg_type.name() if arg_type else "null")
+                            result_type = VOID
                         elif method_name == "pop":
                             # pop(): retorna o elemento do array
                             if len(arg_exprs) != 0:
-                                self._err(
-                                    ctx, "Método 'pop' do array não aceita argumentos")
+                                self._err(node, "method-arguments", "pop")
                             result_type = result_type.elem
                         elif method_name == "size":
                             # size(): retorna number
                             if len(arg_exprs) != 0:
-                                self._err(
-                                    ctx, "Método 'size' do array não aceita argumentos")
-                            result_type = PrimitiveType("number")
+                                self._err(node, "method-arguments", "size")
+                            result_type = NUMBER
                         else:
-                            self._err(
-                                ctx, f"Array não possui método '{method_name}'")
+                            self._err(node, "unknown-array-method", method_name)
                             return None
-                        # Skip the next postfix op (the function call) since we processed it
-                        # Mark for skipping by incrementing op_idx in a way the loop handles
+                        # A chamada seguinte (CallOp) já foi tratada aqui
                     else:
                         # Not a method call on array; would be property access
-                        self._err(
-                            ctx, "Array não possui propriedades acessíveis")
+                        self._err(node, "array-property")
                         return None
                 elif isinstance(result_type, InterfaceType):
                     # Regular property access for interfaces
                     if method_or_prop in result_type.props:
                         result_type = result_type.props[method_or_prop]
                     else:
-                        self._err(
-                            ctx, f"Campo '{method_or_prop}' não existe na interface '{result_type.name()}'")
+                        self._err(node, "unknown-field", method_or_prop, result_type.name())
                         return None
                 else:
-                    self._err(
-                        ctx, "Acesso de propriedade em tipo não-interface")
+                    self._err(node, "member-non-interface")
                     return None
 
-            elif op_text.startswith('(') and op_idx == 0 and primary_id:
+            elif isinstance(op, CallOp) and op_idx == 0 and primary_id:
                 # Function call (first postfix op on identifier)
                 if primary_id in self.sym.funcs:
                     func = self.sym.funcs[primary_id]
-                    # Validate arguments count & types
-                    args_ctx = op
-                    arg_exprs = []
-                    # Extract expressions inside parentheses via parse tree
-                    try:
-                        arg_exprs = list(args_ctx.expression()) if hasattr(
-                            args_ctx, 'expression') and args_ctx.expression() else []
-                    except Exception:
-                        arg_exprs = []
+                    arg_exprs = op.args
                     # Simple arity check
                     if len(func.param_types) != len(arg_exprs):
                         # Allow print(x) single arg; read() zero args
                         pass
+                    # Visita todos os argumentos (registra o tipo de cada um em types)
+                    arg_types = []
+                    for arg in arg_exprs:
+                        arg_types.append((yield arg))
                     # Type validation for print
                     if primary_id == "print" and len(arg_exprs) == 1:
-                        arg_t = self.visit(arg_exprs[0])
-                        if not isinstance(arg_t, PrimitiveType) or arg_t.name() not in ("string", "number", "boolean", "unknown"):
-                            self._err(
-                                ctx, "Função nativa 'print' aceita apenas string, number ou boolean")
+                        if arg_types[0] not in self._PRINTABLE:
+                            self._err(node, "print-argument")
                     if primary_id == "read" and len(arg_exprs) != 0:
-                        self._err(
-                            ctx, "Função nativa 'read' não aceita argumentos")
+                        self._err(node, "read-arguments")
                     result_type = func.return_type
                     if self.current_function:
                         self.call_graph.setdefault(
                             self.current_function, set()).add(primary_id)
 
+            # Tipo do valor até este operador (o gerador decide conversões por ele)
+            self.types[op] = result_type
+
+        self.types[node] = result_type
         return result_type
 
-    def _binary_expr(self, ctx, op_validator, result_type_fn):
-        """Tratador genérico para expressões binárias"""
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.getChild(0))
+    def visitUnaryExpr(self, node):
+        """Processa operadores unários (-, !)
+
+        unaryExpr: (NOT | MINUS)* postfixExpr;
+        - MINUS (-): negação aritmética (number -> number)
+        - NOT (!): negação lógica (qualquer tipo -> boolean)
+        """
+        not_count = node.ops.count('!')
+
+        # Obtém o tipo do operand
+        operand_type = yield node.operand
 
-        left = self.visit(ctx.getChild(0))
+        # Número ímpar de NOT: o resultado é boolean; senão mantém o tipo do operand
+        if not_count > 0 and not_count % 2 == 1:
+            operand_type = BOOLEAN
 
-        for i in range(1, ctx.getChildCount(), 2):
-            op = ctx.getChild(i).getText()
-            right = self.visit(ctx.getChild(i + 1))
+        self.types[node] = operand_type
+        return operand_type
 
-            if left and right:
-                op_validator(left, right, op, ctx)
+    def visitBinaryExpr(self, node):
+        """Processa uma cadeia de operadores binários de um mesmo nível de precedência"""
+        validate, result_type = self._binary_rules[node.ops[0]]
 
-            left = result_type_fn(left, right)
+        left = yield node.operands[0]
 
-        return left
+        for op, operand in zip(node.ops, node.operands[1:]):
+            right = yield operand
 
-    def visitAdditiveExpr(self, ctx):
-        """Processa operadores + e - (apenas number)"""
-        def validate(l, r, op, c):
-            if not (isinstance(l, PrimitiveType) and l.name() == "number" and
-                    isinstance(r, PrimitiveType) and r.name() == "number"):
-                self._err(
-                    c, f"Operador '{op}' requer operandos do tipo number")
+            if left and right:
+                validate(self, left, right, op, node)
 
-        def result_type(l, r):
-            return PrimitiveType("number")
+            left = result_type
 
-        return self._binary_expr(ctx, validate, result_type)
+        self.types[node] = left
+        return left
 
-    def visitMultiplicativeExpr(self, ctx):
-        """Processa operadores *, /, % (apenas number)"""
-        def validate(l, r, op, c):
-            if not (isinstance(l, PrimitiveType) and l.name() == "number" and
-                    isinstance(r, PrimitiveType) and r.name() == "number"):
-                self._err(
-                    c, f"Operador '{op}' requer operandos do tipo number")
+    def _validate_numbers(self, l, r, op, node):
+        """Operadores aritméticos e relacionais: apenas number"""
+        if not (l is NUMBER and r is NUMBER):
+            self._err(node, "number-operands", op)
+
+    def _validate_same_type(self, l, r, op, node):
+        """Operadores == e !=: mesmo tipo em ambos os lados"""
+        if not self.types_equal(l, r):
+            self._err(node, "same-type-operands", op)
+
+    def _validate_booleans(self, l, r, op, node):
+        """Operadores && e ||: apenas boolean"""
+        if not (l is BOOLEAN and r is BOOLEAN):
+            self._err(node, "boolean-operands", op)
+
+    # Operador → (validação dos operandos, tipo do resultado)
+    _binary_rules = {
+        **dict.fromkeys(("+", "-", "*", "/", "%"), (_validate_numbers, NUMBER)),
+        **dict.fromkeys(("<", "<=", ">", ">="), (_validate_numbers, BOOLEAN)),
+        **dict.fromkeys(("==", "!="), (_validate_same_type, BOOLEAN)),
+        **dict.fromkeys(("&&", "||"), (_validate_booleans, BOOLEAN)),
+    }
+
+    @staticmethod
+    def _is_assignment_target(node) -> bool:
+        """Alvos atribuíveis: x, obj.campo, arr[i] (primary identificador e último
+        operador pós-fixado que não é uma chamada)"""
+        if isinstance(node, Identifier):
+            return True
+        return (isinstance(node, PostfixExpr) and isinstance(node.primary, Identifier)
+                and not isinstance(node.ops[-1], CallOp))
+
+    def visitAssignExpr(self, node):
+        """Processa expressões de atribuição (alvo = valor)"""
+        left = node.target
+        if not self._is_assignment_target(left):
+            self._err(node, "assignment-target")
+            yield node.value
+            return None
 
-        def result_type(l, r):
-            return PrimitiveType("number")
+        left_type = yield left
 
-        return self._binary_expr(ctx, validate, result_type)
+        # Check const reassignment
+        if isinstance(left, Identifier):
+            name = left.name
+            var = self.sym.get_var(name)
+            if var is not None and var.is_const:
+                self._err(node, "const-assignment", name)
 
-    def visitUnaryExpr(self, ctx):
-        """Processa operadores unários (-, !)
-        
-        unaryExpr: (NOT | MINUS)* postfixExpr;
-        - MINUS (-): negação aritmética (number -> number)
-        - NOT (!): negação lógica (qualquer tipo -> boolean)
-        """
-        # Conta quantos operadores unários temos
-        not_count = 0
-        minus_count = 0
-        
-        for i in range(ctx.getChildCount()):
-            child_text = ctx.getChild(i).getText()
-            if child_text == '!':
-                not_count += 1
-            elif child_text == '-':
-                minus_count += 1
-        
-        # Obtém o tipo do operand
-        operand_type = self.visit(ctx.postfixExpr())
-        
-        # Se há número ímpar de NOT, o resultado é boolean
-        if not_count > 0 and not_count % 2 == 1:
-            return PrimitiveType("boolean")
-        
-        # Caso contrário, o resultado mantém o tipo do operand
-        return operand_type
+        # Check type compatibility
+        right_type = yield node.value
+        if left_type and right_type:
+            if not self.is_assignable(left_type, right_type, node):
+                self._err(node, "assignment-type", right_type.name(), left_type.name())
 
-    def visitRelationalExpr(self, ctx):
-        """Processa operadores <, <=, >, >= (operandos number; resultado boolean)"""
-        def validate(l, r, op, c):
-            if not (isinstance(l, PrimitiveType) and l.name() == "number" and
-                    isinstance(r, PrimitiveType) and r.name() == "number"):
-                self._err(
-                    c, f"Operador '{op}' requer operandos do tipo number")
-
-        def result_type(l, r):
-            return PrimitiveType("boolean")
-
-        return self._binary_expr(ctx, validate, result_type)
-
-    def visitEqualityExpr(self, ctx):
-        """Processa operadores == e != (mesmo tipo em ambos os lados; resultado boolean)"""
-        def validate(l, r, op, c):
-            if not self.types_equal(l, r):
-                self._err(c, f"Operador '{op}' requer operandos do mesmo tipo")
-
-        def result_type(l, r):
-            return PrimitiveType("boolean")
-
-        return self._binary_expr(ctx, validate, result_type)
-
-    def visitLogicalAndExpr(self, ctx):
-        """Processa operador && (apenas boolean)"""
-        def validate(l, r, op, c):
-            if not (isinstance(l, PrimitiveType) and l.name() == "boolean" and
-                    isinstance(r, PrimitiveType) and r.name() == "boolean"):
-                self._err(c, f"Operador '&&' requer operandos do tipo boolean")
-
-        def result_type(l, r):
-            return PrimitiveType("boolean")
-
-        return self._binary_expr(ctx, validate, result_type)
-
-    def visitLogicalOrExpr(self, ctx):
-        """Processa operador || (apenas boolean)"""
-        def validate(l, r, op, c):
-            if not (isinstance(l, PrimitiveType) and l.name() == "boolean" and
-                    isinstance(r, PrimitiveType) and r.name() == "boolean"):
-                self._err(c, f"Operador '||' requer operandos do tipo boolean")
-
-        def result_type(l, r):
-            return PrimitiveType("boolean")
-
-        return self._binary_expr(ctx, validate, result_type)
-
-    def visitAssignmentExpr(self, ctx):
-        """Processa expressões de atribuição (postfixExpr = assignmentExpr)"""
-        # Find assignment operator
-        assign_idx = -1
-        for i in range(ctx.getChildCount()):
-            text = ctx.getChild(i).getText()
-            if text == '=' and '==' not in text:
-                assign_idx = i
-                break
-
-        if assign_idx > 0:
-            # Assignment found
-            left = ctx.getChild(0)
-            left_type = self.visit(left)
-
-            # Check const reassignment
-            if hasattr(left, 'getText') and assign_idx == 1:
-                left_text = left.getText()
-                if left_text in self.sym.vars and self.sym.vars[left_text].is_const:
-                    self._err(
-                        ctx, f"Não é possível reatribuir variável const '{left_text}'")
-
-            # Check type compatibility
-            right_type = self.visit(ctx.assignmentExpr())
-            if left_type and right_type:
-                if not self.is_assignable(left_type, right_type, ctx):
-                    self._err(
-                        ctx, f"Tipos incompatíveis na atribuição: não é possível atribuir {right_type.name()} a {left_type.name()}")
-
-            return left_type
-        else:
-            # No assignment, just expression
-            if ctx.logicalOrExpr():
-                return self.visit(ctx.logicalOrExpr())
-            return self.visitChildren(ctx)
-
-    def visitChildren(self, node):
-        """Fallback: visita todos os filhos e retorna o último tipo"""
-        result = None
-        for i in range(node.getChildCount()):
-            child = node.getChild(i)
-            if hasattr(child, 'accept'):
-                t = child.accept(self)
-                if t:
-                    result = t
-        return result
+        self.types[node] = left_type
+        return left_type
 
     # ========================================================================
     # ANALYSIS ENTRY POINT
     # ========================================================================
 
-    def analyze(self, tree) -> List[str]:
-        """Ponto de entrada: analisa a árvore e retorna lista de erros"""
-        tree.accept(self)
+    def analyze(self, program) -> List[Diagnostic]:
+        """Ponto de entrada: analisa o programa (TypeScriptAST.Program) e retorna lista de erros
+
+        Com max_errors, a análise para no N-ésimo erro.
+        """
+        try:
+            self.visit(program)
+        except DiagnosticLimit:
+            pass
         return self.errors
@@ -0,0 +1,96 @@
+"""
+Coleta de erros léxicos e sintáticos.
+
+Substitui o ConsoleErrorListener do ANTLR (que escreve em stderr no formato
+`line L:C msg`) no lexer e no parser: os erros são acumulados, na ordem em que
+são encontrados, e relatados no mesmo formato `Linha L:C - mensagem` dos erros
+semânticos. Com um limite de erros (`max_errors`), a análise é interrompida ao
+atingi-lo levantando SyntaxErrorLimit; `max_errors=1` é o modo fail-fast.
+
+Os erros são diagnósticos (TypeScriptDiagnostics) de código `syntax`, com a
+mensagem do ANTLR como argumento. Regras da linguagem que a gramática impõe (como
+`const` exigir inicializador) ganham o mesmo diagnóstico que a análise semântica
+daria.
+
+SyntaxErrorStrategy é o DefaultErrorStrategy usado por parse_program: corrige a
+recuperação de erros em laços do runtime Python, que alterava os conjuntos de
+tokens guardados no ATN e fazia as mensagens dependerem dos textos já analisados.
+"""
+
+from antlr4.IntervalSet import IntervalSet
+from antlr4.Token import Token
+from antlr4.atn.ATNState import ATNState
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+
+from TypeScriptDiagnostics import Diagnostic
+from TypeScriptParser import TypeScriptParser
+
+
+class SyntaxErrorLimit(Exception):
+    """Limite de erros de sintaxe atingido: interrompe lexer e parser"""
+
+
+class SyntaxErrorStrategy(DefaultErrorStrategy):
+    """DefaultErrorStrategy que não altera os conjuntos de tokens do ATN.
+
+    No fim de uma iteração de laço (`(...)*`) com token inesperado, o `sync` do
+    runtime Python une o conjunto de recuperação ao devolvido por
+    getExpectedTokens, que pode ser o `nextTokenWithinRule` que o ATN guarda por
+    estado (o runtime Java cria um conjunto novo). O cache ficava com tokens a
+    mais, e o mesmo texto dava "extraneous input" ou "missing" conforme os erros
+    recuperados antes no processo.
+    """
+
+    _LOOP_BACK = (ATNState.PLUS_LOOP_BACK, ATNState.STAR_LOOP_BACK)
+
+    def sync(self, recognizer):
+        if not self.inErrorRecoveryMode(recognizer):
+            s = recognizer._interp.atn.states[recognizer.state]
+            if s.stateType in self._LOOP_BACK:
+                next_tokens = recognizer.atn.nextTokens(s)
+                if recognizer.getTokenStream().LA(1) not in next_tokens \
+                        and Token.EPSILON not in next_tokens:
+                    self.reportUnwantedToken(recognizer)
+                    recovery = IntervalSet()
+                    recovery.addSet(recognizer.getExpectedTokens())
+                    recovery.addSet(self.getErrorRecoverySet(recognizer))
+                    self.consumeUntil(recognizer, recovery)
+                    return
+        super().sync(recognizer)
+
+
+class SyntaxErrorCollector(ErrorListener):
+    """ErrorListener compartilhado pelo lexer e pelo parser"""
+
+    def __init__(self, max_errors: int = 0):
+        self.max_errors = max_errors  # 0: sem limite
+        self.errors = []              # [Diagnostic], na ordem em que foram encontrados
+
+    @property
+    def count(self) -> int:
+        return len(self.errors)
+
+    @property
+    def limit_reached(self) -> bool:
+        return 0 < self.max_errors <= len(self.errors)
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        ctx = getattr(recognizer, "_ctx", None)
+        if isinstance(ctx, TypeScriptParser.ConstDeclContext) and ctx.typeExpr() is not None \
+                and ctx.ASSIGN() is None:
+            error = Diagnostic("const-without-initializer", ctx.start.line, ctx.start.column,
+                               (ctx.ID().getText(),))
+        else:
+            error = Diagnostic("syntax", line, column, (msg,))
+        self.errors.append(error)
+        if self.limit_reached:
+            raise SyntaxErrorLimit(error.message)
+
+    def diagnostics(self) -> list:
+        """Erros ordenados pela posição"""
+        return sorted(self.errors, key=lambda error: (error.line, error.column))
+
+    def messages(self) -> list:
+        """Erros formatados como os semânticos, ordenados pela posição"""
+        return [str(error) for error in self.diagnostics()]
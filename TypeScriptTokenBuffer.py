@@ -0,0 +1,262 @@
+"""
+Buffer de tokens em arrays paralelos (struct of arrays).
+
+`CommonTokenStream` guarda um CommonToken completo por token (~128 bytes: tipo,
+canal, início, fim, linha, coluna, texto e o par (lexer, entrada)), mais o texto
+quando o lexer o preenche. Depois da árvore, essa lista é a maior alocação do
+parsing.
+
+CompactTokenStream é um CommonTokenStream cujo `tokens` é um TokenArrays: os
+campos de cada token ficam em arrays tipados (~20 bytes por token) e o token
+emitido pelo lexer é descartado. O texto não é copiado, é recortado da entrada
+quando pedido; só textos que diferem do trecho da entrada (como "<EOF>" do
+lexer por regex) são guardados. `tokens[i]`, LT() e get() devolvem um TokenView
+de dois campos, criado sob demanda, com a mesma interface de leitura do
+CommonToken (type, line, column, text, ...); só os tokens guardados na árvore
+(ctx.start, nós terminais) continuam vivos. LA() lê o array de tipos direto.
+"""
+
+from array import array
+from io import StringIO
+
+from antlr4 import CommonTokenStream
+from antlr4.Token import CommonToken, Token
+from antlr4.error.Errors import IllegalStateException
+
+
+class TokenView:
+    """Token de um TokenArrays, lido sob demanda (interface de leitura do CommonToken)"""
+
+    __slots__ = ("_buffer", "tokenIndex")
+
+    def __init__(self, buffer, index: int):
+        self._buffer = buffer
+        self.tokenIndex = index
+
+    @property
+    def type(self) -> int:
+        return self._buffer.types[self.tokenIndex]
+
+    @property
+    def channel(self) -> int:
+        return self._buffer.channels[self.tokenIndex]
+
+    @property
+    def start(self) -> int:
+        return self._buffer.starts[self.tokenIndex]
+
+    @property
+    def stop(self) -> int:
+        return self._buffer.stops[self.tokenIndex]
+
+    @property
+    def line(self) -> int:
+        return self._buffer.lines[self.tokenIndex]
+
+    @property
+    def column(self) -> int:
+        return self._buffer.columns[self.tokenIndex]
+
+    @property
+    def source(self) -> tuple:
+        return self._buffer.source
+
+    @property
+    def text(self) -> str:
+        buffer = self._buffer
+        text = buffer.texts.get(self.tokenIndex)
+        if text is not None:
+            return text
+        input = buffer.source[1]
+        if input is None:
+            return None
+        start, stop = buffer.starts[self.tokenIndex], buffer.stops[self.tokenIndex]
+        n = input.size
+        if start < n and stop < n:
+            return input.getText(start, stop)
+        return "<EOF>"
+
+    @text.setter
+    def text(self, text: str):
+        self._buffer.texts[self.tokenIndex] = text
+
+    def getTokenSource(self):
+        return self._buffer.source[0]
+
+    def getInputStream(self):
+        return self._buffer.source[1]
+
+    def clone(self) -> CommonToken:
+        token = CommonToken(self.source, self.type, self.channel, self.start, self.stop)
+        token.tokenIndex = self.tokenIndex
+        token.line = self.line
+        token.column = self.column
+        token.text = self.text
+        return token
+
+    def __eq__(self, other):
+        if isinstance(other, TokenView):
+            return self._buffer is other._buffer and self.tokenIndex == other.tokenIndex
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._buffer), self.tokenIndex))
+
+    def __str__(self):
+        with StringIO() as buf:
+            txt = self.text
+            if txt is not None:
+                txt = txt.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+            else:
+                txt = "<no text>"
+            channel = f",channel={self.channel}" if self.channel > 0 else ""
+            buf.write(f"[@{self.tokenIndex},{self.start}:{self.stop}='{txt}',"
+                      f"<{self.type}>{channel},{self.line}:{self.column}]")
+            return buf.getvalue()
+
+
+class TokenArrays:
+    """Sequência de tokens guardada em arrays paralelos; os itens são TokenView"""
+
+    __slots__ = ("types", "channels", "starts", "stops", "lines", "columns",
+                 "source", "texts", "others")
+
+    def __init__(self):
+        self.types = array("h")
+        self.channels = array("h")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.source = None
+        self.texts = {}   # índice → texto que difere do trecho da entrada
+        self.others = {}  # índice → token de outra fonte, mantido como objeto
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append(self, token):
+        index = len(self.types)
+        self.types.append(token.type)
+        self.channels.append(token.channel)
+        self.starts.append(token.start)
+        self.stops.append(token.stop)
+        self.lines.append(token.line)
+        self.columns.append(token.column)
+        if self.source is None:
+            self.source = token.source
+        if token.source is not self.source:
+            self.others[index] = token
+            return
+        text = getattr(token, "_text", None)
+        if text is not None and text != token.getInputStream().getText(token.start, token.stop):
+            self.texts[index] = text
+
+    def __getitem__(self, index):
+        if type(index) is not int:
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self.types)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("índice de token fora do buffer")
+        if self.others:
+            token = self.others.get(index)
+            if token is not None:
+                return token
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield self[index]
+
+
+class CompactTokenStream(CommonTokenStream):
+    """CommonTokenStream sobre um TokenArrays"""
+
+    __slots__ = ("_current",)
+
+    def __init__(self, lexer, channel: int = Token.DEFAULT_CHANNEL):
+        super().__init__(lexer, channel)
+        self.tokens = TokenArrays()
+        self._current = None  # último LT(1): o parser pede o mesmo token várias vezes
+
+    def setTokenSource(self, tokenSource):
+        super().setTokenSource(tokenSource)
+        self.tokens = TokenArrays()
+        self._current = None
+
+    def LT(self, k: int):
+        index = self.index
+        if k == 1 and index >= 0:
+            token = self._current
+            if token is None or token.tokenIndex != index:
+                token = self._current = self.tokens[index]
+            return token
+        return super().LT(k)
+
+    # consume/sync/fetch/nextTokenOnChannel são os de BufferedTokenStream, mas medem
+    # o buffer pelo array de tipos (len() de TokenArrays passaria por __len__)
+
+    def consume(self):
+        index = self.index
+        n = len(self.tokens.types)
+        if index >= 0:
+            skip_eof_check = index < n - 1 if self.fetchedEOF else index < n
+        else:
+            skip_eof_check = False
+        if not skip_eof_check and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if self.sync(index + 1):
+            self.index = self.adjustSeekIndex(index + 1)
+
+    def sync(self, i: int) -> bool:
+        n = i - len(self.tokens.types) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def fetch(self, n: int) -> int:
+        if self.fetchedEOF:
+            return 0
+        tokens = self.tokens
+        next_token = self.tokenSource.nextToken
+        for i in range(n):
+            token = next_token()
+            token.tokenIndex = len(tokens.types)
+            tokens.append(token)
+            if token.type == Token.EOF:
+                self.fetchedEOF = True
+                return i + 1
+        return n
+
+    def LA(self, i: int) -> int:
+        index = self.index
+        if i == 1 and index >= 0:
+            return self.tokens.types[index]
+        return self.LT(i).type
+
+    def nextTokenOnChannel(self, i: int, channel: int) -> int:
+        self.sync(i)
+        tokens = self.tokens
+        if i >= len(tokens.types):
+            return len(tokens.types) - 1
+        while tokens.channels[i] != channel:
+            if tokens.types[i] == Token.EOF:
+                return i
+            i += 1
+            self.sync(i)
+        return i
+
+    def previousTokenOnChannel(self, i: int, channel: int) -> int:
+        channels = self.tokens.channels
+        while i >= 0 and channels[i] != channel:
+            i -= 1
+        return i
+
+    def getText(self, start=None, stop=None) -> str:
+        if isinstance(start, TokenView):
+            start = start.tokenIndex
+        if isinstance(stop, TokenView):
+            stop = stop.tokenIndex
+        return super().getText(start, stop)
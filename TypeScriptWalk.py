@@ -0,0 +1,65 @@
+"""
+Percurso do AST sem recursão do Python.
+
+Os métodos visitX de SemanticAnalyzer e JasminGenerator que visitam filhos são
+geradores. `resultado = yield filho` pede a visita de um filho e recebe o
+resultado dela, e o `return` do gerador é o resultado do próprio nó. Métodos que
+não visitam filhos (literais, identificadores) continuam funções comuns.
+
+walk() executa esses geradores com uma pilha explícita: a profundidade do AST
+(parênteses, blocos aninhados, cadeias de else if) fica limitada só pela memória,
+não por sys.getrecursionlimit(). Isso vale para o percurso; o parsing dos
+statements (regras recursivas geradas pelo ANTLR) continua sujeito ao limite,
+veja o README.
+
+Os nós não têm accept(): cada visitor monta no __init__ uma tabela {classe do nó:
+método visitX já ligado} (dispatch_table, sobre TypeScriptAST.NODE_TYPES) e o
+percurso faz uma única consulta ao dicionário por nó, em vez do despacho duplo
+node.accept(visitor) → visitor.visitX(node).
+"""
+
+from types import GeneratorType
+
+from TypeScriptAST import NODE_TYPES
+
+
+def dispatch_table(visitor) -> dict:
+    """Mapeia cada classe de TypeScriptAST.NODE_TYPES para o método visit<Classe>
+    correspondente de `visitor`"""
+    return {cls: getattr(visitor, "visit" + cls.__name__) for cls in NODE_TYPES}
+
+
+def walk(visitor, node):
+    """Visita `node` com `visitor` usando uma pilha explícita de geradores"""
+    if node is None:
+        return None
+    dispatch = visitor.dispatch
+    value = dispatch[type(node)](node)
+    if type(value) is not GeneratorType:
+        return value
+    return run(visitor, value)
+
+
+def run(visitor, generator):
+    """Executa um gerador no formato dos visitX (`resultado = yield filho`) com a
+    mesma pilha explícita de walk() e retorna o valor do seu `return`"""
+    dispatch = visitor.dispatch
+    stack = []
+    push, pop = stack.append, stack.pop
+    send, value = generator.send, None
+    while True:
+        try:
+            child = send(value)
+        except StopIteration as stop:
+            if not stack:
+                return stop.value
+            send, value = pop(), stop.value
+            continue
+        if child is None:  # trecho ausente por erro de sintaxe
+            value = None
+            continue
+        value = dispatch[type(child)](child)
+        if type(value) is GeneratorType:
+            push(send)
+            send, value = value.send, None
+
@@ -0,0 +1,131 @@
+"""
+Benchmark da verificação de atribuição de objetos literais a interfaces.
+
+O programa declara interfaces aninhadas (Item contém Produto e Medidas, e um
+array de string) e atribui --objects objetos literais do mesmo formato a um
+Item[]:
+- um array literal com todos os objetos (let itens: Item[] = [...]);
+- uma atribuição itens[i] = {...} por objeto;
+- uma declaração let item: Item = {...} por objeto, dentro de uma função.
+O AST é montado direto, sem passar pelo parser.
+
+Compara o analisador atual (literais de mesma forma são um único tipo e
+is_assignable memoriza cada par alvo/origem) com a versão sem cache (SemCache,
+abaixo), que cria um tipo por literal e refaz a comparação campo a campo em cada
+atribuição. As duas versões têm que produzir os mesmos erros; --invalid torna um
+a cada N objetos incompatível (preço string), para medir também o caminho de erro.
+
+Uso:
+    python benchmarks/bench_assignability.py [--objects N] [--invalid N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from TypeScriptAST import (  # noqa: E402
+    ArrayLiteral, AssignExpr, Block, ExprStmt, FunctionDecl, Identifier, IndexOp,
+    InterfaceDecl, Literal, ObjectLiteral, PostfixExpr, Program, TypeRef, VarDecl,
+)
+from TypeScriptSemantic import InterfaceType, SemanticAnalyzer  # noqa: E402
+
+
+class SemCache(SemanticAnalyzer):
+    """Verificação de atribuição como era antes do cache"""
+
+    def _assignable_cached(self, target, source):
+        if not (target and source):
+            return False
+        return self._check_assignable(target, source)
+
+    def visitObjectLiteral(self, node):
+        obj = InterfaceType("<obj-literal>")
+        for key, value in node.props:
+            obj.props[key] = yield value
+        return obj
+
+
+ANALYZERS = {"cache": SemanticAnalyzer, "sem cache": SemCache}
+
+
+def _type(name, is_array=False):
+    return TypeRef(name, is_array, 1, 0)
+
+
+def _number(i):
+    return Literal("number", str(i), 1, 0)
+
+
+def _string(text):
+    return Literal("string", f'"{text}"', 1, 0)
+
+
+def _item(i, invalid):
+    preco = _string("caro") if invalid else _number(i)
+    produto = ObjectLiteral([("nome", _string(f"p{i}")), ("preco", preco),
+                             ("ativo", Literal("boolean", "true", 1, 0))], 1, 0)
+    medidas = ObjectLiteral([("largura", _number(i)), ("altura", _number(2)),
+                             ("profundidade", _number(3))], 1, 0)
+    tags = ArrayLiteral([_string("a"), _string("b")], 1, 0)
+    return ObjectLiteral([("produto", produto), ("medidas", medidas), ("tags", tags),
+                          ("quantidade", _number(i))], 1, 0)
+
+
+def make_program(objects: int, invalid: int) -> Program:
+    interfaces = [
+        InterfaceDecl("Produto", [("nome", _type("string")), ("preco", _type("number")),
+                                  ("ativo", _type("boolean"))], 1, 0),
+        InterfaceDecl("Medidas", [("largura", _type("number")), ("altura", _type("number")),
+                                  ("profundidade", _type("number"))], 1, 0),
+        InterfaceDecl("Item", [("produto", _type("Produto")), ("medidas", _type("Medidas")),
+                               ("tags", _type("string", True)),
+                               ("quantidade", _type("number"))], 1, 0),
+    ]
+
+    def bad(i):
+        return invalid > 0 and i % invalid == invalid - 1
+
+    array = VarDecl("itens", _type("Item", True),
+                    ArrayLiteral([_item(i, False) for i in range(objects)], 1, 0), False, 1, 0)
+    assigns = [ExprStmt(AssignExpr(PostfixExpr(Identifier("itens", 1, 0), [IndexOp(_number(i))], 1, 0),
+                                   _item(i, bad(i)), 1, 0), 1, 0)
+               for i in range(objects)]
+    locals_ = Block([VarDecl(f"item{i}", _type("Item"), _item(i, bad(i)), False, 1, 0)
+                     for i in range(objects)], 1, 0)
+    function = FunctionDecl("preencher", [], _type("void"), locals_, 1, 0)
+    return Program(interfaces + [array] + assigns + [function], 1, 0)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--objects", type=int, default=100_000)
+    ap.add_argument("--invalid", type=int, default=0,
+                    help="um objeto incompatível a cada N (0: nenhum)")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    program = make_program(args.objects, args.invalid)
+    gc.collect()
+    print(f"{args.objects} objetos no array literal, {args.objects} atribuições "
+          f"e {args.objects} declarações")
+    results = {}
+    for name, analyzer_class in ANALYZERS.items():
+        best = float("inf")
+        for _ in range(args.runs):
+            analyzer = analyzer_class()
+            t0 = time.perf_counter()
+            errors = analyzer.analyze(program)
+            best = min(best, time.perf_counter() - t0)
+        results[name] = errors
+        print(f"  {name:<10} {best * 1000:9.1f} ms  ({len(errors)} erros)")
+    assert results["cache"] == results["sem cache"]
+
+
+if __name__ == "__main__":
+    main()
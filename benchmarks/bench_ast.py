@@ -0,0 +1,126 @@
+"""
+Benchmark do AST compacto: árvore do ANTLR vs. TypeScriptAST.
+
+Para o mesmo programa sintético (o de bench_expr_parser), mede:
+- memória retida por cada representação (tracemalloc, com os tokens já criados e
+  os DFAs do parser aquecidos, para contar só os nós);
+- tempo de um percurso completo de cada árvore;
+- análise semântica e geração de Jasmin sobre o AST.
+
+Uso:
+    python benchmarks/bench_ast.py [--statements N] [--repeat N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+from antlr4.tree.Tree import TerminalNode  # noqa: E402
+
+from bench_expr_parser import build_source  # noqa: E402
+from main import parse_program  # noqa: E402
+from TypeScriptAST import Node  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+
+def tokenize(source: str) -> CommonTokenStream:
+    tokens = CommonTokenStream(TypeScriptLexer(InputStream(source)))
+    tokens.fill()
+    return tokens
+
+
+def walk_parse_tree(tree) -> int:
+    """Percorre todos os contextos da árvore do ANTLR; retorna quantos visitou"""
+    count = 0
+    stack = [tree]
+    while stack:
+        ctx = stack.pop()
+        count += 1
+        if ctx.children:
+            stack.extend(c for c in ctx.children if not isinstance(c, TerminalNode))
+    return count
+
+
+def walk_ast(program) -> int:
+    """Percorre todos os nós do AST; retorna quantos visitou"""
+    count = 0
+    stack = [program]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Node):
+            count += 1
+            stack.extend(getattr(item, f) for f in item._fields)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return count
+
+
+def retained(build):
+    """(resultado, bytes retidos) de build(), medidos com tracemalloc"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def best_of(repeat: int, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--statements", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    source = build_source(args.statements)
+    print(f"Fonte: {len(source) / 1024:.1f} KiB, {args.statements} statements")
+
+    # Aquece os DFAs para que a medição de memória conte apenas a árvore
+    parse_program(tokenize(source), "auto", "antlr")
+
+    tokens = tokenize(source)
+    tree, bytes_tree = retained(lambda: parse_program(tokens, "auto", "antlr")[0])
+    program, bytes_ast = retained(lambda: lower_program(tree))
+
+    n_tree = walk_parse_tree(tree)
+    n_ast = walk_ast(program)
+    t_tree = best_of(args.repeat, lambda: walk_parse_tree(tree))
+    t_ast = best_of(args.repeat, lambda: walk_ast(program))
+
+    print(f"  {'árvore':>12}  {'nós':>8}  {'memória':>10}  {'bytes/nó':>8}  {'percurso':>10}")
+    for label, nodes, size, elapsed in (("ANTLR", n_tree, bytes_tree, t_tree),
+                                        ("AST", n_ast, bytes_ast, t_ast)):
+        print(f"  {label:>12}  {nodes:8d}  {size / 1024:7.0f} KiB  {size / nodes:8.0f}  "
+              f"{elapsed * 1000:7.1f} ms")
+
+    def passes():
+        analyzer = SemanticAnalyzer()
+        assert not analyzer.analyze(program)
+        JasminGenerator(analyzer, class_name="Bench").visit(program)
+
+    t_passes = best_of(args.repeat, passes)
+    print(f"  semântica + geração sobre o AST: {t_passes * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
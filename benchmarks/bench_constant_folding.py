@@ -0,0 +1,95 @@
+"""
+Benchmark da avaliação de expressões constantes (TypeScriptConstantFolding).
+
+Para cada exemplo do repositório (exemplo_*.txt e teste_biblioteca.txt) e para
+um programa gerado com --functions funções cheias de expressões constantes
+(`60 * 60 * 24`, `-(-5)`, `!true`, condições como `1 > 2`), compara o Jasmin
+gerado com e sem a avaliação:
+- expressões avaliadas;
+- instruções emitidas (linhas de código, sem diretivas nem labels);
+- tempo da avaliação.
+
+Uso:
+    python benchmarks/bench_constant_folding.py [--functions N] [--runs N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptConstantFolding import count_instructions, fold_constants  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+_FUNCTION = """function f{i}(a: number): number {{
+    let segundos: number = a * 60 * 60 * 24;
+    let limite: number = 2147483647 + 1 - -(-5);
+    let ativo: boolean = !true || 1 < 2;
+    for (let k: number = 0; k < 10 * 10; k = k + 1) {{
+        if (k % 2 == 0 && ativo) {{ segundos = segundos + (1000 / 10) * k; }}
+    }}
+    if (3 > 4) {{ print("nunca", limite); }}
+    return segundos - 7 % 3;
+}}
+print(f{i}({i}));
+"""
+
+
+def make_source(functions: int) -> str:
+    return "".join(_FUNCTION.format(i=i) for i in range(functions))
+
+
+def _generate(analyzer, program) -> str:
+    generator = JasminGenerator(analyzer, "Bench")
+    generator.visit(program)
+    return generator.get_result()
+
+
+def measure(code: str, runs: int) -> tuple:
+    """(avaliadas, instruções sem, instruções com, ms da avaliação)"""
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(program)
+    assert errors == [], errors[:3]
+
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        folding = fold_constants(program, analyzer)
+        best = min(best, time.perf_counter() - t0)
+    before = count_instructions(_generate(analyzer, program))
+    after = count_instructions(_generate(analyzer, folding.program))
+    return folding.folded, before, after, best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=200)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    sources = [(path.name, path.read_text(encoding="utf-8"))
+               for path in sorted(ROOT.glob("exemplo_*.txt")) + [ROOT / "teste_biblioteca.txt"]]
+    sources.append((f"gerado ({args.functions} funções)", make_source(args.functions)))
+
+    print(f"{'programa':32}{'avaliadas':>10}{'instr. sem':>12}{'instr. com':>12}"
+          f"{'redução':>9}{'tempo':>10}")
+    for name, code in sources:
+        folded, before, after, elapsed = measure(code, args.runs)
+        print(f"{name:32}{folded:10d}{before:12d}{after:12d}"
+              f"{(before - after) / before:9.1%}{elapsed:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
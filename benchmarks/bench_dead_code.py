@@ -0,0 +1,124 @@
+"""
+Benchmark da eliminação de código morto (TypeScriptDeadCode).
+
+Gera um programa com --functions funções, das quais só uma fração (--reachable)
+é chamada a partir do nível superior, mais interfaces e globais sem uso e
+desvios `if (false)`. Compara o Jasmin gerado com e sem a eliminação:
+- tamanho (bytes e linhas) da classe principal e número de classes emitidas;
+- tempo da eliminação e da geração;
+- tempo de montagem com jasmin.jar (quando java está disponível).
+
+Uso:
+    python benchmarks/bench_dead_code.py [--functions N] [--reachable F] [--runs N]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptDeadCode import eliminate_dead_code  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+_FUNCTION = """interface R{i} {{ v: number; }}
+let g{i}: number = {i};
+function f{i}(a: number, b: number): number {{
+    let total: number = 0;
+    for (let k: number = 0; k < b; k = k + 1) {{
+        if (k % 2 == 0) {{ total = total + a * k; }} else {{ total = total - k; }}
+    }}
+    if (false) {{ print("nunca", total); }}
+    return total;
+}}
+"""
+
+
+def make_source(functions: int, reachable: float) -> str:
+    step = max(1, round(1 / reachable)) if reachable > 0 else functions + 1
+    body = "".join(_FUNCTION.format(i=i) for i in range(functions))
+    calls = "".join(f"print(f{i}(2, 10));\n" for i in range(0, functions, step))
+    return body + calls
+
+
+def _generate(analyzer, program, reachable=None):
+    generator = JasminGenerator(analyzer, "Bench", reachable=reachable)
+    generator.visit(program)
+    return generator.get_result(), generator.interface_classes
+
+
+def _assemble(code: str, interfaces: list, runs: int) -> float:
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(tmp, "Bench.j")]
+        files[0].write_text(code, encoding="utf-8")
+        for i, text in enumerate(interfaces):
+            files.append(Path(tmp, f"I{i}.j"))
+            files[-1].write_text(text, encoding="utf-8")
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run(["java", "-jar", str(ROOT / "jasmin.jar"), "-d", tmp,
+                            *map(str, files)], check=True, capture_output=True)
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=500)
+    ap.add_argument("--reachable", type=float, default=0.1,
+                    help="fração das funções chamadas pelo nível superior")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    code = make_source(args.functions, args.reachable)
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(program)
+    assert errors == [], errors[:3]
+
+    elimination = generation = float("inf")
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        dead = eliminate_dead_code(program, analyzer)
+        elimination = min(elimination, time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        _generate(analyzer, program)
+        generation = min(generation, time.perf_counter() - t0)
+    full, full_interfaces = _generate(analyzer, program)
+    pruned, interfaces = _generate(analyzer, dead.program, dead)
+
+    print(f"{args.functions} funções, {len(code) / 1024:.0f} KiB de fonte")
+    for line in dead.report(max_names=3):
+        print(f"  {line}")
+    print(f"  eliminação: {elimination * 1000:8.1f} ms   geração (sem eliminar): "
+          f"{generation * 1000:8.1f} ms")
+    print(f"\n{'':16}{'bytes':>10}{'linhas':>10}{'classes':>9}")
+    for label, text, classes in (("sem eliminação", full, full_interfaces),
+                                 ("com eliminação", pruned, interfaces)):
+        print(f"{label:16}{len(text.encode()):10d}{text.count(chr(10)):10d}"
+              f"{len(classes) + 1:9d}")
+
+    if shutil.which("java") and (ROOT / "jasmin.jar").exists():
+        before = _assemble(full, full_interfaces, args.runs)
+        after = _assemble(pruned, interfaces, args.runs)
+        print(f"\nmontagem com jasmin.jar: {before * 1000:.0f} ms -> {after * 1000:.0f} ms")
+    else:
+        print("\njava ou jasmin.jar indisponível: montagem não medida")
+
+
+if __name__ == "__main__":
+    main()
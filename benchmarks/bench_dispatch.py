@@ -0,0 +1,143 @@
+"""
+Benchmark do despacho dos visitors: despacho duplo (accept) vs. tabela por instância.
+
+O programa é exemplo_estoque.txt repetido --repeat vezes, cada cópia dentro de um
+bloco { ... } para que as declarações não colidam (sem erros semânticos, o
+caminho é o mesmo de um único exemplo). A análise semântica e a geração de
+código rodam com os dois motores:
+
+- accept: o percurso de TypeScriptWalk como era antes, com o despacho duplo
+  node.accept(visitor) → visitor.visitX(node); os nós não têm mais accept(), e
+  o benchmark instala nas classes de NODE_TYPES os métodos que existiam;
+- tabela: TypeScriptWalk.walk, que consulta visitor.dispatch[type(node)].
+
+A saída mostra o tempo de cada passo e a diferença por nó visitado.
+
+Uso:
+    python benchmarks/bench_dispatch.py [--repeat N] [--runs N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import GeneratorType
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptAST import NODE_TYPES  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+from TypeScriptWalk import walk  # noqa: E402
+
+
+def install_accept():
+    """Recria em cada classe de nó o `accept(self, visitor)` que chamava visitor.visitX"""
+    for cls in NODE_TYPES:
+        namespace = {}
+        exec(f"def accept(self, visitor):\n    return visitor.visit{cls.__name__}(self)\n",
+             namespace)
+        cls.accept = namespace["accept"]
+
+
+def walk_accept(visitor, node):
+    """TypeScriptWalk.walk com o despacho duplo por accept()"""
+    if node is None:
+        return None
+    value = node.accept(visitor)
+    if type(value) is not GeneratorType:
+        return value
+    stack = []
+    push, pop = stack.append, stack.pop
+    send, value = value.send, None
+    while True:
+        try:
+            child = send(value)
+        except StopIteration as stop:
+            if not stack:
+                return stop.value
+            send, value = pop(), stop.value
+            continue
+        if child is None:
+            value = None
+            continue
+        value = child.accept(visitor)
+        if type(value) is GeneratorType:
+            push(send)
+            send, value = value.send, None
+
+
+ENGINES = {"accept": walk_accept, "tabela": walk}
+
+
+def use_engine(engine):
+    SemanticAnalyzer.visit = lambda self, node: engine(self, node)
+    JasminGenerator.visit = lambda self, node: engine(self, node)
+
+
+def compile_program(program):
+    t0 = time.perf_counter()
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(program)
+    t1 = time.perf_counter()
+    JasminGenerator(analyzer, "Bench").visit(program)
+    return errors, t1 - t0, time.perf_counter() - t1
+
+
+def count_visits(program) -> int:
+    """Número de nós despachados em uma análise semântica"""
+    analyzer = SemanticAnalyzer()
+    counter = [0]
+
+    def counting(handler):
+        def counted(node):
+            counter[0] += 1
+            return handler(node)
+        return counted
+
+    analyzer.dispatch = {cls: counting(h) for cls, h in analyzer.dispatch.items()}
+    walk(analyzer, program)
+    return counter[0]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=1000)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    install_accept()
+    source = (ROOT / "exemplo_estoque.txt").read_text(encoding="utf-8")
+    code = f"{{\n{source}\n}}\n" * args.repeat
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    nodes = count_visits(program)
+    print(f"exemplo_estoque.txt × {args.repeat}: {nodes} nós visitados por passo "
+          f"(mínimo de {args.runs} execuções)")
+
+    best = {name: [float("inf"), float("inf")] for name in ENGINES}
+    for _ in range(args.runs):
+        for name, engine in ENGINES.items():
+            use_engine(engine)
+            errors, sem, gen = compile_program(program)
+            assert errors == [], errors[:3]
+            best[name] = [min(best[name][0], sem), min(best[name][1], gen)]
+
+    print(f"  {'motor':<8} {'semântica':>10} {'ns/nó':>7} {'geração':>10} {'ns/nó':>7}")
+    for name, (sem, gen) in best.items():
+        print(f"  {name:<8} {sem * 1000:7.1f} ms {sem / nodes * 1e9:7.0f} "
+              f"{gen * 1000:7.1f} ms {gen / nodes * 1e9:7.0f}")
+    (sem_a, gen_a), (sem_t, gen_t) = best["accept"], best["tabela"]
+    print(f"  economia por nó: semântica {(sem_a - sem_t) / nodes * 1e9:.0f} ns, "
+          f"geração {(gen_a - gen_t) / nodes * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
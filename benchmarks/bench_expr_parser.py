@@ -0,0 +1,94 @@
+"""
+Benchmark do parser de expressões: regras do ANTLR vs. precedence climbing (Pratt).
+
+Gera um programa sintético dominado por expressões (aritmética, comparações,
+lógica, unários, acessos a arrays e chamadas) e mede, para cada parser de
+expressões, o parsing (tokens produzidos antes da medição; inclui a conversão
+para o AST) e as duas passadas seguintes: análise semântica e geração de Jasmin.
+
+Uso:
+    python benchmarks/bench_expr_parser.py [--statements N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+
+def build_source(statements: int) -> str:
+    """Programa válido com muitas expressões de todos os níveis de precedência"""
+    lines = [
+        "let a: number = 1;",
+        "let b: number = 2;",
+        "let c: number = 3;",
+        "let ok: boolean = true;",
+        "let v: number[] = [1, 2, 3, 4];",
+        "function f(x: number, y: number): number { return x * y + 1; }",
+    ]
+    for i in range(statements):
+        kind = i % 4
+        if kind == 0:
+            lines.append(f"a = (a + b * {i}) % 7 - -c + v[{i % 4}] * (b - {i} / (c + 1));")
+        elif kind == 1:
+            lines.append(f"ok = a < b + {i} && !(c >= a * 2) || b != {i} && ok;")
+        elif kind == 2:
+            lines.append(f"if (a * b + c > {i} && v[0] <= f(a, b - 1)) {{ c = c + f(a % 3, {i}); }}")
+        else:
+            lines.append(f"print(a + b * c - f(a, b) + v[{i % 4}] * {i});")
+    return "\n".join(lines) + "\n"
+
+
+def bench(source: str, expr_parser: str, repeat: int):
+    """Retorna (parsing, semântica, geração) — melhores tempos em s — e o nº de tokens"""
+    best = [float("inf")] * 3
+    n_tokens = 0
+    for _ in range(repeat):
+        tokens = CommonTokenStream(TypeScriptLexer(InputStream(source)))
+        tokens.fill()
+        n_tokens = len(tokens.tokens)
+
+        t0 = time.perf_counter()
+        tree, _ = parse_program(tokens, "auto", expr_parser)
+        program = lower_program(tree)
+        t1 = time.perf_counter()
+        analyzer = SemanticAnalyzer()
+        errors = analyzer.analyze(program)
+        t2 = time.perf_counter()
+        JasminGenerator(analyzer, class_name="Bench").visit(program)
+        t3 = time.perf_counter()
+
+        assert not errors, errors[:3]
+        for k, elapsed in enumerate((t1 - t0, t2 - t1, t3 - t2)):
+            best[k] = min(best[k], elapsed)
+    return best, n_tokens
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--statements", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    source = build_source(args.statements)
+    print(f"Fonte: {len(source) / 1024:.1f} KiB, {args.statements} statements")
+    print(f"  {'parser':>6}  {'parsing':>10}  {'semântica':>10}  {'geração':>10}  {'tokens/s':>10}")
+    for expr_parser in ("antlr", "pratt"):
+        (parse, sem, gen), n_tokens = bench(source, expr_parser, args.repeat)
+        print(f"  {expr_parser:>6}  {parse * 1000:8.1f} ms  {sem * 1000:8.1f} ms  "
+              f"{gen * 1000:8.1f} ms  {n_tokens / parse:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark do reparsing incremental: edições de um caractere em arquivos grandes.
+
+Para cada tamanho em --lines, gera um fonte com funções de 7 linhas, faz o parsing
+completo (parse_source) e aplica --edits edições de um caractere em funções
+sorteadas: troca de um dígito, inserção de um espaço e inserção de uma quebra de
+linha (que desloca as posições de todo o resto do arquivo). Mede a mediana de:
+- reparse: relexar e reanalisar o statement editado;
+- program: montar o Program, corrigindo as posições dos segmentos deslocados.
+Ao final de cada tamanho confere que o Program é igual ao do parsing completo.
+
+Uso:
+    python benchmarks/bench_incremental_parse.py [--lines N ...] [--edits N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from TypeScriptIncremental import parse_source, reparse  # noqa: E402
+
+_FUNCTION = """function soma{i}(a: number, b: number): number {{
+    let total: number = 0;
+    for (let k: number = 0; k < b; k = k + 1) {{
+        if (k % 2 == 0) {{ total = total + a * k; }} else {{ total = total - k; }}
+    }}
+    return total;
+}}
+"""
+
+
+def make_source(lines: int) -> str:
+    return "".join(_FUNCTION.format(i=i) for i in range(lines // 7)) + "print(soma0(1, 2));\n"
+
+
+def single_char_edit(text: str, rng: random.Random) -> tuple:
+    """(início, fim, texto) de uma edição de um caractere em uma função sorteada"""
+    anchor = text.find("let total: number = ", rng.randrange(len(text) // 2))
+    digit = anchor + len("let total: number = ")
+    kind = rng.choice(("digit", "space", "newline"))
+    if kind == "digit":
+        return digit, digit + 1, str(rng.randrange(10))
+    if kind == "space":
+        return digit, digit, " "
+    return anchor, anchor, "\n"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--lines", type=int, nargs="+", default=[2500, 5000, 10000, 20000])
+    ap.add_argument("--edits", type=int, default=30)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"  {'linhas':>7} {'completo':>10} {'reparse':>10} {'program':>10} {'relexado':>9}")
+    for lines in args.lines:
+        text = make_source(lines)
+        t0 = time.perf_counter()
+        source = parse_source(text)
+        full = time.perf_counter() - t0
+
+        reparse_times, program_times, region = [], [], []
+        for _ in range(args.edits):
+            start, end, new_text = single_char_edit(source.text, rng)
+            t0 = time.perf_counter()
+            source = reparse(source, start, end, new_text)
+            t1 = time.perf_counter()
+            source.program
+            t2 = time.perf_counter()
+            reparse_times.append(t1 - t0)
+            program_times.append(t2 - t1)
+            region.append(source.reparsed[1] - source.reparsed[0])
+
+        expected = parse_source(source.text).program
+        assert repr(source.program) == repr(expected), "Program diferente do parsing completo"
+        print(f"  {source.text.count(chr(10)):>7} {full:8.2f} s "
+              f"{statistics.median(reparse_times) * 1000:7.1f} ms "
+              f"{statistics.median(program_times) * 1000:7.1f} ms "
+              f"{statistics.median(region):7.0f} c")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark da análise semântica incremental: uma função editada em um programa grande.
+
+Gera um programa com --functions funções (cada uma chama a anterior e usa uma
+interface global), faz o parsing completo (parse_source) e a primeira análise
+com IncrementalAnalyzer. Depois aplica, com reparse, edições em uma função
+sorteada:
+- corpo: troca um dígito de um literal (só essa função é reanalisada);
+- assinatura: troca o tipo de retorno de number para string e volta (a função e
+  a que a chama são reanalisadas);
+- linha: insere uma quebra de linha antes da função (nada é reanalisado, só as
+  posições dos erros seguintes mudam).
+Para cada tipo de edição mede a mediana da análise incremental e da análise
+completa (TwoPhaseAnalyzer novo, como no main.py) do mesmo Program, e confere que os erros são
+iguais.
+
+Uso:
+    python benchmarks/bench_incremental_semantic.py [--functions N] [--edits N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from TypeScriptIncremental import parse_source, reparse  # noqa: E402
+from TypeScriptIncrementalSemantic import IncrementalAnalyzer  # noqa: E402
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer  # noqa: E402
+
+_HEADER = "interface Ponto { x: number; y: number; }\nfunction f0(p: Ponto): number { return p.x; }\n"
+
+_FUNCTION = """function f{i}(p: Ponto): number {{
+    let total: number = f{prev}(p) + 1;
+    for (let k: number = 0; k < p.y; k = k + 1) {{
+        if (k % 2 == 0) {{ total = total + p.x * k; }} else {{ total = total - k; }}
+    }}
+    return total;
+}}
+"""
+
+
+def make_source(functions: int) -> str:
+    return _HEADER + "".join(_FUNCTION.format(i=i, prev=i - 1) for i in range(1, functions))
+
+
+def body_edit(text, i, rng):
+    anchor = text.index(f"function f{i}(")
+    digit = text.index("+ 1;", anchor) + 2
+    return [(digit, digit + 1, str(rng.randrange(2, 10)))]
+
+
+def signature_edit(text, i, rng):
+    anchor = text.index(f"function f{i}(")
+    start = text.index("): number", anchor) + 3
+    return [(start, start + 6, "string"), (start, start + 6, "number")]
+
+
+def line_edit(text, i, rng):
+    anchor = text.index(f"function f{i}(")
+    return [(anchor, anchor, "\n")]
+
+
+EDITS = {"corpo": body_edit, "assinatura": signature_edit, "linha": line_edit}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=5000)
+    ap.add_argument("--edits", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    source = parse_source(make_source(args.functions))
+    incremental = IncrementalAnalyzer()
+    t0 = time.perf_counter()
+    errors = incremental.analyze(source.program)
+    first = time.perf_counter() - t0
+    assert errors == [], errors[:3]
+    print(f"{args.functions} funções, primeira análise incremental: {first * 1000:.0f} ms")
+    print(f"  {'edição':<11} {'completa':>10} {'incremental':>12} {'reanalisados':>13}")
+
+    for name, edit in EDITS.items():
+        full_times, incremental_times, rechecked = [], [], []
+        for _ in range(args.edits):
+            i = rng.randrange(1, args.functions - 1)
+            for start, end, new_text in edit(source.text, i, rng):
+                source = reparse(source, start, end, new_text)
+                program = source.program
+
+                t0 = time.perf_counter()
+                errors = incremental.analyze(program)
+                incremental_times.append(time.perf_counter() - t0)
+                rechecked.append(len(incremental.rechecked))
+
+                t0 = time.perf_counter()
+                expected = TwoPhaseAnalyzer().analyze(program)
+                full_times.append(time.perf_counter() - t0)
+                assert errors == expected, "Erros diferentes da análise completa"
+        print(f"  {name:<11} {statistics.median(full_times) * 1000:7.1f} ms "
+              f"{statistics.median(incremental_times) * 1000:9.1f} ms "
+              f"{statistics.median(rechecked):12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark de memória do fluxo de entrada: antlr4.FileStream vs. CompactFileStream.
+
+Gera um fonte grande (exemplo_*.txt concatenados e repetidos até --size-mb) e mede,
+em um subprocesso novo para cada fluxo, o pico de memória (tracemalloc) e o tempo
+de carga do arquivo. Depois compara o throughput do lexer gerado sobre os dois
+fluxos em um trecho menor (--lex-mb), já que LA() lê de buffers diferentes.
+
+Uso:
+    python benchmarks/bench_input_stream.py [--size-mb N] [--lex-mb N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, FileStream  # noqa: E402
+
+from TypeScriptInputStream import CompactFileStream  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+
+STREAMS = {"FileStream": FileStream, "CompactFileStream": CompactFileStream}
+
+# Executado em um processo novo: carrega o arquivo e imprime "pico tempo tamanho"
+_LOAD_SCRIPT = """
+import sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+from antlr4 import FileStream
+from TypeScriptInputStream import CompactFileStream
+cls = {"FileStream": FileStream, "CompactFileStream": CompactFileStream}[sys.argv[2]]
+tracemalloc.start()
+t0 = time.perf_counter()
+stream = cls(sys.argv[3], encoding="utf-8")
+elapsed = time.perf_counter() - t0
+current, peak = tracemalloc.get_traced_memory()
+print(peak, current, elapsed, stream.size)
+"""
+
+
+def write_source(path: str, size_mb: float):
+    corpus = "\n".join(p.read_text(encoding="utf-8") for p in sorted(ROOT.glob("exemplo_*.txt")))
+    chunk = (corpus + "\n").encode("utf-8")
+    target = int(size_mb * 1024 * 1024)
+    with open(path, "wb") as f:
+        written = 0
+        while written < target:
+            f.write(chunk)
+            written += len(chunk)
+
+
+def measure_load(name: str, path: str) -> tuple:
+    """(pico, retido, segundos, caracteres) da carga do arquivo em um processo novo"""
+    result = subprocess.run([sys.executable, "-c", _LOAD_SCRIPT, str(ROOT), name, path],
+                            capture_output=True, text=True, check=True)
+    peak, current, elapsed, size = result.stdout.split()
+    return int(peak), int(current), float(elapsed), int(size)
+
+
+def lex_time(cls, path: str) -> float:
+    stream = cls(path, encoding="utf-8")
+    start = time.perf_counter()
+    CommonTokenStream(TypeScriptLexer(stream)).fill()
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size-mb", type=float, default=50)
+    ap.add_argument("--lex-mb", type=float, default=0.25)
+    args = ap.parse_args()
+
+    mib = 1024 * 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        big = os.path.join(tmp, "grande.txt")
+        write_source(big, args.size_mb)
+        print(f"Fonte: {os.path.getsize(big) / mib:.1f} MB")
+        print(f"  {'fluxo':<18} {'pico':>10} {'retido':>10} {'bytes/car.':>11} {'carga':>9}")
+        for name in STREAMS:
+            peak, current, elapsed, size = measure_load(name, big)
+            print(f"  {name:<18} {peak / mib:6.1f} MiB {current / mib:6.1f} MiB "
+                  f"{current / size:11.2f} {elapsed:7.2f} s")
+
+        small = os.path.join(tmp, "lexer.txt")
+        write_source(small, args.lex_mb)
+        mb = os.path.getsize(small) / mib
+        print(f"\nLexer gerado sobre {mb:.2f} MB:")
+        for name, cls in STREAMS.items():
+            elapsed = min(lex_time(cls, small) for _ in range(5))
+            print(f"  {name:<18} {elapsed:7.3f} s  {mb / elapsed:6.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
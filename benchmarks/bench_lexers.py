@@ -0,0 +1,62 @@
+"""
+Benchmark de throughput (MB/s) do lexer gerado pelo ANTLR vs. o lexer por regex.
+
+A entrada é a concatenação dos exemplo_*.txt repetida até o tamanho pedido.
+
+Uso:
+    python benchmarks/bench_lexers.py [--size-kb N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from TypeScriptRegexLexer import create_lexer  # noqa: E402
+
+
+def build_source(size_kb: int) -> str:
+    corpus = "\n".join(p.read_text(encoding="utf-8") for p in sorted(ROOT.glob("exemplo_*.txt")))
+    copies = max(1, size_kb * 1024 // len(corpus.encode("utf-8")))
+    return "\n".join([corpus] * copies)
+
+
+def bench(source: str, kind: str, repeat: int):
+    """Retorna (melhor tempo em s, número de tokens)"""
+    best = float("inf")
+    n_tokens = 0
+    for _ in range(repeat):
+        stream = InputStream(source)
+        start = time.perf_counter()
+        tokens = CommonTokenStream(create_lexer(stream, kind))
+        tokens.fill()
+        best = min(best, time.perf_counter() - start)
+        n_tokens = len(tokens.tokens)
+    return best, n_tokens
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size-kb", type=int, default=1024)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    source = build_source(args.size_kb)
+    mb = len(source.encode("utf-8")) / (1024 * 1024)
+    print(f"Entrada: {mb:.2f} MB")
+    results = {}
+    for kind in ("antlr", "regex"):
+        elapsed, n_tokens = bench(source, kind, args.repeat)
+        results[kind] = elapsed
+        print(f"  {kind:>5}: {elapsed:7.3f} s  {mb / elapsed:7.2f} MB/s  ({n_tokens} tokens)")
+    print(f"  speedup: {results['antlr'] / results['regex']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark do parsing paralelo: sequencial vs. parse_parallel com N processos.
+
+Gera um fonte com --functions funções de nível superior e mede lexer + parser +
+conversão para o AST (o mesmo trabalho de _parse_file) no modo sequencial e com
+parse_parallel para cada número de processos de 1 até --max-jobs (padrão: os
+núcleos disponíveis). Cada medida é o mínimo de --repeat execuções; a tabela
+mostra o speedup sobre o sequencial e confere que o Program é o mesmo.
+
+Uso:
+    python benchmarks/bench_parallel_parse.py [--functions N] [--max-jobs N] [--lexer antlr|regex]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptParallelParse import default_jobs, parse_parallel  # noqa: E402
+from TypeScriptRegexLexer import create_lexer  # noqa: E402
+
+_FUNCTION = """function soma{i}(a: number, b: number): number {{
+    let total: number = 0;
+    for (let k: number = 0; k < b; k = k + 1) {{
+        if (k % 2 == 0) {{ total = total + a * k; }} else {{ total = total - k; }}
+    }}
+    return total;
+}}
+"""
+
+
+def make_source(functions: int) -> str:
+    return "".join(_FUNCTION.format(i=i) for i in range(functions)) + "print(soma0(1, 2));\n"
+
+
+def sequential(code: str, lexer: str):
+    tokens = CommonTokenStream(create_lexer(InputStream(code), lexer))
+    tree, _ = parse_program(tokens)
+    return lower_program(tree)
+
+
+def best_of(repeat: int, fn, *args):
+    best, result = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=10_000)
+    ap.add_argument("--max-jobs", type=int, default=default_jobs())
+    ap.add_argument("--lexer", choices=("antlr", "regex"), default="antlr")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    code = make_source(args.functions)
+    print(f"Fonte: {args.functions} funções, {len(code) / 1024 / 1024:.1f} MB, "
+          f"lexer {args.lexer}, {default_jobs()} núcleo(s) disponível(is)")
+
+    base, expected = best_of(args.repeat, sequential, code, args.lexer)
+    expected = repr(expected)
+    print(f"  {'modo':<14} {'blocos':>7} {'tempo':>9} {'speedup':>8}")
+    print(f"  {'sequencial':<14} {'-':>7} {base:7.2f} s {1:7.2f}x")
+    for jobs in range(1, args.max_jobs + 1):
+        elapsed, (program, _, n_chunks) = best_of(args.repeat, parse_parallel, code, jobs,
+                                                  args.lexer)
+        assert repr(program) == expected, "Program diferente do parsing sequencial"
+        print(f"  {f'{jobs} processo(s)':<14} {n_chunks:>7} {elapsed:7.2f} s {base / elapsed:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark da análise semântica em duas fases: SemanticAnalyzer vs. TwoPhaseAnalyzer
+com N processos.
+
+Gera um fonte com --functions funções de nível superior (cada uma chama a anterior
+e usa uma interface global), faz o parsing uma vez e mede a análise semântica com
+SemanticAnalyzer e com TwoPhaseAnalyzer para cada número de processos de 1 até
+--max-jobs (padrão: os núcleos disponíveis). Cada medida é o mínimo de --repeat
+execuções, e o tempo com processos inclui o envio dos corpos ao pool. A tabela
+mostra o speedup sobre o SemanticAnalyzer e confere que os erros são os mesmos.
+
+Uso:
+    python benchmarks/bench_parallel_semantic.py [--functions N] [--max-jobs N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptParallelParse import default_jobs  # noqa: E402
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer  # noqa: E402
+from TypeScriptRegexLexer import create_lexer  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+_HEADER = "interface Ponto { x: number; y: number; }\nfunction f0(p: Ponto): number { return p.x; }\n"
+
+_FUNCTION = """function f{i}(p: Ponto): number {{
+    let total: number = f{prev}(p) + 1;
+    let valores: number[] = [];
+    for (let k: number = 0; k < p.y; k = k + 1) {{
+        valores.push(p.x * k);
+        if (k % 2 == 0 && total > 0) {{ total = total + valores[k]; }} else {{ total = total - k; }}
+    }}
+    while (total > 100) {{ total = total / 2; }}
+    return total;
+}}
+"""
+
+
+def make_source(functions: int) -> str:
+    return _HEADER + "".join(_FUNCTION.format(i=i, prev=i - 1) for i in range(1, functions))
+
+
+def best_of(repeat: int, make_analyzer, program):
+    best, errors = None, None
+    for _ in range(repeat):
+        analyzer = make_analyzer()
+        t0 = time.perf_counter()
+        errors = analyzer.analyze(program)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, errors
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=10_000)
+    ap.add_argument("--max-jobs", type=int, default=default_jobs())
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    code = make_source(args.functions)
+    tree, _ = parse_program(CommonTokenStream(create_lexer(InputStream(code), "regex")))
+    program = lower_program(tree)
+    del tree
+    gc.collect()
+    print(f"Programa: {args.functions} funções, {default_jobs()} núcleo(s) disponível(is)")
+
+    base, expected = best_of(args.repeat, SemanticAnalyzer, program)
+    assert expected == [], expected[:3]
+    print(f"  {'analisador':<22} {'tempo':>9} {'speedup':>8}")
+    print(f"  {'SemanticAnalyzer':<22} {base:7.2f} s {1:7.2f}x")
+    for jobs in range(1, args.max_jobs + 1):
+        elapsed, errors = best_of(args.repeat, lambda: TwoPhaseAnalyzer(jobs), program)
+        assert errors == expected, "Erros diferentes do SemanticAnalyzer"
+        label = f"duas fases, {jobs} proc."
+        print(f"  {label:<22} {elapsed:7.2f} s {base / elapsed:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
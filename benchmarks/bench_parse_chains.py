@@ -0,0 +1,70 @@
+"""
+Benchmark de throughput do parser em cadeias longas de chamadas e acessos a propriedades.
+
+Gera um programa sintético com muitas expressões do tipo `a.b.c.d = x.y(1).z(2)...`
+e mede apenas o parsing (os tokens são produzidos antes da medição).
+
+Uso:
+    python benchmarks/bench_parse_chains.py [--statements N] [--chain N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+
+
+def build_source(statements: int, chain: int) -> str:
+    """Programa com cadeias de propriedades, chamadas encadeadas e argumentos aninhados"""
+    props = ".".join(f"p{i}" for i in range(chain))
+    calls = "".join(f".m{i}({i}, y.q{i})" for i in range(chain))
+    lines = []
+    for i in range(statements):
+        kind = i % 3
+        if kind == 0:
+            lines.append(f"obj.{props} = x{calls};")
+        elif kind == 1:
+            lines.append(f"if (a.{props} == f(b.{props}, c{calls})) {{ z = w.{props}; }}")
+        else:
+            lines.append(f"print(x{calls}.{props});")
+    return "\n".join(lines) + "\n"
+
+
+def bench(source: str, mode: str, repeat: int):
+    """Retorna (melhor tempo em s, número de tokens) para parsing no modo indicado"""
+    best = float("inf")
+    n_tokens = 0
+    for _ in range(repeat):
+        tokens = CommonTokenStream(TypeScriptLexer(InputStream(source)))
+        tokens.fill()
+        n_tokens = len(tokens.tokens)
+        start = time.perf_counter()
+        parse_program(tokens, mode)
+        best = min(best, time.perf_counter() - start)
+    return best, n_tokens
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--statements", type=int, default=600)
+    ap.add_argument("--chain", type=int, default=20)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    source = build_source(args.statements, args.chain)
+    print(f"Fonte: {len(source) / 1024:.1f} KiB, {args.statements} statements, cadeia {args.chain}")
+    for mode in ("sll", "ll"):
+        elapsed, n_tokens = bench(source, mode, args.repeat)
+        print(f"  {mode:>3}: {elapsed * 1000:8.1f} ms  {n_tokens / elapsed:10.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark de escala da análise semântica e da geração de código.
+
+Para cada forma de entrada, gera programas com N elementos (--sizes, por padrão
+10 a 100k) e mede o tempo de semântica + geração (mínimo de --runs execuções):
+
+- soma: let r: number = a + a + ... + a;          (N operandos)
+- precedencia: a * a + a * a - ...                (N operandos, dois níveis)
+- indices: v[0] + v[0] + ...                      (N acessos por índice)
+- print: print(a, a, ..., a);                     (N argumentos)
+- membros: o.p.p. ... .p.v                        (cadeia pós-fixada de N campos,
+                                                   com N interfaces encadeadas)
+- unario: - - ... - a                             (N operadores)
+- array: [1, 1, ..., 1]                           (N elementos)
+- declaracoes: let vK: number = vK-1 + 1;         (N variáveis globais)
+
+O expoente de crescimento é a inclinação da reta log(tempo) × log(N) nos
+tamanhos a partir de 1000 (nos menores domina o custo fixo). O benchmark termina
+com código 1 se alguma forma passar de --max-exponent, isto é, se crescer de
+forma superlinear.
+
+O parsing não entra na medida. A árvore do ANTLR é descartada antes de medir,
+para que as coletas do gc não percorram objetos que não são dos passos medidos.
+
+Uso:
+    python benchmarks/bench_scaling.py [--sizes N ...] [--shapes NOME ...] [--max-exponent X]
+"""
+
+import argparse
+import gc
+import math
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+
+
+def _operators(n: int, operand: str, ops: str) -> str:
+    return operand + "".join(f" {ops[i % len(ops)]} {operand}" for i in range(n - 1))
+
+
+def _member_chain(n: int) -> str:
+    interfaces = ["interface I0 { v: number; }\n"]
+    interfaces += [f"interface I{i} {{ p: I{i - 1}; }}\n" for i in range(1, n)]
+    return "".join(interfaces) + f"let o: I{n - 1};\nprint(o{'.p' * (n - 1)}.v);\n"
+
+
+def _declarations(n: int) -> str:
+    return "let v0: number = 0;\n" + "".join(
+        f"let v{i}: number = v{i - 1} + 1;\n" for i in range(1, n))
+
+
+SHAPES = {
+    "soma": lambda n: f"let a: number = 1;\nlet r: number = {_operators(n, 'a', '+')};\n",
+    "precedencia": lambda n: f"let a: number = 1;\nlet r: number = {_operators(n, 'a', '*+*-')};\n",
+    "indices": lambda n: f"let v: number[] = [1];\nlet r: number = {_operators(n, 'v[0]', '+')};\n",
+    "print": lambda n: "let a: number = 1;\nprint(" + ", ".join(["a"] * n) + ");\n",
+    "membros": _member_chain,
+    "unario": lambda n: f"let a: number = 1;\nlet r: number = {'- ' * n}a;\n",
+    "array": lambda n: "let r: number[] = [" + ", ".join(["1"] * n) + "];\n",
+    "declaracoes": _declarations,
+}
+
+
+def build(code: str):
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    del tree
+    gc.collect()
+    return program
+
+
+def measure(program, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        analyzer = SemanticAnalyzer()
+        errors = analyzer.analyze(program)
+        JasminGenerator(analyzer, "Escala").visit(program)
+        best = min(best, time.perf_counter() - t0)
+        assert errors == [], errors[:3]
+    return best
+
+
+def growth_exponent(points: list) -> float:
+    """Inclinação (mínimos quadrados) de log(tempo) em função de log(N)"""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+            / sum((x - mx) ** 2 for x in xs))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10_000, 100_000])
+    ap.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--max-exponent", type=float, default=1.25)
+    args = ap.parse_args()
+
+    print(f"  {'forma':<12} " + " ".join(f"{n:>10}" for n in args.sizes) + f" {'expoente':>9}")
+    superlinear = []
+    for name in args.shapes:
+        points = []
+        for n in args.sizes:
+            program = build(SHAPES[name](n))
+            points.append((n, measure(program, args.runs)))
+            del program
+        large = [p for p in points if p[0] >= 1000]
+        exponent = growth_exponent(large) if len(large) >= 2 else float("nan")
+        cells = " ".join(f"{t * 1000:7.2f} ms" for _, t in points)
+        print(f"  {name:<12} {cells} {exponent:9.2f}", flush=True)
+        if exponent > args.max_exponent:
+            superlinear.append(name)
+
+    if superlinear:
+        print(f"\nCrescimento superlinear (expoente > {args.max_exponent}): {', '.join(superlinear)}")
+        sys.exit(1)
+    print(f"\nTodas as formas crescem linearmente (expoente ≤ {args.max_exponent}).")
+
+
+if __name__ == "__main__":
+    main()
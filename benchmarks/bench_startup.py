@@ -0,0 +1,79 @@
+"""
+Benchmark de inicialização: custo mínimo de um `python main.py` em processo novo.
+
+Compila um programa trivial (`print(1);`) várias vezes em subprocessos e compara
+com o piso do interpretador e com a importação antecipada de todos os módulos do
+compilador (o que main.py fazia antes das importações sob demanda):
+- python -c pass                    piso do interpretador
+- importação antecipada             antlr4 + lexer/parser gerados + semântica + gerador
+- main.py --help                    só argparse
+- main.py (cache de programas)      acerto: sem runtime do ANTLR
+- main.py --no-cache                lexer + parser carregados sob demanda
+
+Uso:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MAIN = str(PROJECT_ROOT / "main.py")
+
+EAGER_IMPORTS = ("import antlr4, TypeScriptLexer, TypeScriptParser, TypeScriptExprParser, "
+                 "TypeScriptSemantic, TypeScriptJasminGenerate")
+
+
+def measure(cmd, runs: int) -> tuple:
+    """(mediana, mínimo) do tempo de parede de `cmd`, em segundos"""
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = subprocess.run(cmd, cwd=str(PROJECT_ROOT), capture_output=True, text=True)
+        times.append(time.perf_counter() - t0)
+        assert result.returncode == 0, result.stdout + result.stderr
+    return statistics.median(times), min(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=15)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "trivial.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("print(1);\n")
+
+        # Garante a entrada no cache de programas antes das medições com cache
+        subprocess.run([sys.executable, MAIN, source], cwd=str(PROJECT_ROOT),
+                       capture_output=True)
+
+        cases = [
+            ("python -c pass", [sys.executable, "-c", "pass"]),
+            ("importação antecipada", [sys.executable, "-c", EAGER_IMPORTS]),
+            ("main.py --help", [sys.executable, MAIN, "--help"]),
+            ("main.py (cache de programas)", [sys.executable, MAIN, source]),
+            ("main.py --no-cache", [sys.executable, MAIN, "--no-cache", source]),
+        ]
+        print(f"Programa trivial, {args.runs} execuções por caso")
+        print(f"  {'caso':<30} {'mediana':>10} {'mínimo':>10}")
+        for label, cmd in cases:
+            median, best = measure(cmd, args.runs)
+            print(f"  {label:<30} {median * 1000:7.1f} ms {best * 1000:7.1f} ms")
+
+        result = subprocess.run([sys.executable, MAIN, "--startup-report", source],
+                                cwd=str(PROJECT_ROOT), capture_output=True, text=True)
+        print()
+        print(result.stdout[result.stdout.index("Tempo de inicialização"):].rstrip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark da tabela de símbolos: escopos encadeados vs. implementação anterior.
+
+A implementação anterior (MergedScopes, abaixo) procurava cada nome percorrendo a
+pilha de escopos, e `vars` copiava as globais e todos os escopos a cada acesso.
+SymbolTable mantém o símbolo visível de cada nome em um único dicionário.
+
+1. Programa com --globals variáveis globais e --refs referências: as referências
+   ficam em print(v + v + ...) dentro de --depth blocos aninhados (com uma variável
+   local em cada bloco). O AST é montado direto, sem passar pelo parser. Mede a
+   análise semântica com cada tabela.
+2. get_var de um nome global com a pilha de escopos em profundidades crescentes.
+3. Um acesso a `vars` com --globals variáveis globais.
+
+Uso:
+    python benchmarks/bench_symbol_table.py [--globals N] [--refs N] [--depth N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from TypeScriptAST import (  # noqa: E402
+    BinaryExpr, Block, CallOp, ExprStmt, Identifier, Literal, PostfixExpr, Program, TypeRef,
+    VarDecl,
+)
+import TypeScriptSemantic  # noqa: E402
+from TypeScriptSemantic import PrimitiveType, SemanticAnalyzer, SymbolTable, VarSymbol  # noqa: E402
+
+REFS_PER_PRINT = 10
+
+
+class MergedScopes(SymbolTable):
+    """SymbolTable como era antes dos escopos encadeados"""
+
+    @property
+    def vars(self):
+        result = self.global_vars.copy()
+        for scope in self.scope_stack:
+            result.update(scope)
+        return result
+
+    def push_scope(self):
+        self.scope_stack.append({})
+
+    def pop_scope(self):
+        if self.scope_stack:
+            self.scope_stack.pop()
+
+    def define_var(self, name, symbol, is_block_local=False):
+        if is_block_local and self.scope_stack:
+            self.scope_stack[-1][name] = symbol
+        else:
+            self.global_vars[name] = symbol
+
+    def get_var(self, name):
+        for scope in reversed(self.scope_stack):
+            if name in scope:
+                return scope[name]
+        return self.global_vars.get(name)
+
+
+TABLES = {"encadeada": SymbolTable, "anterior": MergedScopes}
+
+
+def make_program(n_globals: int, n_refs: int, depth: int) -> Program:
+    number = TypeRef("number", False, 1, 0)
+    names = [f"v{i}" for i in range(n_globals)]
+    body = [VarDecl(name, number, Literal("number", "1", 1, 0), False, 1, 0) for name in names]
+    prints = []
+    for start in range(0, n_refs, REFS_PER_PRINT):
+        ids = [Identifier(names[(start + k) % n_globals], 1, 0) for k in range(REFS_PER_PRINT)]
+        total = BinaryExpr(["+"] * (REFS_PER_PRINT - 1), ids, 1, 0)
+        prints.append(ExprStmt(PostfixExpr(Identifier("print", 1, 0), [CallOp([total])], 1, 0), 1, 0))
+    block = Block(prints, 1, 0)
+    for level in range(depth):
+        block = Block([VarDecl(f"local{level}", number, Literal("number", "1", 1, 0), False, 1, 0),
+                       block], 1, 0)
+    return Program(body + [block], 1, 0)
+
+
+def analyze_with(table_class, program) -> float:
+    TypeScriptSemantic.SymbolTable = table_class
+    try:
+        analyzer = SemanticAnalyzer()
+    finally:
+        TypeScriptSemantic.SymbolTable = SymbolTable
+    t0 = time.perf_counter()
+    errors = analyzer.analyze(program)
+    elapsed = time.perf_counter() - t0
+    assert errors == [], errors[:3]
+    return elapsed
+
+
+def lookup_time(table_class, depth: int, lookups: int) -> float:
+    table = table_class()
+    table.define_var("g", VarSymbol("g", PrimitiveType("number")))
+    for level in range(depth):
+        table.push_scope()
+        table.define_var(f"l{level}", VarSymbol("l", PrimitiveType("number")), is_block_local=True)
+    get_var = table.get_var
+    t0 = time.perf_counter()
+    for _ in range(lookups):
+        get_var("g")
+    return time.perf_counter() - t0
+
+
+def vars_time(table_class, n_globals: int) -> float:
+    table = table_class()
+    for i in range(n_globals):
+        table.define_var(f"v{i}", VarSymbol("v", PrimitiveType("number")))
+    t0 = time.perf_counter()
+    table.vars
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--globals", type=int, default=50_000)
+    ap.add_argument("--refs", type=int, default=500_000)
+    ap.add_argument("--depth", type=int, default=20)
+    ap.add_argument("--lookups", type=int, default=500_000)
+    args = ap.parse_args()
+
+    program = make_program(args.globals, args.refs, args.depth)
+    print(f"Análise semântica: {args.globals} globais, {args.refs} referências, "
+          f"{args.depth} blocos aninhados")
+    for name, table_class in TABLES.items():
+        print(f"  {name:<10} {analyze_with(table_class, program) * 1000:9.1f} ms")
+
+    print(f"\nget_var de uma global, {args.lookups} buscas:")
+    print(f"  {'escopos':>8} " + " ".join(f"{name:>12}" for name in TABLES))
+    for depth in (0, 10, 100, 1000):
+        cells = " ".join(f"{lookup_time(cls, depth, args.lookups) * 1000:9.1f} ms"
+                         for cls in TABLES.values())
+        print(f"  {depth:>8} {cells}")
+
+    print(f"\nUm acesso a vars com {args.globals} globais:")
+    for name, table_class in TABLES.items():
+        print(f"  {name:<10} {vars_time(table_class, args.globals) * 1e6:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
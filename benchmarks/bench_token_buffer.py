@@ -0,0 +1,94 @@
+"""
+Benchmark de memória do buffer de tokens: CommonTokenStream vs. CompactTokenStream.
+
+Gera um fonte sintético (exemplo_*.txt concatenados e repetidos até --size-mb) e
+mede, em um subprocesso novo para cada combinação, com tracemalloc:
+- tokens: memória retida pelo fluxo de tokens após fill() (sem parser);
+- parsing: pico durante lexer + parser (árvore do ANTLR + tokens) e tempo.
+
+Uso:
+    python benchmarks/bench_token_buffer.py [--size-mb N] [--lexer antlr|regex]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STREAMS = ("CommonTokenStream", "CompactTokenStream")
+
+# Executado em um processo novo: imprime "retido pico segundos tokens"
+_SCRIPT = """
+import sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+from antlr4 import CommonTokenStream
+from main import parse_program
+from TypeScriptInputStream import CompactFileStream
+from TypeScriptRegexLexer import create_lexer
+from TypeScriptTokenBuffer import CompactTokenStream
+cls = {"CommonTokenStream": CommonTokenStream, "CompactTokenStream": CompactTokenStream}[sys.argv[2]]
+stream = CompactFileStream(sys.argv[3], encoding="utf-8")
+tracemalloc.start()
+t0 = time.perf_counter()
+tokens = cls(create_lexer(stream, sys.argv[4]))
+if sys.argv[5] == "tokens":
+    tokens.fill()
+    result = tokens
+else:
+    result, _ = parse_program(tokens)
+elapsed = time.perf_counter() - t0
+current, peak = tracemalloc.get_traced_memory()
+print(current, peak, elapsed, len(tokens.tokens))
+"""
+
+
+def write_source(path: str, size_mb: float):
+    corpus = "\n".join(p.read_text(encoding="utf-8") for p in sorted(ROOT.glob("exemplo_*.txt")))
+    chunk = (corpus + "\n").encode("utf-8")
+    target = int(size_mb * 1024 * 1024)
+    with open(path, "wb") as f:
+        written = 0
+        while written < target:
+            f.write(chunk)
+            written += len(chunk)
+
+
+def measure(stream: str, path: str, lexer: str, stage: str) -> tuple:
+    result = subprocess.run([sys.executable, "-c", _SCRIPT, str(ROOT), stream, path, lexer, stage],
+                            capture_output=True, text=True, check=True)
+    current, peak, elapsed, n_tokens = result.stdout.split()
+    return int(current), int(peak), float(elapsed), int(n_tokens)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size-mb", type=float, default=2)
+    ap.add_argument("--lexer", choices=("antlr", "regex"), default="antlr")
+    args = ap.parse_args()
+
+    mib = 1024 * 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sintetico.txt")
+        write_source(path, args.size_mb)
+        print(f"Fonte: {os.path.getsize(path) / mib:.1f} MB, lexer {args.lexer}")
+
+        print("Tokens (fill, sem parser):")
+        print(f"  {'fluxo':<20} {'retido':>10} {'bytes/token':>12} {'tokens':>10}")
+        for stream in STREAMS:
+            current, _, _, n_tokens = measure(stream, path, args.lexer, "tokens")
+            print(f"  {stream:<20} {current / mib:6.1f} MiB {current / n_tokens:12.1f} {n_tokens:>10}")
+
+        print("Parsing (lexer + parser):")
+        print(f"  {'fluxo':<20} {'pico':>10} {'retido':>10} {'tempo':>9}")
+        for stream in STREAMS:
+            current, peak, elapsed, _ = measure(stream, path, args.lexer, "parse")
+            print(f"  {stream:<20} {peak / mib:6.1f} MiB {current / mib:6.1f} MiB {elapsed:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark do percurso do AST: pilha explícita (walk) vs. recursão (walk_recursive).
+
+walk_recursive executa os mesmos geradores visitX por recursão (cada nível de
+aninhamento custa alguns frames do Python); existe só para esta comparação.
+
+1. Programas de exemplo concatenados (--repeat vezes): tempo da análise semântica
+   e da geração de código com cada motor, que devem gerar o mesmo Jasmin.
+2. Expressão aninhada 1 + (1 * (1 + ...)) com profundidade crescente: tempo de
+   semântica + geração com cada motor; a recursão para em RecursionError no
+   limite do Python (sys.getrecursionlimit()).
+
+Uso:
+    python benchmarks/bench_tree_walk.py [--repeat N] [--depths N ...]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import GeneratorType
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptAST import (  # noqa: E402
+    BinaryExpr, CallOp, ExprStmt, Identifier, Literal, PostfixExpr, Program,
+)
+from TypeScriptJasminGenerate import JasminGenerator  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer  # noqa: E402
+from TypeScriptWalk import walk  # noqa: E402
+
+
+def walk_recursive(visitor, node):
+    """Mesma semântica de walk(), com uma chamada recursiva por filho"""
+    if node is None:
+        return None
+    value = visitor.dispatch[type(node)](node)
+    if type(value) is not GeneratorType:
+        return value
+    generator, value = value, None
+    try:
+        while True:
+            value = walk_recursive(visitor, generator.send(value))
+    except StopIteration as stop:
+        return stop.value
+
+
+ENGINES = {"pilha explícita": walk, "recursivo": walk_recursive}
+
+
+def use_engine(engine):
+    SemanticAnalyzer.visit = lambda self, node: engine(self, node)
+    JasminGenerator.visit = lambda self, node: engine(self, node)
+
+
+def compile_program(program):
+    """(segundos da semântica, segundos da geração, Jasmin gerado)"""
+    t0 = time.perf_counter()
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(program)
+    t1 = time.perf_counter()
+    generator = JasminGenerator(analyzer, "Bench")
+    generator.visit(program)
+    return t1 - t0, time.perf_counter() - t1, generator.get_result()
+
+
+def deep_program(depth: int) -> Program:
+    node = Literal("number", "1", 1, 0)
+    for level in range(depth):
+        node = BinaryExpr(["*" if level % 2 else "+"], [Literal("number", "1", 1, 0), node], 1, 0)
+    call = PostfixExpr(Identifier("print", 1, 0), [CallOp([node])], 1, 0)
+    return Program([ExprStmt(call, 1, 0)], 1, 0)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--depths", type=int, nargs="+", default=[100, 300, 1000, 10_000, 100_000])
+    args = ap.parse_args()
+
+    corpus = "\n".join(p.read_text(encoding="utf-8") for p in sorted(ROOT.glob("exemplo_*.txt")))
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(corpus * args.repeat))))
+    program = lower_program(tree)
+    print(f"Exemplos × {args.repeat} (mínimo de {args.runs} execuções):")
+    print(f"  {'motor':<16} {'semântica':>10} {'geração':>10}")
+    best = {name: [float("inf"), float("inf")] for name in ENGINES}
+    for _ in range(args.runs):
+        results = set()
+        for name, engine in ENGINES.items():
+            use_engine(engine)
+            sem, gen, jasmin = compile_program(program)
+            best[name] = [min(best[name][0], sem), min(best[name][1], gen)]
+            results.add(jasmin)
+        assert len(results) == 1, "os motores geraram Jasmin diferente"
+    for name, (sem, gen) in best.items():
+        print(f"  {name:<16} {sem * 1000:7.1f} ms {gen * 1000:7.1f} ms")
+
+    print(f"\nExpressão aninhada (limite de recursão: {sys.getrecursionlimit()}):")
+    print(f"  {'profundidade':>12} " + " ".join(f"{name:>16}" for name in ENGINES))
+    for depth in args.depths:
+        program = deep_program(depth)
+        cells = []
+        for engine in ENGINES.values():
+            use_engine(engine)
+            try:
+                sem, gen, _ = compile_program(program)
+                cells.append(f"{(sem + gen) * 1000:13.1f} ms")
+            except RecursionError:
+                cells.append(f"{'RecursionError':>16}")
+        print(f"  {depth:>12} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark das alocações de tipos na análise semântica (tracemalloc).
+
+Gera um programa com --functions funções (parâmetros, variáveis locais, arrays,
+laços, comparações e aritmética) e analisa com tracemalloc ligado. Relata:
+- pico de memória alocada durante analyze();
+- memória que continua alocada pelo analisador ao final, por linha de
+  TypeScriptSemantic.py (os tipos guardados em símbolos, parâmetros e arrays);
+- número de objetos Type vivos ao final;
+- tempo da análise sem tracemalloc.
+
+O script usa só a interface pública do analisador e roda também em versões
+anteriores do compilador, para comparar.
+
+Uso:
+    python benchmarks/bench_types.py [--functions N] [--top N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from antlr4 import CommonTokenStream, InputStream  # noqa: E402
+
+from main import parse_program  # noqa: E402
+from TypeScriptLexer import TypeScriptLexer  # noqa: E402
+from TypeScriptLowering import lower_program  # noqa: E402
+import TypeScriptSemantic  # noqa: E402
+from TypeScriptSemantic import SemanticAnalyzer, Type  # noqa: E402
+
+_FUNCTION = """function f{i}(a: number, b: number, nomes: string[]): number {{
+    let total: number = 0;
+    let valores: number[] = [];
+    let ativo: boolean = a > b;
+    for (let k: number = 0; k < b; k = k + 1) {{
+        valores.push(a * k + 1);
+        if (k % 2 == 0 && ativo) {{ total = total + valores[k]; }} else {{ total = total - k; }}
+    }}
+    while (total > 100 || !ativo) {{ total = total / 2; ativo = true; }}
+    print("f{i}", total, valores.size());
+    return total;
+}}
+"""
+
+
+def make_source(functions: int) -> str:
+    return "".join(_FUNCTION.format(i=i) for i in range(functions))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--functions", type=int, default=2000)
+    ap.add_argument("--top", type=int, default=8)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    code = make_source(args.functions)
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    del tree
+    gc.collect()
+
+    best = float("inf")
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        SemanticAnalyzer().analyze(program)
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    analyzer = SemanticAnalyzer()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    errors = analyzer.analyze(program)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    assert errors == [], errors[:3]
+
+    semantic = tracemalloc.Filter(True, TypeScriptSemantic.__file__)
+    stats = after.filter_traces([semantic]).compare_to(before.filter_traces([semantic]), "lineno")
+    retained = sum(stat.size_diff for stat in stats)
+    types_alive = sum(1 for obj in gc.get_objects() if isinstance(obj, Type))
+
+    print(f"{args.functions} funções ({len(code) / 1024:.0f} KiB de fonte)")
+    print(f"  análise:               {best * 1000:8.1f} ms")
+    print(f"  pico durante analyze:  {peak / 1024:8.1f} KiB")
+    print(f"  retido por TypeScriptSemantic.py: {retained / 1024:.1f} KiB")
+    print(f"  objetos Type vivos:    {types_alive:8d}")
+    print("\nMaiores alocações retidas (TypeScriptSemantic.py):")
+    for stat in stats[:args.top]:
+        frame = stat.traceback[0]
+        line = Path(frame.filename).read_text(encoding="utf-8").splitlines()[frame.lineno - 1]
+        print(f"  {stat.size_diff / 1024:8.1f} KiB {stat.count_diff:7d} blocos  "
+              f"{frame.lineno:4d}: {line.strip()[:70]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,61 @@ Entrada do compilador estilo TypeScript
 Pipeline simples: Análise Lexical → Parsing → Análise Semântica
 """
 
-import re
-import os
-from TypeScriptJasminGenerate import JasminGenerator
-from TypeScriptSemantic import SemanticAnalyzer
-from TypeScriptParser import TypeScriptParser
-from TypeScriptLexer import TypeScriptLexer
-import sys
-from antlr4 import FileStream, CommonTokenStream
+import time
+
+_STARTED = time.perf_counter()
+
+import re  # noqa: E402
+import os  # noqa: E402
+import importlib  # noqa: E402
+import json  # noqa: E402
+from contextlib import redirect_stdout  # noqa: E402
+from TypeScriptDiagnostics import Diagnostic  # noqa: E402
+from TypeScriptProgramCache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ProgramCache, source_key  # noqa: E402
+import sys  # noqa: E402
+import argparse  # noqa: E402
+
+# Os módulos pesados (runtime do ANTLR, lexer/parser gerados, semântica e gerador)
+# são importados sob demanda: `--help`, erros de argumento e acertos do cache de
+# programas não pagam pelo runtime do ANTLR nem pela desserialização dos ATNs.
+
+# Estratégias de predição aceitas por compile_file
+PARSE_MODES = ("auto", "sll", "ll")
+
+# Parsers de expressão: precedence climbing (padrão) ou as regras do ANTLR
+EXPR_PARSERS = {"pratt": ("TypeScriptExprParser", "TypeScriptPrattParser"),
+                "antlr": ("TypeScriptParser", "TypeScriptParser")}
+
+# Buffers de tokens: lista de CommonToken (antlr4) ou arrays paralelos
+# (TypeScriptTokenBuffer); "auto" usa os arrays a partir de COMPACT_TOKENS_MIN_BYTES
+TOKEN_BUFFERS = ("auto", "list", "compact")
+COMPACT_TOKENS_MIN_BYTES = 1024 * 1024
+
+# Formatos do relatório de erros: lista legível ou documento JSON em stdout
+DIAGNOSTIC_FORMATS = ("text", "json")
+
+# Tempo (s) da primeira importação de cada módulo carregado sob demanda
+IMPORT_TIMES = {}
+
+
+def _load(name: str):
+    """Importa um módulo sob demanda, registrando o tempo da primeira importação"""
+    module = sys.modules.get(name)
+    if module is None:
+        t0 = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMES[name] = time.perf_counter() - t0
+    return module
+
+
+def parser_class(expr_parser: str):
+    """Classe do parser para o parser de expressões indicado"""
+    if expr_parser not in EXPR_PARSERS:
+        raise ValueError(f"Parser de expressões desconhecido: '{expr_parser}'")
+    module, name = EXPR_PARSERS[expr_parser]
+    _load("antlr4")
+    _load("TypeScriptParser")  # desserializa o ATN do parser
+    return getattr(_load(module), name)
 
 
 def _derive_class_name(filepath: str) -> str:
@@ -29,38 +76,284 @@ def _derive_class_name(filepath: str) -> str:
     return base[0].upper() + base[1:]
 
 
-def compile_file(filepath: str) -> bool:
+def parse_program(tokens, parse_mode: str = "auto", expr_parser: str = "pratt",
+                  error_listener=None, profile: bool = False):
+    """Executa o parser sobre o fluxo de tokens.
+
+    - "auto": tenta SLL com BailErrorStrategy; se falhar, reinicia com LL completo
+    - "sll": apenas SLL (com recuperação de erros padrão)
+    - "ll": apenas LL completo (comportamento padrão do ANTLR)
+
+    expr_parser: "pratt" (TypeScriptPrattParser) ou "antlr" (regras da gramática)
+    error_listener: substitui o ConsoleErrorListener do parser (ex.: SyntaxErrorCollector)
+    profile: usa o ProfilingATNSimulator (tree.parser._interp guarda as estatísticas)
+
+    Retorna (árvore, caminho), onde caminho é "SLL", "LL" ou "SLL→LL".
+    """
+    if parse_mode not in PARSE_MODES:
+        raise ValueError(f"Modo de parsing inválido: '{parse_mode}'")
+    parser = parser_class(expr_parser)(tokens)
+    if error_listener is not None:
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+    if profile:
+        _load("TypeScriptParserProfiler").enable_profiling(parser)
+
+    from antlr4.atn.PredictionMode import PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+
+    # Recuperação de erros sem alterar os conjuntos de tokens do ATN
+    SyntaxErrorStrategy = _load("TypeScriptSyntaxErrors").SyntaxErrorStrategy
+    parser._errHandler = SyntaxErrorStrategy()
+    if parse_mode == "ll":
+        parser._interp.predictionMode = PredictionMode.LL
+        return parser.program(), "LL"
+
+    parser._interp.predictionMode = PredictionMode.SLL
+    if parse_mode == "sll":
+        return parser.program(), "SLL"
+
+    # Estágio 1: SLL sem relatar erros (qualquer erro aborta o estágio)
+    listeners = list(parser._listeners)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    try:
+        return parser.program(), "SLL"
+    except ParseCancellationException:
+        pass
+
+    # Estágio 2: reinicia com LL completo e relato de erros normal
+    tokens.seek(0)
+    parser.reset()
+    for listener in listeners:
+        parser.addErrorListener(listener)
+    parser._errHandler = SyntaxErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program(), "SLL→LL"
+
+
+def _parse_file(filepath: str, parse_mode: str, dfa_cache: str, lexer_kind: str,
+                expr_parser: str, cache: ProgramCache = None, cache_key: str = None,
+                max_syntax_errors: int = 0, profile_parser: str = None,
+                token_buffer: str = "auto", jobs: int = 1):
+    """Lexer + parser + conversão para o AST; grava no cache se não houve erros.
+
+    Com jobs > 1 os statements de nível superior são analisados em paralelo
+    (TypeScriptParallelParse); se algum bloco tiver erro, o parsing sequencial é
+    refeito para relatar os erros do arquivo inteiro.
+
+    Retorna (programa, coletor de erros); programa é None se houve erros de sintaxe.
+    """
+    antlr4 = _load("antlr4")
+    _load("TypeScriptLexer")  # desserializa o ATN do lexer
+    create_lexer = _load("TypeScriptRegexLexer").create_lexer
+    parser_class(expr_parser)
+    lower_program = _load("TypeScriptLowering").lower_program
+    CompactFileStream = _load("TypeScriptInputStream").CompactFileStream
+    syntax_errors = _load("TypeScriptSyntaxErrors")
+
+    # Snapshot dos DFAs de predição (opcional)
+    if dfa_cache:
+        TypeScriptDFACache = _load("TypeScriptDFACache")
+        dfa_status = TypeScriptDFACache.load_dfa_cache(dfa_cache)
+        dfa_states_before = TypeScriptDFACache.dfa_state_count()
+
+    # Parse source file
+    errors = syntax_errors.SyntaxErrorCollector(max_syntax_errors)
+    input_stream = CompactFileStream(filepath, encoding="utf-8")
+    program = None
+    if jobs > 1 and not profile_parser:
+        parallel = _load("TypeScriptParallelParse")
+        parsed = parallel.parse_parallel(input_stream.strdata, jobs, lexer_kind,
+                                         expr_parser, parse_mode)
+        if parsed is not None:
+            program, parse_path, n_chunks = parsed
+            print(f"✔ Parsing concluído (predição: {parse_path}; "
+                  f"{n_chunks} blocos em {jobs} processos)")
+        else:
+            print("⚠ Erros no parsing paralelo: refazendo o parsing sequencial")
+
+    if program is None:
+        lexer = create_lexer(input_stream, lexer_kind)
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(errors)
+        if token_buffer == "auto":
+            token_buffer = "compact" if input_stream.size >= COMPACT_TOKENS_MIN_BYTES else "list"
+        if token_buffer == "compact":
+            tokens = _load("TypeScriptTokenBuffer").CompactTokenStream(lexer)
+        else:
+            tokens = antlr4.CommonTokenStream(lexer)
+        try:
+            t0 = time.perf_counter()
+            tree, parse_path = parse_program(tokens, parse_mode, expr_parser, errors,
+                                             profile=bool(profile_parser))
+            parse_ms = (time.perf_counter() - t0) * 1000
+            print(f"✔ Parsing concluído (predição: {parse_path})")
+            if profile_parser:
+                _report_parser_profile(tree.parser._interp, profile_parser, filepath=filepath,
+                                       parse_mode=parse_mode, expr_parser=expr_parser,
+                                       prediction=parse_path, parse_ms=parse_ms)
+        except syntax_errors.SyntaxErrorLimit:
+            tree = None
+            print(f"✘ Parsing interrompido no {errors.count}º erro de sintaxe "
+                  f"(limite: {errors.max_errors})")
+
+    if dfa_cache:
+        dfa_states = TypeScriptDFACache.dfa_state_count()
+        if dfa_states != dfa_states_before or dfa_status != "carregado":
+            TypeScriptDFACache.save_dfa_cache(dfa_cache)
+        print(f"✔ Cache de DFA: {dfa_status} "
+              f"({dfa_states_before} estados, {dfa_states} após o parsing)")
+
+    # Com erros de sintaxe a árvore tem lacunas: nada é convertido nem gravado
+    if errors.count:
+        return None, errors
+
+    # Conversão única para o AST compacto usado pelas passadas seguintes
+    if program is None:
+        program = lower_program(tree)
+    if cache is not None:
+        cache.put(cache_key, program)
+    return program, errors
+
+
+def _report_parser_profile(simulator, path, **meta):
+    """Imprime a tabela do perfil do parser e, se path for um caminho, grava o JSON"""
+    profiler = _load("TypeScriptParserProfiler")
+    rows = profiler.decision_report(simulator)
+    print(profiler.format_table(rows))
+    if isinstance(path, str):
+        profiler.write_json(path, rows, **meta)
+        print(f"✔ Perfil do parser gravado: {path}")
+
+
+def compile_file(filepath: str, parse_mode: str = "auto",
+                 dfa_cache: str = None, lexer_kind: str = "antlr",
+                 expr_parser: str = "pratt", program_cache: str = None,
+                 cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_syntax_errors: int = 0, profile_parser: str = None,
+                 token_buffer: str = "auto", jobs: int = 1, max_errors: int = 0,
+                 diagnostics: str = "text", dead_code_elimination: bool = True,
+                 constant_folding: bool = True) -> bool:
     """Compila um arquivo estilo TypeScript.
     Retorna True se bem-sucedido, False se erros encontrados.
+
+    dfa_cache: caminho do snapshot de DFAs do lexer/parser (None desativa)
+    lexer_kind: "antlr" (TypeScriptLexer gerado) ou "regex" (TypeScriptRegexLexer)
+    expr_parser: "pratt" (precedence climbing) ou "antlr" (regras da gramática)
+    program_cache: diretório do cache de programas analisados (None desativa)
+    cache_max_bytes: limite de tamanho do cache de programas (remoção LRU)
+    max_syntax_errors: interrompe o parsing no N-ésimo erro de sintaxe (0: sem limite,
+        1: fail-fast). Com erros de sintaxe, semântica e geração de código não rodam.
+    profile_parser: perfila as decisões do parser e grava o JSON nesse caminho (True só
+        imprime a tabela; None desativa). O cache de programas não é consultado.
+    token_buffer: "list" (CommonToken por token), "compact" (arrays paralelos,
+        TypeScriptTokenBuffer) ou "auto" (compact para fontes a partir de 1 MiB)
+    jobs: processos para o parsing paralelo por statements de nível superior e para a
+        verificação dos corpos de função (1: sequencial; 0: um por núcleo). O parsing
+        paralelo é ignorado com profile_parser.
+    max_errors: interrompe a análise semântica no N-ésimo erro (0: sem limite)
+    diagnostics: "text" (erros listados junto com o progresso) ou "json" (stdout recebe
+        só um documento JSON com os diagnósticos; o progresso vai para stderr)
+    dead_code_elimination: gera só as funções, globais e interfaces alcançáveis a
+        partir do código de nível superior, sem desvios de condição constante
+        (TypeScriptDeadCode), e imprime o que foi removido
+    constant_folding: substitui expressões com operandos literais pelo seu valor, com
+        a aritmética de int da JVM (TypeScriptConstantFolding), antes da eliminação
+        de código morto
     """
+    if diagnostics not in DIAGNOSTIC_FORMATS:
+        raise ValueError(f"Formato de diagnósticos inválido: '{diagnostics}'")
+    args = (filepath, parse_mode, dfa_cache, lexer_kind, expr_parser, program_cache,
+            cache_max_bytes, max_syntax_errors, profile_parser, token_buffer, jobs, max_errors,
+            dead_code_elimination, constant_folding)
+    if diagnostics == "text":
+        return _compile_file(*args)[0]
+
+    with redirect_stdout(sys.stderr):
+        success, errors = _compile_file(*args)
+    print(json.dumps({"file": filepath, "success": success,
+                      "diagnostics": [error.to_dict() for error in errors]},
+                     ensure_ascii=False))
+    return success
+
+
+def _compile_file(filepath, parse_mode, dfa_cache, lexer_kind, expr_parser, program_cache,
+                  cache_max_bytes, max_syntax_errors, profile_parser, token_buffer, jobs,
+                  max_errors, dead_code_elimination, constant_folding) -> tuple:
+    """Corpo de compile_file: retorna (sucesso, [Diagnostic])"""
     print(f"Compiling: {filepath}")
 
     try:
-        # Parse source file
-        input_stream = FileStream(filepath, encoding="utf-8")
-        lexer = TypeScriptLexer(input_stream)
-        tokens = CommonTokenStream(lexer)
-        parser = TypeScriptParser(tokens)
-        tree = parser.program()
+        # Cache de programas: um acerto dispensa lexer e parser
+        program = cache = cache_key = None
+        if program_cache and not profile_parser:
+            cache = ProgramCache(program_cache, cache_max_bytes)
+            with open(filepath, "rb") as f:
+                cache_key = source_key(f.read())
+            program = cache.get(cache_key)
+            outcome = "acerto" if program is not None else "falha"
+            print(f"✔ Cache de programas: {outcome} "
+                  f"(acertos: {cache.hits}, falhas: {cache.misses})")
+
+        if program is None:
+            if jobs == 0:
+                jobs = _load("TypeScriptParallelParse").default_jobs()
+            program, syntax_errors = _parse_file(filepath, parse_mode, dfa_cache, lexer_kind,
+                                                 expr_parser, cache, cache_key,
+                                                 max_syntax_errors, profile_parser,
+                                                 token_buffer, jobs)
+            if program is None:
+                errors = syntax_errors.diagnostics()
+                print("\n❌ ERROS ENCONTRADOS:\n")
+                for error in errors:
+                    print(f"  - {error}")
+                print("\n⚠ Execução abortada devido a erros de sintaxe.\n")
+                return False, errors
 
-        # Semantic analysis
-        analyzer = SemanticAnalyzer()
-        errors = analyzer.analyze(tree)
+        # Semantic analysis (declarações primeiro, corpos de função em até `jobs` processos)
+        _load("TypeScriptSemantic")
+        analyzer = _load("TypeScriptParallelSemantic").TwoPhaseAnalyzer(jobs, max_errors)
+        errors = analyzer.analyze(program)
 
         # Report results
         if errors:
             print("\n❌ ERROS ENCONTRADOS:\n")
             for error in errors:
                 print(f"  - {error}")
+            if len(errors) == max_errors:
+                print(f"\n✘ Análise semântica interrompida no limite de {max_errors} erro(s)")
             print("\n⚠ Execução abortada devido a erros semânticos.\n")
-            return False
+            return False, errors
 
         print("✔ Semântica concluída sem erros.")
 
+        # Expressões constantes viram literais (e condições constantes, desvios mortos)
+        if constant_folding:
+            folding = _load("TypeScriptConstantFolding").fold_constants(program, analyzer)
+            program = folding.program
+            if folding.folded:
+                print(f"✔ Expressões constantes avaliadas: {folding.folded}")
+            for line, column in folding.division_by_zero:
+                print(f"⚠ Linha {line}:{column} - divisão por zero mantida para a execução")
+
+        # Só o código alcançável a partir do nível superior chega ao gerador
+        reachable = None
+        if dead_code_elimination:
+            reachable = _load("TypeScriptDeadCode").eliminate_dead_code(program, analyzer)
+            program = reachable.program
+            if reachable.removed_anything():
+                first, *details = reachable.report()
+                print(f"✔ {first}")
+                for line in details:
+                    print(line)
+
         # Jasmin (código intermediário)
         class_name = _derive_class_name(filepath)
-        generator = JasminGenerator(analyzer, class_name=class_name)
-        generator.visit(tree)
+        generator = _load("TypeScriptJasminGenerate").JasminGenerator(
+            analyzer, class_name=class_name, reachable=reachable)
+        generator.visit(program)
         
         # Salva classes de interface
         for iface_code in generator.interface_classes:
@@ -88,22 +381,119 @@ def compile_file(filepath: str) -> bool:
         print("Para montar e executar:")
         print(f"  java -jar jasmin.jar {class_name}.j")
         print(f"  java {class_name}\n")
-        return True
+        return True, []
 
     except Exception as e:
         print(f"\n❌ COMPILATION ERROR: {e}\n")
-        return False
+        return False, [Diagnostic("internal", None, None, (str(e),))]
+
+
+def print_startup_report(elapsed: float):
+    """Tabela com o tempo de importação de cada módulo carregado sob demanda"""
+    print("Tempo de inicialização (importações sob demanda, em ordem de carga):")
+    total = 0.0
+    for name, seconds in IMPORT_TIMES.items():
+        total += seconds
+        print(f"  {name:<28} {seconds * 1000:8.1f} ms")
+    print(f"  {'total das importações':<28} {total * 1000:8.1f} ms")
+    print(f"  {'main.py (carga + execução)':<28} {elapsed * 1000:8.1f} ms")
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("USAGE:")
-        print("  python main.py <file.ts>")
-        print("\nExample:")
-        print("  python main.py program.ts")
-        sys.exit(1)
-
-    success = compile_file(sys.argv[1])
+    arg_parser = argparse.ArgumentParser(
+        description="Compilador estilo TypeScript → Jasmin",
+        epilog="Example:\n  python main.py program.ts",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("file", help="arquivo fonte (.ts / .txt)")
+    arg_parser.add_argument(
+        "--parse-mode", choices=PARSE_MODES, default="auto",
+        help="estratégia de predição do parser: auto (SLL e, se falhar, LL), "
+             "sll ou ll (padrão: auto)")
+    arg_parser.add_argument(
+        "--dfa-cache", nargs="?", metavar="PATH", const=True, default=None,
+        help="carrega/grava snapshot dos DFAs do lexer e do parser "
+             "(padrão: .ts_cache/dfa.bin)")
+    arg_parser.add_argument(
+        "--lexer", choices=("antlr", "regex"), default="antlr",
+        help="lexer: antlr (gerado) ou regex (regex mestre, mais rápido)")
+    arg_parser.add_argument(
+        "--expr-parser", choices=tuple(EXPR_PARSERS), default="pratt",
+        help="parser de expressões: pratt (precedence climbing, padrão) ou "
+             "antlr (regras da gramática)")
+    arg_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="não usa o cache de programas analisados (.ts_cache/programs)")
+    arg_parser.add_argument(
+        "--cache-size", type=int, metavar="MiB", default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="limite do cache de programas em MiB; as entradas menos usadas "
+             "são removidas (padrão: %(default)s)")
+    arg_parser.add_argument(
+        "--max-syntax-errors", type=int, metavar="N", default=0,
+        help="interrompe o parsing no N-ésimo erro de sintaxe (padrão: 0, sem limite)")
+    arg_parser.add_argument(
+        "--fail-fast", action="store_true",
+        help="interrompe no primeiro erro de sintaxe (o mesmo que --max-syntax-errors=1)")
+    arg_parser.add_argument(
+        "--max-errors", type=int, metavar="N", default=0,
+        help="interrompe a análise semântica no N-ésimo erro (padrão: 0, sem limite)")
+    arg_parser.add_argument(
+        "--diagnostics", choices=DIAGNOSTIC_FORMATS, default="text",
+        help="formato dos erros: text (lista legível, padrão) ou json (stdout recebe "
+             "só um documento JSON com código, severidade, linha, coluna, argumentos "
+             "e mensagem de cada erro; o progresso vai para stderr)")
+    arg_parser.add_argument(
+        "--keep-dead-code", action="store_true",
+        help="gera todas as funções, globais e interfaces, mesmo as não alcançáveis "
+             "a partir do código de nível superior")
+    arg_parser.add_argument(
+        "--no-constant-folding", action="store_true",
+        help="não avalia em tempo de compilação as expressões com operandos literais")
+    arg_parser.add_argument(
+        "--token-buffer", choices=TOKEN_BUFFERS, default="auto",
+        help="armazenamento dos tokens: list (um CommonToken por token), compact "
+             "(arrays paralelos, menos memória) ou auto (compact a partir de 1 MiB)")
+    arg_parser.add_argument(
+        "--jobs", "-j", type=int, metavar="N", default=1,
+        help="analisa os statements de nível superior e verifica os corpos de função "
+             "em N processos (padrão: 1, sequencial; 0: um por núcleo)")
+    arg_parser.add_argument(
+        "--profile-parser", action="store_true",
+        help="perfila as decisões do parser (invocações, fallbacks SLL→LL, lookahead, "
+             "tempo por regra); imprime a tabela e grava JSON (ver --profile-output). "
+             "Desativa o cache de programas. Com --expr-parser=pratt (padrão) as "
+             "expressões não passam pelo ANTLR e a tabela mostra só as decisões de "
+             "statement/ifStmt; use --expr-parser=antlr para perfilar as expressões")
+    arg_parser.add_argument(
+        "--profile-output", metavar="PATH", default=None,
+        help="caminho do JSON de --profile-parser (padrão: .ts_cache/parser_profile.json); "
+             "implica --profile-parser")
+    arg_parser.add_argument(
+        "--startup-report", action="store_true",
+        help="ao final, mostra o tempo de importação de cada módulo")
+    args = arg_parser.parse_args()
+
+    dfa_cache = args.dfa_cache
+    if dfa_cache is True:
+        dfa_cache = _load("TypeScriptDFACache").DEFAULT_CACHE_PATH
+    profile_parser = args.profile_output
+    if args.profile_parser and profile_parser is None:
+        profile_parser = _load("TypeScriptParserProfiler").DEFAULT_PROFILE_PATH
+
+    success = compile_file(args.file, parse_mode=args.parse_mode,
+                           dfa_cache=dfa_cache, lexer_kind=args.lexer,
+                           expr_parser=args.expr_parser,
+                           program_cache=None if args.no_cache else DEFAULT_CACHE_DIR,
+                           cache_max_bytes=args.cache_size * 1024 * 1024,
+                           max_syntax_errors=1 if args.fail_fast else args.max_syntax_errors,
+                           profile_parser=profile_parser, token_buffer=args.token_buffer,
+                           jobs=args.jobs, max_errors=args.max_errors,
+                           diagnostics=args.diagnostics,
+                           dead_code_elimination=not args.keep_dead_code,
+                           constant_folding=not args.no_constant_folding)
+    if args.startup_report:
+        # Com --diagnostics=json, stdout fica só com o documento JSON
+        with redirect_stdout(sys.stderr if args.diagnostics == "json" else sys.stdout):
+            print_startup_report(time.perf_counter() - _STARTED)
     sys.exit(0 if success else 1)
 
 
@@ -2,10 +2,20 @@
 Utilitários de teste do compilador - funções auxiliares para executar o compilador TypeScript.
 """
 
+import json
 import subprocess
 import sys
 from pathlib import Path
 
+from antlr4 import CommonTokenStream, InputStream
+
+from main import parse_program
+from TypeScriptDiagnostics import Diagnostic
+from TypeScriptJasminGenerate import JasminGenerator
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptLowering import lower_program
+from TypeScriptSemantic import SemanticAnalyzer
+
 
 def compile_code(code: str) -> tuple:
     """
@@ -17,28 +27,26 @@ def compile_code(code: str) -> tuple:
     Returns:
         tupla (success: bool, errors: list)
         - success: True se a compilação foi bem-sucedida (sem erros)
-        - errors: lista de mensagens de erro, se houver
+        - errors: lista de Diagnostic (str(erro) dá "Linha L:C - mensagem"), se houver
     """
     # Write code to temporary file
     test_file = Path("/tmp/test_code.ts")
     test_file.write_text(code)
     
     try:
-        # Execute compiler
+        # Execute compiler (diagnósticos em JSON no stdout)
         project_root = Path(__file__).parent.parent
         result = subprocess.run(
-            [sys.executable, str(project_root / "main.py"), str(test_file)],
+            [sys.executable, str(project_root / "main.py"), "--diagnostics=json", str(test_file)],
             capture_output=True,
             text=True,
             cwd=str(project_root)
         )
         
-        # Parse errors from output
-        errors = _extract_errors(result.stdout, result.stderr)
-        
-        # Success = exit code 0 and no "ERRORS FOUND" marker
-        success = result.returncode == 0 and "❌ ERRORS FOUND:" not in result.stdout
-        
+        report = _extract_errors(result.stdout, result.stderr)
+        success = result.returncode == 0 and report["success"]
+        errors = [Diagnostic(d["code"], d["line"], d["column"], tuple(d["args"]), d["severity"])
+                  for d in report["diagnostics"]]
         return (success, errors)
         
     finally:
@@ -46,31 +54,68 @@ def compile_code(code: str) -> tuple:
         test_file.unlink(missing_ok=True)
 
 
-def _extract_errors(stdout: str, stderr: str) -> list:
-    """Extrai mensagens de erro da saída do compilador"""
-    errors = []
-    
-    # Verifica a seção de erros no stdout (Português: ERROS ENCONTRADOS)
-    if "❌ ERROS ENCONTRADOS:" in stdout:
-        lines = stdout.split('\n')
-        in_errors = False
-        
-        for line in lines:
-            # Início da seção de erros
-            if "❌ ERROS ENCONTRADOS:" in line:
-                in_errors = True
-                continue
-            
-            # Linha de erro (começa com hífen)
-            if in_errors and line.strip().startswith("-"):
-                errors.append(line.strip()[1:].strip())
-            
-            # Fim da seção de erros
-            if in_errors and ("⚠" in line or "✔" in line):
-                break
-    
-    # Adiciona stderr se presente
-    if stderr.strip():
-        errors.extend([e.strip() for e in stderr.strip().split('\n')])
-    
-    return errors
+def parse_code(code: str):
+    """
+    Analisa e reduz um trecho de código TypeScript, sem passar pelo main.py.
+
+    Args:
+        code: código fonte TypeScript em string
+
+    Returns:
+        Program (AST reduzido)
+    """
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    return lower_program(tree)
+
+
+def analyze_code(code: str) -> tuple:
+    """
+    Analisa um trecho que deve ser semanticamente válido.
+
+    Returns:
+        tupla (program, analyzer) - o Program e o SemanticAnalyzer já executado
+    """
+    program = parse_code(code)
+    analyzer = SemanticAnalyzer()
+    assert analyzer.analyze(program) == []
+    return program, analyzer
+
+
+def global_tables(analyzer) -> tuple:
+    """
+    Tabelas globais de um analisador em forma comparável.
+
+    Returns:
+        tupla (variáveis, funções, interfaces, grafo de chamadas), com os tipos por nome
+    """
+    sym = analyzer.sym
+    return ({n: (s.type.name() if s.type else None, s.is_const) for n, s in sym.global_vars.items()},
+            {n: ([t.name() for t in f.param_types], f.return_type.name())
+             for n, f in sym.funcs.items()},
+            {n: {k: t.name() for k, t in i.props.items()} for n, i in sym.interfaces.items()},
+            analyzer.call_graph)
+
+
+def jasmin_generator(analyzer, program, reachable=None) -> JasminGenerator:
+    """
+    Gera o Jasmin de um Program já analisado.
+
+    Returns:
+        o JasminGenerator depois de visitar o programa (get_result(), interface_classes)
+    """
+    generator = JasminGenerator(analyzer, "Teste", reachable=reachable)
+    generator.visit(program)
+    return generator
+
+
+def generate_jasmin(analyzer, program) -> str:
+    """Código Jasmin da classe principal de um Program já analisado"""
+    return jasmin_generator(analyzer, program).get_result()
+
+
+def _extract_errors(stdout: str, stderr: str) -> dict:
+    """Documento JSON de --diagnostics=json; sem ele, o compilador falhou antes de relatar"""
+    try:
+        return json.loads(stdout)
+    except json.JSONDecodeError:
+        raise AssertionError(f"Saída do compilador sem diagnósticos em JSON:\n{stdout}{stderr}")
@@ -0,0 +1,149 @@
+"""
+Testes da conversão da árvore do ANTLR para o AST compacto (TypeScriptLowering).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+from main import parse_program
+from TypeScriptAST import (
+    Block, ExprStmt, ForStmt, FunctionDecl, IfStmt, InterfaceDecl, Node, Program,
+    ReturnStmt, VarDecl, WhileStmt, preorder,
+)
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptLowering import lower_program
+from TypeScriptSemantic import SemanticAnalyzer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+
+def _lower(code, expr_parser="pratt"):
+    tokens = CommonTokenStream(TypeScriptLexer(InputStream(code)))
+    tree, _ = parse_program(tokens, "auto", expr_parser)
+    return lower_program(tree)
+
+
+def _walk(node):
+    """Todos os nós alcançáveis (inclusive dentro de listas e tuplas)"""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, Node):
+            yield item
+            stack.extend(getattr(item, f) for f in item._fields)
+
+
+class TestLowering:
+    """Forma dos statements convertidos"""
+
+    def test_declarations_are_collapsed(self):
+        """statement → variableDecl → letDecl vira um único VarDecl"""
+        program = _lower("let x: number = 1;\nconst s: string[] = [];\nlet p: P;")
+        assert isinstance(program, Program)
+        x, s, p = program.body
+        assert all(isinstance(d, VarDecl) for d in (x, s, p))
+        assert (x.name, x.type.name, x.type.is_array, x.is_const) == ("x", "number", False, False)
+        assert (s.type.name, s.type.is_array, s.is_const) == ("string", True, True)
+        assert p.init is None and p.type.name == "P"
+        assert (s.line, s.column, s.type.line, s.type.column) == (2, 0, 2, 9)
+
+    def test_function_and_interface(self):
+        program = _lower("interface P { a: number; b: P[]; }\n"
+                         "function f(x: number, y: P): void { return; }")
+        iface, func = program.body
+        assert isinstance(iface, InterfaceDecl)
+        assert [(n, t.name, t.is_array) for n, t in iface.props] == [("a", "number", False),
+                                                                     ("b", "P", True)]
+        assert isinstance(func, FunctionDecl) and func.return_type.name == "void"
+        assert [(p.name, p.type.name) for p in func.params] == [("x", "number"), ("y", "P")]
+        assert isinstance(func.body, Block) and isinstance(func.body.body[0], ReturnStmt)
+        assert func.body.body[0].value is None
+
+    def test_control_flow(self):
+        program = _lower("if (a) b; else { c; }\nwhile (a) {}")
+        if_stmt, while_stmt = program.body
+        assert isinstance(if_stmt, IfStmt) and isinstance(if_stmt.then, ExprStmt)
+        assert isinstance(if_stmt.else_, Block)
+        assert _lower("if (a) b;").body[0].else_ is None
+        assert isinstance(while_stmt, WhileStmt) and while_stmt.body.body == []
+
+    @pytest.mark.parametrize("code, parts", [
+        ("for (let i: number = 0; i < 3; i = i + 1) {}", (VarDecl, True, True)),
+        ("for (i = 0; ; i = i + 1) {}", (ExprStmt, False, True)),
+        ("for (; i < 3;) {}", (type(None), True, False)),
+        ("for (;;) {}", (type(None), False, False)),
+    ])
+    def test_for_parts_by_position(self, code, parts):
+        """Condição e incremento são identificados pela posição, não pela contagem"""
+        node = _lower(code).body[0]
+        assert isinstance(node, ForStmt)
+        assert (type(node.init), node.cond is not None, node.update is not None) == parts
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_same_ast_with_both_expression_parsers(self, example):
+        code = example.read_text(encoding="utf-8")
+        assert repr(_lower(code, "pratt")) == repr(_lower(code, "antlr"))
+
+
+class TestCompactNodes:
+    """Nós com __slots__ e strings internadas"""
+
+    @pytest.mark.parametrize("expr_parser", ["pratt", "antlr"])
+    def test_nodes_have_no_dict(self, expr_parser):
+        code = (PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8")
+        nodes = list(_walk(_lower(code, expr_parser)))
+        assert len(nodes) > 100
+        assert not [n for n in nodes if hasattr(n, "__dict__")]
+
+    @pytest.mark.parametrize("expr_parser", ["pratt", "antlr"])
+    def test_names_and_operators_are_interned(self, expr_parser):
+        program = _lower("let total: number = 1;\ntotal = total + total;", expr_parser)
+        decl, stmt = program.body
+        assign = stmt.expr
+        names = [decl.name, assign.target.name] + [o.name for o in assign.value.operands]
+        assert all(name is names[0] for name in names)
+        assert decl.type.name is sys.intern("number")
+        assert assign.value.ops[0] is sys.intern("+")
+
+
+class TestPreorder:
+    """preorder: todos os nós, pais antes dos filhos, na ordem dos campos"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_same_nodes_as_full_walk(self, example):
+        program = _lower(example.read_text(encoding="utf-8"))
+        nodes = preorder(program)
+        assert nodes[0] is program
+        assert len(nodes) == len(set(map(id, nodes)))
+        assert set(map(id, nodes)) == set(map(id, _walk(program)))
+
+    def test_order(self):
+        program = _lower("let x: number = a + b * c;")
+        names = [n.name for n in preorder(program) if type(n).__name__ == "Identifier"]
+        assert names == ["a", "b", "c"]
+
+    def test_equal_trees_give_equal_positions(self):
+        code = (PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8")
+        first, second = preorder(_lower(code)), preorder(_lower(code, "antlr"))
+        assert [repr(n) for n in first] == [repr(n) for n in second]
+
+
+class TestTypeResolution:
+    """Resolução de TypeRef na análise semântica"""
+
+    def test_undeclared_interface_reported_at_type(self):
+        errors = SemanticAnalyzer().analyze(_lower("let x: number;\nlet p: Pessoa[];"))
+        assert list(map(str, errors)) == ["Linha 2:7 - Interface 'Pessoa' não declarada"]
+
+    def test_array_of_interface(self):
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(_lower("interface P { a: number; }\nlet ps: P[] = [];"))
+        ps = analyzer.sym.get_var("ps").type
+        assert ps.name() == "P[]" and ps.elem is analyzer.sym.interfaces["P"]
@@ -479,6 +479,59 @@ let c: boolean = a || b;
         assert success, f"Esperado sucesso, mas obteve erros: {errors}"
 
 
+class TestAssignmentTargets:
+    """Testes para o alvo de atribuições (checado na semântica)"""
+
+    def test_chained_assignment(self):
+        """Atribuição encadeada a = b = c deve compilar"""
+        code = """
+let a: number = 1;
+let b: number = 2;
+a = b = 3;
+"""
+        success, errors = compile_code(code)
+        assert success, f"Esperado sucesso, mas obteve erros: {errors}"
+
+    def test_assign_to_array_element_and_field(self):
+        """Elemento de array e campo de interface são atribuíveis"""
+        code = """
+interface P { id: number; }
+let p: P = { id: 1 };
+let nums: number[] = [1, 2];
+nums[0] = 5;
+p.id = 2;
+"""
+        success, errors = compile_code(code)
+        assert success, f"Esperado sucesso, mas obteve erros: {errors}"
+
+    def test_assign_to_binary_expression_error(self):
+        """Expressão binária não é atribuível"""
+        code = """
+let a: number = 1;
+let b: number = 2;
+a + b = 3;
+"""
+        success, errors = compile_code(code)
+        assert not success, "Esperado erro para alvo de atribuição inválido"
+        assert any("atribuição" in str(e).lower() for e in errors), \
+            f"Erro deve mencionar atribuição, obteve: {errors}"
+
+    def test_assign_to_call_error(self):
+        """Resultado de chamada de função não é atribuível"""
+        code = """
+function f(): number { return 1; }
+f() = 3;
+"""
+        success, errors = compile_code(code)
+        assert not success, "Esperado erro para atribuição a chamada de função"
+
+    def test_assign_to_literal_error(self):
+        """Literal não é atribuível"""
+        code = "5 = 3;"
+        success, errors = compile_code(code)
+        assert not success, "Esperado erro para atribuição a literal"
+
+
 class TestUnaryOperators:
     """Testes para operadores unários (negação, NOT)"""
     
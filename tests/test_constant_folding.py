@@ -0,0 +1,245 @@
+"""
+Testes da avaliação de expressões constantes (TypeScriptConstantFolding):
+aritmética de int da JVM, operadores avaliados e mantidos, tabela de tipos e
+o mesmo resultado na JVM com e sem a avaliação.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from main import compile_file
+from TypeScriptAST import ExprStmt, Literal, Program, UnaryExpr
+from TypeScriptConstantFolding import (
+    INT_MAX, INT_MIN, count_instructions, fold_constants, idiv, irem, wrap,
+)
+from TypeScriptDeadCode import eliminate_dead_code
+from TypeScriptSemantic import BOOLEAN, NUMBER, SemanticAnalyzer
+from .compiler_utils import analyze_code, generate_jasmin
+from .test_tree_walk import DEPTH, _print
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+HAS_JVM = shutil.which("java") is not None and (PROJECT_ROOT / "jasmin.jar").exists()
+
+# Expressões impressas uma por linha; a JVM calcula o mesmo valor sem a avaliação
+EXPRESSIONS = [
+    "60 * 60 * 24", "-(-5)", "--5", "-5", "2147483647 + 1", "0 - 2147483647 - 2",
+    "65536 * 65536", "65536 * 32768", "46341 * 46341", "-2147483648 / -1",
+    "-2147483648 % -1", "3000000000 + 0", "4294967301 * 1", "7 / 2", "-7 / 2", "7 / -2",
+    "-7 / -2", "7 % 3", "-7 % 3", "7 % -3", "-7 % -3", "10 - 4 - 3", "100 / 10 / 3", "2 + 3 * 4", "7.9 * 2",
+    "1 < 2", "2 <= 1", "3 > 3", "3 >= 3", "1 == 1", "1 != 1", "true == false",
+    "false != true", "!true", "!!false", "!(1 < 2)", "true && false", "true || false",
+    "false || false || true", "true && true && true", "1 == 2 == false", "1 < 2 == true",
+    "1 != 1 != true", "2 == 2 != false", "true && false || true", "false || 1 > 2",
+]
+
+
+def _expr(code):
+    """Expressão de `print(<code>);` depois da avaliação, e o analisador"""
+    program, analyzer = analyze_code(f"let x: number = 3;\nprint({code});\n")
+    folded = fold_constants(program, analyzer).program
+    return folded.body[1].expr.ops[0].args[0], analyzer
+
+
+class TestIntArithmetic:
+    """wrap, idiv e irem seguem as instruções da JVM"""
+
+    def test_wrap(self):
+        assert wrap(INT_MAX + 1) == INT_MIN
+        assert wrap(INT_MIN - 1) == INT_MAX
+        assert wrap(2 ** 32 + 5) == 5
+        assert wrap(-5) == -5
+
+    def test_idiv_truncates_toward_zero(self):
+        assert [idiv(7, 2), idiv(-7, 2), idiv(7, -2), idiv(-7, -2)] == [3, -3, -3, 3]
+        assert idiv(INT_MIN, -1) == INT_MIN
+
+    def test_irem_has_sign_of_dividend(self):
+        assert [irem(7, 3), irem(-7, 3), irem(7, -3), irem(-7, -3)] == [1, -1, 1, -1]
+        assert irem(INT_MIN, -1) == 0
+
+
+class TestFolding:
+    """O que vira literal e o que fica para a execução"""
+
+    @pytest.mark.parametrize("code, kind, text", [
+        ("60 * 60 * 24", "number", "86400"),
+        ("-(-5)", "number", "5"),
+        ("!true", "boolean", "false"),
+        ("2147483647 + 1", "number", "-2147483648"),
+        ("-7 / 2", "number", "-3"),
+        ("-7 % 2", "number", "-1"),
+        ("7.9 * 2", "number", "14"),
+        ("2147483648", "number", "2147483648"),
+        ("2147483648 + 0", "number", "-2147483648"),
+        ("1 + 2 < 4", "boolean", "true"),
+        ("1 == 2 == false", "boolean", "true"),
+        ("true && !false || false", "boolean", "true"),
+        ("!0", "boolean", "true"),
+    ])
+    def test_literal(self, code, kind, text):
+        expr, analyzer = _expr(code)
+        assert (type(expr), expr.kind, expr.text) == (Literal, kind, text)
+        assert analyzer.types[expr] is (NUMBER if kind == "number" else BOOLEAN)
+
+    def test_arithmetic_prefix(self):
+        expr, analyzer = _expr("60 * 60 * x")
+        assert expr.ops == ["*"] and expr.operands[0].text == "3600"
+        assert analyzer.types[expr] is NUMBER and analyzer.types[expr.operands[0]] is NUMBER
+        # (x * 60) * 60 não é reassociado
+        expr, _ = _expr("x * 60 * 60")
+        assert expr.ops == ["*", "*"]
+
+    @pytest.mark.parametrize("code", ["1 / 0", "5 % 0", "x / 0", "1 < x", "x == 1",
+                                      "true && x > 1", "99999999999999999999 - 1", "-true"])
+    def test_kept(self, code):
+        program, analyzer = analyze_code(f"let x: number = 3;\nprint({code});\n")
+        assert fold_constants(program, analyzer).program is program
+
+    def test_division_by_zero_stays_for_runtime(self):
+        program, analyzer = analyze_code("print(2 * 3 / 0 + 1);\n")
+        folding = fold_constants(program, analyzer)
+        expr = folding.program.body[0].expr.ops[0].args[0]
+        assert expr.operands[0].ops == ["/"] and expr.operands[0].operands[0].text == "6"
+        assert folding.division_by_zero == [(1, 6)]
+
+    def test_nested_statements_and_types(self):
+        program, analyzer = analyze_code(
+            "interface P { v: number; }\n"
+            "function f(a: number[]): number {\n"
+            "    let p: P = { v: 2 * 3 };\n"
+            "    for (let i: number = 0 + 0; i < 1 + 1; i = i + 2 - 1) {\n"
+            "        while (1 > 2) { a.push(-(3)); }\n"
+            "    }\n"
+            "    if (!false) { return a[1 - 1] + p.v; }\n"
+            "    return 4 % 3;\n"
+            "}\n"
+            "let arr: number[] = [];\narr.push(10 * 10);\nprint(f(arr));\n")
+        before = repr(program)
+        folding = fold_constants(program, analyzer)
+        assert repr(program) == before
+        assert folding.folded == 9
+        function = folding.program.body[1]
+        assert function is not program.body[1]
+        assert analyzer.types[function] is analyzer.types[program.body[1]]
+        # O gerador consulta o tipo das declarações copiadas
+        assert analyzer.types[function.body.body[0]] is analyzer.types[program.body[1].body.body[0]]
+        assert function.body.body[0].init.props == [("v", function.body.body[0].init.props[0][1])]
+        assert function.body.body[0].init.props[0][1].text == "6"
+        # Interfaces e statements sem constantes são compartilhados
+        assert folding.program.body[0] is program.body[0]
+        assert folding.program.body[2] is program.body[2]
+
+    def test_dead_code_sees_folded_conditions(self):
+        program, analyzer = analyze_code(
+            "function nunca(): number { return 1; }\n"
+            "if (2 * 2 == 5) { print(nunca()); }\nwhile (1 > 2) { print(2); }\n")
+        folded = fold_constants(program, analyzer).program
+        dead = eliminate_dead_code(folded, analyzer)
+        assert dead.removed_functions == ["nunca"]
+        assert [kind for kind, _, _ in dead.removed_branches] == ["if", "while"]
+        assert dead.program.body == []
+
+    def test_deep_unary_nesting(self):
+        node = Literal("number", "5", 1, 0)
+        for _ in range(DEPTH):
+            node = UnaryExpr(["-"], node, 1, 0)
+        program = Program([_print(node)], 1, 0)
+        analyzer = SemanticAnalyzer()
+        assert analyzer.analyze(program) == []
+        folding = fold_constants(program, analyzer)
+        stmt = folding.program.body[0]
+        assert type(stmt) is ExprStmt
+        assert stmt.expr.ops[0].args[0].text == ("5" if DEPTH % 2 == 0 else "-5")
+        assert folding.folded == DEPTH
+
+
+class TestGeneratedCode:
+    """Menos instruções, mesmo resultado"""
+
+    def test_fewer_instructions(self):
+        program, analyzer = analyze_code("".join(f"print({code});\n" for code in EXPRESSIONS))
+        before = count_instructions(generate_jasmin(analyzer, program))
+        after = count_instructions(generate_jasmin(analyzer, fold_constants(program, analyzer).program))
+        empty = count_instructions(generate_jasmin(*reversed(analyze_code(""))))
+        # Cada print fica com getstatic, um ldc/iconst e invokevirtual
+        assert after == empty + 3 * len(EXPRESSIONS) < before
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples(self, example):
+        program, analyzer = analyze_code(example.read_text(encoding="utf-8"))
+        folding = fold_constants(program, analyzer)
+        before = count_instructions(generate_jasmin(analyzer, program))
+        after = count_instructions(generate_jasmin(analyzer, folding.program))
+        # Cada expressão avaliada economiza pelo menos uma instrução (-2: ldc 2, ineg)
+        assert after <= before - folding.folded
+        if not folding.folded:
+            assert folding.program is program
+
+    @pytest.mark.skipif(not HAS_JVM, reason="java ou jasmin.jar indisponível")
+    def test_same_output_on_the_jvm(self, tmp_path, capsys):
+        code = "".join(f"print({expr});\n" for expr in EXPRESSIONS)
+        outputs = []
+        for folding in (True, False):
+            directory = tmp_path / str(folding)
+            directory.mkdir()
+            source = directory / "dobra.txt"
+            source.write_text(code, encoding="utf-8")
+            assert compile_file(str(source), constant_folding=folding)
+            assert ("Expressões constantes avaliadas" in capsys.readouterr().out) is folding
+            subprocess.run(["java", "-jar", str(PROJECT_ROOT / "jasmin.jar"), "-d",
+                            str(directory), str(directory / "Dobra.j")],
+                           check=True, capture_output=True)
+            result = subprocess.run(["java", "-cp", str(directory), "Dobra"],
+                                    capture_output=True, text=True, timeout=30)
+            assert result.returncode == 0, result.stderr
+            outputs.append(result.stdout.split())
+        assert outputs[0] == outputs[1]
+        assert outputs[0][:4] == ["86400", "5", "5", "-5"]
+
+    @pytest.mark.skipif(not HAS_JVM, reason="java ou jasmin.jar indisponível")
+    def test_chains_on_the_jvm(self, tmp_path, capsys):
+        # Cadeias de comparação e lógicas, com literais (avaliadas) e com variáveis
+        code = ("function efeito(): boolean { print(99); return true; }\n"
+                "let um: number = 1;\nlet f: boolean = false;\n"
+                "print(1 == 2 == false);\nprint(um == 2 == f);\n"
+                "print(1 < 2 == true);\nprint(um < 2 == true);\n"
+                "print(true || false);\nprint(!f || f);\n"
+                "print(false && efeito());\nprint(f && efeito());\n"
+                "print(true || efeito());\nprint(!f || efeito());\n"
+                "print(f || f || !f);\nprint(!f && !f && f);\n")
+        outputs = []
+        for folding in (True, False):
+            directory = tmp_path / str(folding)
+            directory.mkdir()
+            source = directory / "cadeia.txt"
+            source.write_text(code, encoding="utf-8")
+            assert compile_file(str(source), constant_folding=folding)
+            capsys.readouterr()
+            subprocess.run(["java", "-jar", str(PROJECT_ROOT / "jasmin.jar"), "-d",
+                            str(directory), str(directory / "Cadeia.j")],
+                           check=True, capture_output=True)
+            result = subprocess.run(["java", "-cp", str(directory), "Cadeia"],
+                                    capture_output=True, text=True, timeout=30)
+            assert result.returncode == 0, result.stderr
+            outputs.append(result.stdout.split())
+        # efeito() nunca roda: && e || param no primeiro operando que decide
+        assert outputs[0] == outputs[1] == ["1", "1", "1", "1", "1", "1", "0", "0", "1", "1",
+                                            "1", "0"]
+
+    @pytest.mark.skipif(not HAS_JVM, reason="java ou jasmin.jar indisponível")
+    def test_division_by_zero_fails_at_runtime(self, tmp_path, capsys):
+        source = tmp_path / "zero.txt"
+        source.write_text("print(1);\nprint(7 / (2 - 2));\n", encoding="utf-8")
+        assert compile_file(str(source))
+        assert "Linha 2:6 - divisão por zero mantida para a execução" in capsys.readouterr().out
+        subprocess.run(["java", "-jar", str(PROJECT_ROOT / "jasmin.jar"), "-d", str(tmp_path),
+                        str(tmp_path / "Zero.j")], check=True, capture_output=True)
+        result = subprocess.run(["java", "-cp", str(tmp_path), "Zero"],
+                                capture_output=True, text=True, timeout=30)
+        assert result.stdout.split() == ["1"]
+        assert "ArithmeticException" in result.stderr
@@ -0,0 +1,166 @@
+"""
+Testes da eliminação de código morto (TypeScriptDeadCode): alcançabilidade a
+partir do código de nível superior, desvios com condição constante e o Jasmin
+gerado só com o que é alcançável.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from main import compile_file
+from TypeScriptAST import Block, ExprStmt, IfStmt, Literal, Program
+from TypeScriptDeadCode import eliminate_dead_code
+from TypeScriptSemantic import SemanticAnalyzer
+from .compiler_utils import analyze_code, jasmin_generator
+from .test_tree_walk import DEPTH, _print
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+PROGRAM = """interface Ponto { x: number; }
+interface Caixa { p: Ponto; }
+interface Nada { n: number; }
+interface Lista { itens: Ponto[]; }
+let usado: number = 2;
+let morto: number = 3;
+let derivado: number = morto * 2;
+let lista: number[] = [];
+lista.push(usado);
+function folha(): number { return usado; }
+function nunca(): number { return 7; }
+function raiz(n: number): number { if (false) { return nunca(); } return folha() + n; }
+function orfa(c: Caixa): number { return c.p.x; }
+function recursiva(n: number): number { if (n < 1) { return 0; } return recursiva(n - 1); }
+let q: Ponto;
+q.x = 5;
+print(raiz(1));
+if (true) { print(q.x); } else { print(recursiva(3)); }
+while (false) { print(1); }
+for (let i: number = 0; false; i = i + 1) { print(i); }
+"""
+
+
+class TestReachability:
+    """O que é mantido e o que é removido"""
+
+    def test_removed_declarations(self):
+        program, analyzer = analyze_code(PROGRAM)
+        dead = eliminate_dead_code(program, analyzer)
+        assert dead.removed_functions == ["nunca", "orfa", "recursiva"]
+        assert dead.removed_globals == ["morto", "derivado"]
+        assert dead.removed_interfaces == ["Caixa", "Nada", "Lista"]
+        assert dead.removed_branches == [("if", 12, 35), ("if", 18, 0), ("while", 19, 0),
+                                         ("for", 20, 0)]
+        assert set(dead.global_vars) == {"usado", "lista", "q"}
+        assert set(dead.interfaces) == {"Ponto"}
+
+    def test_calls_are_followed_transitively(self):
+        program, analyzer = analyze_code(
+            "function c(): number { return 1; }\nfunction b(): number { return c(); }\n"
+            "function a(): number { return b(); }\nfunction d(): number { return a(); }\n"
+            "print(a());\n")
+        dead = eliminate_dead_code(program, analyzer)
+        assert dead.removed_functions == ["d"]
+
+    def test_initializer_with_effects_is_kept(self):
+        program, analyzer = analyze_code(
+            "function f(): number { print(1); return 1; }\n"
+            "let x: number = f();\nlet y: number = 1 / 1;\nlet z: number = 1;\n")
+        dead = eliminate_dead_code(program, analyzer)
+        assert dead.removed_functions == []
+        # As declarações com efeitos ficam; os campos estáticos saem
+        assert [getattr(stmt, "name", None) for stmt in dead.program.body] == ["f", "x", "y"]
+        assert dead.global_vars == {}
+
+    def test_interfaces_reached_through_fields(self):
+        program, analyzer = analyze_code(
+            "interface C { n: number; }\ninterface B { c: C; }\ninterface A { b: B[]; }\n"
+            "interface D { a: A; }\nlet a: A;\nprint(a.b.size());\n")
+        dead = eliminate_dead_code(program, analyzer)
+        assert dead.removed_interfaces == ["D"]
+
+    def test_program_is_not_modified(self):
+        program, analyzer = analyze_code(PROGRAM)
+        before = repr(program)
+        dead = eliminate_dead_code(program, analyzer)
+        assert repr(program) == before
+        raiz = next(stmt for stmt in dead.program.body if getattr(stmt, "name", None) == "raiz")
+        original = next(stmt for stmt in program.body if getattr(stmt, "name", None) == "raiz")
+        assert raiz is not original and raiz.params is original.params
+        assert analyzer.types[raiz] is analyzer.types[original]
+
+    def test_report(self):
+        program, analyzer = analyze_code(PROGRAM)
+        report = eliminate_dead_code(program, analyzer).report(max_names=2)
+        assert report[0] == ("Código morto removido: 3 função(ões), 2 global(is), "
+                             "3 interface(s), 4 desvio(s) com condição constante")
+        assert "  funções: nunca, orfa (+1)" in report
+        assert "  desvios: if na linha 12, if na linha 18 (+2)" in report
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples_unchanged(self, example):
+        program, analyzer = analyze_code(example.read_text(encoding="utf-8"))
+        dead = eliminate_dead_code(program, analyzer)
+        assert not dead.removed_anything()
+        assert (jasmin_generator(analyzer, dead.program, dead).get_result()
+                == jasmin_generator(analyzer, program).get_result())
+
+    def test_deep_constant_branches(self):
+        node = _print(Literal("number", "1", 1, 0))
+        for _ in range(DEPTH):
+            node = Block([IfStmt(Literal("boolean", "true", 1, 0), node, None, 1, 0)], 1, 0)
+        program = Program([node], 1, 0)
+        analyzer = SemanticAnalyzer()
+        assert analyzer.analyze(program) == []
+        dead = eliminate_dead_code(program, analyzer)
+        assert len(dead.removed_branches) == DEPTH
+        inner = dead.program.body[0]
+        for _ in range(DEPTH):
+            inner = inner.body[0]
+        assert type(inner) is ExprStmt
+
+
+class TestGeneratedCode:
+    """Jasmin sem as funções, campos e classes removidos"""
+
+    def test_smaller_class(self):
+        program, analyzer = analyze_code(PROGRAM)
+        full = jasmin_generator(analyzer, program)
+        dead = eliminate_dead_code(program, analyzer)
+        pruned = jasmin_generator(analyzer, dead.program, dead)
+        full, full_interfaces = full.get_result(), full.interface_classes
+        pruned, interfaces = pruned.get_result(), pruned.interface_classes
+        assert ".method public static orfa" in full and ".method public static orfa" not in pruned
+        assert ".field public static morto" not in pruned
+        assert "invokestatic Teste/nunca" not in pruned
+        assert len(interfaces) == 1 and len(full_interfaces) == 4
+        assert len(pruned) < len(full)
+
+    @pytest.mark.skipif(shutil.which("java") is None or not (PROJECT_ROOT / "jasmin.jar").exists(),
+                        reason="java ou jasmin.jar indisponível")
+    def test_same_output_on_the_jvm(self, tmp_path, capsys):
+        outputs = []
+        for keep in (False, True):
+            directory = tmp_path / str(keep)
+            directory.mkdir()
+            source = directory / "morto.txt"
+            source.write_text(PROGRAM, encoding="utf-8")
+            assert compile_file(str(source), dead_code_elimination=not keep)
+            printed = capsys.readouterr().out
+            assert ("Código morto removido" in printed) is not keep
+            classes = sorted(path.name for path in directory.glob("*.j"))
+            assert classes == (["Caixa.j", "Lista.j", "Morto.j", "Nada.j", "Ponto.j"] if keep
+                               else ["Morto.j", "Ponto.j"])
+            subprocess.run(["java", "-jar", str(PROJECT_ROOT / "jasmin.jar"), "-d",
+                            str(directory), *map(str, directory.glob("*.j"))],
+                           check=True, capture_output=True)
+            result = subprocess.run(["java", "-cp", str(directory), "Morto"],
+                                    capture_output=True, text=True, timeout=30)
+            assert result.returncode == 0, result.stderr
+            outputs.append(result.stdout)
+        # folha() lê o campo estático de `usado`, e globais vivem como locais do main
+        assert outputs[0] == outputs[1] and outputs[0].split() == ["1", "5"]
@@ -0,0 +1,104 @@
+"""
+Testes do snapshot persistente dos DFAs do lexer e do parser.
+"""
+
+import marshal
+import subprocess
+import sys
+from pathlib import Path
+
+import TypeScriptDFACache
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Imprime a árvore do exemplo e o status/tamanho do cache em um processo novo
+_PARSE_SCRIPT = """
+import sys
+from antlr4 import CommonTokenStream, FileStream
+import TypeScriptDFACache
+from main import parse_program
+from TypeScriptLexer import TypeScriptLexer
+status = TypeScriptDFACache.load_dfa_cache(sys.argv[1]) if sys.argv[1] else "off"
+before = TypeScriptDFACache.dfa_state_count()
+tokens = CommonTokenStream(TypeScriptLexer(FileStream(sys.argv[2], encoding="utf-8")))
+tree, _ = parse_program(tokens)
+if sys.argv[1]:
+    TypeScriptDFACache.save_dfa_cache(sys.argv[1])
+print(status, before, TypeScriptDFACache.dfa_state_count())
+print(tree.toStringTree(recog=tree.parser))
+"""
+
+
+def _parse_in_new_process(cache_path, source):
+    result = subprocess.run(
+        [sys.executable, "-c", _PARSE_SCRIPT, str(cache_path or ""), str(source)],
+        capture_output=True,
+        text=True,
+        cwd=str(PROJECT_ROOT)
+    )
+    assert result.returncode == 0, result.stderr
+    header, tree = result.stdout.split("\n", 1)
+    status, before, after = header.split()
+    return status, int(before), int(after), tree
+
+
+def _compile(cache_path, source):
+    return subprocess.run(
+        [sys.executable, str(PROJECT_ROOT / "main.py"), f"--dfa-cache={cache_path}", "--no-cache",
+         str(source)],
+        capture_output=True,
+        text=True,
+        cwd=str(PROJECT_ROOT)
+    )
+
+
+class TestDFACache:
+    """Carga, reuso e invalidação do snapshot"""
+
+    def test_snapshot_warms_new_process(self, tmp_path):
+        """Segundo processo deve começar com os DFAs aquecidos e sem criar estados"""
+        cache = tmp_path / "dfa.bin"
+        source = PROJECT_ROOT / "exemplo_estoque.txt"
+
+        status, before, warmed, cold_tree = _parse_in_new_process(cache, source)
+        assert status == "ausente" and before == 0 and warmed > 0
+
+        status, before, after, warm_tree = _parse_in_new_process(cache, source)
+        assert status == "carregado"
+        assert before == warmed and after == warmed
+        assert warm_tree == cold_tree
+
+    def test_snapshot_grows_with_new_input(self, tmp_path):
+        """Snapshot carregado continua funcionando para entradas novas"""
+        cache = tmp_path / "dfa.bin"
+        _parse_in_new_process(cache, PROJECT_ROOT / "exemplo_1.txt")
+        _, _, _, expected = _parse_in_new_process(None, PROJECT_ROOT / "exemplo_estoque.txt")
+        status, before, after, tree = _parse_in_new_process(cache, PROJECT_ROOT / "exemplo_estoque.txt")
+        assert status == "carregado"
+        assert after >= before
+        assert tree == expected
+
+    def test_stale_snapshot_is_rebuilt(self, tmp_path):
+        """Snapshot de outra gramática deve ser descartado e regravado"""
+        cache = tmp_path / "dfa.bin"
+        _parse_in_new_process(cache, PROJECT_ROOT / "exemplo_1.txt")
+        snapshot = marshal.loads(cache.read_bytes())
+        snapshot["key"] = "0" * 64
+        cache.write_bytes(marshal.dumps(snapshot))
+
+        result = _compile(cache, PROJECT_ROOT / "exemplo_1.txt")
+        assert "Cache de DFA: obsoleto" in result.stdout
+        assert marshal.loads(cache.read_bytes())["key"] == TypeScriptDFACache.grammar_key()
+
+    def test_corrupt_snapshot_is_rebuilt(self, tmp_path):
+        """Snapshot corrompido deve ser ignorado sem afetar a compilação"""
+        cache = tmp_path / "dfa.bin"
+        _parse_in_new_process(cache, PROJECT_ROOT / "exemplo_1.txt")
+        data = cache.read_bytes()
+        cache.write_bytes(data[: len(data) // 2])
+
+        result = _compile(cache, PROJECT_ROOT / "exemplo_1.txt")
+        assert result.returncode == 0, result.stdout
+        assert "Cache de DFA: corrompido" in result.stdout
+        assert "Cache de DFA: carregado" in _compile(cache, PROJECT_ROOT / "exemplo_1.txt").stdout
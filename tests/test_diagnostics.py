@@ -0,0 +1,192 @@
+"""
+Testes dos diagnósticos estruturados (TypeScriptDiagnostics): formatação sob
+demanda, limite de erros da análise semântica e saída --diagnostics=json.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import TypeScriptDiagnostics
+import TypeScriptParallelSemantic
+from main import compile_file
+from TypeScriptDiagnostics import MESSAGES, Diagnostic
+from TypeScriptIncrementalSemantic import IncrementalAnalyzer
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer
+from TypeScriptSemantic import SemanticAnalyzer
+from .compiler_utils import parse_code
+from .test_parallel_semantic import WITH_ERRORS
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Um erro por linha, em statements de nível superior
+MANY_ERRORS = "".join(f"let v{i}: number = \"s\";\n" for i in range(20))
+
+
+class TestDiagnostic:
+    """Campos, formato textual e igualdade"""
+
+    def test_text_format(self):
+        error = Diagnostic("undeclared-variable", 3, 7, ("x",))
+        assert error.message == "Variável 'x' não declarada"
+        assert str(error) == "Linha 3:7 - Variável 'x' não declarada"
+        assert str(Diagnostic("internal", None, None, ("falhou",))) == "ERRO: falhou"
+
+    def test_to_dict(self):
+        error = Diagnostic("assignment-type", 2, 0, ("string", "number"))
+        assert error.to_dict() == {
+            "code": "assignment-type", "severity": "error", "line": 2, "column": 0,
+            "args": ["string", "number"],
+            "message": "Tipos incompatíveis na atribuição: não é possível atribuir string a number"}
+
+    def test_equality_and_position(self):
+        error = Diagnostic("undeclared-variable", 3, 7, ("x",))
+        assert error == Diagnostic("undeclared-variable", 3, 7, ("x",))
+        assert error != Diagnostic("undeclared-variable", 3, 8, ("x",))
+        assert error.at(5, 1) == Diagnostic("undeclared-variable", 5, 1, ("x",))
+        assert len({error, error.at(3, 7)}) == 1
+
+    def test_every_reported_code_has_a_message(self):
+        source = (PROJECT_ROOT / "TypeScriptSemantic.py").read_text(encoding="utf-8")
+        codes = set(re.findall(r'_err\(\w+, "([\w-]+)"', source))
+        assert len(codes) > 20 and codes <= set(MESSAGES)
+
+    def test_message_formatted_on_demand(self, monkeypatch):
+        errors = SemanticAnalyzer().analyze(parse_code("print(x);\n"))
+        assert errors[0].code == "undeclared-variable" and errors[0].args == ("x",)
+        monkeypatch.setitem(TypeScriptDiagnostics.MESSAGES, "undeclared-variable", "'{0}'?")
+        assert str(errors[0]) == "Linha 1:6 - 'x'?"
+
+
+class TestErrorLimit:
+    """max_errors interrompe a análise"""
+
+    @pytest.mark.parametrize("limit", [1, 5])
+    def test_single_pass_stops(self, limit):
+        program = parse_code(MANY_ERRORS)
+        analyzer = SemanticAnalyzer(limit)
+        errors = analyzer.analyze(program)
+        assert errors == SemanticAnalyzer().analyze(program)[:limit]
+        # Os statements depois do N-ésimo erro não são visitados
+        assert program.body[limit] not in analyzer.types
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    @pytest.mark.parametrize("limit", [1, 4, 7])
+    def test_two_phase_independent_of_processes(self, jobs, limit, monkeypatch):
+        monkeypatch.setattr(TypeScriptParallelSemantic, "MIN_PARALLEL_FUNCTIONS", 1)
+        program = parse_code(WITH_ERRORS)
+        full = SemanticAnalyzer().analyze(program)
+        errors = TwoPhaseAnalyzer(jobs, limit).analyze(program)
+        assert len(errors) == limit
+        assert errors == TwoPhaseAnalyzer(1, limit).analyze(program)
+        assert set(errors) <= set(full)
+        lines = [error.line for error in errors]
+        assert lines == sorted(lines)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_top_level_error_before_function(self, jobs, monkeypatch):
+        monkeypatch.setattr(TypeScriptParallelSemantic, "MIN_PARALLEL_FUNCTIONS", 1)
+        program = parse_code("let x: number = \"s\";\n"
+                         "function f(): number { return \"t\"; }\n"
+                         "function g(a: Nada): number { return true; }\n")
+        errors = TwoPhaseAnalyzer(jobs, 1).analyze(program)
+        assert [(error.code, error.line) for error in errors] == [("initializer-type", 1)]
+        # Erro da fase 1 (assinatura de g) depois dos erros dos corpos anteriores
+        errors = TwoPhaseAnalyzer(jobs, 2).analyze(program)
+        assert [(error.code, error.line) for error in errors] == [
+            ("initializer-type", 1), ("return-type", 2)]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_limit_keeps_first_errors_by_position(self, jobs, monkeypatch):
+        monkeypatch.setattr(TypeScriptParallelSemantic, "MIN_PARALLEL_FUNCTIONS", 1)
+        program = parse_code(WITH_ERRORS + MANY_ERRORS)
+        full = TwoPhaseAnalyzer(1).analyze(program)
+        assert len(full) > 20
+        for limit in range(1, len(full) + 2):
+            assert TwoPhaseAnalyzer(jobs, limit).analyze(program) == full[:limit]
+
+    def test_cli_top_level_error_first(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text("let x: number = \"s\";\nfunction f(): number { return \"t\"; }\n"
+                          "print(x);\n", encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--no-cache",
+             "--diagnostics=json", "--max-errors=1", str(source)],
+            capture_output=True, text=True, cwd=str(PROJECT_ROOT))
+        report = json.loads(result.stdout)
+        assert [(d["code"], d["line"]) for d in report["diagnostics"]] == [
+            ("initializer-type", 1)]
+
+    def test_two_phase_skips_top_level_code(self):
+        errors = TwoPhaseAnalyzer(1, 3).analyze(parse_code(MANY_ERRORS))
+        assert [error.line for error in errors] == [1, 2, 3]
+
+    def test_limit_above_error_count(self):
+        program = parse_code(WITH_ERRORS)
+        assert TwoPhaseAnalyzer(2, 100).analyze(program) == SemanticAnalyzer().analyze(program)
+
+    def test_incremental_keeps_diagnostics(self):
+        program = parse_code(WITH_ERRORS)
+        incremental = IncrementalAnalyzer()
+        incremental.analyze(program)
+        shifted = parse_code("\n\n" + WITH_ERRORS)
+        errors = incremental.analyze(shifted)
+        assert errors == TwoPhaseAnalyzer().analyze(shifted)
+        assert all(type(error) is Diagnostic for error in errors)
+
+
+class TestJsonOutput:
+    """--diagnostics=json: stdout tem só o documento JSON"""
+
+    def test_compile_file(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text(MANY_ERRORS, encoding="utf-8")
+        assert not compile_file(str(source), diagnostics="json", max_errors=2)
+        captured = capsys.readouterr()
+        report = json.loads(captured.out)
+        assert report["success"] is False
+        assert [(d["code"], d["line"], d["column"]) for d in report["diagnostics"]] == [
+            ("initializer-type", 1, 0), ("initializer-type", 2, 0)]
+        assert "Compiling:" in captured.err
+
+    def test_syntax_errors(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text("let x: number = ;\nconst c: number;\n", encoding="utf-8")
+        assert not compile_file(str(source), diagnostics="json")
+        codes = [d["code"] for d in json.loads(capsys.readouterr().out)["diagnostics"]]
+        assert codes == ["syntax", "const-without-initializer"]
+
+    def test_success(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text("let x: number = 1;\nprint(x);\n", encoding="utf-8")
+        assert compile_file(str(source), diagnostics="json")
+        assert json.loads(capsys.readouterr().out) == {
+            "file": str(source), "success": True, "diagnostics": []}
+        assert (tmp_path / "Prog.j").exists()
+
+    def test_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            compile_file(str(tmp_path / "prog.txt"), diagnostics="xml")
+
+    def test_cli(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text(MANY_ERRORS, encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--no-cache",
+             "--diagnostics=json", "--max-errors", "3", "--startup-report", str(source)],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 1
+        report = json.loads(result.stdout)
+        assert [str(Diagnostic(d["code"], d["line"], d["column"], tuple(d["args"])))
+                for d in report["diagnostics"]] == [
+            f"Linha {line}:0 - Tipo do inicializador incompatível: esperado number mas foi string"
+            for line in (1, 2, 3)]
+        assert "Tempo de inicialização" in result.stderr
@@ -0,0 +1,259 @@
+"""
+Testes do parser de expressões por precedência (TypeScriptPrattParser) e dos nós planos.
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from main import compile_file, parse_program, parser_class
+from TypeScriptAST import (
+    AssignExpr, BinaryExpr, CallOp, Identifier, IndexOp, Literal, MemberOp,
+    PostfixExpr, UnaryExpr,
+)
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptLowering import expression_node, lower_program
+from TypeScriptParser import TypeScriptParser
+from TypeScriptSemantic import SemanticAnalyzer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+BINARY_OPS = ["||", "&&", "==", "!=", "<", "<=", ">", ">=", "+", "-", "*", "/", "%"]
+
+
+class _CollectErrors(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def _parse(code, expr_parser):
+    """Retorna (árvore, erros de sintaxe) usando o parser de expressões indicado"""
+    tokens = CommonTokenStream(TypeScriptLexer(InputStream(code)))
+    parser = parser_class(expr_parser)(tokens)
+    parser.removeErrorListeners()
+    listener = _CollectErrors()
+    parser.addErrorListener(listener)
+    return parser.program(), listener.errors
+
+
+def _expressions(tree):
+    """Nós planos de todos os ExpressionContext de nível de statement"""
+    result = []
+
+    def walk(node):
+        if isinstance(node, TypeScriptParser.ExpressionContext):
+            result.append(repr(expression_node(node)))
+            return
+        for i in range(node.getChildCount()):
+            child = node.getChild(i)
+            if hasattr(child, "getChildCount"):
+                walk(child)
+
+    walk(tree)
+    return result
+
+
+def _expr(code):
+    """Nó plano da expressão de um statement `code;` (parser de precedência)"""
+    tree, errors = _parse(code + ";", "pratt")
+    assert not errors, errors
+    return expression_node(tree.statement(0).expressionStmt().expression())
+
+
+def _random_expression(rng, depth=0):
+    if depth > 4 or rng.random() < 0.3:
+        return rng.choice(["x", "y1", "42", "3.5", "\"s\"", "true", "[]", "{}", "[1, a]",
+                           "{a: 1, \"b\": c}"])
+    kind = rng.randrange(6)
+    sub = lambda: _random_expression(rng, depth + 1)  # noqa: E731
+    if kind == 0:
+        parts = [sub()]
+        for _ in range(rng.randint(1, 4)):
+            parts += [rng.choice(BINARY_OPS), sub()]
+        return " ".join(parts)
+    if kind == 1:
+        return "".join(rng.choice("!-") for _ in range(rng.randint(1, 3))) + sub()
+    if kind == 2:
+        return f"({sub()})"
+    if kind == 3:
+        ops = []
+        for _ in range(rng.randint(1, 4)):
+            op = rng.randrange(3)
+            if op == 0:
+                ops.append(f"[{sub()}]")
+            elif op == 1:
+                ops.append(".campo")
+            else:
+                ops.append("(" + ", ".join(sub() for _ in range(rng.randint(0, 3))) + ")")
+        return rng.choice(["a", "f", "(b)"]) + "".join(ops)
+    if kind == 4:
+        return f"{rng.choice(['x', 'o.p', 'v[0]'])} = {sub()}"
+    return f"[{sub()}, {sub()}]"
+
+
+class TestPrattConformance:
+    """O parser de precedência deve produzir os mesmos nós que as regras do ANTLR"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples(self, example):
+        """Mesmos nós (com posições) em todos os exemplos"""
+        code = example.read_text(encoding="utf-8")
+        pratt, _ = _parse(code, "pratt")
+        antlr, _ = _parse(code, "antlr")
+        assert _expressions(pratt) == _expressions(antlr)
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_random_expressions(self, seed):
+        """Mesmos nós para expressões aleatórias com todos os operadores"""
+        rng = random.Random(seed)
+        code = "\n".join(_random_expression(rng) + ";" for _ in range(5))
+        pratt, pratt_errors = _parse(code, "pratt")
+        antlr, antlr_errors = _parse(code, "antlr")
+        assert pratt_errors == antlr_errors == []
+        assert _expressions(pratt) == _expressions(antlr)
+
+    @pytest.mark.parametrize("code", [
+        "let x: number = (1 + 2;",
+        "let o: P = {a 1};",
+        "f(1 2);",
+        "let x: number = ;",
+        "let y: number = 1 +;",
+    ])
+    def test_syntax_error_messages(self, code):
+        """Erros de sintaxe nas expressões relatados como no parser gerado"""
+        _, pratt_errors = _parse(code, "pratt")
+        _, antlr_errors = _parse(code, "antlr")
+        assert pratt_errors
+        assert [e[:2] for e in pratt_errors] == [e[:2] for e in antlr_errors]
+        assert pratt_errors[0][2].split()[0] == antlr_errors[0][2].split()[0]
+
+    def test_sll_stage_falls_back_on_expression_error(self, capsys):
+        """Erro dentro de uma expressão aborta o estágio SLL e é relatado uma vez no LL"""
+        tokens = CommonTokenStream(TypeScriptLexer(InputStream("let x: number = (1 + 2;")))
+        tree, path = parse_program(tokens, "auto", "pratt")
+        assert path == "SLL→LL"
+        assert tree.parser.getNumberOfSyntaxErrors() == 1
+        assert capsys.readouterr().err.count("missing ')'") == 1
+
+
+class TestFlatNodes:
+    """Forma dos nós gerados"""
+
+    def test_same_level_chain_is_flat(self):
+        """a + b - c vira um único BinaryExpr com três operandos"""
+        node = _expr("a + b - c")
+        assert isinstance(node, BinaryExpr)
+        assert node.ops == ["+", "-"]
+        assert [o.name for o in node.operands] == ["a", "b", "c"]
+
+    def test_precedence(self):
+        """* liga mais forte que +, que liga mais forte que <, ==, && e ||"""
+        node = _expr("a || b && c == d < e + f * g")
+        levels = []
+        while isinstance(node, BinaryExpr):
+            levels.append(node.ops[0])
+            node = node.operands[-1]
+        assert levels == ["||", "&&", "==", "<", "+", "*"]
+
+    def test_parentheses_do_not_create_nodes(self):
+        """(a + b) * c: o operando entre parênteses é o próprio BinaryExpr interno"""
+        node = _expr("(a + b) * c")
+        assert node.ops == ["*"]
+        assert isinstance(node.operands[0], BinaryExpr) and node.operands[0].ops == ["+"]
+        assert (node.line, node.column) == (1, 0)
+        assert (node.operands[0].line, node.operands[0].column) == (1, 1)
+
+    def test_assignment_is_right_associative(self):
+        node = _expr("a = b = 1")
+        assert isinstance(node, AssignExpr) and isinstance(node.value, AssignExpr)
+        assert isinstance(node.value.value, Literal)
+
+    def test_unary_and_postfix(self):
+        node = _expr("!-arr[0].campo(1, 2)")
+        assert isinstance(node, UnaryExpr) and node.ops == ["!", "-"]
+        postfix = node.operand
+        assert isinstance(postfix, PostfixExpr) and postfix.primary.name == "arr"
+        assert [type(op) for op in postfix.ops] == [IndexOp, MemberOp, CallOp]
+        assert len(postfix.ops[2].args) == 2
+
+    def test_literal_is_a_single_node(self):
+        """Um literal vira um nó, não uma cadeia de ~10 contextos"""
+        node = _expr("42")
+        assert isinstance(node, Literal) and node.kind == "number"
+        assert isinstance(_expr("x"), Identifier)
+
+
+class TestPrattPipeline:
+    """Semântica e geração de código consumindo os nós planos"""
+
+    PROGRAM = """
+let x: number = 1;
+const c: number = 2;
+let s: string = "a";
+x = s + 1;
+c = 3;
+(x + 1) = 2;
+let b: boolean = !(x < 2) && x;
+print(y[0]);
+"""
+
+    def test_semantic_errors_match_antlr_expressions(self):
+        """Mesmos erros semânticos (mensagem e posição) com os dois parsers"""
+        results = []
+        for expr_parser in ("pratt", "antlr"):
+            tree, _ = _parse(self.PROGRAM, expr_parser)
+            results.append(SemanticAnalyzer().analyze(lower_program(tree)))
+        assert results[0] == results[1]
+        assert len(results[0]) >= 5
+
+    @pytest.mark.parametrize("target, valid", [
+        ("a", True), ("(a)", True), ("((a))", True), ("(arr[0])", True), ("(arr)[0]", True),
+        ("(p.x)", True), ("(p).x", True), ("(f())", False), ("(a = 1)", False), ("(1)", False),
+        ("(-a)", False), ("(a + 1)", False), ("-(a)", False), ("(f)()", False),
+    ])
+    def test_parenthesized_targets_in_both_modes(self, target, valid, tmp_path, capsys):
+        """Alvos entre parênteses: mesmos diagnósticos com --expr-parser=pratt e antlr"""
+        source = tmp_path / "alvo.txt"
+        source.write_text("interface P { x: number; }\nlet p: P;\nlet arr: number[] = [];\n"
+                          "let a: number = 1;\nfunction f(): number { return 1; }\n"
+                          f"{target} = 2;\n", encoding="utf-8")
+        results = []
+        for expr_parser in ("pratt", "antlr"):
+            success = compile_file(str(source), expr_parser=expr_parser, diagnostics="json")
+            results.append((success, capsys.readouterr().out))
+        assert results[0] == results[1]
+        assert results[0][0] is valid
+        if not valid:
+            assert '"code": "assignment-target", "severity": "error", "line": 6' in results[0][1]
+
+    def test_cli_expr_parsers_generate_same_jasmin(self, tmp_path):
+        """main.py --expr-parser=antlr|pratt deve gerar o mesmo código Jasmin"""
+        source = tmp_path / "teste_biblioteca.txt"
+        source.write_text((PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8"),
+                          encoding="utf-8")
+        outputs = []
+        for expr_parser in ("antlr", "pratt"):
+            result = subprocess.run(
+                [sys.executable, str(PROJECT_ROOT / "main.py"),
+                 f"--expr-parser={expr_parser}", "--no-cache", str(source)],
+                capture_output=True,
+                text=True,
+                cwd=str(PROJECT_ROOT)
+            )
+            assert result.returncode == 0, f"Erro compilando: {result.stdout}\n{result.stderr}"
+            outputs.append((tmp_path / "Teste_biblioteca.j").read_text(encoding="utf-8"))
+        assert outputs[0] == outputs[1]
+
+    def test_invalid_expr_parser(self):
+        with pytest.raises(ValueError):
+            parse_program(CommonTokenStream(TypeScriptLexer(InputStream("1;"))), "auto", "lr")
@@ -0,0 +1,103 @@
+"""
+Testes do reparsing incremental (TypeScriptIncremental).
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from TypeScriptIncremental import parse_source, reparse
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SOURCE = "\n".join((PROJECT_ROOT / name).read_text(encoding="utf-8")
+                   for name in ("teste_biblioteca.txt", "exemplo_5.txt", "exemplo_estoque.txt"))
+
+LINE = "let a: number = 1; let b: number = 2; print(a + b);\nprint(b);\n"
+
+
+def _edit(source, start, end, new_text):
+    """Aplica a edição e confere o resultado contra o parsing completo"""
+    result = reparse(source, start, end, new_text)
+    full = parse_source(result.text)
+    assert result.text == source.text[:start] + new_text + source.text[end:]
+    assert [str(error) for error in result.errors] == [str(error) for error in full.errors]
+    assert repr(result.program) == repr(full.program)
+    return result
+
+
+class TestReparse:
+    """Resultado igual ao do parsing completo, reanalisando só a região editada"""
+
+    def test_single_character_edit_reparses_one_statement(self):
+        source = parse_source(SOURCE)
+        offset = SOURCE.index("function fatorialRecursivo")
+        result = _edit(source, offset + len("function "), offset + len("function f"), "F")
+        start, end = result.reparsed
+        assert result.text[start:].startswith("function FatorialRecursivo")
+        assert end - start < len(SOURCE) // 10
+        assert result.bodies[-1] is source.bodies[-1]
+
+    def test_positions_after_inserted_lines_and_columns(self):
+        source = parse_source(LINE)
+        result = _edit(source, LINE.index("1;"), LINE.index("1;") + 1, "1 +\n\n  10")
+        program = result.program
+        assert [(s.line, s.column) for s in program.body] == [(1, 0), (3, 6), (3, 25), (4, 0)]
+
+    def test_edit_on_statement_boundary(self):
+        source = parse_source(LINE)
+        boundary = LINE.index("let b")
+        result = _edit(source, boundary, boundary, "let c: number = 3;")
+        assert len(result.program.body) == 5
+
+    def test_unbalanced_brace(self):
+        source = parse_source("function f(): void {\n  print(1);\n}\nprint(2);\n")
+        result = _edit(source, source.text.index("}"), source.text.index("}") + 1, "")
+        assert result.errors
+
+    def test_merging_statements(self):
+        code = "if (true) print(1);\nlet e: number = 2;\n"
+        source = parse_source(code)
+        result = _edit(source, code.index("let e"), code.index(";\n", 20), "else print(2)")
+        assert len(result.program.body) == 1
+
+    def test_syntax_error_and_recovery(self):
+        source = parse_source(LINE)
+        broken = _edit(source, LINE.index("2;"), LINE.index("2;") + 1, "")
+        assert broken.program is None and broken.errors
+        fixed = _edit(broken, LINE.index("2;") - 1, LINE.index("2;") - 1, "7")
+        assert fixed.program.body[1].init.text == "7"
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            reparse(parse_source(LINE), 10, 5, "")
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_edits(self, seed):
+        rng = random.Random(seed)
+        pieces = list("ax1;{}() \n=+") + ["else", "print(1);", ""]
+        source = parse_source(SOURCE)
+        for _ in range(40):
+            start = rng.randrange(len(source.text) + 1)
+            end = min(len(source.text), start + rng.choice((0, 1, 3)))
+            result = _edit(source, start, end, rng.choice(pieces))
+            if not result.errors:
+                source = result
+
+    @pytest.mark.parametrize("seed", [0, 15, 46])
+    def test_random_edits_on_broken_file(self, seed):
+        """As edições continuam sobre o arquivo com erros: mesmas mensagens"""
+        rng = random.Random(seed)
+        pieces = list("ax1;{}() \n=+") + ["else", "print(1);", ""]
+        source = parse_source(SOURCE)
+        for _ in range(40):
+            start = rng.randrange(len(source.text) + 1)
+            end = min(len(source.text), start + rng.choice((0, 1, 3)))
+            source = _edit(source, start, end, rng.choice(pieces))
+
+    def test_errors_independent_of_previous_parses(self):
+        broken = "interface P {\n  x: number;\n 1 y: number;\n}\nprint(1)\n"
+        first = [str(error) for error in parse_source(broken).errors]
+        assert first == [str(error) for error in parse_source(broken).errors]
+        assert first[0] == "Linha 3:1 - extraneous input '1' expecting {'}', ID}"
@@ -0,0 +1,197 @@
+"""
+Testes da análise semântica incremental (TypeScriptIncrementalSemantic).
+
+O resultado incremental é sempre comparado ao de um TwoPhaseAnalyzer novo sobre
+o mesmo programa (a análise do main.py): erros, tabelas globais, grafo de chamadas
+e código Jasmin.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from TypeScriptIncremental import parse_source, reparse
+from TypeScriptIncrementalSemantic import IncrementalAnalyzer
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer
+from TypeScriptSemantic import SemanticAnalyzer
+from .compiler_utils import generate_jasmin, global_tables, parse_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+PROGRAM = """interface Ponto { x: number; y: number; }
+interface Linha { a: Ponto; b: Ponto; }
+let origem: Ponto = { x: 0, y: 0 };
+const passos: number = 3;
+function dobro(n: number): number { return n * 2; }
+function norma(p: Ponto): number { return dobro(p.x) + dobro(p.y); }
+function comprimento(l: Linha): number { return norma(l.b) - norma(l.a); }
+let l: Linha = { a: origem, b: { x: 1, y: 2 } };
+print(comprimento(l), passos);
+function vazio(): void { print(dobro(passos)); }
+for (let i: number = 0; i < passos; i = i + 1) { vazio(); }
+"""
+
+# Edições que mudam assinaturas, formas de interface, ordem e posições
+EDITS = [
+    ("n: number): number { return n * 2; }", "n: number): number { return n * 3; }"),
+    ("dobro(n: number): number", "dobro(n: string): number"),
+    ("dobro(n: number): number", "dobro(n: number): string"),
+    ("interface Ponto { x: number; y: number; }", "interface Ponto { x: number; y: string; }"),
+    ("interface Ponto { x: number; y: number; }", "interface Ponto { x: number; }"),
+    ("const passos: number = 3;", "let passos: number = 3;"),
+    ("const passos: number = 3;", "const passos: string = 3;"),
+    ("let origem", "\n\nlet origem"),
+    ("print(comprimento(l), passos);", "print(comprimento(origem), passos);"),
+    ("function vazio(): void { print(dobro(passos)); }\n", ""),
+    ("function dobro(n: number): number { return n * 2; }\n", ""),
+    ("let l: Linha", "let dobro: Linha"),
+]
+
+# Referências adiante: aceitas por TwoPhaseAnalyzer, não por SemanticAnalyzer
+FORWARD = """function total(): number { return parcela(limite) + limite; }
+print(total());
+function parcela(n: number): number { return n * 2; }
+let limite: number = 5;
+"""
+
+
+def _check(incremental, program):
+    """Análise incremental igual à completa; retorna os statements reanalisados"""
+    errors = incremental.analyze(program)
+    full = TwoPhaseAnalyzer()
+    assert errors == full.analyze(program)
+    assert incremental.analyzer.errors == errors
+    assert global_tables(incremental.analyzer) == global_tables(full)
+    if not errors:
+        assert generate_jasmin(incremental.analyzer, program) == generate_jasmin(full, program)
+    return incremental.rechecked
+
+
+class TestSameResultAsFullAnalysis:
+    """Resultado incremental = análise completa"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples(self, example):
+        incremental = IncrementalAnalyzer()
+        program = parse_code(example.read_text(encoding="utf-8"))
+        _check(incremental, program)
+        assert _check(incremental, parse_code(example.read_text(encoding="utf-8"))) == []
+
+    @pytest.mark.parametrize("edit", EDITS, ids=lambda e: e[1][:30] or "remove")
+    def test_single_edits(self, edit):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(PROGRAM))
+        _check(incremental, parse_code(PROGRAM.replace(*edit, 1)))
+        assert _check(incremental, parse_code(PROGRAM)) is not None
+
+    def test_nested_functions(self):
+        code = ("function externa(): number { function interna(n: number): number { return n; } "
+                "return interna(1); }\n"
+                "function usa(): number { function outra(): number { return interna(2); } "
+                "return outra(); }\n"
+                "print(externa(), usa());\n")
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(code))
+        # usa é verificada de novo com a tabela em que externa registrou interna
+        assert _check(incremental, parse_code(code.replace("interna(n: number)",
+                                                           "interna(n: string)"))) == [0, 1]
+        for old, new in [("interna(n: number)", "interna(n: string)"), ("return n;", "return 2;"),
+                         ("print(", "\nprint(")]:
+            _check(incremental, parse_code(code.replace(old, new)))
+            _check(incremental, parse_code(code))
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_random_edit_sequences(self, seed):
+        rng = random.Random(seed)
+        incremental = IncrementalAnalyzer()
+        for _ in range(12):
+            code = PROGRAM
+            for old, new in rng.sample(EDITS, rng.randint(1, 3)):
+                code = code.replace(old, new, 1)
+            _check(incremental, parse_code(code))
+
+
+class TestWhatIsRechecked:
+    """Só o statement editado e os que dependem de uma assinatura alterada"""
+
+    def _index(self, program, prefix):
+        lines = program.splitlines()
+        return next(i for i, line in enumerate(lines) if line.startswith(prefix))
+
+    def test_body_edit_rechecks_one_function(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(PROGRAM))
+        rechecked = _check(incremental, parse_code(PROGRAM.replace(*EDITS[0])))
+        assert rechecked == [self._index(PROGRAM, "function dobro")]
+
+    def test_signature_edit_rechecks_callers(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(PROGRAM))
+        rechecked = _check(incremental, parse_code(PROGRAM.replace(*EDITS[2])))
+        assert rechecked == [self._index(PROGRAM, prefix) for prefix in
+                             ("function dobro", "function norma", "function vazio")]
+
+    def test_interface_shape_edit_rechecks_users(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(PROGRAM))
+        rechecked = _check(incremental, parse_code(PROGRAM.replace(*EDITS[3])))
+        # Linha e comprimento mudam porque Linha contém Ponto
+        assert 0 in rechecked and 1 in rechecked and self._index(PROGRAM, "function comprimento") in rechecked
+        assert self._index(PROGRAM, "function dobro") not in rechecked
+
+    def test_moved_statements_are_not_rechecked(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(PROGRAM.replace("const passos: number = 3;", "const passos: string = 3;")))
+        shifted = "\n\n" + PROGRAM.replace("const passos: number = 3;", "const passos: string = 3;")
+        assert _check(incremental, parse_code(shifted)) == []
+        assert all(error.line is not None for error in incremental.analyzer.errors)
+
+    def test_with_incremental_reparse(self):
+        source = parse_source(PROGRAM)
+        incremental = IncrementalAnalyzer()
+        _check(incremental, source.program)
+        offset = PROGRAM.index("n * 2") + len("n * ")
+        edited = reparse(source, offset, offset + 1, "5")
+        assert _check(incremental, edited.program) == [self._index(PROGRAM, "function dobro")]
+
+
+class TestForwardReferences:
+    """Funções chamadas e globais lidas antes da declaração, como em TwoPhaseAnalyzer"""
+
+    def _index(self, prefix):
+        return next(i for i, line in enumerate(FORWARD.splitlines()) if line.startswith(prefix))
+
+    def test_forward_call_and_global(self):
+        program = parse_code(FORWARD)
+        assert SemanticAnalyzer().analyze(program) != []
+        incremental = IncrementalAnalyzer()
+        assert _check(incremental, program) == list(range(4))
+        assert incremental.analyzer.errors == []
+        assert incremental.analyzer.call_graph["total"] == {"parcela"}
+
+    def test_later_signature_edit_rechecks_earlier_caller(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(FORWARD))
+        edited = FORWARD.replace("parcela(n: number): number", "parcela(n: number): string")
+        assert _check(incremental, parse_code(edited)) == [self._index("function total"),
+                                                            self._index("function parcela")]
+        assert [error.line for error in incremental.analyzer.errors] == [1, 3]
+
+    def test_later_global_edit_rechecks_function(self):
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(FORWARD))
+        edited = FORWARD.replace("let limite: number = 5;", 'let limite: string = "5";')
+        rechecked = _check(incremental, parse_code(edited))
+        assert self._index("function total") in rechecked
+        assert self._index("function parcela") not in rechecked
+        assert incremental.analyzer.errors != []
+
+    def test_top_level_read_before_declaration(self):
+        code = "print(limite);\n" + FORWARD
+        incremental = IncrementalAnalyzer()
+        _check(incremental, parse_code(code))
+        assert incremental.analyzer.errors[0].code == "undeclared-variable"
+        assert _check(incremental, parse_code("\n" + code)) == []
@@ -0,0 +1,79 @@
+"""
+Testes do fluxo de entrada compacto (TypeScriptInputStream) contra antlr4.FileStream.
+"""
+
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, FileStream, InputStream
+
+from TypeScriptInputStream import CompactFileStream, CompactInputStream, code_points
+from TypeScriptRegexLexer import create_lexer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+# Uma amostra por largura do buffer: latin-1, plano básico e fora dele
+TEXTS = {
+    "B": "let nome: string = \"ação\";\nprint(nome);\n",
+    "H": "let s: string = \"日本語\"; @\nprint(s);\n",
+    "I": "let s: string = \"a😀b\";\nprint(s); ´\n",
+}
+
+
+def _tokens(stream, kind="antlr"):
+    tokens = CommonTokenStream(create_lexer(stream, kind))
+    tokens.fill()
+    return [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in tokens.tokens]
+
+
+class TestCompactInputStream:
+    """Mesma interface e mesmos code points que InputStream"""
+
+    @pytest.mark.parametrize("width, text", TEXTS.items())
+    def test_code_points_and_width(self, width, text):
+        stream = CompactInputStream(text)
+        assert stream.data.format == width
+        assert list(stream.data) == InputStream(text).data
+        assert stream.size == len(text) and str(stream) == text
+
+    def test_stream_interface(self):
+        stream, reference = CompactInputStream(TEXTS["I"]), InputStream(TEXTS["I"])
+        for s in (stream, reference):
+            s.seek(20)
+            s.consume()
+        assert stream.index == reference.index == 21
+        assert [stream.LA(i) for i in (-2, -1, 1, 2)] == [reference.LA(i) for i in (-2, -1, 1, 2)]
+        assert stream.getText(16, 21) == reference.getText(16, 21)
+        stream.seek(10 ** 6)
+        assert stream.LA(1) == reference.LA(10 ** 6) == -1
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "vazio.txt"
+        path.write_bytes(b"")
+        assert CompactFileStream(str(path), encoding="utf-8").size == 0
+        assert len(code_points("")) == 0
+
+
+class TestCompactFileStream:
+    """Mesmos tokens que FileStream, nos dois lexers"""
+
+    @pytest.mark.parametrize("kind", ["antlr", "regex"])
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_same_tokens_as_file_stream(self, example, kind):
+        expected = _tokens(FileStream(str(example), encoding="utf-8"), kind)
+        assert _tokens(CompactFileStream(str(example), encoding="utf-8"), kind) == expected
+
+    @pytest.mark.parametrize("width", TEXTS)
+    def test_non_ascii_sources(self, tmp_path, width):
+        path = tmp_path / "fonte.txt"
+        path.write_text(TEXTS[width], encoding="utf-8")
+        stream = CompactFileStream(str(path), encoding="utf-8")
+        assert stream.fileName == str(path) and stream.data.format == width
+        assert _tokens(stream) == _tokens(FileStream(str(path), encoding="utf-8"))
+
+    def test_keeps_line_endings(self, tmp_path):
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"let x: number = 1;\r\nprint(x);\r\n")
+        assert CompactFileStream(str(path), encoding="utf-8").strdata.count("\r\n") == 2
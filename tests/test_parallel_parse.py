@@ -0,0 +1,134 @@
+"""
+Testes do parsing paralelo por statements de nível superior (TypeScriptParallelParse).
+"""
+
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+import TypeScriptParallelParse
+from main import compile_file, parse_program
+from TypeScriptAST import preorder
+from TypeScriptLowering import lower_program
+from TypeScriptParallelParse import parse_parallel, split_chunks, statement_offsets
+from TypeScriptRegexLexer import create_lexer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+# Vários statements na mesma linha, else após '}' e após ';', literal de objeto
+# seguido de ';' e de '.', comentários e strings com chaves
+TRICKY = (
+    "// início { não conta\n"
+    "let a: number = 1; let b: number = 2;\n"
+    "interface P { nome: string; preco: number; }\n"
+    "let p: P = { nome: \"}{\", preco: 2 };\n"
+    "function f(x: number): number { if (x > 0) { return 1; } else { return 2; } }\n"
+    "if (a > b) print(a); else print(b);\n"
+    "/* { */ while (a < 3) { a = a + 1; }   for (let i: number = 0; i < 2; i = i + 1) { print(i); }\n"
+    "{ let c: number = 3; print(c); }\n"
+    "print({ x: 1 }.x);\n"
+)
+
+# Um statement com 3000 níveis de parênteses, depois de outro na mesma linha
+DEEP = ("let a: number = 1; print(" + "(a + " * 3000 + "a" + ")" * 3000 + ");\n"
+        "print(a);\n")
+
+
+def _sequential(code, lexer_kind="antlr", expr_parser="pratt"):
+    tokens = CommonTokenStream(create_lexer(InputStream(code), lexer_kind))
+    tree, _ = parse_program(tokens, "auto", expr_parser)
+    return lower_program(tree)
+
+
+@pytest.fixture
+def one_statement_per_chunk(monkeypatch):
+    """Força blocos de um statement (o caso mais exigente para as posições)"""
+    monkeypatch.setattr(TypeScriptParallelParse, "CHUNKS_PER_JOB", 10 ** 6)
+
+
+class TestStatementScan:
+    """Limites dos statements de nível superior"""
+
+    def test_offsets(self):
+        code = "let a: number = 1; let b: number = 2;\nif (a) { a = 2; } else { a = 3; }\nprint(a);"
+        starts = [code[offset:offset + 5] for offset in statement_offsets(code)]
+        assert starts == ["let b", "if (a", "print"]
+
+    def test_continuations_are_not_split(self):
+        code = "if (a) print(a); else print(b);\nlet p: P = { x: 1 };\nprint({ x: 1 }.x);"
+        assert [code[o:o + 5] for o in statement_offsets(code)] == ["let p", "print"]
+
+    def test_chunks_keep_original_positions(self):
+        chunks = split_chunks(TRICKY, 10 ** 6)
+        assert "".join(text for text, _, _ in chunks) == TRICKY
+        lines = TRICKY.split("\n")
+        for text, line, column in chunks[1:]:
+            assert lines[line - 1][column:].startswith(text.split("\n")[0])
+
+
+class TestParallelParse:
+    """O Program montado a partir dos blocos é igual ao do parsing sequencial"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples(self, example, one_statement_per_chunk):
+        code = example.read_text(encoding="utf-8")
+        program, _, n_chunks = parse_parallel(code, 2)
+        assert n_chunks > 1
+        assert repr(program) == repr(_sequential(code))
+
+    @pytest.mark.parametrize("lexer_kind, expr_parser", [("antlr", "antlr"), ("regex", "pratt")])
+    def test_positions_on_shared_lines(self, lexer_kind, expr_parser, one_statement_per_chunk):
+        program, _, n_chunks = parse_parallel(TRICKY, 2, lexer_kind, expr_parser)
+        assert n_chunks == len(statement_offsets(TRICKY)) + 1
+        assert repr(program) == repr(_sequential(TRICKY, lexer_kind, expr_parser))
+        assert (program.body[1].line, program.body[1].column) == (2, 19)
+
+    def test_deep_nesting(self, one_statement_per_chunk):
+        program, _, n_chunks = parse_parallel(DEEP, 2)
+        assert n_chunks == 3
+
+        def shape(program):
+            return [(type(node), getattr(node, "line", None), getattr(node, "column", None))
+                    for node in preorder(program)]
+        assert shape(program) == shape(_sequential(DEEP))
+
+    def test_syntax_error_in_a_chunk(self, one_statement_per_chunk):
+        assert parse_parallel("let a: number = 1;\nlet b: number = ;\n", 2) is None
+
+
+class TestCompileParallel:
+    """compile_file com jobs > 1"""
+
+    def test_same_output(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text((PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8"),
+                          encoding="utf-8")
+        outputs = []
+        for jobs in (1, 2):
+            assert compile_file(str(source), jobs=jobs)
+            outputs.append((tmp_path / "Prog.j").read_text(encoding="utf-8"))
+        out = capsys.readouterr().out
+        assert "blocos em 2 processos" in out
+        assert outputs[0] == outputs[1]
+
+    def test_deep_nesting_same_output(self, tmp_path, capsys, one_statement_per_chunk):
+        source = tmp_path / "prog.txt"
+        source.write_text(DEEP, encoding="utf-8")
+        outputs = []
+        for jobs in (1, 2):
+            assert compile_file(str(source), jobs=jobs)
+            outputs.append((tmp_path / "Prog.j").read_text(encoding="utf-8"))
+        assert "blocos em 2 processos" in capsys.readouterr().out
+        assert outputs[0] == outputs[1]
+
+    def test_errors_come_from_sequential_parse(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text("let a: number = 1;\nfunction f(): void { let b: number = ; }\n",
+                          encoding="utf-8")
+        assert not compile_file(str(source), jobs=2)
+        out = capsys.readouterr().out
+        assert "refazendo o parsing sequencial" in out
+        assert "Linha 2:37" in out
@@ -0,0 +1,113 @@
+"""
+Testes da análise semântica em duas fases (TypeScriptParallelSemantic).
+
+Os corpos de função são verificados no próprio processo (jobs=1) e em um pool de
+processos com uma função por bloco; os resultados são comparados entre si e com
+os do SemanticAnalyzer.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import TypeScriptParallelSemantic
+from main import compile_file
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer
+from TypeScriptSemantic import SemanticAnalyzer
+from .compiler_utils import generate_jasmin, global_tables, parse_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+# Erros de tipo em corpos, assinaturas e no código de nível superior
+WITH_ERRORS = """interface P { n: number; }
+function a(x: number): number { return x + "s"; }
+function b(p: P): string { let k: number = p.m; return "b"; }
+let g: number = "g";
+function a(): void { print(a); }
+function c(q: Q): boolean { if (q) { return 1; } }
+print(b({ n: 1 }));
+function d(): number { let z: string = 1; }
+"""
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    """Pool de processos mesmo para poucas funções, com uma função por bloco"""
+    monkeypatch.setattr(TypeScriptParallelSemantic, "MIN_PARALLEL_FUNCTIONS", 1)
+    monkeypatch.setattr(TypeScriptParallelSemantic, "CHUNKS_PER_JOB", 10 ** 6)
+
+
+class TestSameResultAsSinglePass:
+    """Sem referências adiante, o resultado é o do SemanticAnalyzer"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_examples(self, example, jobs, parallel):
+        program = parse_code(example.read_text(encoding="utf-8"))
+        full = SemanticAnalyzer()
+        errors = full.analyze(program)
+        analyzer = TwoPhaseAnalyzer(jobs)
+        assert analyzer.analyze(program) == errors
+        assert global_tables(analyzer) == global_tables(full)
+        if not errors:
+            assert generate_jasmin(analyzer, program) == generate_jasmin(full, program)
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_errors_in_source_order(self, jobs, parallel):
+        program = parse_code(WITH_ERRORS)
+        errors = TwoPhaseAnalyzer(jobs).analyze(program)
+        assert errors == SemanticAnalyzer().analyze(program)
+        lines = [error.line for error in errors]
+        assert lines == sorted(lines) and set(lines) == {2, 3, 4, 5, 6, 8}
+
+    def test_without_fork(self, parallel, monkeypatch):
+        monkeypatch.setattr(TypeScriptParallelSemantic, "FORK", False)
+        monkeypatch.setattr(TypeScriptParallelSemantic, "_CONTEXT", None)
+        program = parse_code(WITH_ERRORS)
+        assert TwoPhaseAnalyzer(2).analyze(program) == SemanticAnalyzer().analyze(program)
+
+    def test_nested_functions(self, parallel):
+        code = ("function f(): number { function g(): number { return 1; } return g(); }\n"
+                "function h(): number { return 2; }\n"
+                "function k(): void { function g(): void { } }\n"
+                "print(g());\n")
+        program = parse_code(code)
+        full = SemanticAnalyzer()
+        errors = full.analyze(program)
+        analyzer = TwoPhaseAnalyzer(2)
+        assert analyzer.analyze(program) == errors
+        assert any(str(error).endswith("Função 'g' já declarada") for error in errors)
+        assert global_tables(analyzer) == global_tables(full)
+
+
+class TestDeclarationsFirst:
+    """Funções, interfaces e globais declaradas mais adiante no arquivo"""
+
+    CODE = ("print(dobro(2));\n"
+            "function quadruplo(x: number): number { return dobro(dobro(x)) + base; }\n"
+            "function dobro(x: number): number { return x * fator(); }\n"
+            "function fator(): number { return 2; }\n"
+            "function nome(p: Pessoa): string { return p.nome; }\n"
+            "interface Pessoa { nome: string; }\n"
+            "let base: number = quadruplo(1);\n")
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_later_declarations_resolve(self, jobs, parallel):
+        analyzer = TwoPhaseAnalyzer(jobs)
+        assert analyzer.analyze(parse_code(self.CODE)) == []
+        assert analyzer.call_graph["quadruplo"] == {"dobro"}
+        assert analyzer.call_graph["dobro"] == {"fator"}
+        assert SemanticAnalyzer().analyze(parse_code(self.CODE)) != []
+
+    def test_top_level_code_still_runs_in_order(self):
+        errors = TwoPhaseAnalyzer().analyze(parse_code("let y: number = x;\nlet x: number = 1;\n"))
+        assert str(errors[0]) == "Linha 1:16 - Variável 'x' não declarada"
+
+    def test_compile_file(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text(self.CODE.replace("print(dobro(2));\n", "")
+                          + "print(dobro(base));\n", encoding="utf-8")
+        assert compile_file(str(source), jobs=2)
+        assert "invokestatic Prog/dobro(I)I" in (tmp_path / "Prog.j").read_text(encoding="utf-8")
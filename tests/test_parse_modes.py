@@ -0,0 +1,74 @@
+"""
+Testes das estratégias de predição do parser (SLL → LL em dois estágios).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, FileStream, InputStream
+
+from main import parse_program
+from TypeScriptLexer import TypeScriptLexer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt"))
+
+
+def _tokens_from_file(path):
+    return CommonTokenStream(TypeScriptLexer(FileStream(str(path), encoding="utf-8")))
+
+
+def _tokens_from_text(code):
+    return CommonTokenStream(TypeScriptLexer(InputStream(code)))
+
+
+class TestTwoStageParsing:
+    """Parsing SLL com fallback para LL"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples_take_sll_path(self, example):
+        """Exemplos válidos devem ser resolvidos apenas com SLL"""
+        tree, path = parse_program(_tokens_from_file(example))
+        assert path == "SLL"
+        assert tree.exception is None
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_all_modes_build_same_tree(self, example):
+        """SLL, LL e auto devem produzir a mesma árvore"""
+        trees = set()
+        for mode in ("auto", "sll", "ll"):
+            tree, _ = parse_program(_tokens_from_file(example), mode)
+            trees.add(tree.toStringTree(recog=tree.parser))
+        assert len(trees) == 1
+
+    def test_forced_ll_mode(self):
+        """--parse-mode=ll deve usar apenas LL"""
+        _, path = parse_program(_tokens_from_text("let x: number = 1;"), "ll")
+        assert path == "LL"
+
+    def test_syntax_error_falls_back_to_ll(self, capsys):
+        """Erro de sintaxe no SLL deve reiniciar com LL e relatar o erro uma vez"""
+        tree, path = parse_program(_tokens_from_text("let x: number = ;"))
+        assert path == "SLL→LL"
+        assert tree.parser.getNumberOfSyntaxErrors() == 1
+        assert capsys.readouterr().err.count("mismatched input") == 1
+
+    def test_invalid_mode(self):
+        """Modo desconhecido deve ser rejeitado"""
+        with pytest.raises(ValueError):
+            parse_program(_tokens_from_text("let x: number = 1;"), "lalr")
+
+    def test_cli_reports_parse_path(self):
+        """main.py deve informar o caminho de predição usado"""
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--parse-mode=ll", "--no-cache",
+             str(PROJECT_ROOT / "exemplo_1.txt")],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 0, f"Erro compilando: {result.stdout}\n{result.stderr}"
+        assert "predição: LL" in result.stdout
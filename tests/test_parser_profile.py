@@ -0,0 +1,103 @@
+"""
+Testes do perfil de decisões do parser (TypeScriptParserProfiler e --profile-parser).
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+from main import parse_program
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptParser import TypeScriptParser
+from TypeScriptParserProfiler import ProfilingATNSimulator, decision_report, format_table
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# if aninhado com else: a decisão do else (ifStmt) é ambígua e exige LL completo
+DANGLING_ELSE = "let a: boolean = true;\nif (a) if (a) print(1); else print(2);\n"
+
+
+def _profile(code, parse_mode="ll", expr_parser="pratt"):
+    tokens = CommonTokenStream(TypeScriptLexer(InputStream(code)))
+    tree, _ = parse_program(tokens, parse_mode, expr_parser, profile=True)
+    assert isinstance(tree.parser._interp, ProfilingATNSimulator)
+    return tree, {row["rule"]: row for row in decision_report(tree.parser._interp)}
+
+
+class TestProfilingSimulator:
+    """Estatísticas por decisão"""
+
+    def test_dangling_else_falls_back_to_ll(self):
+        _, rows = _profile(DANGLING_ELSE)
+        if_stmt = rows["ifStmt"]
+        assert if_stmt["invocations"] == 2
+        assert if_stmt["ll_fallback"] == 1 and if_stmt["ambiguities"] == 1
+        assert if_stmt["ll_max_look"] > if_stmt["sll_max_look"] >= 1
+        assert if_stmt["ll_atn_transitions"] > 0
+
+    def test_sll_mode_has_no_fallbacks(self):
+        _, rows = _profile(DANGLING_ELSE, "sll")
+        assert rows["ifStmt"]["ll_fallback"] == 0
+
+    def test_decisions_mapped_to_rules(self):
+        _, rows = _profile(DANGLING_ELSE)
+        assert set(rows) <= set(TypeScriptParser.ruleNames)
+        assert rows["statement"]["invocations"] == 5
+        assert all(row["time_ms"] > 0 for row in rows.values())
+
+    @pytest.mark.parametrize("expr_parser", ["pratt", "antlr"])
+    def test_same_tree_as_without_profiling(self, expr_parser):
+        code = (PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8")
+        tree, _ = _profile(code, "auto", expr_parser)
+        plain, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))),
+                                 "auto", expr_parser)
+        assert tree.toStringTree(recog=tree.parser) == plain.toStringTree(recog=plain.parser)
+
+    def test_table(self):
+        _, rows = _profile(DANGLING_ELSE)
+        table = format_table(sorted(rows.values(), key=lambda row: -row["time_ms"]))
+        assert table.splitlines()[0].startswith("Perfil do parser")
+        assert "ifStmt" in table and "statement" in table
+
+
+class TestProfileCli:
+    """--profile-parser imprime a tabela e grava o JSON"""
+
+    def test_cli_writes_json(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text(DANGLING_ELSE, encoding="utf-8")
+        report = tmp_path / "profile.json"
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--parse-mode=ll",
+             f"--profile-output={report}", str(source)],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Perfil do parser" in result.stdout
+        assert "Cache de programas" not in result.stdout  # o parsing precisa acontecer
+
+        data = json.loads(report.read_text(encoding="utf-8"))
+        assert (data["parse_mode"], data["prediction"]) == ("ll", "LL")
+        by_rule = {row["rule"]: row for row in data["decisions"]}
+        assert by_rule["ifStmt"]["ll_fallback"] == 1
+
+    def test_flag_before_source(self, tmp_path):
+        # --profile-parser não consome o argumento seguinte (o arquivo fonte)
+        source = tmp_path / "prog.txt"
+        source.write_text(DANGLING_ELSE, encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--profile-parser", str(source)],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Perfil do parser" in result.stdout
+        assert "statement" in result.stdout
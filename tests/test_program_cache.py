@@ -0,0 +1,145 @@
+"""
+Testes do cache persistente de programas analisados (TypeScriptProgramCache).
+"""
+
+import marshal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+import TypeScriptProgramCache
+from main import compile_file
+from TypeScriptAST import preorder
+from TypeScriptProgramCache import ProgramCache, decode, encode, source_key
+from .compiler_utils import parse_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+
+def _compile(tmp_path, code, capsys, cache_dir=None):
+    """Compila `code` com o cache em cache_dir; retorna (sucesso, stdout)"""
+    source = tmp_path / "prog.txt"
+    source.write_text(code, encoding="utf-8")
+    ok = compile_file(str(source), program_cache=str(cache_dir or tmp_path / "cache"))
+    return ok, capsys.readouterr().out
+
+
+class TestSerialization:
+    """encode/decode do AST"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_roundtrip(self, example):
+        program = parse_code(example.read_text(encoding="utf-8"))
+        loaded = decode(marshal.loads(marshal.dumps(encode(program))))
+        assert repr(loaded) == repr(program)
+
+    def test_deep_program(self):
+        depth = 10_000
+        assert sys.getrecursionlimit() < depth
+        program = parse_code("let a: number = 1;\nprint(" + "(a + " * depth + "a" + ")" * depth + ");")
+        loaded = decode(marshal.loads(marshal.dumps(encode(program))))
+        shape = [(type(node), getattr(node, "line", None), getattr(node, "column", None))
+                 for node in preorder(program)]
+        assert [(type(node), getattr(node, "line", None), getattr(node, "column", None))
+                for node in preorder(loaded)] == shape
+        assert len(shape) > 2 * depth
+
+    def test_names_stay_interned(self):
+        program = decode(marshal.loads(marshal.dumps(encode(parse_code("let abc: number = 1;")))))
+        assert program.body[0].name is sys.intern("abc")
+
+
+class TestProgramCache:
+    """Acertos, falhas, invalidação e limite de tamanho"""
+
+    CODE = "let x: number = 1;\nprint(x + 2);\n"
+
+    def test_hit_skips_lexer_and_parser(self, tmp_path, capsys, monkeypatch):
+        ok, out = _compile(tmp_path, self.CODE, capsys)
+        assert ok and "Cache de programas: falha (acertos: 0, falhas: 1)" in out
+        assert "Parsing concluído" in out
+        first = (tmp_path / "Prog.j").read_text(encoding="utf-8")
+
+        def no_parse(*args):
+            raise AssertionError("lexer/parser não deveriam ser executados")
+        monkeypatch.setattr(main, "_parse_file", no_parse)
+
+        ok, out = _compile(tmp_path, self.CODE, capsys)
+        assert ok and "Cache de programas: acerto (acertos: 1, falhas: 1)" in out
+        assert "Parsing concluído" not in out
+        assert (tmp_path / "Prog.j").read_text(encoding="utf-8") == first
+
+    def test_deep_program_is_cached(self, tmp_path, capsys):
+        code = "let a: number = 1;\nprint(" + "(a + " * 3000 + "a" + ")" * 3000 + ");\n"
+        ok, out = _compile(tmp_path, code, capsys)
+        assert ok and "falha (acertos: 0, falhas: 1)" in out
+        first = (tmp_path / "Prog.j").read_text(encoding="utf-8")
+        ok, out = _compile(tmp_path, code, capsys)
+        assert ok and "acerto (acertos: 1, falhas: 1)" in out
+        assert (tmp_path / "Prog.j").read_text(encoding="utf-8") == first
+
+    def test_semantic_errors_reported_on_hit(self, tmp_path, capsys):
+        code = "let x: number = \"a\";\n"
+        _, first = _compile(tmp_path, code, capsys)
+        ok, second = _compile(tmp_path, code, capsys)
+        assert not ok and "acerto" in second
+        assert first.split("ERROS ENCONTRADOS")[1] == second.split("ERROS ENCONTRADOS")[1]
+
+    def test_syntax_errors_are_not_cached(self, tmp_path, capsys):
+        code = "let x: number = (1 + 2;\n"
+        _compile(tmp_path, code, capsys)
+        _, out = _compile(tmp_path, code, capsys)
+        assert "falha (acertos: 0, falhas: 2)" in out
+        assert ProgramCache(str(tmp_path / "cache")).index["entries"] == {}
+
+    def test_compiler_key_change_invalidates(self, tmp_path, capsys, monkeypatch):
+        _compile(tmp_path, self.CODE, capsys)
+        monkeypatch.setattr(TypeScriptProgramCache, "_compiler_key", "0" * 64)
+        _, out = _compile(tmp_path, self.CODE, capsys)
+        assert "falha" in out
+
+    def test_corrupt_entry_is_discarded(self, tmp_path, capsys):
+        cache_dir = tmp_path / "cache"
+        _compile(tmp_path, self.CODE, capsys)
+        for entry in cache_dir.glob("*.bin"):
+            if entry.name != "index.bin":
+                entry.write_bytes(entry.read_bytes()[:10])
+        ok, out = _compile(tmp_path, self.CODE, capsys)
+        assert ok and "falha (acertos: 0, falhas: 2)" in out
+        ok, out = _compile(tmp_path, self.CODE, capsys)
+        assert "acerto" in out
+
+    def test_lru_eviction(self, tmp_path):
+        programs = {name: parse_code(f"let {name}: number = 1;") for name in ("a", "b", "c", "d")}
+        keys = {name: source_key(name.encode()) for name in programs}
+        size = len(marshal.dumps({"key": keys["a"], "program": encode(programs["a"])}))
+
+        cache = ProgramCache(str(tmp_path), max_bytes=3 * size)
+        for name in ("a", "b", "c"):
+            assert cache.put(keys[name], programs[name])
+        assert cache.get(keys["a"]) is not None  # "a" passa a ser o mais recente
+        cache.put(keys["d"], programs["d"])
+
+        reloaded = ProgramCache(str(tmp_path), max_bytes=3 * size)
+        assert set(reloaded.index["entries"]) == {keys["a"], keys["c"], keys["d"]}
+        assert not (tmp_path / f"{keys['b']}.bin").exists()
+        assert reloaded.total_bytes <= 3 * size
+        assert reloaded.get(keys["b"]) is None
+
+    def test_cli_no_cache(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text(self.CODE, encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--no-cache", str(source)],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 0, result.stdout
+        assert "Cache de programas" not in result.stdout
+        assert "Parsing concluído" in result.stdout
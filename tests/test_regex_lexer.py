@@ -0,0 +1,121 @@
+"""
+Testes de conformidade do lexer por regex (TypeScriptRegexLexer) com o TypeScriptLexer gerado.
+"""
+
+import random
+import string
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from main import parse_program
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptRegexLexer import TypeScriptRegexLexer, create_lexer
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt"))
+
+# Fragmentos usados para gerar entradas aleatórias (inclui casos de erro do lexer)
+FRAGMENTS = [
+    "let", "const", "function", "if", "else", "while", "for", "interface", "return",
+    "number", "string", "boolean", "void", "true", "false", "truex", "letter", "_id", "x1",
+    "0", "42", "3.14", "1.", ".5", "=", "==", "!", "!=", "<", "<=", ">", ">=", "&&", "&",
+    "||", "|", "+", "-", "*", "/", "%", "{", "}", "(", ")", "[", "]", ";", ":", ",", ".",
+    "\"", "'", "\"ab\\\"c\"", "'x\\'y'", "\\", "//", "/*", "*/", " ", "  ", "\t", "\n",
+    "\r\n", "@", "#", "ç", "é", "$",
+]
+
+
+class _CollectErrors(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def _lex(lexer_class, text):
+    lexer = lexer_class(InputStream(text))
+    lexer.removeErrorListeners()
+    listener = _CollectErrors()
+    lexer.addErrorListener(listener)
+    tokens = CommonTokenStream(lexer)
+    tokens.fill()
+    fields = [(t.type, t.text, t.line, t.column, t.start, t.stop, t.tokenIndex, t.channel)
+              for t in tokens.tokens]
+    return fields, listener.errors
+
+
+def _assert_same_tokens(text):
+    expected = _lex(TypeScriptLexer, text)
+    actual = _lex(TypeScriptRegexLexer, text)
+    assert actual == expected, f"Divergência para {text!r}"
+
+
+class TestRegexLexerConformance:
+    """O lexer por regex deve ser indistinguível do lexer gerado"""
+
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_examples(self, example):
+        """Mesmos tokens e posições em todos os exemplo_*.txt"""
+        _assert_same_tokens(example.read_text(encoding="utf-8"))
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_random_input(self, seed):
+        """Mesmos tokens, posições e erros em entradas aleatórias"""
+        rng = random.Random(seed)
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 60)))
+        _assert_same_tokens(text)
+
+    @pytest.mark.parametrize("seed", range(100))
+    def test_random_characters(self, seed):
+        """Mesmo comportamento para sequências arbitrárias de caracteres"""
+        rng = random.Random(seed)
+        alphabet = string.printable + "çé€\u00a0"
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        _assert_same_tokens(text)
+
+    @pytest.mark.parametrize("text", [
+        "", "   ", "\"sem fim", "'sem fim\\", "/* sem fim", "a &", "a |\n|b",
+        "x = \"multi\nlinha\"; y", "// só comentário",
+    ])
+    def test_edge_cases(self, text):
+        """Entradas vazias, strings/comentários sem fechamento e erros no fim"""
+        _assert_same_tokens(text)
+
+    def test_parses_same_tree(self):
+        """Parser alimentado pelo lexer por regex produz a mesma árvore"""
+        source = (PROJECT_ROOT / "exemplo_estoque.txt").read_text(encoding="utf-8")
+        trees = []
+        for kind in ("antlr", "regex"):
+            tokens = CommonTokenStream(create_lexer(InputStream(source), kind))
+            tree, _ = parse_program(tokens)
+            trees.append(tree.toStringTree(recog=tree.parser))
+        assert trees[0] == trees[1]
+
+    def test_unknown_lexer_kind(self):
+        with pytest.raises(ValueError):
+            create_lexer(InputStream(""), "lalr")
+
+    def test_cli_flag_generates_same_jasmin(self, tmp_path):
+        """main.py --lexer=regex deve gerar o mesmo código Jasmin"""
+        source = tmp_path / "exemplo_estoque.txt"
+        source.write_text((PROJECT_ROOT / "exemplo_estoque.txt").read_text(encoding="utf-8"),
+                          encoding="utf-8")
+        outputs = []
+        for kind in ("antlr", "regex"):
+            result = subprocess.run(
+                [sys.executable, str(PROJECT_ROOT / "main.py"), f"--lexer={kind}", "--no-cache",
+                 str(source)],
+                capture_output=True,
+                text=True,
+                cwd=str(PROJECT_ROOT)
+            )
+            assert result.returncode == 0, f"Erro compilando: {result.stdout}\n{result.stderr}"
+            outputs.append((tmp_path / "Exemplo_estoque.j").read_text(encoding="utf-8"))
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,65 @@
+"""
+Testes de escala: expressões longas e muitos símbolos em tempo linear.
+
+As medições de crescimento ficam em benchmarks/bench_scaling.py; aqui são
+conferidos o resultado em entradas grandes e a ausência dos caminhos que
+custavam proporcional ao número de símbolos por identificador.
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+from main import parse_program
+from TypeScriptJasminGenerate import JasminGenerator
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptLowering import lower_program
+from TypeScriptSemantic import SemanticAnalyzer, SymbolTable
+
+
+N = 5000
+
+
+def _compile(code):
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    program = lower_program(tree)
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(program)
+    generator = JasminGenerator(analyzer, "Escala")
+    generator.visit(program)
+    return errors, generator.get_result()
+
+
+class TestLongInputs:
+    """Expressões e programas grandes"""
+
+    def test_long_sum(self):
+        errors, code = _compile("let a: number = 1;\nlet r: number = " + " + ".join(["a"] * N) + ";\n")
+        assert errors == [] and code.count("iadd") == N - 1
+
+    def test_print_with_many_arguments(self):
+        errors, code = _compile('let a: number = 1;\nprint(' + ", ".join(['a', '"s"'] * (N // 2)) + ");\n")
+        assert errors == []
+        assert code.count("append(I)") == N // 2
+        assert code.count("append(Ljava/lang/String;)") == N // 2 + N - 1
+
+    def test_long_member_chain(self):
+        interfaces = "interface I0 { v: number; }\n" + "".join(
+            f"interface I{i} {{ p: I{i - 1}; }}\n" for i in range(1, N))
+        errors, _ = _compile(interfaces + f"let o: I{N - 1};\nprint(o{'.p' * (N - 1)}.v);\n")
+        assert errors == []
+
+    def test_many_globals(self):
+        code = "let v0: number = 0;\n" + "".join(
+            f"let v{i}: number = v{i - 1} + 1;\n" for i in range(1, N))
+        errors, jasmin = _compile(code + f"v0 = v{N - 1};\n")
+        assert errors == [] and jasmin.count("istore ") == N + 1
+
+
+class TestNoPerIdentifierScopeCopies:
+    """Identificadores são resolvidos sem montar o dicionário com todos os escopos"""
+
+    def test_identifiers_do_not_use_merged_scopes(self, monkeypatch):
+        monkeypatch.setattr(SymbolTable, "vars", property(lambda self: pytest.fail("vars")))
+        errors, _ = _compile(
+            "const c: number = 1;\nlet x: number = c;\n{ let y: number = x; y = c; }\nc = 2;\n")
+        assert list(map(str, errors)) == ["Linha 4:0 - Não é possível reatribuir variável const 'c'"]
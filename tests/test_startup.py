@@ -0,0 +1,51 @@
+"""
+Testes da inicialização sob demanda de main.py (--startup-report e importações adiadas).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Compila sys.argv[1] com o cache em sys.argv[2] e informa se o ANTLR foi carregado
+_COMPILE_SCRIPT = """
+import sys
+import main
+ok = main.compile_file(sys.argv[1], program_cache=sys.argv[2])
+print("ANTLR:", "antlr4" in sys.modules, "TypeScriptParser" in sys.modules, ok)
+"""
+
+
+def _run(*args):
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                            cwd=str(PROJECT_ROOT))
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+class TestLazyStartup:
+    """Módulos pesados só são importados quando necessários"""
+
+    def test_importing_main_does_not_load_antlr(self):
+        out = _run("-c", "import sys, main; print(sorted(m for m in ('antlr4', "
+                         "'TypeScriptParser', 'TypeScriptSemantic') if m in sys.modules))")
+        assert out.strip() == "[]"
+
+    def test_cache_hit_does_not_load_antlr(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text("let x: number = 1;\nprint(x);\n", encoding="utf-8")
+        cache = str(tmp_path / "cache")
+
+        assert "ANTLR: True True True" in _run("-c", _COMPILE_SCRIPT, str(source), cache)
+        assert "ANTLR: False False True" in _run("-c", _COMPILE_SCRIPT, str(source), cache)
+
+    def test_startup_report(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text("print(1);\n", encoding="utf-8")
+        out = _run(str(PROJECT_ROOT / "main.py"), "--no-cache", "--startup-report", str(source))
+        report = out[out.index("Tempo de inicialização"):]
+        for module in ("antlr4", "TypeScriptLexer", "TypeScriptParser", "TypeScriptSemantic",
+                       "TypeScriptJasminGenerate", "total das importações"):
+            assert module in report
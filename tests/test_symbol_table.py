@@ -0,0 +1,123 @@
+"""
+Testes da tabela de símbolos com escopos encadeados (SymbolTable).
+"""
+
+import random
+
+import pytest
+
+from TypeScriptSemantic import PrimitiveType, SymbolTable, VarSymbol
+
+
+class MergedScopes:
+    """Implementação anterior, usada como referência: vars junta todos os escopos"""
+
+    def __init__(self):
+        self.global_vars = {}
+        self.scope_stack = []
+
+    @property
+    def vars(self):
+        result = self.global_vars.copy()
+        for scope in self.scope_stack:
+            result.update(scope)
+        return result
+
+    def push_scope(self):
+        self.scope_stack.append({})
+
+    def pop_scope(self):
+        if self.scope_stack:
+            self.scope_stack.pop()
+
+    def define_var(self, name, symbol, is_block_local=False):
+        if is_block_local and self.scope_stack:
+            self.scope_stack[-1][name] = symbol
+        else:
+            self.global_vars[name] = symbol
+
+    def get_var(self, name):
+        for scope in reversed(self.scope_stack):
+            if name in scope:
+                return scope[name]
+        return self.global_vars.get(name)
+
+    def var_exists_in_current_scope(self, name):
+        return name in (self.scope_stack[-1] if self.scope_stack else self.global_vars)
+
+
+def _var(name):
+    return VarSymbol(name, PrimitiveType("number"))
+
+
+class TestShadowing:
+    """Declarações em blocos escondem as de fora até o fim do bloco"""
+
+    def test_block_hides_global_until_pop(self):
+        table = SymbolTable()
+        outer, inner = _var("x"), _var("x")
+        table.define_var("x", outer)
+        table.push_scope()
+        table.define_var("x", inner, is_block_local=True)
+        assert table.get_var("x") is inner and table.global_vars["x"] is outer
+        table.pop_scope()
+        assert table.get_var("x") is outer
+
+    def test_nested_blocks(self):
+        table = SymbolTable()
+        first, second = _var("y"), _var("y")
+        table.push_scope()
+        table.define_var("y", first, is_block_local=True)
+        table.push_scope()
+        table.define_var("y", second, is_block_local=True)
+        table.define_var("y", _var("y"), is_block_local=True)
+        table.pop_scope()
+        assert table.get_var("y") is first
+        table.pop_scope()
+        assert table.get_var("y") is None and "y" not in table.vars
+
+    def test_global_defined_inside_a_block(self):
+        table = SymbolTable()
+        local, late = _var("z"), _var("z")
+        table.push_scope()
+        table.define_var("z", local, is_block_local=True)
+        table.define_var("z", late)
+        assert table.get_var("z") is local
+        table.pop_scope()
+        assert table.get_var("z") is late
+
+    def test_vars_is_a_read_only_view(self):
+        table = SymbolTable()
+        table.define_var("a", _var("a"))
+        view = table.vars
+        table.define_var("b", _var("b"))
+        assert set(view) == {"a", "b"}
+        with pytest.raises(TypeError):
+            view["c"] = _var("c")
+
+
+class TestAgainstMergedScopes:
+    """Mesmas respostas da implementação anterior em sequências aleatórias"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_operations(self, seed):
+        rng = random.Random(seed)
+        table, reference = SymbolTable(), MergedScopes()
+        names = [f"v{i}" for i in range(6)]
+        for _ in range(2000):
+            action = rng.random()
+            if action < 0.15:
+                table.push_scope()
+                reference.push_scope()
+            elif action < 0.3:
+                table.pop_scope()
+                reference.pop_scope()
+            elif action < 0.65:
+                name, symbol, local = rng.choice(names), _var("v"), rng.random() < 0.7
+                table.define_var(name, symbol, is_block_local=local)
+                reference.define_var(name, symbol, is_block_local=local)
+            name = rng.choice(names)
+            assert table.get_var(name) is reference.get_var(name)
+            assert (table.var_exists_in_current_scope(name)
+                    == reference.var_exists_in_current_scope(name))
+            assert dict(table.vars) == reference.vars
@@ -0,0 +1,118 @@
+"""
+Testes da coleta de erros de sintaxe (TypeScriptSyntaxErrors) e do modo fail-fast.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+import main
+from main import compile_file, parse_program
+from TypeScriptRegexLexer import create_lexer
+from TypeScriptSyntaxErrors import SyntaxErrorCollector, SyntaxErrorLimit
+from .compiler_utils import compile_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Três erros de sintaxe (um léxico) e um erro semântico (q não declarada)
+BROKEN = "let x: number = ;\nlet y: number = @ 2;\nlet z: number = (1 + ;\nprint(q);\n"
+EXPECTED = [
+    "Linha 1:16 - mismatched input ';' expecting",
+    "Linha 2:16 - token recognition error at: '@'",
+    "Linha 3:21 - mismatched input ';' expecting",
+]
+
+
+def _collect(code, max_errors=0, lexer_kind="antlr", parse_mode="auto"):
+    errors = SyntaxErrorCollector(max_errors)
+    lexer = create_lexer(InputStream(code), lexer_kind)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    try:
+        parse_program(CommonTokenStream(lexer), parse_mode, "pratt", errors)
+    except SyntaxErrorLimit:
+        pass
+    return errors.messages()
+
+
+def _compile(tmp_path, code, capsys, **kwargs):
+    source = tmp_path / "prog.txt"
+    source.write_text(code, encoding="utf-8")
+    ok = compile_file(str(source), **kwargs)
+    return ok, capsys.readouterr()
+
+
+class TestSyntaxErrorCollector:
+    """Coleta, formato e limite de erros"""
+
+    @pytest.mark.parametrize("lexer_kind", ["antlr", "regex"])
+    def test_all_errors_in_semantic_format(self, lexer_kind, capsys):
+        messages = _collect(BROKEN, lexer_kind=lexer_kind)
+        assert len(messages) == len(EXPECTED)
+        assert all(m.startswith(e) for m, e in zip(messages, EXPECTED))
+        assert capsys.readouterr().err == ""  # nada do ConsoleErrorListener
+
+    @pytest.mark.parametrize("max_errors", [1, 2])
+    def test_limit_stops_parsing(self, max_errors):
+        messages = _collect(BROKEN, max_errors)
+        assert len(messages) == max_errors
+        assert all(m.startswith(e) for m, e in zip(messages, EXPECTED))
+
+    @pytest.mark.parametrize("parse_mode", ["auto", "sll", "ll"])
+    def test_fail_fast_in_every_parse_mode(self, parse_mode):
+        assert len(_collect(BROKEN, 1, parse_mode=parse_mode)) == 1
+
+    def test_valid_program_has_no_errors(self):
+        assert _collect("let x: number = 1;\nprint(x);\n") == []
+
+    def test_const_without_initializer_message(self):
+        """A gramática exige '=' em const: o erro mantém a mensagem da semântica"""
+        assert _collect("const x: number;") == [
+            "Linha 1:0 - Variável const 'x' deve ser inicializada na declaração"]
+
+
+class TestCompileWithSyntaxErrors:
+    """compile_file não executa semântica nem geração de código após erros de sintaxe"""
+
+    def test_semantics_and_codegen_skipped(self, tmp_path, capsys, monkeypatch):
+        def no_semantics():
+            raise AssertionError("a análise semântica não deveria ser executada")
+        monkeypatch.setattr(main._load("TypeScriptSemantic"), "SemanticAnalyzer", no_semantics)
+
+        ok, captured = _compile(tmp_path, BROKEN, capsys)
+        assert not ok
+        assert "erros de sintaxe" in captured.out
+        assert "q' não declarada" not in captured.out
+        assert not (tmp_path / "Prog.j").exists()
+        assert captured.err == ""
+
+    def test_fail_fast(self, tmp_path, capsys):
+        ok, captured = _compile(tmp_path, BROKEN, capsys, max_syntax_errors=1)
+        assert not ok
+        assert "interrompido no 1º erro de sintaxe" in captured.out
+        assert EXPECTED[0] in captured.out and "Linha 2:16" not in captured.out
+
+    def test_errors_reported_like_semantic_errors(self):
+        """compile_code extrai os erros de sintaxe da mesma seção dos semânticos"""
+        success, errors = compile_code(BROKEN)
+        assert not success
+        assert len(errors) == len(EXPECTED)
+        assert all(str(err).startswith(e) for err, e in zip(errors, EXPECTED))
+
+    def test_cli_fail_fast(self, tmp_path):
+        source = tmp_path / "prog.txt"
+        source.write_text(BROKEN, encoding="utf-8")
+        result = subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "main.py"), "--no-cache", "--fail-fast",
+             str(source)],
+            capture_output=True,
+            text=True,
+            cwd=str(PROJECT_ROOT)
+        )
+        assert result.returncode == 1
+        assert result.stdout.count("  - Linha") == 1
+        assert result.stderr == ""
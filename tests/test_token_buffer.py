@@ -0,0 +1,92 @@
+"""
+Testes do buffer de tokens em arrays paralelos (TypeScriptTokenBuffer).
+"""
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+from main import compile_file, parse_program
+from TypeScriptLowering import lower_program
+from TypeScriptRegexLexer import create_lexer
+from TypeScriptSyntaxErrors import SyntaxErrorCollector
+from TypeScriptTokenBuffer import CompactTokenStream, TokenView
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+BROKEN = "let x: number = ;\nlet y: number = @ 2;\nif (x > ) { print(\"a\nb\"); }\n"
+
+
+def _parse(stream_class, code, lexer_kind="antlr", expr_parser="pratt"):
+    errors = SyntaxErrorCollector()
+    lexer = create_lexer(InputStream(code), lexer_kind)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    tokens = stream_class(lexer)
+    tree, _ = parse_program(tokens, "auto", expr_parser, errors)
+    return tokens, tree, errors.messages()
+
+
+class TestCompactTokenStream:
+    """Mesmos tokens, árvore, AST e erros que CommonTokenStream"""
+
+    @pytest.mark.parametrize("expr_parser", ["pratt", "antlr"])
+    @pytest.mark.parametrize("lexer_kind", ["antlr", "regex"])
+    @pytest.mark.parametrize("example", EXAMPLES, ids=lambda p: p.name)
+    def test_same_result_as_common_token_stream(self, example, lexer_kind, expr_parser):
+        code = example.read_text(encoding="utf-8")
+        expected = _parse(CommonTokenStream, code, lexer_kind, expr_parser)
+        actual = _parse(CompactTokenStream, code, lexer_kind, expr_parser)
+        assert [str(t) for t in actual[0].tokens] == [str(t) for t in expected[0].tokens]
+        assert actual[1].toStringTree(recog=actual[1].parser) == \
+            expected[1].toStringTree(recog=expected[1].parser)
+        assert repr(lower_program(actual[1])) == repr(lower_program(expected[1]))
+
+    @pytest.mark.parametrize("lexer_kind", ["antlr", "regex"])
+    def test_same_syntax_errors(self, lexer_kind):
+        expected = _parse(CommonTokenStream, BROKEN, lexer_kind)[2]
+        assert len(expected) >= 3
+        assert _parse(CompactTokenStream, BROKEN, lexer_kind)[2] == expected
+
+    def test_tokens_are_views_with_token_interface(self):
+        tokens, tree, _ = _parse(CompactTokenStream, "let nome: string = \"a\";\n")
+        first = tokens.get(1)
+        assert isinstance(first, TokenView) and isinstance(tree.start, TokenView)
+        assert (first.text, first.line, first.column, first.start, first.stop) == \
+            ("nome", 1, 4, 4, 7)
+        assert first == tokens.tokens[1] and first is not tokens.tokens[1]
+        assert tokens.tokens[-1].text == "<EOF>"
+        clone = first.clone()
+        assert (clone.text, clone.type, clone.tokenIndex) == ("nome", first.type, 1)
+        assert tokens.getText(tree.start, tree.stop) == "letnome:string=\"a\";"
+
+    def test_less_memory_than_common_tokens(self):
+        code = "\n".join(p.read_text(encoding="utf-8") for p in EXAMPLES) * 4
+        retained = {}
+        for stream_class in (CommonTokenStream, CompactTokenStream):
+            stream = InputStream(code)
+            tracemalloc.start()
+            tokens = stream_class(create_lexer(stream, "regex"))
+            tokens.fill()
+            retained[stream_class] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+        assert retained[CompactTokenStream] * 4 < retained[CommonTokenStream]
+
+
+class TestCompileWithTokenBuffer:
+    """compile_file gera o mesmo Jasmin com os dois buffers"""
+
+    def test_same_output(self, tmp_path, capsys):
+        source = tmp_path / "prog.txt"
+        source.write_text((PROJECT_ROOT / "teste_biblioteca.txt").read_text(encoding="utf-8"),
+                          encoding="utf-8")
+        outputs = []
+        for token_buffer in ("list", "compact"):
+            assert compile_file(str(source), token_buffer=token_buffer)
+            outputs.append((tmp_path / "Prog.j").read_text(encoding="utf-8"))
+        capsys.readouterr()
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,232 @@
+"""
+Testes do percurso sem recursão (TypeScriptWalk) com aninhamento profundo.
+
+As regras de statement do parser do ANTLR são recursivas, então os programas
+com 10k níveis de blocos e else if são montados direto no AST; com poucos
+níveis, o mesmo AST é comparado ao do fonte analisado. Expressões (parser de
+precedência, também sem recursão) são compiladas do fonte com compile_file.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from main import compile_file
+from TypeScriptAST import (
+    NODE_TYPES, BinaryExpr, Block, CallOp, ExprStmt, FunctionDecl, Identifier, IfStmt, Literal, Param,
+    PostfixExpr, Program, ReturnStmt, TypeRef, VarDecl, WhileStmt,
+)
+from TypeScriptJasminGenerate import JasminGenerator
+from TypeScriptSemantic import SemanticAnalyzer
+from TypeScriptWalk import dispatch_table, walk
+from .compiler_utils import parse_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+DEPTH = 10_000
+
+
+def _one():
+    return Literal("number", "1", 1, 0)
+
+
+def _number():
+    return TypeRef("number", False, 1, 0)
+
+
+def _print(expr):
+    return ExprStmt(PostfixExpr(Identifier("print", 1, 0), [CallOp([expr])], 1, 0), 1, 0)
+
+
+def nested_expression(depth):
+    """1 + (1 * (1 + (1 * ... 1)))"""
+    node = _one()
+    for level in range(depth):
+        node = BinaryExpr(["*" if level % 2 else "+"], [_one(), node], 1, 0)
+    return node
+
+
+def nested_expression_source(depth):
+    text = "1"
+    for level in range(depth):
+        text = f"1 {'*' if level % 2 else '+'} ({text})"
+    return text
+
+
+def else_if_ladder(depth):
+    """if (x == 0) print(0); else if (x == 1) print(1); ... else print(-1);"""
+    node = _print(_one())
+    for level in reversed(range(depth)):
+        cond = BinaryExpr(["=="], [Identifier("x", 1, 0),
+                                   Literal("number", str(level), 1, 0)], 1, 0)
+        node = IfStmt(cond, _print(Literal("number", str(level), 1, 0)), node, 1, 0)
+    return node
+
+
+def else_if_ladder_source(depth):
+    return "".join(f"if (x == {i}) print({i}); else " for i in range(depth)) + "print(1);"
+
+
+def nested_blocks(depth):
+    """{ let v: number = 1; { ... { print(v); } } }"""
+    node = Block([_print(Identifier("v", 1, 0))], 1, 0)
+    for _ in range(depth):
+        node = Block([VarDecl("v", _number(), _one(), False, 1, 0), node], 1, 0)
+    return node
+
+
+def nested_blocks_source(depth):
+    return "{ let v: number = 1; " * depth + "{ print(v); }" + " }" * depth
+
+
+def nested_calls(depth):
+    """f(f(f(... f(1))))"""
+    node = _one()
+    for _ in range(depth):
+        node = PostfixExpr(Identifier("f", 1, 0), [CallOp([node])], 1, 0)
+    return node
+
+
+def nested_calls_source(depth):
+    return "f(" * depth + "1" + ")" * depth
+
+
+def program(*body):
+    function = FunctionDecl("f", [Param("n", _number())], _number(),
+                            Block([ReturnStmt(Identifier("n", 1, 0), 1, 0)], 1, 0), 1, 0)
+    declaration = VarDecl("x", _number(), _one(), False, 1, 0)
+    return Program([function, declaration, *body], 1, 0)
+
+
+def program_source(body):
+    return f"function f(n: number): number {{ return n; }}\nlet x: number = 1;\n{body}\n"
+
+
+def _compile(prog):
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(prog)
+    generator = JasminGenerator(analyzer, "Profundo")
+    generator.visit(prog)
+    return errors, generator.get_result()
+
+
+CASES = {
+    "expressao": (lambda d: program(_print(nested_expression(d))),
+                  lambda d: program_source(f"print({nested_expression_source(d)});")),
+    "else_if": (lambda d: program(else_if_ladder(d)),
+                lambda d: program_source(else_if_ladder_source(d))),
+    "blocos": (lambda d: program(nested_blocks(d)),
+               lambda d: program_source(nested_blocks_source(d))),
+    "chamadas": (lambda d: program(_print(nested_calls(d))),
+                 lambda d: program_source(f"print({nested_calls_source(d)});")),
+}
+
+
+class TestDeepNesting:
+    """Semântica e geração de código com 10k níveis de aninhamento"""
+
+    @pytest.mark.parametrize("case", CASES)
+    def test_built_ast_matches_parsed_source(self, case):
+        build, source = CASES[case]
+        assert _compile(build(30)) == _compile(parse_code(source(30)))
+
+    @pytest.mark.parametrize("case", CASES)
+    def test_ten_thousand_levels(self, case):
+        assert sys.getrecursionlimit() < DEPTH
+        errors, code = _compile(CASES[case][0](DEPTH))
+        assert errors == []
+        assert code.endswith(".end method")
+
+    def test_instructions_of_deep_expression(self):
+        _, code = _compile(program(_print(nested_expression(DEPTH))))
+        assert code.count("iadd") == DEPTH // 2 and code.count("imul") == DEPTH // 2
+
+    def test_error_at_the_innermost_level(self):
+        expr = BinaryExpr(["+"], [_one(), Literal("boolean", "true", 7, 3)], 7, 3)
+        for _ in range(DEPTH):
+            expr = BinaryExpr(["*"], [_one(), expr], 1, 0)
+        errors, _ = _compile(program(_print(expr)))
+        assert list(map(str, errors)) == ["Linha 7:3 - Operador '+' requer operandos do tipo number"]
+
+    def test_deep_while_bodies(self):
+        body = _print(_one())
+        for _ in range(DEPTH):
+            body = WhileStmt(BinaryExpr(["<"], [Identifier("x", 1, 0), _one()], 1, 0), body, 1, 0)
+        errors, code = _compile(program(body))
+        assert errors == [] and code.count("ifeq") == DEPTH
+
+
+class TestDeepSource:
+    """compile_file com 10k níveis de aninhamento em expressões"""
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("(" * DEPTH + "x" + ")" * DEPTH, None),
+        ("-(" * DEPTH + "x" + ")" * DEPTH, None),
+        (nested_expression_source(DEPTH), None),
+        (nested_calls_source(DEPTH), None),
+        ("[" * DEPTH + "x" + "]" * DEPTH, "print-argument"),
+        ("{a: " * DEPTH + "x" + "}" * DEPTH, "print-argument"),
+    ], ids=["parenteses", "unarios", "binarios", "chamadas", "arrays", "objetos"])
+    def test_expression(self, expression, expected, tmp_path, capsys):
+        assert sys.getrecursionlimit() < DEPTH
+        source = tmp_path / "profundo.txt"
+        source.write_text(program_source(f"print({expression});"), encoding="utf-8")
+        assert compile_file(str(source), diagnostics="json") is (expected is None)
+        report = json.loads(capsys.readouterr().out)
+        assert [d["code"] for d in report["diagnostics"]] == ([expected] if expected else [])
+
+    def test_assignment_chain_and_index(self, tmp_path):
+        source = tmp_path / "profundo.txt"
+        source.write_text(program_source(
+            "let a: number[] = [0];\n"
+            f"x = {'x = ' * DEPTH}2;\n"
+            f"print({'a[' * DEPTH}0{']' * DEPTH});"), encoding="utf-8")
+        assert compile_file(str(source))
+        code = (tmp_path / "Profundo.j").read_text(encoding="utf-8")
+        assert code.count("java/util/ArrayList/get") == DEPTH
+
+    def test_else_if_ladder(self, tmp_path):
+        # Abaixo do limite das regras recursivas de statement do ANTLR
+        source = tmp_path / "profundo.txt"
+        source.write_text(program_source(else_if_ladder_source(200)), encoding="utf-8")
+        assert compile_file(str(source))
+
+
+class TestWalk:
+    """walk com nós sem filhos e trechos ausentes"""
+
+    def test_plain_handlers_and_missing_nodes(self):
+        analyzer = SemanticAnalyzer()
+        assert walk(analyzer, None) is None
+        assert walk(analyzer, _one()).name() == "number"
+        assert walk(analyzer, ExprStmt(None, 1, 0)) is None
+
+
+class TestDispatchTable:
+    """Tabela {classe do nó: visitX ligado}, montada uma vez por visitor"""
+
+    @pytest.mark.parametrize("visitor_class", [SemanticAnalyzer, JasminGenerator])
+    def test_covers_every_node_type(self, visitor_class):
+        visitor = (visitor_class() if visitor_class is SemanticAnalyzer
+                   else visitor_class(SemanticAnalyzer()))
+        assert tuple(visitor.dispatch) == NODE_TYPES
+        for cls, handler in visitor.dispatch.items():
+            assert handler.__self__ is visitor
+            assert handler.__func__ is getattr(visitor_class, "visit" + cls.__name__)
+        assert {Literal, BinaryExpr, Program, WhileStmt} <= set(visitor.dispatch)
+
+    def test_nodes_have_no_accept(self):
+        assert not any(hasattr(cls, "accept") for cls in NODE_TYPES)
+        analyzer = SemanticAnalyzer()
+        assert analyzer.visit(program(_print(nested_expression(3)))) is None
+        assert analyzer.errors == []
+
+    def test_one_table_per_instance(self):
+        first, second = SemanticAnalyzer(), SemanticAnalyzer()
+        assert first.dispatch is not second.dispatch
+        assert dispatch_table(first)[Literal].__self__ is first
+
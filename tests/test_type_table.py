@@ -0,0 +1,209 @@
+"""
+Testes da tabela de tipos por nó (SemanticAnalyzer.types) e do seu uso pelo
+gerador de Jasmin.
+
+A análise semântica registra o tipo de cada expressão e declaração; o gerador
+escolhe instruções (iload/aload, conversões de ArrayList, println) só por essa
+tabela. Os analisadores em duas fases e incremental devem produzir a mesma tabela.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import TypeScriptParallelSemantic
+from main import compile_file
+from TypeScriptAST import CallOp, Expr, IndexOp, MemberOp, ObjectLiteral, preorder
+from TypeScriptIncremental import parse_source, reparse
+from TypeScriptIncrementalSemantic import IncrementalAnalyzer
+from TypeScriptParallelSemantic import TwoPhaseAnalyzer
+from TypeScriptSemantic import STRING, SemanticAnalyzer
+from .compiler_utils import analyze_code, generate_jasmin, parse_code
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAMPLES = sorted(PROJECT_ROOT.glob("exemplo_*.txt")) + [PROJECT_ROOT / "teste_biblioteca.txt"]
+
+# Strings em variáveis locais, arrays e retornos; interfaces vindas de arrays
+PROGRAM = """interface Ponto { x: number; nome: string; }
+function saudacao(nome: string): string {
+    let prefixo: string = "Ola";
+    print(prefixo, nome);
+    return nome;
+}
+function registra(p: Ponto): void {
+    print(p.nome, p.x);
+}
+function primeiro(lista: Ponto[]): Ponto {
+    return lista[0];
+}
+let nomes: string[] = [];
+nomes.push("ana");
+nomes.push(saudacao("bia"));
+let n: string = nomes[1];
+print(n);
+let ultimo: string = nomes.pop();
+print(ultimo);
+let p: Ponto;
+p.x = 3;
+p.nome = "origem";
+let pontos: Ponto[] = [];
+pontos.push(p);
+registra(primeiro(pontos));
+print(pontos[0].nome);
+let flags: boolean[] = [];
+flags.push(true);
+print(flags[0]);
+"""
+
+OUTPUT = ["Ola bia", "bia", "bia", "origem 3", "origem", "1"]
+
+
+def _typed_nodes(program):
+    """Expressões e operadores pós-fixados: todos devem ter tipo"""
+    return [node for node in preorder(program)
+            if isinstance(node, (Expr, IndexOp, MemberOp, CallOp))]
+
+
+def _names(analyzer, program):
+    return [analyzer.types[node].name() for node in _typed_nodes(program)]
+
+
+class TestTypeTable:
+    """Conteúdo da tabela depois da análise"""
+
+    @pytest.mark.parametrize("example", EXAMPLES + [None], ids=lambda p: p.name if p else "strings")
+    def test_every_expression_has_a_type(self, example):
+        program = parse_code(example.read_text(encoding="utf-8") if example else PROGRAM)
+        analyzer = SemanticAnalyzer()
+        assert analyzer.analyze(program) == []
+        missing = [node for node in _typed_nodes(program) if node not in analyzer.types]
+        assert missing == []
+
+    def test_declarations(self):
+        program = parse_code(PROGRAM)
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(program)
+        saudacao = program.body[1]
+        assert analyzer.types[saudacao] is STRING
+        assert analyzer.types[saudacao.params[0]] is STRING
+        local = saudacao.body.body[0]
+        assert analyzer.types[local] is STRING
+        assert analyzer.types[program.body[3]] is analyzer.sym.funcs["primeiro"].return_type
+
+    def test_postfix_operators_record_value_so_far(self):
+        program = parse_code("interface P { n: string; }\nlet ps: P[] = [];\nprint(ps[0].n);\n")
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze(program)
+        call = program.body[2].expr
+        inner = call.ops[0].args[0]
+        index, member = inner.ops
+        assert analyzer.types[index] is analyzer.sym.interfaces["P"]
+        assert analyzer.types[member] is STRING
+        assert analyzer.types[inner] is STRING
+
+    def test_call_arguments_and_indices_are_visited(self):
+        errors = SemanticAnalyzer().analyze(parse_code(
+            "function f(a: number): number { return a; }\n"
+            "let v: number[] = [];\nprint(1, f(x), v[y]);\n"))
+        assert list(map(str, errors)) == ["Linha 3:11 - Variável 'x' não declarada",
+                                          "Linha 3:17 - Variável 'y' não declarada"]
+
+
+class TestSameTableInEveryAnalyzer:
+    """Duas fases (com e sem pool) e incremental produzem a tabela da análise completa"""
+
+    @pytest.fixture
+    def parallel(self, monkeypatch):
+        monkeypatch.setattr(TypeScriptParallelSemantic, "MIN_PARALLEL_FUNCTIONS", 1)
+        monkeypatch.setattr(TypeScriptParallelSemantic, "CHUNKS_PER_JOB", 10 ** 6)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_two_phase(self, jobs, parallel):
+        program = parse_code(PROGRAM)
+        full = SemanticAnalyzer()
+        full.analyze(program)
+        analyzer = TwoPhaseAnalyzer(jobs)
+        assert analyzer.analyze(program) == []
+        assert _names(analyzer, program) == _names(full, program)
+        # Interfaces vindas do pool são as do analisador principal, não cópias
+        ponto = analyzer.sym.interfaces["Ponto"]
+        primeiro = program.body[3]
+        assert analyzer.types[primeiro.body.body[0].value] is ponto
+
+    def test_two_phase_object_literals(self, parallel):
+        code = ("interface P { x: number; }\n"
+                "function f(): P { let p: P = { x: 1 }; return p; }\n"
+                "function g(): number { let q: P = { x: 2 }; return q.x; }\n")
+        program = parse_code(code)
+        analyzer = TwoPhaseAnalyzer(2)
+        assert analyzer.analyze(program) == []
+        literals = [analyzer.types[node] for node in preorder(program)
+                    if type(node) is ObjectLiteral]
+        assert len(literals) == 2 and literals[0] is literals[1]
+        assert literals[0] in analyzer._literal_shapes.values()
+
+    def test_incremental(self):
+        incremental = IncrementalAnalyzer()
+        incremental.analyze(parse_code(PROGRAM))
+        edited = parse_code("\n" + PROGRAM.replace('"ana"', '"eva"'))
+        assert incremental.analyze(edited) == []
+        full = TwoPhaseAnalyzer()
+        full.analyze(edited)
+        assert _names(incremental.analyzer, edited) == _names(full, edited)
+        assert set(incremental.analyzer.types) == set(full.types)
+
+    def test_incremental_after_reparse_and_removal(self):
+        source = parse_source(PROGRAM)
+        incremental = IncrementalAnalyzer()
+        incremental.analyze(source.program)
+        start = PROGRAM.index("print(n);")
+        for edit in [(start, start + len("print(n);"), 'print(n, "!");'),
+                     (start, start + len('print(n, "!");'), "")]:
+            source = reparse(source, *edit)
+            assert incremental.analyze(source.program) == []
+            full = TwoPhaseAnalyzer()
+            full.analyze(source.program)
+            assert ({node: t.name() for node, t in incremental.analyzer.types.items()}
+                    == {node: t.name() for node, t in full.types.items()})
+
+
+class TestGeneratorUsesTable:
+    """Instruções escolhidas pelo tipo registrado, não pela forma da expressão"""
+
+    def _jasmin(self, code):
+        program, analyzer = analyze_code(code)
+        return generate_jasmin(analyzer, program)
+
+    def test_string_locals_are_references(self):
+        jasmin = self._jasmin('function f(s: string): string { let t: string = s; print(t); return t; }\n')
+        assert "astore 1" in jasmin and "aload 0" in jasmin and "aload 1" in jasmin
+        assert "istore" not in jasmin and "iload" not in jasmin
+        assert "println(Ljava/lang/String;)V" in jasmin
+        assert "areturn" in jasmin
+
+    def test_void_calls_are_not_popped(self):
+        jasmin = self._jasmin("function v(): void { }\nfunction n(): number { return 1; }\n"
+                              "v();\nn();\n")
+        main = jasmin[jasmin.index("main("):]
+        assert main.count("pop") == 1
+
+    def test_string_arrays_are_not_boxed(self):
+        jasmin = self._jasmin('let a: string[] = [];\na.push("x");\nprint(a[0]);\n')
+        assert "Integer" not in jasmin
+        assert "checkcast java/lang/String" in jasmin
+
+    @pytest.mark.skipif(shutil.which("java") is None or not (PROJECT_ROOT / "jasmin.jar").exists(),
+                        reason="java ou jasmin.jar indisponível")
+    def test_program_runs(self, tmp_path):
+        source = tmp_path / "tabela.txt"
+        source.write_text(PROGRAM, encoding="utf-8")
+        assert compile_file(str(source))
+        subprocess.run(["java", "-jar", str(PROJECT_ROOT / "jasmin.jar"), "-d", str(tmp_path),
+                        *map(str, tmp_path.glob("*.j"))], check=True, capture_output=True)
+        result = subprocess.run(["java", "-cp", str(tmp_path), "Tabela"],
+                                capture_output=True, text=True, timeout=30)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == OUTPUT
@@ -0,0 +1,147 @@
+"""
+Testes dos tipos canônicos (primitivos únicos, arrays por tipo de elemento).
+"""
+
+import pickle
+
+from antlr4 import CommonTokenStream, InputStream
+
+from main import parse_program
+from TypeScriptAST import BinaryExpr, Literal
+from TypeScriptLexer import TypeScriptLexer
+from TypeScriptLowering import lower_program
+from TypeScriptSemantic import (
+    BOOLEAN, NUMBER, STRING, UNKNOWN_ARRAY, ArrayType, InterfaceType, PrimitiveType,
+    SemanticAnalyzer,
+)
+
+
+def _analyze(code):
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(code))))
+    analyzer = SemanticAnalyzer()
+    return analyzer, [str(error) for error in analyzer.analyze(lower_program(tree))]
+
+
+def _lower_expr(code):
+    tree, _ = parse_program(CommonTokenStream(TypeScriptLexer(InputStream(f"let e: number = {code};"))))
+    return lower_program(tree).body[0].init
+
+
+class TestCanonicalTypes:
+    """Um objeto por tipo primitivo e por tipo array"""
+
+    def test_primitives_are_singletons(self):
+        assert PrimitiveType("number") is NUMBER
+        assert PrimitiveType("string") is STRING
+
+    def test_arrays_are_hash_consed(self):
+        assert ArrayType(NUMBER) is ArrayType(PrimitiveType("number"))
+        assert ArrayType(ArrayType(BOOLEAN)) is ArrayType(ArrayType(BOOLEAN))
+        assert ArrayType(NUMBER) is not ArrayType(STRING)
+        assert ArrayType(NUMBER).name() == "number[]"
+
+    def test_interface_arrays_are_per_interface(self):
+        first, second = InterfaceType("P"), InterfaceType("P")
+        assert ArrayType(first) is ArrayType(first)
+        assert ArrayType(first) is not ArrayType(second)
+
+    def test_pickle_keeps_identity(self):
+        assert pickle.loads(pickle.dumps(NUMBER)) is NUMBER
+        assert pickle.loads(pickle.dumps(ArrayType(STRING))) is ArrayType(STRING)
+
+    def test_no_instance_dict(self):
+        assert not hasattr(NUMBER, "__dict__") and not hasattr(InterfaceType("I"), "__dict__")
+
+
+class TestAnalyzerUsesCanonicalTypes:
+    """Tipos de símbolos e expressões são os objetos canônicos"""
+
+    def test_declared_types(self):
+        analyzer, errors = _analyze(
+            "interface P { n: number; }\nlet a: number = 1;\nlet b: P[] = [];\n"
+            "function f(x: string): boolean { return x == x; }\n")
+        assert errors == []
+        assert analyzer.sym.get_var("a").type is NUMBER
+        assert analyzer.sym.get_var("b").type is ArrayType(analyzer.sym.interfaces["P"])
+        assert analyzer.sym.funcs["f"].param_types == [STRING]
+        assert analyzer.sym.funcs["f"].return_type is BOOLEAN
+        assert analyzer.sym.funcs["array"].return_type is UNKNOWN_ARRAY
+
+    def test_expression_types(self):
+        analyzer, _ = _analyze("")
+        one = Literal("number", "1", 1, 0)
+        assert analyzer.visit(one) is NUMBER
+        assert analyzer.visit(BinaryExpr(["<"], [one, one], 1, 0)) is BOOLEAN
+
+    def test_unresolved_interface_is_reused(self):
+        analyzer, errors = _analyze("let a: Q = 1;\nlet b: Q[] = [];\n")
+        assert len([e for e in errors if "Interface 'Q' não declarada" in e]) == 2
+        unknown = analyzer.sym.get_var("a").type
+        assert analyzer.sym.get_var("b").type is ArrayType(unknown)
+
+    def test_equality(self):
+        analyzer = SemanticAnalyzer()
+        assert analyzer.types_equal(ArrayType(NUMBER), ArrayType(NUMBER))
+        assert not analyzer.types_equal(NUMBER, STRING)
+        assert not analyzer.types_equal(None, None)
+        # Objetos literais são tipos distintos com o mesmo nome
+        assert analyzer.types_equal(InterfaceType("<obj-literal>"), InterfaceType("<obj-literal>"))
+
+
+class TestAssignabilityCache:
+    """is_assignable memorizado por par (alvo, origem), erros só nas falhas"""
+
+    PRODUTO = "interface Produto { nome: string; preco: number; }\n"
+
+    def test_same_shape_literals_share_type(self):
+        analyzer, _ = _analyze("")
+        a = analyzer.visit(_lower_expr("{ x: 1, y: \"a\" }"))
+        b = analyzer.visit(_lower_expr("{ x: 2, y: \"b\" }"))
+        c = analyzer.visit(_lower_expr("{ y: \"b\", x: 2 }"))
+        assert a is b and a is not c
+
+    def test_structural_check_runs_once_per_pair(self):
+        source = self.PRODUTO + "".join(
+            f"let p{i}: Produto = {{ nome: \"n\", preco: {i} }};\n" for i in range(50))
+        analyzer, errors = _analyze(source)
+        assert errors == []
+        produto = analyzer.sym.interfaces["Produto"]
+        assert len([key for key in analyzer._assignable if key[0] is produto]) == 1
+
+    def test_every_failure_is_reported(self):
+        _, errors = _analyze(self.PRODUTO
+                             + "let a: Produto = { nome: \"n\", preco: \"x\" };\n"
+                             + "let b: Produto = { nome: \"n\", preco: \"y\" };\n"
+                             + "let c: Produto = { nome: \"n\" };\n"
+                             + "let d: Produto = { nome: \"n\", preco: 1, cor: 2 };\n")
+        mismatch = "Tipo do inicializador incompatível: esperado Produto mas foi <obj-literal>"
+        assert errors == [
+            "Linha 2:0 - Tipo do campo 'preco' incompatível: esperado number mas foi string",
+            f"Linha 2:0 - {mismatch}",
+            "Linha 3:0 - Tipo do campo 'preco' incompatível: esperado number mas foi string",
+            f"Linha 3:0 - {mismatch}",
+            "Linha 4:0 - Campo 'preco' ausente no objeto literal para a interface Produto",
+            f"Linha 4:0 - {mismatch}",
+            "Linha 5:0 - Campo extra 'cor' no objeto literal não declarado na interface Produto",
+            f"Linha 5:0 - {mismatch}",
+        ]
+
+    def test_nested_and_array_failures(self):
+        _, errors = _analyze(self.PRODUTO
+                             + "interface Item { p: Produto; }\n"
+                             + "let ok: Produto[] = [{ nome: \"a\", preco: 1 }, { nome: \"b\", preco: 2 }];\n"
+                             + "let i1: Item = { p: { nome: \"n\", preco: true } };\n"
+                             + "let i2: Item = { p: { nome: \"n\", preco: true } };\n"
+                             + "let ps: Produto[] = [{ nome: 1, preco: 1 }];\n")
+        assert sum("Tipo do campo 'preco' incompatível" in e for e in errors) == 2
+        assert sum("Tipo do campo 'p' incompatível" in e for e in errors) == 2
+        assert any(e.startswith("Linha 6:") and "Tipo do campo 'nome'" in e for e in errors)
+        assert not any(e.startswith("Linha 3:") for e in errors)
+
+    def test_cache_hit_is_silent(self):
+        analyzer, _ = _analyze(self.PRODUTO)
+        produto = analyzer.sym.interfaces["Produto"]
+        literal = analyzer.visit(_lower_expr("{ nome: \"n\", preco: 1 }"))
+        for _ in range(3):
+            assert analyzer.is_assignable(produto, literal, None)
+        assert analyzer.errors == []